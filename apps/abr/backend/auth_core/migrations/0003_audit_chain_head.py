@@ -0,0 +1,57 @@
+"""
+Migration: per-org audit chain heads.
+
+Appends now lock one ``audit_chain_heads`` row per org (claimed with
+``UPDATE … RETURNING``) instead of the newest ``audit_logs`` row, and each
+record stores its ``chain_seq``.  Existing records keep ``chain_seq = NULL``
+and sort before sequenced ones; heads are seeded lazily from the latest
+record.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth_core", "0002_audit_hash_chain"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auditlogs",
+            name="chain_seq",
+            field=models.BigIntegerField(
+                blank=True,
+                null=True,
+                help_text="Position in the org's chain. NULL for records written before chain heads.",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlogs",
+            index=models.Index(
+                fields=["organization_id", "chain_seq"],
+                name="idx_audit_logs_org_seq",
+            ),
+        ),
+        migrations.CreateModel(
+            name="AuditChainHead",
+            fields=[
+                (
+                    "organization_id",
+                    models.UUIDField(
+                        primary_key=True,
+                        serialize=False,
+                        help_text="Org UUID; compliance.services.NULL_ORG_CHAIN for org-less records",
+                    ),
+                ),
+                ("last_seq", models.BigIntegerField(default=0)),
+                ("last_hash", models.CharField(blank=True, max_length=64, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "audit_chain_heads",
+                "verbose_name": "AuditChainHead",
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+"""
+Migration: checkpoints for the streaming audit-chain verifier.
+
+compliance.chain_verifier records the last verified record per org so
+routine verification only walks the new tail of each chain.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth_core", "0003_audit_chain_head"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChainCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("chain", models.CharField(max_length=64)),
+                ("org_id", models.UUIDField(blank=True, null=True)),
+                (
+                    "position",
+                    models.JSONField(help_text="Keyset of the last verified record"),
+                ),
+                ("last_hash", models.CharField(max_length=64)),
+                ("verified_count", models.BigIntegerField(default=0)),
+                ("verified_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "chain_verification_checkpoints",
+                "verbose_name": "ChainCheckpoint",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("chain", "org_id"),
+                        name="uq_chain_checkpoint_chain_org",
+                    )
+                ],
+            },
+        ),
+    ]
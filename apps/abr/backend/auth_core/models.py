@@ -522,6 +522,11 @@ class AuditLogs(BaseModel):
         blank=True,
         help_text="content_hash of the immediately preceding AuditLogs record for this org. NULL for first record.",
     )
+    chain_seq = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Position in the org's chain. NULL for records written before chain heads.",
+    )
 
     class Meta:
         db_table = "audit_logs"
@@ -532,4 +537,54 @@ class AuditLogs(BaseModel):
                 name="idx_audit_logs_org_created",
             ),
             models.Index(fields=["correlation_id"], name="idx_audit_logs_correlation"),
+            models.Index(
+                fields=["organization_id", "chain_seq"],
+                name="idx_audit_logs_org_seq",
+            ),
+        ]
+
+
+class AuditChainHead(models.Model):
+    """Tip of one organization's audit hash chain.
+
+    compliance.services.create_audit_log claims the next chain_seq with
+    UPDATE … RETURNING on this row, so concurrent writers queue on one small
+    row per org instead of locking the newest AuditLogs record.
+    """
+
+    organization_id = models.UUIDField(
+        primary_key=True,
+        help_text="Org UUID; compliance.services.NULL_ORG_CHAIN for org-less records",
+    )
+    last_seq = models.BigIntegerField(default=0)
+    last_hash = models.CharField(max_length=64, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "audit_chain_heads"
+        verbose_name = "AuditChainHead"
+
+
+class ChainCheckpoint(models.Model):
+    """Last verified position of one org's hash chain.
+
+    Written by compliance.chain_verifier after a clean run so the next
+    verify_audit_chain call only walks records after ``position``.
+    """
+
+    chain = models.CharField(max_length=64)
+    org_id = models.UUIDField(null=True, blank=True)
+    position = models.JSONField(help_text="Keyset of the last verified record")
+    last_hash = models.CharField(max_length=64)
+    verified_count = models.BigIntegerField(default=0)
+    verified_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "chain_verification_checkpoints"
+        verbose_name = "ChainCheckpoint"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["chain", "org_id"],
+                name="uq_chain_checkpoint_chain_org",
+            ),
         ]
@@ -0,0 +1,115 @@
+"""
+auth_core test migration — creates ONLY the audit hash-chain tables using
+SQLite-compatible field types.
+
+This migration is used EXCLUSIVELY in pytest (config.settings.test).
+Production uses the real auth_core/migrations/ folder.
+
+We intentionally:
+  - Skip every other auth_core table (ArrayField / VectorField columns and
+    Organizations FK chains are not needed in ABR tests)
+  - Include AuditLogs and AuditChainHead, which compliance.services writes
+    on every create_audit_log call
+"""
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+    dependencies = []
+
+    operations = [
+        # ── 1. AuditLogs ──────────────────────────────────────────────────────
+        migrations.CreateModel(
+            name="AuditLogs",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("organization_id", models.UUIDField(blank=True, null=True)),
+                ("action", models.CharField(blank=True, max_length=100, null=True)),
+                (
+                    "resource_type",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "resource_id",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("user_id", models.UUIDField(blank=True, null=True)),
+                (
+                    "ip_address",
+                    models.GenericIPAddressField(blank=True, null=True),
+                ),
+                ("user_agent", models.TextField(blank=True, null=True)),
+                ("correlation_id", models.UUIDField(blank=True, null=True)),
+                ("request_id", models.UUIDField(blank=True, null=True)),
+                ("details", models.JSONField(blank=True, default=dict, null=True)),
+                ("changes", models.JSONField(blank=True, default=dict, null=True)),
+                (
+                    "content_hash",
+                    models.CharField(blank=True, max_length=64, null=True),
+                ),
+                (
+                    "previous_hash",
+                    models.CharField(blank=True, max_length=64, null=True),
+                ),
+                ("chain_seq", models.BigIntegerField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "audit_logs",
+                "verbose_name": "AuditLogs",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="auditlogs",
+            index=models.Index(
+                fields=["organization_id", "created_at"],
+                name="idx_audit_logs_org_created",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlogs",
+            index=models.Index(
+                fields=["correlation_id"], name="idx_audit_logs_correlation"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlogs",
+            index=models.Index(
+                fields=["organization_id", "chain_seq"],
+                name="idx_audit_logs_org_seq",
+            ),
+        ),
+        # ── 2. AuditChainHead ─────────────────────────────────────────────────
+        migrations.CreateModel(
+            name="AuditChainHead",
+            fields=[
+                (
+                    "organization_id",
+                    models.UUIDField(primary_key=True, serialize=False),
+                ),
+                ("last_seq", models.BigIntegerField(default=0)),
+                (
+                    "last_hash",
+                    models.CharField(blank=True, max_length=64, null=True),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "audit_chain_heads",
+                "verbose_name": "AuditChainHead",
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+"""
+auth_core test migration — adds the chain verification checkpoint table
+read and written by compliance.chain_verifier.
+
+Used EXCLUSIVELY in pytest (config.settings.test), like 0001_audit_chain.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth_core", "0001_audit_chain"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChainCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("chain", models.CharField(max_length=64)),
+                ("org_id", models.UUIDField(blank=True, null=True)),
+                ("position", models.JSONField()),
+                ("last_hash", models.CharField(max_length=64)),
+                ("verified_count", models.BigIntegerField(default=0)),
+                ("verified_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "chain_verification_checkpoints",
+                "verbose_name": "ChainCheckpoint",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="chaincheckpoint",
+            constraint=models.UniqueConstraint(
+                fields=("chain", "org_id"), name="uq_chain_checkpoint_chain_org"
+            ),
+        ),
+    ]
@@ -11,6 +11,8 @@ The export includes:
   - Audit trail for the case
   - Dual-control approvals (if identity is unmasked)
   - Seal envelope (SHA-256 Merkle root + HMAC)
+  - Per-artifact Merkle inclusion proofs, so a single exhibit can be
+    checked against the seal with verify_artifact() in O(log n)
 """
 
 from __future__ import annotations
@@ -20,6 +22,7 @@ import hmac
 import json
 import os
 import uuid
+from bisect import bisect_left
 from datetime import datetime, timezone
 from typing import Any
 
@@ -34,17 +37,96 @@ def _hmac_sha256(key: str, data: str) -> str:
     ).hexdigest()
 
 
+class MerkleTree:
+    """
+    Iteratively built SHA-256 Merkle tree that keeps every level.
+
+    Pairs are hashed as ``sha256(left_hex + right_hex)``; an odd node at the
+    end of a level is paired with itself.  An empty tree has the root
+    ``sha256("empty")`` and a single leaf is its own root.
+    """
+
+    def __init__(self, leaves: list[str]):
+        sha256 = hashlib.sha256
+        level = list(leaves)
+        self.levels: list[list[str]] = [level]
+        while len(level) > 1:
+            level = [
+                sha256((level[i] + level[min(i + 1, len(level) - 1)]).encode()).hexdigest()
+                for i in range(0, len(level), 2)
+            ]
+            self.levels.append(level)
+
+    @property
+    def root(self) -> str:
+        top = self.levels[-1]
+        return top[0] if top else _sha256("empty")
+
+    def proof(self, index: int) -> dict[str, Any]:
+        """Sibling path from leaf *index* up to the root."""
+        if not 0 <= index < len(self.levels[0]):
+            raise IndexError(f"Leaf index {index} out of range")
+        path = []
+        i = index
+        for level in self.levels[:-1]:
+            if i % 2:
+                path.append({"hash": level[i - 1], "position": "left"})
+            else:
+                path.append({"hash": level[min(i + 1, len(level) - 1)], "position": "right"})
+            i //= 2
+        return {"index": index, "path": path}
+
+
 def _merkle_root(hashes: list[str]) -> str:
-    if not hashes:
-        return _sha256("empty")
-    if len(hashes) == 1:
-        return hashes[0]
-    pairs = []
-    for i in range(0, len(hashes), 2):
-        left = hashes[i]
-        right = hashes[i + 1] if i + 1 < len(hashes) else left
-        pairs.append(_sha256(left + right))
-    return _merkle_root(pairs)
+    return MerkleTree(hashes).root
+
+
+def _tree_depth(leaf_count: int) -> int:
+    """Number of levels above the leaves in a tree of *leaf_count* leaves."""
+    depth = 0
+    while leaf_count > 1:
+        leaf_count = (leaf_count + 1) // 2
+        depth += 1
+    return depth
+
+
+def _fold_proof(leaf: str, proof: dict[str, Any], leaf_count: int) -> str | None:
+    """
+    Walk *proof* from *leaf* to the root of a tree of *leaf_count* leaves.
+
+    The path must be exactly as long as the tree is deep and the sides come
+    from the bits of ``proof["index"]``, not the stored ``position`` hints, so
+    an internal node (or the root) cannot pass as a leaf with a shortened
+    path.  Returns None for a proof that does not fit the tree.
+    """
+    index, path = proof.get("index"), proof.get("path")
+    if (
+        not isinstance(leaf_count, int)
+        or not isinstance(index, int)
+        or not isinstance(path, list)
+        or not 0 <= index < leaf_count
+        or len(path) != _tree_depth(leaf_count)
+    ):
+        return None
+    node = leaf
+    for step in path:
+        if index % 2:
+            node = _sha256(step["hash"] + node)
+        else:
+            node = _sha256(node + step["hash"])
+        index //= 2
+    return node
+
+
+def _seal_payload(root: str, sealed_at: Any, case_id: Any, count: Any) -> str:
+    return _stable_json(
+        {
+            "merkleRoot": root,
+            "sealedAt": sealed_at,
+            "caseId": case_id,
+            "artifactCount": count,
+        }
+    )
 
 
 def _stable_json(obj: Any) -> str:
@@ -101,7 +183,8 @@ def seal_case_evidence_pack(pack: dict[str, Any]) -> dict[str, Any]:
     Seal a draft case evidence pack.
 
     Computes a Merkle root over all artifact hashes + case data hash,
-    then signs with EVIDENCE_SEAL_KEY.
+    then signs with EVIDENCE_SEAL_KEY.  Each evidence artifact gets a
+    ``proof`` of its inclusion under that root.
     """
     if pack.get("status") != "draft":
         raise ValueError("Can only seal a draft pack")
@@ -116,18 +199,14 @@ def seal_case_evidence_pack(pack: dict[str, Any]) -> dict[str, Any]:
     hashes.append(_sha256(_stable_json(pack.get("auditTrail", []))))
     hashes.sort()
 
-    root = _merkle_root(hashes)
+    tree = MerkleTree(hashes)
+    root = tree.root
     sealed_at = datetime.now(timezone.utc).isoformat()
 
-    payload = _stable_json(
-        {
-            "merkleRoot": root,
-            "sealedAt": sealed_at,
-            "caseId": pack.get("caseId"),
-            "artifactCount": len(hashes),
-        }
-    )
+    for artifact in pack.get("evidenceArtifacts", []):
+        artifact["proof"] = tree.proof(bisect_left(hashes, artifact["sha256"]))
 
+    payload = _seal_payload(root, sealed_at, pack.get("caseId"), len(hashes))
     seal = _hmac_sha256(seal_key, payload)
 
     pack["status"] = "sealed"
@@ -136,6 +215,7 @@ def seal_case_evidence_pack(pack: dict[str, Any]) -> dict[str, Any]:
         "seal": seal,
         "merkleRoot": root,
         "sealedAt": sealed_at,
+        "caseId": pack.get("caseId"),
         "artifactCount": len(hashes),
     }
 
@@ -173,17 +253,48 @@ def verify_case_evidence_pack(pack: dict[str, Any]) -> dict[str, Any]:
     if root != seal_info.get("merkleRoot"):
         errors.append("Merkle root mismatch — pack has been tampered with")
 
-    payload = _stable_json(
-        {
-            "merkleRoot": root,
-            "sealedAt": seal_info.get("sealedAt"),
-            "caseId": pack.get("caseId"),
-            "artifactCount": len(hashes),
-        }
+    payload = _seal_payload(
+        root, seal_info.get("sealedAt"), pack.get("caseId"), len(hashes)
     )
-
     expected_seal = _hmac_sha256(seal_key, payload)
     if expected_seal != seal_info.get("seal"):
         errors.append("HMAC seal mismatch — seal has been tampered with")
 
     return {"valid": len(errors) == 0, "errors": errors}
+
+
+def verify_artifact(
+    pack_seal: dict[str, Any],
+    artifact: dict[str, Any],
+    proof: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Verify that one evidence artifact belongs to a sealed pack.
+
+    *pack_seal* is the pack's ``seal`` block and *proof* the artifact's
+    stored inclusion proof.  Checks the HMAC over the seal and walks the
+    proof to the Merkle root, without touching the rest of the pack.
+    Returns { valid: bool, errors: list[str] }.
+    """
+    errors: list[str] = []
+
+    seal_key = os.environ.get("EVIDENCE_SEAL_KEY")
+    if not seal_key:
+        errors.append("EVIDENCE_SEAL_KEY not available for verification")
+        return {"valid": False, "errors": errors}
+
+    root = pack_seal.get("merkleRoot")
+    payload = _seal_payload(
+        root,
+        pack_seal.get("sealedAt"),
+        pack_seal.get("caseId"),
+        pack_seal.get("artifactCount"),
+    )
+    if not hmac.compare_digest(_hmac_sha256(seal_key, payload), pack_seal.get("seal", "")):
+        errors.append("HMAC seal mismatch — seal has been tampered with")
+
+    count = pack_seal.get("artifactCount")
+    if _fold_proof(artifact.get("sha256", ""), proof or {}, count) != root:
+        errors.append("Merkle proof mismatch — artifact is not part of this pack")
+
+    return {"valid": len(errors) == 0, "errors": errors}
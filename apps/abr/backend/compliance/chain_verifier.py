@@ -0,0 +1,396 @@
+"""
+Streaming, resumable verification for hash-chained tables.
+
+Backs ``compliance.services.verify_audit_chain``.  Mirrors the Union Eyes
+``core.chain_verifier`` engine; keep the two in step.
+
+* Rows are read in keyset-paginated pages (``WHERE key > last_key ORDER BY
+  key LIMIT n``) through server-side cursors, so memory stays flat whatever
+  the chain length and no query holds a long-running snapshot.  A chain is
+  made of one or more phases, each paged on its own indexed keyset.
+* After a clean run the last verified key and hash are stored in
+  ``ChainCheckpoint``; the next run re-checks that anchor row and then only
+  verifies the new tail.  ``full=True`` ignores the checkpoint.
+* With ``workers > 1`` the chain is cut into segments whose boundary hashes
+  are read from the table, and segments are verified in a process pool.
+  A tampered boundary row is still caught by the segment that ends with it.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 5_000
+SEGMENT_SIZE = 100_000
+ITERATOR_CHUNK_SIZE = 1_000
+
+Key = Tuple[Any, ...]  # (phase, *order values)
+
+
+# ---------------------------------------------------------------------------
+# Chain definitions
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ChainPhase:
+    """A run of chain rows paged on one keyset."""
+
+    order: Tuple[str, ...]  # unique keyset ordering, backed by an index
+    where: Q = Q()
+
+
+@dataclass(frozen=True)
+class ChainSpec:
+    """How to read and check one hash-chained table."""
+
+    model: str  # "app_label.Model"
+    org_field: str
+    phases: Tuple[ChainPhase, ...]  # verified one after another
+    fields: Tuple[str, ...]  # columns the check (and failure report) needs
+    hash_field: str  # stored hash that the next row links to
+    check: Callable[[Dict[str, Any], Optional[str]], bool]
+
+    def queryset(self, org_id):
+        return apps.get_model(self.model).objects.filter(**{self.org_field: org_id})
+
+    def phase_queryset(self, org_id, phase: int):
+        selected = self.phases[phase]
+        return self.queryset(org_id).filter(selected.where).order_by(*selected.order)
+
+
+def _check_audit_log(row: Dict[str, Any], previous_hash: Optional[str]) -> bool:
+    from compliance.services import compute_content_hash
+
+    return row["content_hash"] == compute_content_hash(
+        action=row["action"] or "",
+        resource_type=row["resource_type"] or "",
+        resource_id=str(row["resource_id"] or ""),
+        user_id=str(row["user_id"] or ""),
+        correlation_id=str(row["correlation_id"] or ""),
+        details=row["details"],
+        previous_hash=previous_hash,
+    )
+
+
+CHAINS: Dict[str, ChainSpec] = {
+    "audit_logs": ChainSpec(
+        model="auth_core.AuditLogs",
+        org_field="organization_id",
+        # Pre-chain-head rows (chain_seq NULL) come first, by time, then the
+        # sequenced rows.  Each phase pages on a plain indexed column so a
+        # page is a range scan, not a sort of the org's remaining rows.
+        phases=(
+            ChainPhase(order=("created_at", "id"), where=Q(chain_seq__isnull=True)),
+            ChainPhase(order=("chain_seq",), where=Q(chain_seq__isnull=False)),
+        ),
+        fields=(
+            "id",
+            "action",
+            "resource_type",
+            "resource_id",
+            "user_id",
+            "correlation_id",
+            "details",
+            "content_hash",
+        ),
+        hash_field="content_hash",
+        check=_check_audit_log,
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SegmentResult:
+    count: int
+    last_key: Optional[Key]
+    last_hash: Optional[str]
+    broken_row: Optional[Dict[str, Any]] = None
+    broken_offset: Optional[int] = None
+
+
+@dataclass
+class ChainVerification:
+    valid: bool
+    count: int  # rows in the chain
+    verified: int  # rows actually checked by this run
+    broken_row: Optional[Dict[str, Any]] = None
+    broken_index: Optional[int] = None
+    resumed_from: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def verify_chain(
+    chain: str,
+    org_id,
+    *,
+    full: bool = False,
+    workers: int = 1,
+    segment_size: int = SEGMENT_SIZE,
+    page_size: int = PAGE_SIZE,
+) -> ChainVerification:
+    """Verify *chain* for *org_id*, resuming from the last checkpoint.
+
+    ``full=True`` re-verifies from the genesis row; ``workers > 1`` verifies
+    segments of ``segment_size`` rows in parallel processes.
+    """
+    spec = CHAINS[chain]
+    start_key: Optional[Key] = None
+    previous_hash: Optional[str] = None
+    offset = 0
+
+    checkpoint = None if full else _load_checkpoint(chain, org_id)
+    if checkpoint is not None:
+        position = _decode_key(checkpoint.position)
+        if _anchor_intact(spec, org_id, position, checkpoint.last_hash):
+            start_key, previous_hash = position, checkpoint.last_hash
+            offset = checkpoint.verified_count
+        else:
+            logger.warning(
+                "Checkpoint anchor for %s/%s changed — re-verifying in full",
+                chain,
+                org_id,
+            )
+
+    if workers > 1:
+        segments = _plan_segments(spec, org_id, start_key, previous_hash, segment_size)
+    else:
+        segments = [(start_key, None, previous_hash)]
+
+    if len(segments) > 1:
+        results = _verify_in_pool(chain, org_id, segments, workers, page_size)
+    else:
+        results = [
+            _verify_range(spec, org_id, *segments[0], page_size=page_size)
+        ]
+
+    verified = 0
+    for result in results:
+        if result.broken_row is not None:
+            return ChainVerification(
+                valid=False,
+                count=spec.queryset(org_id).count(),
+                verified=verified + result.broken_offset + 1,
+                broken_row=result.broken_row,
+                broken_index=offset + verified + result.broken_offset,
+                resumed_from=offset,
+            )
+        verified += result.count
+
+    last = next((r for r in reversed(results) if r.count), None)
+    if last is not None:
+        _save_checkpoint(chain, org_id, last.last_key, last.last_hash, offset + verified)
+    return ChainVerification(
+        valid=True, count=offset + verified, verified=verified, resumed_from=offset
+    )
+
+
+def reset_checkpoint(chain: str, org_id) -> None:
+    """Forget the stored position so the next run verifies from genesis."""
+    from auth_core.models import ChainCheckpoint
+
+    ChainCheckpoint.objects.filter(chain=chain, org_id=org_id).delete()
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+
+def _after(order: Tuple[str, ...], key: Key) -> Q:
+    """Keyset predicate: rows strictly after *key* in *order*."""
+    q = Q(**{f"{order[-1]}__gt": key[-1]})
+    for field, value in zip(reversed(order[:-1]), reversed(key[:-1])):
+        q = Q(**{f"{field}__gt": value}) | (Q(**{field: value}) & q)
+    return q
+
+
+def _stream(
+    spec: ChainSpec,
+    org_id,
+    columns: Tuple[str, ...],
+    start_key: Optional[Key],
+    end_key: Optional[Key],
+    page_size: int,
+) -> Iterator[Tuple[Key, Dict[str, Any]]]:
+    """Yield ``(key, row)`` in chain order between the exclusive/inclusive keys."""
+    first = start_key[0] if start_key is not None else 0
+    last = end_key[0] if end_key is not None else len(spec.phases) - 1
+    for phase in range(first, last + 1):
+        order = spec.phases[phase].order
+        key = start_key[1:] if start_key is not None and phase == first else None
+        through = end_key[1:] if end_key is not None and phase == last else None
+        values = dict.fromkeys((*order, *columns))  # order-preserving dedupe
+        while True:
+            qs = spec.phase_queryset(org_id, phase)
+            if key is not None:
+                qs = qs.filter(_after(order, key))
+            if through is not None:
+                qs = qs.exclude(_after(order, through))
+            seen = 0
+            row = None
+            for row in qs.values(*values)[:page_size].iterator(
+                chunk_size=ITERATOR_CHUNK_SIZE
+            ):
+                seen += 1
+                yield (phase, *(row[f] for f in order)), row
+            if seen < page_size:
+                break
+            key = tuple(row[f] for f in order)
+
+
+def _verify_range(
+    spec: ChainSpec,
+    org_id,
+    start_key: Optional[Key],
+    end_key: Optional[Key],
+    previous_hash: Optional[str],
+    *,
+    page_size: int = PAGE_SIZE,
+) -> SegmentResult:
+    count = 0
+    last_key: Optional[Key] = None
+    for key, row in _stream(spec, org_id, spec.fields, start_key, end_key, page_size):
+        if not spec.check(row, previous_hash):
+            return SegmentResult(count, last_key, previous_hash, row, count)
+        previous_hash = row[spec.hash_field]
+        last_key = key
+        count += 1
+    return SegmentResult(count, last_key, previous_hash)
+
+
+def _plan_segments(
+    spec: ChainSpec,
+    org_id,
+    start_key: Optional[Key],
+    previous_hash: Optional[str],
+    segment_size: int,
+) -> List[Tuple[Optional[Key], Optional[Key], Optional[str]]]:
+    """Cut the chain into ``(after_key, through_key, previous_hash)`` segments.
+
+    Scans only the ordering columns and stored hash, not the row payloads.
+    """
+    segments = []
+    segment_start, segment_prev = start_key, previous_hash
+    seen = 0
+    for key, row in _stream(spec, org_id, (spec.hash_field,), start_key, None, PAGE_SIZE):
+        seen += 1
+        if seen % segment_size == 0:
+            segments.append((segment_start, key, segment_prev))
+            segment_start, segment_prev = key, row[spec.hash_field]
+    segments.append((segment_start, None, segment_prev))
+    return segments
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+
+def _verify_in_pool(chain, org_id, segments, workers, page_size) -> List[SegmentResult]:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(segments)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(
+            os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings"),
+            connection.settings_dict["NAME"],
+        ),
+    ) as pool:
+        futures = [
+            pool.submit(_verify_segment, chain, org_id, start, end, prev, page_size)
+            for start, end, prev in segments
+        ]
+        return [future.result() for future in futures]
+
+
+def _init_worker(settings_module: str, database_name: str) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+    from django.conf import settings
+
+    django.setup()
+    settings.DATABASES["default"]["NAME"] = database_name
+
+
+def _verify_segment(chain, org_id, start_key, end_key, previous_hash, page_size):
+    return _verify_range(
+        CHAINS[chain], org_id, start_key, end_key, previous_hash, page_size=page_size
+    )
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints
+# ---------------------------------------------------------------------------
+
+
+def _load_checkpoint(chain: str, org_id):
+    from auth_core.models import ChainCheckpoint
+
+    return ChainCheckpoint.objects.filter(chain=chain, org_id=org_id).first()
+
+
+def _save_checkpoint(chain, org_id, key: Key, last_hash: str, count: int) -> None:
+    from auth_core.models import ChainCheckpoint
+
+    ChainCheckpoint.objects.update_or_create(
+        chain=chain,
+        org_id=org_id,
+        defaults={
+            "position": _encode_key(key),
+            "last_hash": last_hash,
+            "verified_count": count,
+        },
+    )
+
+
+def _anchor_intact(spec: ChainSpec, org_id, key: Key, last_hash: str) -> bool:
+    """True if the checkpointed row still exists with the checkpointed hash."""
+    phase = key[0] if key else None
+    if not (
+        isinstance(phase, int)
+        and 0 <= phase < len(spec.phases)
+        and len(key) == len(spec.phases[phase].order) + 1
+    ):
+        return False  # not a position in this chain's current layout
+    anchor = dict(zip(spec.phases[phase].order, key[1:]))
+    return (
+        spec.phase_queryset(org_id, phase)
+        .filter(**anchor, **{spec.hash_field: last_hash})
+        .exists()
+    )
+
+
+def _encode_key(key: Key) -> list:
+    # Full-precision ISO timestamps: keyset equality needs the exact value.
+    return [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, UUID) else v
+        for v in key
+    ]
+
+
+def _decode_key(position: list) -> Key:
+    return tuple(position)
@@ -44,6 +44,7 @@ import logging
 import uuid
 from typing import Any, Optional
 
+from compliance.governance_guard import bridge_entry
 from compliance.services import (
     EvidenceSealViolationError,
     create_audit_log,
@@ -160,6 +161,7 @@ class _GovernanceBridge:
 
     # ── Audit ─────────────────────────────────────────────────────────────
 
+    @bridge_entry
     def emit_audit(
         self,
         *,
@@ -221,6 +223,7 @@ class _GovernanceBridge:
 
     # ── Evidence Sealing ──────────────────────────────────────────────────
 
+    @bridge_entry
     def seal_evidence(
         self,
         bundle,
@@ -255,6 +258,7 @@ class _GovernanceBridge:
 
     # ── Integration Dispatch ──────────────────────────────────────────────
 
+    @bridge_entry
     def dispatch_notification(
         self,
         *,
@@ -5,10 +5,18 @@ Blocks direct audit writes, evidence sealing, and integration dispatches
 that do NOT originate from the governance bridge. Enforced in pilot/prod;
 disabled in dev to allow low-friction local testing.
 
-This guard inspects the call stack at write time. If a governed write
-does not pass through `compliance.governance_bridge`, the guard raises
-`GovernanceBridgeBypassError` in enforced environments and logs a
-warning in dev.
+The bridge (and compliance.services) mark the current execution context
+with a `contextvars` token on entry — see `bridge_scope()` /
+`bridge_entry`. At write time the guard only reads that token, so a
+permitted save costs one ContextVar lookup instead of an
+`inspect.stack()` walk. If a governed write happens without the token,
+the guard raises `GovernanceBridgeBypassError` in enforced environments
+and logs a warning in dev.
+
+A cheap `sys._getframe` walk over module names stays as a fallback for
+allowed modules that were not entered through `bridge_entry`; it runs
+only when the token is missing and logs the call site for diagnosis.
+Set GOVERNANCE_GUARD_FRAME_FALLBACK=0 to rely on the token alone.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 Activation:
@@ -29,11 +37,13 @@ Runtime behaviour:
 
 from __future__ import annotations
 
-import inspect
 import logging
 import os
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +51,7 @@ logger = logging.getLogger(__name__)
 
 _NZILA_ENV = os.environ.get("NZILA_ENV", "dev").lower()
 _ENFORCED = _NZILA_ENV in ("pilot", "prod", "production")
+_FRAME_FALLBACK = os.environ.get("GOVERNANCE_GUARD_FRAME_FALLBACK", "1") != "0"
 
 # Modules that are allowed to perform governed writes directly.
 _ALLOWED_CALLERS = frozenset(
@@ -55,15 +66,59 @@ class GovernanceBridgeBypassError(Exception):
     """Raised when a governed write is attempted outside the governance bridge."""
 
 
-# ── Stack inspection ──────────────────────────────────────────────────────────
+# ── Bridge token ──────────────────────────────────────────────────────────────
 
+_BRIDGE_ACTIVE: ContextVar[bool] = ContextVar("governance_bridge_active", default=False)
 
-def _caller_is_bridge() -> bool:
-    """Return True if the governance bridge (or compliance.services) is in the call stack."""
-    for frame_info in inspect.stack():
-        module = frame_info.frame.f_globals.get("__name__", "")
-        if module in _ALLOWED_CALLERS:
+
+@contextmanager
+def bridge_scope() -> Iterator[None]:
+    """Mark governed writes made inside the block as coming from the bridge."""
+    token = _BRIDGE_ACTIVE.set(True)
+    try:
+        yield
+    finally:
+        _BRIDGE_ACTIVE.reset(token)
+
+
+def bridge_entry(fn: Callable) -> Callable:
+    """Decorator form of `bridge_scope()` for bridge entry points."""
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with bridge_scope():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _allowed_module_on_stack() -> bool:
+    """Walk frame globals (no source reads) looking for an allowed module."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get("__name__") in _ALLOWED_CALLERS:
             return True
+        frame = frame.f_back
+    return False
+
+
+def _caller_location(depth: int = 1) -> str:
+    """`file:line` of the frame `depth` levels above the caller."""
+    frame = sys._getframe(depth + 1)
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+def _caller_is_bridge() -> bool:
+    """Return True if the current context was entered through the governance bridge."""
+    if _BRIDGE_ACTIVE.get():
+        return True
+    if _FRAME_FALLBACK and _allowed_module_on_stack():
+        logger.debug(
+            "[GOVERNANCE GUARD] Allowed module on the stack without a bridge "
+            "token — wrap the entry point with bridge_entry. Caller: %s",
+            _caller_location(2),
+        )
+        return True
     return False
 
 
@@ -88,7 +143,7 @@ def governed_write(operation_name: str) -> Callable:
                 msg = (
                     f"[GOVERNANCE GUARD] Direct call to `{operation_name}` detected. "
                     f"All governed writes must originate from compliance.governance_bridge. "
-                    f"Caller: {inspect.stack()[1].filename}:{inspect.stack()[1].lineno}"
+                    f"Caller: {_caller_location()}"
                 )
                 if _ENFORCED:
                     raise GovernanceBridgeBypassError(msg)
@@ -109,7 +164,7 @@ _guard_installed = False
 
 def install_governance_guard() -> None:
     """
-    Monkey-patch governed operations so they check the call stack at runtime.
+    Monkey-patch governed operations so they check for the bridge token at runtime.
 
     Safe to call multiple times — only installs once.
 
@@ -137,7 +192,7 @@ def install_governance_guard() -> None:
                 msg = (
                     "[GOVERNANCE GUARD] Direct AuditLogs.save() — "
                     "must use governance.emit_audit(). "
-                    f"Caller: {inspect.stack()[1].filename}:{inspect.stack()[1].lineno}"
+                    f"Caller: {_caller_location()}"
                 )
                 if _ENFORCED:
                     raise GovernanceBridgeBypassError(msg)
@@ -165,7 +220,7 @@ def install_governance_guard() -> None:
                 msg = (
                     "[GOVERNANCE GUARD] Direct EvidenceBundles.save() — "
                     "must use governance.seal_evidence(). "
-                    f"Caller: {inspect.stack()[1].filename}:{inspect.stack()[1].lineno}"
+                    f"Caller: {_caller_location()}"
                 )
                 if _ENFORCED:
                     raise GovernanceBridgeBypassError(msg)
@@ -6,20 +6,111 @@ The identity vault lives in a dedicated table to enforce need-to-know access
 at the database layer. All identity payloads are AES-256-GCM encrypted
 before storage.
 
+Keys are loaded once per process into a key ring keyed by ``key_id``
+(``reset_key_ring()`` forces a reload):
+
+  IDENTITY_VAULT_KEYS           "key_id:hex,key_id:hex" — every key that may
+                                still be needed for decryption
+  IDENTITY_VAULT_KEY            legacy single key, registered as "default"
+  IDENTITY_VAULT_ACTIVE_KEY_ID  key used for new entries (defaults to
+                                "default", or the only configured key)
+
+Entries keep the ``key_id`` they were written with, so any number of keys
+can be live at once.
+
+Rotating to a new key: add it to IDENTITY_VAULT_KEYS, point
+IDENTITY_VAULT_ACTIVE_KEY_ID at it, then run
+``manage.py reencrypt_identity_vault``.
+
 NzilaOS Integration: Mirrors @nzila/os-core/abr/confidential-reporting
 patterns for the Django/Python backend.
 """
 
 import json
 import os
+import threading
 import uuid
-from datetime import datetime, timezone
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
 
-from backend.auth_core.models import Organizations
+from auth_core.models import Organizations
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from django.conf import settings
 from django.db import models
 
+DEFAULT_KEY_ID = "default"
+
+
+class KeyRing:
+    """AES-256-GCM ciphers for every configured vault key, built once."""
+
+    def __init__(self, keys: Dict[str, bytes], active_key_id: str):
+        for key_id, key in keys.items():
+            if len(key) != 32:
+                raise ValueError(
+                    f"Identity vault key '{key_id}' must be 32 bytes (64 hex chars)"
+                )
+        self._ciphers = {key_id: AESGCM(key) for key_id, key in keys.items()}
+        self.active_key_id = active_key_id
+
+    @classmethod
+    def from_env(cls, keys_env: str, key_env: str, active_env: str) -> "KeyRing":
+        keys: Dict[str, bytes] = {}
+        if key_env:
+            keys[DEFAULT_KEY_ID] = bytes.fromhex(key_env)
+        for item in filter(None, (part.strip() for part in keys_env.split(","))):
+            key_id, sep, raw = item.partition(":")
+            if not sep or not key_id:
+                raise ValueError("IDENTITY_VAULT_KEYS entries must be 'key_id:hex'")
+            keys[key_id] = bytes.fromhex(raw)
+        if not keys:
+            raise ValueError("IDENTITY_VAULT_KEY environment variable is required")
+
+        active = active_env or (DEFAULT_KEY_ID if DEFAULT_KEY_ID in keys else None)
+        if active is None and len(keys) == 1:
+            active = next(iter(keys))
+        if active not in keys:
+            raise ValueError(
+                "IDENTITY_VAULT_ACTIVE_KEY_ID must name one of the configured keys"
+            )
+        return cls(keys, active)
+
+    @property
+    def key_ids(self) -> Tuple[str, ...]:
+        return tuple(self._ciphers)
+
+    def cipher(self, key_id: str) -> AESGCM:
+        try:
+            return self._ciphers[key_id]
+        except KeyError:
+            raise ValueError(f"Identity vault key '{key_id}' is not configured") from None
+
+
+_key_ring: Optional[KeyRing] = None
+_key_ring_lock = threading.Lock()
+
+
+def get_key_ring() -> KeyRing:
+    """Process-wide key ring, built from the environment on first use."""
+    global _key_ring
+    ring = _key_ring
+    if ring is None:
+        with _key_ring_lock:
+            if _key_ring is None:
+                _key_ring = KeyRing.from_env(
+                    os.environ.get("IDENTITY_VAULT_KEYS", ""),
+                    os.environ.get("IDENTITY_VAULT_KEY", ""),
+                    os.environ.get("IDENTITY_VAULT_ACTIVE_KEY_ID", ""),
+                )
+            ring = _key_ring
+    return ring
+
+
+def reset_key_ring() -> None:
+    """Drop the cached key ring so the next use re-reads the environment."""
+    global _key_ring
+    with _key_ring_lock:
+        _key_ring = None
+
 
 class IdentityVaultEntry(models.Model):
     """
@@ -79,48 +170,68 @@ class IdentityVaultEntry(models.Model):
             organization: Owning Org
             identity_data: Dict with reporter PII fields
             created_by: Actor who created the entry
-            key_id: Optional key ID. Defaults to 'default'.
+            key_id: Optional key ID. Defaults to the key ring's active key.
         """
-        raw_key = os.environ.get("IDENTITY_VAULT_KEY")
-        if not raw_key:
-            raise ValueError("IDENTITY_VAULT_KEY environment variable is required")
+        entry = cls(organization=organization, created_by=created_by)
+        entry._seal(identity_data, key_id or get_key_ring().active_key_id)
+        entry.save(force_insert=True)
+        return entry
 
-        key = bytes.fromhex(raw_key)
-        if len(key) != 32:
-            raise ValueError("IDENTITY_VAULT_KEY must be 32 bytes (64 hex chars)")
+    def decrypt(self) -> dict:
+        """
+        Decrypt identity data with this entry's key from the key ring.
+        Raises on tampered data (GCM auth failure).
+        """
+        return self._open(get_key_ring().cipher(self.key_id))
 
-        aesgcm = AESGCM(key)
-        iv = os.urandom(12)
-        plaintext = json.dumps(identity_data).encode("utf-8")
-        ciphertext_with_tag = aesgcm.encrypt(iv, plaintext, None)
+    @classmethod
+    def decrypt_many(
+        cls, entries: Iterable["IdentityVaultEntry"]
+    ) -> Dict[uuid.UUID, dict]:
+        """
+        Decrypt a batch of entries, resolving each key once per group.
 
-        # GCM appends 16-byte tag
-        ciphertext = ciphertext_with_tag[:-16]
-        auth_tag = ciphertext_with_tag[-16:]
-
-        return cls.objects.create(
-            organization=organization,
-            encrypted_payload=ciphertext,
-            iv=iv,
-            auth_tag=auth_tag,
-            key_id=key_id or "default",
-            created_by=created_by,
-        )
+        Returns ``{entry.id: identity_data}``. Raises on the first tampered
+        entry or unknown key_id, like ``decrypt()``.
+        """
+        ring = get_key_ring()
+        by_key = defaultdict(list)
+        for entry in entries:
+            by_key[entry.key_id].append(entry)
 
-    def decrypt(self) -> dict:
+        decrypted = {}
+        for key_id, group in by_key.items():
+            cipher = ring.cipher(key_id)
+            for entry in group:
+                decrypted[entry.id] = entry._open(cipher)
+        return decrypted
+
+    def rekey(self, key_id: str, identity_data: Optional[dict] = None) -> None:
         """
-        Decrypt identity data. Requires IDENTITY_VAULT_KEY env var.
-        Raises on tampered data (GCM auth failure).
+        Re-encrypt this entry under ``key_id`` in memory (caller saves).
+
+        Pass ``identity_data`` when it was already decrypted, e.g. by
+        ``decrypt_many``.
         """
-        raw_key = os.environ.get("IDENTITY_VAULT_KEY")
-        if not raw_key:
-            raise ValueError("IDENTITY_VAULT_KEY environment variable is required")
+        if identity_data is None:
+            identity_data = self.decrypt()
+        self._seal(identity_data, key_id)
 
-        key = bytes.fromhex(raw_key)
-        aesgcm = AESGCM(key)
+    def _seal(self, identity_data: dict, key_id: str) -> None:
+        cipher = get_key_ring().cipher(key_id)
+        iv = os.urandom(12)
+        plaintext = json.dumps(identity_data).encode("utf-8")
+        ciphertext_with_tag = cipher.encrypt(iv, plaintext, None)
+
+        # GCM appends 16-byte tag
+        self.encrypted_payload = ciphertext_with_tag[:-16]
+        self.auth_tag = ciphertext_with_tag[-16:]
+        self.iv = iv
+        self.key_id = key_id
 
+    def _open(self, cipher: AESGCM) -> dict:
         ciphertext_with_tag = bytes(self.encrypted_payload) + bytes(self.auth_tag)
-        plaintext = aesgcm.decrypt(bytes(self.iv), ciphertext_with_tag, None)
+        plaintext = cipher.decrypt(bytes(self.iv), ciphertext_with_tag, None)
         return json.loads(plaintext.decode("utf-8"))
 
     def __str__(self):
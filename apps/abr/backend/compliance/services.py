@@ -12,9 +12,12 @@ import hashlib
 import json
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import F
+
+from compliance.governance_guard import bridge_entry
 
 # ── Seal lifecycle ────────────────────────────────────────────────────────────
 
@@ -39,6 +42,7 @@ def assert_bundle_unsealed(bundle) -> None:
         )
 
 
+@bridge_entry
 def seal_bundle(bundle, actor_id: uuid.UUID, seal_envelope: dict) -> None:
     """Apply a cryptographic seal to the bundle and persist the state change.
 
@@ -132,6 +136,11 @@ def compute_content_hash(
     return hashlib.sha256(payload.encode()).hexdigest()
 
 
+#: Chain-head key for audit records written without an organization.
+NULL_ORG_CHAIN = uuid.UUID(int=0)
+
+
+@bridge_entry
 def create_audit_log(
     *,
     organization_id: uuid.UUID,
@@ -147,23 +156,19 @@ def create_audit_log(
 ):
     """Create a hash-chained AuditLogs record.
 
-    Fetches the latest record for this org to get previous_hash, then
-    computes content_hash before inserting. Must be called inside a
-    transaction.atomic() block to prevent race conditions on the chain.
+    Claims the next chain_seq and previous_hash from the org's
+    AuditChainHead with UPDATE … RETURNING (row-locking only the head until
+    commit), inserts the record, then advances the head's hash.
 
     Returns the saved AuditLogs instance.
     """
-    from auth_core.models import AuditLogs  # local import avoids circular deps
+    from auth_core.models import (  # local import avoids circular deps
+        AuditChainHead,
+        AuditLogs,
+    )
 
     with transaction.atomic():
-        # Lock the latest record for this org to prevent parallel chain-break
-        latest = (
-            AuditLogs.objects.select_for_update()
-            .filter(organization_id=organization_id)
-            .order_by("-created_at")
-            .first()
-        )
-        previous_hash = latest.content_hash if latest else None
+        seq, previous_hash = _claim_chain_slot(organization_id)
 
         content_hash = compute_content_hash(
             action=action,
@@ -171,11 +176,11 @@ def create_audit_log(
             resource_id=str(resource_id),
             user_id=str(actor_id),
             correlation_id=str(correlation_id) if correlation_id else "",
-            details=details,
+            details=details or {},  # hash what is stored, as verification does
             previous_hash=previous_hash,
         )
 
-        return AuditLogs.objects.create(
+        log = AuditLogs.objects.create(
             organization_id=organization_id,
             action=action,
             resource_type=resource_type,
@@ -188,55 +193,78 @@ def create_audit_log(
             user_agent=user_agent,
             content_hash=content_hash,
             previous_hash=previous_hash,
+            chain_seq=seq,
         )
+        AuditChainHead.objects.filter(
+            organization_id=organization_id or NULL_ORG_CHAIN
+        ).update(last_hash=content_hash)
+        return log
 
 
-def verify_audit_chain(organization_id: uuid.UUID) -> dict:
+def _claim_chain_slot(organization_id: Optional[uuid.UUID]) -> Tuple[int, Optional[str]]:
+    """Reserve the next chain_seq; returns ``(seq, previous_hash)``.
+
+    The head row stays locked until the surrounding transaction ends.  A
+    missing head is seeded once from the newest existing AuditLogs record.
+    """
+    from auth_core.models import AuditChainHead, AuditLogs
+
+    head_key = organization_id or NULL_ORG_CHAIN
+    head_param = AuditChainHead._meta.pk.get_db_prep_value(head_key, connection)
+    table = connection.ops.quote_name(AuditChainHead._meta.db_table)
+    sql = (
+        f"UPDATE {table} SET last_seq = last_seq + 1, updated_at = %s "
+        f"WHERE organization_id = %s RETURNING last_seq, last_hash"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [datetime.now(tz=timezone.utc), head_param])
+        row = cursor.fetchone()
+        if row is None:
+            latest = (
+                AuditLogs.objects.filter(organization_id=organization_id)
+                .order_by(F("chain_seq").desc(nulls_last=True), "-created_at")
+                .values("content_hash", "chain_seq")
+                .first()
+            ) or {}
+            AuditChainHead.objects.bulk_create(
+                [
+                    AuditChainHead(
+                        organization_id=head_key,
+                        last_seq=latest.get("chain_seq") or 0,
+                        last_hash=latest.get("content_hash"),
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            cursor.execute(sql, [datetime.now(tz=timezone.utc), head_param])
+            row = cursor.fetchone()
+    return row[0], row[1]
+
+
+def verify_audit_chain(
+    organization_id: uuid.UUID, *, full: bool = False, workers: int = 1
+) -> dict:
     """Verify the integrity of the audit log hash chain for an org.
 
+    Resumes after the last verified checkpoint unless ``full`` is set;
+    ``workers > 1`` verifies chain segments in parallel processes
+    (see compliance.chain_verifier).
+
     Returns:
         {'valid': True, 'count': N}
         or {'valid': False, 'broken_at_id': '<uuid>', 'broken_at_index': N, 'count': N}
     """
-    from auth_core.models import AuditLogs
-
-    records = list(
-        AuditLogs.objects.filter(organization_id=organization_id)
-        .order_by("created_at")
-        .values(
-            "id",
-            "action",
-            "resource_type",
-            "resource_id",
-            "user_id",
-            "correlation_id",
-            "details",
-            "content_hash",
-            "previous_hash",
-        )
-    )
-
-    prev_hash = None
-    for idx, rec in enumerate(records):
-        expected = compute_content_hash(
-            action=rec["action"] or "",
-            resource_type=rec["resource_type"] or "",
-            resource_id=str(rec["resource_id"] or ""),
-            user_id=str(rec["user_id"] or ""),
-            correlation_id=str(rec["correlation_id"] or ""),
-            details=rec["details"],
-            previous_hash=prev_hash,
-        )
-        if rec["content_hash"] != expected:
-            return {
-                "valid": False,
-                "broken_at_id": str(rec["id"]),
-                "broken_at_index": idx,
-                "count": len(records),
-            }
-        prev_hash = rec["content_hash"]
-
-    return {"valid": True, "count": len(records)}
+    from compliance.chain_verifier import verify_chain
+
+    result = verify_chain("audit_logs", organization_id, full=full, workers=workers)
+    if result.valid:
+        return {"valid": True, "count": result.count}
+    return {
+        "valid": False,
+        "broken_at_id": str(result.broken_row["id"]),
+        "broken_at_index": result.broken_index,
+        "count": result.count,
+    }
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,95 @@
+"""
+ABR audit hash chain — per-org chain heads.
+
+Proves appends are sequenced through AuditChainHead, seeded from legacy
+history, and that verify_audit_chain still passes (and still detects
+tampering) with the new ordering.
+
+Run with:
+  pytest backend/compliance/tests/test_audit_chain_head.py -v
+"""
+
+import uuid
+
+import pytest
+from auth_core.models import AuditChainHead, AuditLogs
+from compliance.services import (
+    compute_content_hash,
+    create_audit_log,
+    verify_audit_chain,
+)
+
+ACTOR = uuid.uuid4()
+
+
+def _append(org_id, n, **kwargs):
+    return [
+        create_audit_log(
+            organization_id=org_id,
+            actor_id=ACTOR,
+            action="update",
+            resource_type="AbrCase",
+            resource_id=str(i),
+            **kwargs,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.django_db
+def test_appends_are_sequenced_and_verify():
+    org_id = uuid.uuid4()
+    logs = _append(org_id, 3, details={"field": "status"})
+
+    assert [log.chain_seq for log in logs] == [1, 2, 3]
+    assert logs[2].previous_hash == logs[1].content_hash
+    head = AuditChainHead.objects.get(organization_id=org_id)
+    assert (head.last_seq, head.last_hash) == (3, logs[2].content_hash)
+    assert verify_audit_chain(org_id) == {"valid": True, "count": 3}
+
+
+@pytest.mark.django_db
+def test_orgs_have_independent_chains():
+    org_a, org_b = uuid.uuid4(), uuid.uuid4()
+    _append(org_a, 2)
+    (first_b,) = _append(org_b, 1)
+
+    assert first_b.chain_seq == 1
+    assert first_b.previous_hash is None
+
+
+@pytest.mark.django_db
+def test_head_seeded_from_legacy_history():
+    org_id = uuid.uuid4()
+    legacy_hash = compute_content_hash(
+        action="create",
+        resource_type="AbrCase",
+        resource_id="0",
+        user_id=str(ACTOR),
+        correlation_id="",
+        details={},
+        previous_hash=None,
+    )
+    AuditLogs.objects.create(
+        organization_id=org_id,
+        action="create",
+        resource_type="AbrCase",
+        resource_id="0",
+        user_id=ACTOR,
+        content_hash=legacy_hash,
+    )
+
+    (log,) = _append(org_id, 1)
+    assert log.previous_hash == legacy_hash
+    assert verify_audit_chain(org_id) == {"valid": True, "count": 2}
+
+
+@pytest.mark.django_db
+def test_tampering_still_detected():
+    org_id = uuid.uuid4()
+    logs = _append(org_id, 3)
+    AuditLogs.objects.filter(pk=logs[1].pk).update(resource_id="forged")
+
+    result = verify_audit_chain(org_id)
+    assert result["valid"] is False
+    assert result["broken_at_index"] == 1
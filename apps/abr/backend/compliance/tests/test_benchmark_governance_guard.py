@@ -0,0 +1,82 @@
+"""
+Benchmark — governance guard overhead on a guarded save.
+
+Calls a no-op "save" wrapped by the guard from 40 frames below a
+governance-bridge entry point (roughly a request → view → ORM stack),
+once with the previous ``inspect.stack()`` check and once with the
+context-token check. No database needed.
+
+Run with:
+  pytest backend/compliance/tests/test_benchmark_governance_guard.py --benchmark-only
+"""
+
+import inspect
+from unittest.mock import patch
+
+import pytest
+from compliance.governance_guard import _ALLOWED_CALLERS, bridge_entry, governed_write
+
+STACK_DEPTH = 40
+
+
+def _legacy_caller_is_bridge() -> bool:
+    """The stack walk this change replaced."""
+    for frame_info in inspect.stack():
+        module = frame_info.frame.f_globals.get("__name__", "")
+        if module in _ALLOWED_CALLERS:
+            return True
+    return False
+
+
+def _legacy_guard(fn):
+    def wrapper(*args, **kwargs):
+        if not _legacy_caller_is_bridge():
+            raise AssertionError("bridge not found on the stack")
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _bridge_call():
+    """A callable whose frame belongs to compliance.governance_bridge."""
+    namespace = {"__name__": "compliance.governance_bridge"}
+    exec("def call(fn):\n    return fn()\n", namespace)
+    return namespace["call"]
+
+
+def _at_depth(depth, fn):
+    if depth == 0:
+        return fn()
+    return _at_depth(depth - 1, fn)
+
+
+def _save():
+    return "saved"
+
+
+@pytest.fixture(autouse=True)
+def enforced():
+    with patch("compliance.governance_guard._ENFORCED", True):
+        yield
+
+
+@pytest.mark.benchmark(group="governance-guard")
+def test_stack_walk_guard(benchmark):
+    guarded = _legacy_guard(_save)
+    bridge = _bridge_call()
+
+    result = benchmark(bridge, lambda: _at_depth(STACK_DEPTH, guarded))
+
+    assert result == "saved"
+    benchmark.extra_info.update(stack_depth=STACK_DEPTH)
+
+
+@pytest.mark.benchmark(group="governance-guard")
+def test_token_guard(benchmark):
+    guarded = governed_write("audit_log_create")(_save)
+    bridge = bridge_entry(_bridge_call())
+
+    result = benchmark(bridge, lambda: _at_depth(STACK_DEPTH, guarded))
+
+    assert result == "saved"
+    benchmark.extra_info.update(stack_depth=STACK_DEPTH)
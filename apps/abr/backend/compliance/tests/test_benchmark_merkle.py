@@ -0,0 +1,66 @@
+"""
+Benchmark — Merkle tree build and single-artifact verification for
+ABR case evidence packs.
+
+Builds the level-cached tree over 10k and 1M leaves, then checks one
+artifact's inclusion proof against a sealed root (O(log n) hashes).
+No database needed.
+
+Run with:
+  pytest backend/compliance/tests/test_benchmark_merkle.py --benchmark-only
+"""
+
+import hashlib
+import os
+
+import pytest
+from compliance.case_evidence_export import (
+    MerkleTree,
+    _hmac_sha256,
+    _seal_payload,
+    verify_artifact,
+)
+
+SEAL_KEY = "bench-seal-key"
+
+
+def _leaves(count: int) -> list[str]:
+    return sorted(hashlib.sha256(str(i).encode()).hexdigest() for i in range(count))
+
+
+@pytest.fixture(scope="module", params=[10_000, 1_000_000], ids=["10k", "1m"])
+def leaves(request):
+    return _leaves(request.param)
+
+
+@pytest.mark.benchmark(group="merkle-build")
+def test_build_tree(benchmark, leaves):
+    tree = benchmark.pedantic(MerkleTree, args=(leaves,), rounds=3, iterations=1)
+    benchmark.extra_info.update(leaves=len(leaves), levels=len(tree.levels))
+
+
+@pytest.mark.benchmark(group="merkle-verify")
+def test_verify_single_artifact(benchmark, leaves):
+    tree = MerkleTree(leaves)
+    root = tree.root
+    seal = {
+        "merkleRoot": root,
+        "sealedAt": "2026-01-01T00:00:00+00:00",
+        "caseId": "case-1",
+        "artifactCount": len(leaves),
+    }
+    seal["seal"] = _hmac_sha256(
+        SEAL_KEY, _seal_payload(root, seal["sealedAt"], "case-1", len(leaves))
+    )
+    index = len(leaves) // 2
+    artifact = {"sha256": leaves[index]}
+    proof = tree.proof(index)
+
+    os.environ["EVIDENCE_SEAL_KEY"] = SEAL_KEY
+    try:
+        result = benchmark(verify_artifact, seal, artifact, proof)
+    finally:
+        os.environ.pop("EVIDENCE_SEAL_KEY", None)
+
+    assert result["valid"] is True
+    benchmark.extra_info.update(leaves=len(leaves), proof_length=len(proof["path"]))
@@ -9,6 +9,8 @@ Covers:
   - verify_case_evidence_pack fails when pack is tampered with
   - verify_case_evidence_pack fails when seal is invalid
   - Export ordering is deterministic (same input → same Merkle root)
+  - Iterative Merkle tree keeps the recursive builder's roots
+  - verify_artifact checks one artifact's inclusion proof against the seal
   - view endpoint: non-compliance-officer rejected (403)
   - view endpoint: missing justification rejected (400)
   - view endpoint: export creates access log entry
@@ -24,8 +26,11 @@ from typing import Any
 
 import pytest
 from compliance.case_evidence_export import (
+    MerkleTree,
+    _sha256,
     build_case_evidence_pack,
     seal_case_evidence_pack,
+    verify_artifact,
     verify_case_evidence_pack,
 )
 
@@ -273,6 +278,148 @@ class TestDeterministicOrdering:
         assert root_a != root_b
 
 
+# ── Merkle tree + inclusion proofs ───────────────────────────────────────────
+
+
+def _recursive_merkle_root(hashes: list[str]) -> str:
+    """The original recursive builder, kept as the reference for sealed roots."""
+    if not hashes:
+        return _sha256("empty")
+    if len(hashes) == 1:
+        return hashes[0]
+    pairs = []
+    for i in range(0, len(hashes), 2):
+        left = hashes[i]
+        right = hashes[i + 1] if i + 1 < len(hashes) else left
+        pairs.append(_sha256(left + right))
+    return _recursive_merkle_root(pairs)
+
+
+class TestMerkleTree:
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 5, 8, 13, 64, 100])
+    def test_root_matches_recursive_builder(self, size):
+        leaves = [_sha256(str(i)) for i in range(size)]
+        assert MerkleTree(leaves).root == _recursive_merkle_root(leaves)
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 10])
+    def test_every_leaf_proof_folds_to_root(self, size):
+        leaves = [_sha256(str(i)) for i in range(size)]
+        tree = MerkleTree(leaves)
+        for index, leaf in enumerate(leaves):
+            node = leaf
+            for step in tree.proof(index)["path"]:
+                pair = step["hash"] + node if step["position"] == "left" else node + step["hash"]
+                node = _sha256(pair)
+            assert node == tree.root
+
+    def test_proof_length_is_logarithmic(self):
+        tree = MerkleTree([_sha256(str(i)) for i in range(1000)])
+        assert len(tree.proof(999)["path"]) == 10
+
+    def test_proof_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            MerkleTree([_sha256("x")]).proof(1)
+
+
+class TestVerifyArtifact:
+    def setup_method(self):
+        os.environ["EVIDENCE_SEAL_KEY"] = SEAL_KEY
+
+    def teardown_method(self):
+        os.environ.pop("EVIDENCE_SEAL_KEY", None)
+
+    def _sealed_pack(self) -> dict[str, Any]:
+        pack = build_case_evidence_pack(
+            case_data=SAMPLE_CASE,
+            audit_entries=SAMPLE_AUDIT,
+            evidence_artifacts=SAMPLE_ARTIFACTS,
+        )
+        return seal_case_evidence_pack(pack)
+
+    def test_seal_stores_a_proof_per_artifact(self):
+        pack = self._sealed_pack()
+        for artifact in pack["evidenceArtifacts"]:
+            assert "proof" in artifact
+            assert artifact["proof"]["path"]
+
+    def test_every_artifact_verifies(self):
+        pack = self._sealed_pack()
+        for artifact in pack["evidenceArtifacts"]:
+            result = verify_artifact(pack["seal"], artifact, artifact["proof"])
+            assert result == {"valid": True, "errors": []}
+
+    def test_full_pack_still_verifies_with_proofs(self):
+        pack = self._sealed_pack()
+        assert verify_case_evidence_pack(pack)["valid"] is True
+
+    def test_tampered_artifact_fails(self):
+        pack = self._sealed_pack()
+        artifact = deepcopy(pack["evidenceArtifacts"][0])
+        artifact["sha256"] = "f" * 64
+        result = verify_artifact(pack["seal"], artifact, artifact["proof"])
+        assert result["valid"] is False
+        assert any("Merkle" in e for e in result["errors"])
+
+    def test_proof_from_another_artifact_fails(self):
+        pack = self._sealed_pack()
+        first, second = pack["evidenceArtifacts"]
+        result = verify_artifact(pack["seal"], first, second["proof"])
+        assert result["valid"] is False
+
+    def test_forged_root_fails_hmac(self):
+        pack = self._sealed_pack()
+        artifact = pack["evidenceArtifacts"][0]
+        forged = dict(pack["seal"], merkleRoot=_sha256("forged"))
+        result = verify_artifact(forged, artifact, {"index": 0, "path": []})
+        assert result["valid"] is False
+        assert any("HMAC" in e for e in result["errors"])
+
+    def test_empty_path_fails(self):
+        pack = self._sealed_pack()
+        artifact = pack["evidenceArtifacts"][0]
+        result = verify_artifact(pack["seal"], artifact, {"index": 0, "path": []})
+        assert result["valid"] is False
+
+    def test_root_as_leaf_fails(self):
+        pack = self._sealed_pack()
+        root = pack["seal"]["merkleRoot"]
+        result = verify_artifact(pack["seal"], {"sha256": root}, {"path": []})
+        assert result["valid"] is False
+        assert any("Merkle" in e for e in result["errors"])
+
+    def test_internal_node_as_leaf_fails(self):
+        pack = self._sealed_pack()
+        artifact = pack["evidenceArtifacts"][0]
+        proof = artifact["proof"]
+        first, rest = proof["path"][0], proof["path"][1:]
+        if first["position"] == "left":
+            parent = _sha256(first["hash"] + artifact["sha256"])
+        else:
+            parent = _sha256(artifact["sha256"] + first["hash"])
+        # The parent node with the rest of the path reaches the root too.
+        forged = {"index": proof["index"] // 2, "path": rest}
+        result = verify_artifact(pack["seal"], {"sha256": parent}, forged)
+        assert result["valid"] is False
+
+    def test_index_out_of_range_fails(self):
+        pack = self._sealed_pack()
+        artifact = pack["evidenceArtifacts"][0]
+        proof = dict(artifact["proof"], index=pack["seal"]["artifactCount"])
+        assert verify_artifact(pack["seal"], artifact, proof)["valid"] is False
+
+    def test_position_hints_are_ignored(self):
+        pack = self._sealed_pack()
+        artifact = pack["evidenceArtifacts"][0]
+        flipped = {
+            "index": artifact["proof"]["index"],
+            "path": [
+                {"hash": step["hash"], "position": "left" if step["position"] == "right" else "right"}
+                for step in artifact["proof"]["path"]
+            ],
+        }
+        assert verify_artifact(pack["seal"], artifact, flipped)["valid"] is True
+
+
 # ── View endpoint tests (DB-backed) ──────────────────────────────────────────
 
 
@@ -0,0 +1,207 @@
+"""
+ABR identity vault — key ring, bulk decrypt and resumable re-encryption.
+
+Proves keys are loaded once per process (until reset_key_ring), that
+decrypt_many resolves each key once per group, that rekey moves an entry
+between keys, and that an interrupted re-encryption run resumes after its
+checkpoint.
+
+Run with:
+  pytest backend/compliance/tests/test_identity_vault.py -v
+"""
+
+import json
+import uuid
+
+import pytest
+from compliance.identity_vault import (
+    IdentityVaultEntry,
+    KeyRing,
+    get_key_ring,
+    reset_key_ring,
+)
+from cryptography.exceptions import InvalidTag
+
+OLD_KEY = "11" * 32
+NEW_KEY = "22" * 32
+
+
+@pytest.fixture(autouse=True)
+def vault_keys(monkeypatch):
+    monkeypatch.delenv("IDENTITY_VAULT_KEY", raising=False)
+    monkeypatch.setenv("IDENTITY_VAULT_KEYS", f"old:{OLD_KEY},new:{NEW_KEY}")
+    monkeypatch.setenv("IDENTITY_VAULT_ACTIVE_KEY_ID", "old")
+    reset_key_ring()
+    yield monkeypatch
+    reset_key_ring()
+
+
+def _entry(data, key_id):
+    entry = IdentityVaultEntry(id=uuid.uuid4(), organization_id=uuid.uuid4())
+    entry._seal(data, key_id)
+    return entry
+
+
+# ── Key ring ──────────────────────────────────────────────────────────────────
+
+
+def test_key_ring_is_built_once_until_reset(vault_keys):
+    ring = get_key_ring()
+    assert ring.key_ids == ("old", "new")
+    assert ring.active_key_id == "old"
+
+    vault_keys.setenv("IDENTITY_VAULT_ACTIVE_KEY_ID", "new")
+    assert get_key_ring() is ring
+    reset_key_ring()
+    assert get_key_ring().active_key_id == "new"
+
+
+def test_legacy_single_key_is_the_default_key():
+    ring = KeyRing.from_env("", OLD_KEY, "")
+    assert (ring.key_ids, ring.active_key_id) == (("default",), "default")
+
+
+@pytest.mark.parametrize(
+    "keys_env, key_env, active_env",
+    [
+        ("", "", ""),  # nothing configured
+        ("a:abcd", "", ""),  # short key
+        (f"a:{OLD_KEY},b:{NEW_KEY}", "", ""),  # several keys, no active one
+        (f"a:{OLD_KEY}", "", "b"),  # active key not configured
+    ],
+)
+def test_invalid_key_config_is_rejected(keys_env, key_env, active_env):
+    with pytest.raises(ValueError):
+        KeyRing.from_env(keys_env, key_env, active_env)
+
+
+# ── decrypt / decrypt_many / rekey ────────────────────────────────────────────
+
+
+def test_decrypt_many_resolves_each_key_once(monkeypatch):
+    entries = [_entry({"n": i}, "old" if i % 2 else "new") for i in range(6)]
+    ring = get_key_ring()
+    lookups = []
+    original = ring.cipher
+    monkeypatch.setattr(ring, "cipher", lambda key_id: lookups.append(key_id) or original(key_id))
+
+    decrypted = IdentityVaultEntry.decrypt_many(entries)
+
+    assert decrypted == {entry.id: {"n": i} for i, entry in enumerate(entries)}
+    assert sorted(lookups) == ["new", "old"]
+
+
+def test_rekey_moves_entry_to_new_key():
+    entry = _entry({"name": "Reporter"}, "old")
+    old_ciphertext = bytes(entry.encrypted_payload)
+
+    entry.rekey("new")
+
+    assert entry.key_id == "new"
+    assert bytes(entry.encrypted_payload) != old_ciphertext
+    assert entry.decrypt() == {"name": "Reporter"}
+
+
+def test_tampered_entry_fails_authentication():
+    entry = _entry({"name": "Reporter"}, "old")
+    entry.auth_tag = bytes(16)
+    with pytest.raises(InvalidTag):
+        IdentityVaultEntry.decrypt_many([entry])
+
+
+# ── Re-encryption run ─────────────────────────────────────────────────────────
+
+
+def test_interrupted_run_resumes_after_checkpoint(monkeypatch, tmp_path):
+    from compliance import vault_rotation
+
+    ids = [uuid.UUID(int=i) for i in range(1, 7)]
+    starts = []
+
+    def batches(key_id, after, batch_size):
+        starts.append(after)
+        remaining = [i for i in ids if after is None or str(i) > after]
+        for n in range(0, len(remaining), batch_size):
+            yield remaining[n : n + batch_size]
+
+    calls = []
+
+    def rotate(batch, key_id):
+        calls.append(batch)
+        if len(calls) == 2:
+            raise RuntimeError("worker died")
+        return len(batch), 0, []
+
+    monkeypatch.setattr(vault_rotation, "_id_batches", batches)
+    monkeypatch.setattr(vault_rotation, "rotate_batch", rotate)
+    checkpoint = str(tmp_path / "rekey.json")
+
+    with pytest.raises(RuntimeError):
+        vault_rotation.reencrypt_entries("new", batch_size=2, checkpoint_path=checkpoint)
+    with open(checkpoint) as fh:
+        assert json.load(fh)["last_id"] == str(ids[1])
+
+    stats = vault_rotation.reencrypt_entries("new", batch_size=2, checkpoint_path=checkpoint)
+
+    assert starts == [None, str(ids[1])]
+    assert (stats.rotated, stats.batches, stats.last_id) == (6, 3, str(ids[-1]))
+
+
+def test_locked_rows_hold_the_checkpoint_for_the_next_run(monkeypatch, tmp_path):
+    from compliance import vault_rotation
+
+    ids = [uuid.UUID(int=i) for i in range(1, 7)]
+    locked = {ids[3]}
+
+    def batches(key_id, after, batch_size):
+        remaining = [i for i in ids if after is None or str(i) > after]
+        for n in range(0, len(remaining), batch_size):
+            yield remaining[n : n + batch_size]
+
+    def rotate(batch, key_id):
+        skipped = [i for i in batch if i in locked]
+        return len(batch) - len(skipped), 0, skipped
+
+    monkeypatch.setattr(vault_rotation, "_id_batches", batches)
+    monkeypatch.setattr(vault_rotation, "rotate_batch", rotate)
+    checkpoint = str(tmp_path / "rekey.json")
+
+    stats = vault_rotation.reencrypt_entries("new", batch_size=2, checkpoint_path=checkpoint)
+
+    assert (stats.rotated, stats.skipped) == (5, 1)
+    with open(checkpoint) as fh:
+        assert json.load(fh)["last_id"] == str(ids[2])  # just before the locked row
+
+    locked.clear()
+    stats = vault_rotation.reencrypt_entries("new", batch_size=2, checkpoint_path=checkpoint)
+    assert (stats.skipped, stats.last_id) == (0, str(ids[-1]))
+
+
+def test_rotate_batch_retries_rows_skipped_as_locked(monkeypatch):
+    from compliance import vault_rotation
+
+    ids = [uuid.UUID(int=i) for i in range(1, 5)]
+    passes = []
+
+    def rotate_unlocked(batch, key_id):
+        passes.append(list(batch))
+        still_locked = [ids[1]] if len(passes) < 3 else []
+        return len(batch) - len(still_locked), 0, still_locked
+
+    monkeypatch.setattr(vault_rotation, "_rotate_unlocked", rotate_unlocked)
+    monkeypatch.setattr(vault_rotation, "LOCKED_RETRY_DELAY", 0)
+
+    assert vault_rotation.rotate_batch(ids, "new") == (4, 0, [])
+    assert passes == [ids, [ids[1]], [ids[1]]]
+
+    passes.clear()
+    monkeypatch.setattr(vault_rotation, "LOCKED_RETRIES", 1)
+    assert vault_rotation.rotate_batch(ids, "new") == (3, 0, [ids[1]])
+
+
+def test_unknown_target_key_fails_before_any_work(monkeypatch):
+    from compliance import vault_rotation
+
+    monkeypatch.setattr(vault_rotation, "_id_batches", pytest.fail)
+    with pytest.raises(ValueError, match="not configured"):
+        vault_rotation.reencrypt_entries("missing")
@@ -78,6 +78,10 @@ def test_all_models_are_org_scoped(app_label: str) -> None:
         "EvidenceBundleComponents",
         "EvidenceBundlePolicyMappings",
         "EvidenceBundleTimeline",
+        # Identity vault access audit: every row belongs to one vault entry
+        # (vault_entry → IdentityVaultEntry → organization FK) and is only
+        # written and read through that entry.
+        "IdentityAccessLog",
     }
 
     models = _get_concrete_models(app_label)
@@ -0,0 +1,280 @@
+"""
+Online re-encryption of identity vault entries under another key.
+
+Backs ``manage.py reencrypt_identity_vault``.
+
+* Entries not yet on the target key are read in id-keyset pages, so memory
+  stays flat and rows a previous run already moved are never re-read.
+* Each batch is locked (``SKIP LOCKED``), decrypted with ``decrypt_many``,
+  re-encrypted under the target key and written back with one
+  ``bulk_update`` in its own transaction.  Every key stays in the key ring
+  for the whole run, so readers are unaffected whichever key a row is on.
+* With ``workers > 1`` batches run in a process pool.  The checkpoint only
+  advances past a batch once it and every earlier batch have committed, so
+  a restarted run never skips unrotated rows.
+* Rows another transaction holds locked are retried a few times; any still
+  locked are reported as ``skipped`` and the checkpoint stops before the
+  first of them, so the next run revisits them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from cryptography.exceptions import InvalidTag
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+#: Extra passes over rows that SKIP LOCKED left out of a batch.
+LOCKED_RETRIES = 3
+LOCKED_RETRY_DELAY = 0.5  # seconds, times the pass number
+
+
+@dataclass
+class RotationStats:
+    """Progress of one re-encryption run; also the checkpoint contents."""
+
+    key_id: str
+    rotated: int = 0
+    failed: int = 0
+    skipped: int = 0
+    batches: int = 0
+    last_id: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        return self.rotated / self.seconds if self.seconds else 0.0
+
+
+def reencrypt_entries(
+    key_id: Optional[str] = None,
+    *,
+    batch_size: int = BATCH_SIZE,
+    workers: int = 1,
+    checkpoint_path: Optional[str] = None,
+    on_progress: Optional[Callable[[RotationStats], None]] = None,
+) -> RotationStats:
+    """Move every vault entry onto *key_id* (default: the active key).
+
+    Resumes from *checkpoint_path* when it holds a run for the same key.
+    Entries that fail to decrypt are counted in ``failed`` and left as-is;
+    entries that stayed locked are counted in ``skipped`` and still need a
+    later run.
+    """
+    from compliance.identity_vault import get_key_ring
+
+    ring = get_key_ring()
+    target = key_id or ring.active_key_id
+    ring.cipher(target)  # fail fast on an unknown key
+
+    stats = _load_checkpoint(checkpoint_path, target)
+    started, previous_seconds = time.monotonic(), stats.seconds
+    held = False  # a batch left rows behind: stop advancing the checkpoint
+
+    def done(ids: List[UUID], result: Tuple[int, int, List[UUID]]) -> None:
+        nonlocal held
+        rotated, failed, skipped = result
+        stats.rotated += rotated
+        stats.failed += failed
+        stats.skipped += len(skipped)
+        stats.batches += 1
+        if skipped and not held:
+            held = True
+            first = ids.index(skipped[0])
+            if first:
+                stats.last_id = str(ids[first - 1])
+        elif not held:
+            stats.last_id = str(ids[-1])
+        stats.seconds = previous_seconds + time.monotonic() - started
+        _save_checkpoint(checkpoint_path, stats)
+        if on_progress is not None:
+            on_progress(stats)
+
+    batches = _id_batches(target, stats.last_id, batch_size)
+    if workers > 1:
+        _rotate_in_pool(batches, target, workers, done)
+    else:
+        for ids in batches:
+            done(ids, rotate_batch(ids, target))
+
+    logger.info(
+        "identity vault re-encryption to %s: %d rotated, %d failed, %d skipped (locked) "
+        "in %.1fs (%.0f/s)",
+        target,
+        stats.rotated,
+        stats.failed,
+        stats.skipped,
+        stats.seconds,
+        stats.per_second,
+    )
+    return stats
+
+
+def rotate_batch(ids: List[UUID], key_id: str) -> Tuple[int, int, List[UUID]]:
+    """Re-encrypt the given entries under *key_id*.
+
+    Returns (rotated, failed, skipped): ``skipped`` lists, in batch order,
+    the ids still on an old key because another transaction kept them
+    locked through every retry.
+    """
+    rotated = failed = 0
+    pending = list(ids)
+    for attempt in range(LOCKED_RETRIES + 1):
+        if attempt:
+            time.sleep(LOCKED_RETRY_DELAY * attempt)
+        done, bad, pending = _rotate_unlocked(pending, key_id)
+        rotated += done
+        failed += bad
+        if not pending:
+            break
+    if pending:
+        logger.warning(
+            "%d identity vault entries stayed locked and were not rotated", len(pending)
+        )
+    return rotated, failed, pending
+
+
+def _rotate_unlocked(ids: List[UUID], key_id: str) -> Tuple[int, int, List[UUID]]:
+    """One locking pass: returns (rotated, failed, ids skipped as locked)."""
+    from compliance.identity_vault import IdentityVaultEntry
+    from compliance.models import AbrReporterIdentity
+
+    with transaction.atomic():
+        entries = list(
+            IdentityVaultEntry.objects.select_for_update(skip_locked=True)
+            .filter(id__in=ids)
+            .exclude(key_id=key_id)
+        )
+        try:
+            plaintexts = IdentityVaultEntry.decrypt_many(entries)
+        except (InvalidTag, ValueError):
+            plaintexts = _decrypt_each(entries)
+
+        rotated = []
+        for entry in entries:
+            if entry.id in plaintexts:
+                entry.rekey(key_id, plaintexts[entry.id])
+                rotated.append(entry)
+        IdentityVaultEntry.objects.bulk_update(
+            rotated, ["encrypted_payload", "iv", "auth_tag", "key_id"]
+        )
+        AbrReporterIdentity.objects.filter(
+            vault_entry_id__in=[entry.id for entry in rotated]
+        ).update(key_id=key_id)
+
+    # Rows SKIP LOCKED left out that are still not on the target key (a
+    # plain read does not wait for row locks).
+    selected = {entry.id for entry in entries}
+    unrotated = set(
+        IdentityVaultEntry.objects.filter(id__in=[i for i in ids if i not in selected])
+        .exclude(key_id=key_id)
+        .values_list("id", flat=True)
+    )
+    locked = [i for i in ids if i in unrotated]
+    return len(rotated), len(entries) - len(rotated), locked
+
+
+def _decrypt_each(entries) -> dict:
+    """Slow path for a batch with a bad entry: skip just the bad ones."""
+    plaintexts = {}
+    for entry in entries:
+        try:
+            plaintexts[entry.id] = entry.decrypt()
+        except (InvalidTag, ValueError):
+            logger.warning(
+                "identity vault entry %s (key %s) failed to decrypt — not rotated",
+                entry.id,
+                entry.key_id,
+            )
+    return plaintexts
+
+
+def _id_batches(key_id: str, after: Optional[str], batch_size: int) -> Iterator[List[UUID]]:
+    from compliance.identity_vault import IdentityVaultEntry
+
+    while True:
+        qs = IdentityVaultEntry.objects.exclude(key_id=key_id).order_by("id")
+        if after is not None:
+            qs = qs.filter(id__gt=after)
+        ids = list(qs.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+        after = ids[-1]
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+
+def _rotate_in_pool(batches, key_id, workers, done) -> None:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(
+            os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings"),
+            connection.settings_dict["NAME"],
+        ),
+    ) as pool:
+        # Bounded read-ahead; results are taken in submission order so the
+        # checkpoint never moves past an unfinished batch.
+        pending = deque()
+        for ids in batches:
+            pending.append((ids, pool.submit(rotate_batch, ids, key_id)))
+            if len(pending) >= workers * 2:
+                finished, future = pending.popleft()
+                done(finished, future.result())
+        while pending:
+            finished, future = pending.popleft()
+            done(finished, future.result())
+
+
+def _init_worker(settings_module: str, database_name: str) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+    from django.conf import settings
+
+    django.setup()
+    settings.DATABASES["default"]["NAME"] = database_name
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints
+# ---------------------------------------------------------------------------
+
+
+def _load_checkpoint(path: Optional[str], key_id: str) -> RotationStats:
+    if path and os.path.exists(path):
+        with open(path) as fh:
+            data = json.load(fh)
+        if data.get("key_id") == key_id:
+            # Skipped rows sit after the checkpoint and are revisited now.
+            data["skipped"] = 0
+            return RotationStats(**data)
+        logger.info("Checkpoint %s is for key %s — starting over", path, data.get("key_id"))
+    return RotationStats(key_id=key_id)
+
+
+def _save_checkpoint(path: Optional[str], stats: RotationStats) -> None:
+    if not path:
+        return
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as fh:
+        json.dump(asdict(stats), fh)
+    os.replace(tmp, path)
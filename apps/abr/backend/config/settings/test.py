@@ -67,7 +67,8 @@ INSTALLED_APPS = [
 # ── Migrations: skip all non-ABR migrations ───────────────────────────────────
 # compliance uses a dedicated test_migrations package that creates ONLY the 6
 # SQLite-safe ABR tables (no EvidenceBundles, no auth_core FK chains).
-# auth_core uses an empty stub — no tables created, no ArrayField SQL generated.
+# auth_core uses a test_migrations package that creates ONLY the audit hash-chain
+# tables — no other tables created, no ArrayField SQL generated.
 # Standard Django apps run their own SQLite-compatible built-in migrations.
 MIGRATION_MODULES = {
     "compliance": "compliance.test_migrations",
@@ -5,3 +5,6 @@ class AuthCoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "auth_core"
     verbose_name = "Auth Core"
+
+    def ready(self):
+        from auth_core import signals  # noqa: F401 — registers receivers
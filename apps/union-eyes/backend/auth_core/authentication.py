@@ -3,13 +3,17 @@
 Production-ready implementation with:
 - JWKS caching for performance
 - Organization context extraction
-- User profile synchronization
+- User profile synchronization (skipped while the claims fingerprint is unchanged)
 - Comprehensive error handling
 - JWT key rotation support
 """
 
+import hashlib
+import json
 import logging
-from functools import lru_cache
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Tuple
 
 import jwt
@@ -19,8 +23,276 @@ from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from rest_framework import authentication, exceptions
 
+from auth_core.caching import MISSING, TieredCache
+
 logger = logging.getLogger(__name__)
 
+# JWKS refresh interval, lower bound between unknown-kid refetches, and the
+# verified-token cache bounds (all overridable in settings).
+JWKS_LIFESPAN_SECONDS = 3600
+JWKS_MIN_REFETCH_SECONDS = 30
+JWKS_FETCH_TIMEOUT_SECONDS = 5
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_ENTRIES = 2048
+
+# User fields kept in the user-sync cache; enough to rebuild the request user
+# without a query.  Anything else is deferred and loaded on first access.
+USER_CACHE_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+)
+
+
+class SigningKeyStore:
+    """Process-wide, thread-safe cache of Clerk signing keys keyed by ``kid``.
+
+    - Keys are fetched once and served from memory.
+    - Once older than ``lifespan`` the set is refreshed on a background
+      thread while the current keys keep serving requests.
+    - An unknown ``kid`` (key rotation) triggers one synchronous refetch,
+      throttled by ``min_refetch_interval`` so forged ``kid`` values cannot
+      turn every request into a Clerk round trip.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        lifespan: float = JWKS_LIFESPAN_SECONDS,
+        min_refetch_interval: float = JWKS_MIN_REFETCH_SECONDS,
+        timeout: float = JWKS_FETCH_TIMEOUT_SECONDS,
+    ):
+        self.jwks_url = jwks_url
+        self.lifespan = lifespan
+        self.min_refetch_interval = min_refetch_interval
+        self.timeout = timeout
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        """Return the signing key for *kid*, fetching the JWKS if needed.
+
+        Raises:
+            jwt.PyJWKClientError: If no key matches after a refetch.
+        """
+        if not self._keys:
+            self.refresh()
+        elif time.monotonic() - self._fetched_at > self.lifespan:
+            self._refresh_in_background()
+
+        key = self._lookup(kid)
+        if key is not None:
+            return key
+
+        # Unknown kid — Clerk may have rotated keys since the last fetch.
+        if time.monotonic() - self._fetched_at >= self.min_refetch_interval:
+            self.refresh()
+            key = self._lookup(kid)
+            if key is not None:
+                return key
+
+        raise jwt.PyJWKClientError(
+            f'Unable to find a signing key that matches: "{kid}"'
+        )
+
+    def refresh(self) -> None:
+        """Fetch the JWKS from Clerk and atomically replace the key map."""
+        response = requests.get(self.jwks_url, timeout=self.timeout)
+        response.raise_for_status()
+        jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        keys = {k.key_id: k for k in jwk_set.keys if k.public_key_use in (None, "sig")}
+        with self._lock:
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = {}
+            self._fetched_at = 0.0
+
+    def _lookup(self, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        keys = self._keys
+        if kid is None and len(keys) == 1:
+            return next(iter(keys.values()))
+        return keys.get(kid)
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(
+            target=self._refresh_quietly, name="clerk-jwks-refresh", daemon=True
+        ).start()
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            # Keep serving the previous key set; retry on the next request.
+            logger.warning(f"Background JWKS refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+class VerifiedTokenCache:
+    """Thread-safe LRU of verified JWT payloads keyed by token digest.
+
+    Entries live for at most ``ttl`` seconds and never past the token's own
+    ``exp`` claim, so an expired token always falls through to full
+    verification (and its ``ExpiredSignatureError``).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = TOKEN_CACHE_TTL_SECONDS,
+        max_entries: int = TOKEN_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_key_stores: Dict[str, SigningKeyStore] = {}
+_key_stores_lock = threading.Lock()
+_token_cache: Optional[VerifiedTokenCache] = None
+
+
+def get_signing_key_store(jwks_url: str) -> SigningKeyStore:
+    """Return the process-wide key store for *jwks_url*."""
+    store = _key_stores.get(jwks_url)
+    if store is None:
+        with _key_stores_lock:
+            store = _key_stores.get(jwks_url)
+            if store is None:
+                store = SigningKeyStore(
+                    jwks_url,
+                    lifespan=getattr(
+                        settings, "CLERK_JWKS_LIFESPAN", JWKS_LIFESPAN_SECONDS
+                    ),
+                    min_refetch_interval=getattr(
+                        settings, "CLERK_JWKS_MIN_REFETCH", JWKS_MIN_REFETCH_SECONDS
+                    ),
+                )
+                _key_stores[jwks_url] = store
+    return store
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    """Return the process-wide verified-token cache."""
+    global _token_cache
+    if _token_cache is None:
+        with _key_stores_lock:
+            if _token_cache is None:
+                _token_cache = VerifiedTokenCache(
+                    ttl=getattr(
+                        settings, "CLERK_TOKEN_CACHE_TTL", TOKEN_CACHE_TTL_SECONDS
+                    ),
+                    max_entries=getattr(
+                        settings, "CLERK_TOKEN_CACHE_SIZE", TOKEN_CACHE_MAX_ENTRIES
+                    ),
+                )
+    return _token_cache
+
+
+# Clerk ``sub`` → {"fingerprint": <claims hash>, "user": {USER_CACHE_FIELDS}}.
+# Invalidated by the Clerk user.* webhooks and on every User save/delete
+# (see ``invalidate_user_cache`` and ``auth_core.signals``).
+user_sync_cache = TieredCache("clerk_user", local_ttl=30, shared_ttl=900)
+
+
+def reset_auth_caches() -> None:
+    """Drop all cached signing keys and verified tokens (tests, key revocation)."""
+    global _token_cache
+    with _key_stores_lock:
+        _key_stores.clear()
+        _token_cache = None
+    user_sync_cache.local.clear()
+
+
+def claims_fingerprint(payload: Dict[str, Any]) -> str:
+    """Hash of every claim that ``_get_or_create_user`` syncs to the DB."""
+    org_id, _ = _extract_org(payload)
+    canonical = json.dumps(
+        {
+            "email": payload.get("email", ""),
+            "first_name": payload.get("given_name", ""),
+            "last_name": payload.get("family_name", ""),
+            "org_id": org_id,
+            "public_metadata": payload.get("public_metadata", {}),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def invalidate_user_cache(clerk_user_id: Optional[str]) -> None:
+    """Forget the cached sync state for a Clerk user (webhook path)."""
+    if clerk_user_id:
+        user_sync_cache.delete(clerk_user_id)
+
+
+def _user_cache_fields(user) -> Dict[str, Any]:
+    return {name: getattr(user, name) for name in USER_CACHE_FIELDS}
+
+
+def _user_from_cache(fields: Dict[str, Any]):
+    """Rebuild a persisted User instance from cached fields without a query."""
+    User = get_user_model()
+    concrete = [f.attname for f in User._meta.concrete_fields if f.attname in fields]
+    return User.from_db(
+        User.objects.db, concrete, [fields[name] for name in concrete]
+    )
+
 
 def _extract_org(payload: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
     """Extract organization ID and role from Clerk JWT payload.
@@ -105,7 +377,8 @@ class ClerkAuthentication(authentication.BaseAuthentication):
     def _verify_token(self, token: str) -> Dict[str, Any]:
         """Verify JWT token signature and decode payload.
 
-        Uses cached JWKS client for performance.
+        Signing keys come from the process-wide ``SigningKeyStore`` and
+        already-verified tokens are served from ``VerifiedTokenCache``.
 
         Args:
             token: Raw JWT string
@@ -122,16 +395,16 @@ class ClerkAuthentication(authentication.BaseAuthentication):
                 "CLERK_JWKS_URL not configured in Django settings"
             )
 
-        # Cache JWKS client for performance (auto-refreshes on key rotation)
-        jwks_client = jwt.PyJWKClient(
-            jwks_url,
-            cache_keys=True,
-            max_cached_keys=16,
-            cache_jwk_set=True,
-            lifespan=3600,  # Refresh JWKS every hour
-        )
+        token_cache = get_token_cache()
+        cached = token_cache.get(token)
+        if cached is not None:
+            return cached
 
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
+        # Process-wide key store (refreshes in the background on key rotation)
+        header = jwt.get_unverified_header(token)
+        signing_key = get_signing_key_store(jwks_url).get_signing_key(
+            header.get("kid")
+        )
 
         # Decode and verify token
         payload = jwt.decode(
@@ -141,12 +414,15 @@ class ClerkAuthentication(authentication.BaseAuthentication):
             options={"verify_aud": False},  # Clerk doesn't set aud claim
         )
 
+        token_cache.put(token, payload)
         return payload
 
     def _get_or_create_user(self, payload: Dict[str, Any]):
         """Get or create Django user from Clerk JWT payload.
 
-        Syncs user metadata from Clerk to Django User/Profile models.
+        Syncs user metadata from Clerk to Django User/Profile models.  The
+        DB is only touched when the claims fingerprint differs from the one
+        recorded in ``user_sync_cache`` for this Clerk user.
 
         Args:
             payload: Decoded JWT payload from Clerk
@@ -160,6 +436,11 @@ class ClerkAuthentication(authentication.BaseAuthentication):
         if not clerk_user_id:
             raise exceptions.AuthenticationFailed("Token missing user ID (sub claim)")
 
+        fingerprint = claims_fingerprint(payload)
+        cached = user_sync_cache.get(clerk_user_id)
+        if cached is not MISSING and cached.get("fingerprint") == fingerprint:
+            return _user_from_cache(cached["user"])
+
         email = payload.get("email", "")
         first_name = payload.get("given_name", "")
         last_name = payload.get("family_name", "")
@@ -194,6 +475,10 @@ class ClerkAuthentication(authentication.BaseAuthentication):
         # Sync to Profile model if it exists
         self._sync_user_profile(user, payload)
 
+        user_sync_cache.set(
+            clerk_user_id,
+            {"fingerprint": fingerprint, "user": _user_cache_fields(user)},
+        )
         return user
 
     def _sync_user_profile(self, user, payload: Dict[str, Any]):
@@ -251,10 +536,11 @@ class ClerkAPIKeyAuthentication(authentication.BaseAuthentication):
         return (None, {"is_service_account": True})
 
 
-# Cache user lookups by Clerk ID for 5 minutes
-@lru_cache(maxsize=1000)
 def get_cached_user_by_clerk_id(clerk_user_id: str):
-    """Cache user lookups for performance.
+    """Look up a user by Clerk ID through ``user_sync_cache``.
+
+    Entries expire and are invalidated by the Clerk webhooks and User
+    saves/deletes, unlike the process-lifetime ``lru_cache`` this replaces.
 
     Args:
         clerk_user_id: Clerk user ID (sub claim)
@@ -262,6 +548,10 @@ def get_cached_user_by_clerk_id(clerk_user_id: str):
     Returns:
         User or None
     """
+    cached = user_sync_cache.get(clerk_user_id)
+    if cached is not MISSING:
+        return _user_from_cache(cached["user"])
+
     User = get_user_model()
     try:
         return User.objects.get(username=clerk_user_id)
@@ -0,0 +1,114 @@
+"""Two-level (process-local + Django/Redis) caches for the auth hot path.
+
+The local tier absorbs repeated lookups inside one worker without a network
+hop; the shared tier lets every worker benefit from one DB read and gives
+webhooks / signals a single place to invalidate.  Local entries use a short
+TTL because an invalidation only clears the local tier of the process that
+received it.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+#: Returned by ``get`` on a miss, so ``None`` can be cached as a value.
+MISSING = object()
+
+
+class LocalTTLCache:
+    """Thread-safe, size-bounded LRU whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, *, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TieredCache:
+    """Per-process ``LocalTTLCache`` in front of the default Django cache.
+
+    Keys are namespaced with *prefix* in the shared tier.  Shared-cache errors
+    are logged and treated as misses so Redis outages degrade to DB reads.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        *,
+        local_ttl: float = 30,
+        shared_ttl: float = 900,
+        max_entries: int = 4096,
+    ):
+        self.prefix = prefix
+        self.shared_ttl = shared_ttl
+        self.local = LocalTTLCache(ttl=local_ttl, max_entries=max_entries)
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        value = self.local.get(key)
+        if value is not MISSING:
+            return value
+        try:
+            value = cache.get(self._shared_key(key), MISSING)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed for {self.prefix}: {e}")
+            value = MISSING
+        if value is MISSING:
+            return default
+        self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store *value* in both tiers (``ttl`` overrides the shared TTL)."""
+        shared_ttl = self.shared_ttl if ttl is None else ttl
+        self.local.set(key, value, ttl=min(self.local.ttl, shared_ttl))
+        try:
+            cache.set(self._shared_key(key), value, timeout=shared_ttl)
+        except Exception as e:
+            logger.warning(f"Shared cache write failed for {self.prefix}: {e}")
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        try:
+            cache.delete(self._shared_key(key))
+        except Exception as e:
+            logger.warning(f"Shared cache delete failed for {self.prefix}: {e}")
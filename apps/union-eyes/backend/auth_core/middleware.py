@@ -89,7 +89,12 @@ class OrganizationIsolationMiddleware(MiddlewareMixin):
     """
 
     def process_request(self, request):
-        """Attach organization object to request for multi-org scoping."""
+        """Attach organization object to request for multi-org scoping.
+
+        The org comes from the Clerk JWT claim only.  It is resolved through
+        ``auth_core.org_cache`` and memoised on the request, so
+        ``OrgScopedMixin`` reuses the lookup when the header names the same org.
+        """
         # Skip if no org_id (anonymous or service account)
         org_id = getattr(request, "clerk_org_id", None)
         if not org_id:
@@ -98,11 +103,9 @@ class OrganizationIsolationMiddleware(MiddlewareMixin):
 
         # Try to get Organization model instance
         try:
-            from auth_core.models import Organizations
+            from auth_core.org_cache import resolve_request_organization
 
-            organization = Organizations.objects.filter(
-                clerk_organization_id=org_id
-            ).first()
+            organization = resolve_request_organization(request, org_id)
 
             if not organization:
                 logger.warning(
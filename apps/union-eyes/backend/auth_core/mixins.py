@@ -16,7 +16,11 @@ Apply `OrgScopedMixin` to any ModelViewSet that has an `organization` FK
 
 The mixin reads the Clerk organisation ID from the `X-Organization-Id`
 request header (forwarded by the Next.js djangoProxy utility) and resolves
-it to the local `organizations.id` UUID.
+it to the local `organizations.id` UUID.  Resolution goes through
+`auth_core.org_cache` and is memoised per request, so
+`OrganizationIsolationMiddleware`, `get_queryset` and `perform_create`
+share a single lookup.  The header org is only used for the queryset
+filter and is never attached to the request.
 
 If the header is absent (unauthenticated or single-org call) the mixin
 falls through to the default queryset with no org filter applied.
@@ -28,33 +32,36 @@ import logging
 
 from rest_framework.exceptions import PermissionDenied
 
+from auth_core.org_cache import (
+    model_field_names,
+    model_has_org_field,
+    resolve_request_organization,
+)
+
 logger = logging.getLogger(__name__)
 
 
-def _resolve_local_org_id(clerk_org_id: str | None) -> str | None:
+def _resolve_local_org_id(request, clerk_org_id: str | None) -> str | None:
     """Map a Clerk org ID to the local UUID.
 
-    Cached per-process via a simple dict (no Redis required for dev).
-    In production, replace with a Redis-backed cache.
+    Reuses the lookup `OrganizationIsolationMiddleware` made for the same
+    org; otherwise resolves it through the two-level org cache and memoises
+    it for later calls.
 
     Returns the local `organizations.id` (UUID string) or None.
     """
     if not clerk_org_id:
         return None
 
-    # Lazy import to avoid circular imports at module load time.
-    from auth_core.models import Organizations  # noqa: PLC0415
-
-    try:
-        org = Organizations.objects.only("id").get(clerk_organization_id=clerk_org_id)
-        return str(org.id)
-    except Organizations.DoesNotExist:
+    organization = resolve_request_organization(request, clerk_org_id)
+    if organization is None:
         logger.warning(
             "OrgScopedMixin: clerk org %s has no local record yet. "
             "Trigger organization.created webhook or create the org manually.",
             clerk_org_id,
         )
         return None
+    return str(organization.id)
 
 
 class OrgScopedMixin:
@@ -86,19 +93,13 @@ class OrgScopedMixin:
                 )
             return qs
 
-        local_org_id = _resolve_local_org_id(clerk_org_id)
+        local_org_id = _resolve_local_org_id(self.request, clerk_org_id)  # type: ignore[attr-defined]
         if not local_org_id:
             # Org hasn't been created locally yet (no webhook fired).
             # Fail closed — return empty queryset rather than leaking data.
             return qs.none()
 
-        model = qs.model
-        field_names = {f.name for f in model._meta.get_fields()}
-
-        if "organization" in field_names:
-            return qs.filter(organization_id=local_org_id)
-
-        if "organization_id" in field_names:
+        if model_has_org_field(qs.model):
             return qs.filter(organization_id=local_org_id)
 
         # Model has no org FK — return unfiltered.
@@ -109,14 +110,9 @@ class OrgScopedMixin:
         clerk_org_id: str | None = self.request.META.get(  # type: ignore[attr-defined]
             "HTTP_X_ORGANIZATION_ID"
         )
-        local_org_id = _resolve_local_org_id(clerk_org_id)
-
-        model = serializer.Meta.model
-        field_names = {f.name for f in model._meta.get_fields()}
+        local_org_id = _resolve_local_org_id(self.request, clerk_org_id)  # type: ignore[attr-defined]
 
-        if local_org_id and "organization" in field_names:
-            serializer.save(organization_id=local_org_id)
-        elif local_org_id and "organization_id" in field_names:
+        if local_org_id and model_has_org_field(serializer.Meta.model):
             serializer.save(organization_id=local_org_id)
         else:
             serializer.save()
@@ -141,10 +137,7 @@ class UserScopedMixin:
             user.username
         )  # ClerkAuthentication sets username = Clerk user ID
 
-        model = qs.model
-        field_names = {f.name for f in model._meta.get_fields()}
-
-        if "user_id" in field_names:
+        if "user_id" in model_field_names(qs.model):
             return qs.filter(user_id=clerk_user_id)
 
         return qs
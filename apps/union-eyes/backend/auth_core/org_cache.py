@@ -0,0 +1,90 @@
+"""Cached Clerk organisation → local ``Organizations`` resolution.
+
+Shared by ``OrganizationIsolationMiddleware`` and ``OrgScopedMixin`` so a
+request resolves its organisation at most once, and repeated requests for the
+same org are served from a per-process TTL dict in front of Redis.
+
+Unknown Clerk org IDs are cached negatively for a short time, so a client
+hammering a not-yet-synced org does not hit the DB on every request.  Entries
+are invalidated by the ``Organizations`` save/delete signals (see
+``auth_core.signals``).
+"""
+
+import copy
+import logging
+from functools import lru_cache
+from typing import FrozenSet, Optional
+
+from auth_core.caching import MISSING, TieredCache
+
+logger = logging.getLogger(__name__)
+
+ORG_CACHE_LOCAL_TTL = 30
+ORG_CACHE_SHARED_TTL = 900
+ORG_CACHE_NEGATIVE_TTL = 30
+
+org_cache = TieredCache(
+    "clerk_org", local_ttl=ORG_CACHE_LOCAL_TTL, shared_ttl=ORG_CACHE_SHARED_TTL
+)
+
+
+def resolve_organization(clerk_org_id: Optional[str]):
+    """Return the local ``Organizations`` row for a Clerk org ID, or None.
+
+    Each caller gets its own copy so request code cannot mutate the cached
+    instance.
+    """
+    if not clerk_org_id:
+        return None
+
+    organization = org_cache.get(clerk_org_id)
+    if organization is MISSING:
+        # Lazy import to avoid circular imports at module load time.
+        from auth_core.models import Organizations  # noqa: PLC0415
+
+        organization = Organizations.objects.filter(
+            clerk_organization_id=clerk_org_id
+        ).first()
+        org_cache.set(
+            clerk_org_id,
+            organization,
+            ttl=None if organization is not None else ORG_CACHE_NEGATIVE_TTL,
+        )
+
+    return copy.copy(organization) if organization is not None else None
+
+
+def resolve_request_organization(request, clerk_org_id: Optional[str]):
+    """Resolve *clerk_org_id* at most once per request.
+
+    Later calls for the same Clerk org ID return the memoised result without
+    touching any cache.  Only the memo is stored on *request*; attaching
+    ``request.organization`` is left to ``OrganizationIsolationMiddleware``,
+    which trusts the JWT claim alone.
+    """
+    request = getattr(request, "_request", request)  # unwrap DRF Request
+    memo = getattr(request, "_org_resolution", None)
+    if memo is not None and memo[0] == clerk_org_id:
+        return memo[1]
+
+    organization = resolve_organization(clerk_org_id)
+    request._org_resolution = (clerk_org_id, organization)
+    return organization
+
+
+def invalidate_organization(clerk_org_id: Optional[str]) -> None:
+    """Drop the cached resolution (positive or negative) for a Clerk org ID."""
+    if clerk_org_id:
+        org_cache.delete(clerk_org_id)
+
+
+@lru_cache(maxsize=None)
+def model_field_names(model) -> FrozenSet[str]:
+    """Field names of *model*, computed once per model class."""
+    return frozenset(f.name for f in model._meta.get_fields())
+
+
+def model_has_org_field(model) -> bool:
+    """True if *model* can be filtered by ``organization_id``."""
+    names = model_field_names(model)
+    return "organization" in names or "organization_id" in names
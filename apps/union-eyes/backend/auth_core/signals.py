@@ -0,0 +1,43 @@
+"""Cache invalidation hooks for auth_core models."""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from auth_core.authentication import invalidate_user_cache
+from auth_core.models import Organizations
+from auth_core.org_cache import invalidate_organization
+
+
+@receiver(pre_save, sender=Organizations)
+def _remember_clerk_org_id(sender, instance, **kwargs):
+    """Record the stored Clerk org ID so a changed ID can be invalidated too."""
+    if instance._state.adding:
+        instance._previous_clerk_organization_id = None
+        return
+    instance._previous_clerk_organization_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("clerk_organization_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Organizations)
+@receiver(post_delete, sender=Organizations)
+def _invalidate_org_resolution(sender, instance, **kwargs):
+    """Forget cached Clerk org resolution when an organisation changes."""
+    invalidate_organization(instance.clerk_organization_id)
+    previous = getattr(instance, "_previous_clerk_organization_id", None)
+    if previous and previous != instance.clerk_organization_id:
+        invalidate_organization(previous)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _invalidate_user_sync(sender, instance, **kwargs):
+    """Forget a cached user when it is changed or deleted outside Clerk.
+
+    Covers privilege flags (is_active, is_staff, is_superuser) edited in the
+    admin or a shell, which the Clerk webhooks never see.
+    """
+    invalidate_user_cache(instance.get_username())
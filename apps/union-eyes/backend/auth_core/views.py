@@ -18,6 +18,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from .authentication import invalidate_user_cache
 from .models import (InternationalAddresses, CountryAddressFormats, AddressValidationCache, AddressChangeHistory, FeatureFlags, OrganizationSharingSettings, CrossOrgAccessLog, OrganizationSharingGrants, UserUuidMapping, PendingProfiles, Profiles, Users, OrganizationUsers, UserSessions, OauthProviders, MemberContactPreferences, MemberEmploymentDetails, MemberConsents, MemberHistoryEvents, OrganizationMembers, SsoProviders, ScimConfigurations, SsoSessions, ScimEventsLog, MfaConfigurations, Organizations)
 from .serializers import (InternationalAddressesSerializer, CountryAddressFormatsSerializer, AddressValidationCacheSerializer, AddressChangeHistorySerializer, FeatureFlagsSerializer, OrganizationSharingSettingsSerializer, CrossOrgAccessLogSerializer, OrganizationSharingGrantsSerializer, UserUuidMappingSerializer, PendingProfilesSerializer, ProfilesSerializer, UsersSerializer, OrganizationUsersSerializer, UserSessionsSerializer, OauthProvidersSerializer, MemberContactPreferencesSerializer, MemberEmploymentDetailsSerializer, MemberConsentsSerializer, MemberHistoryEventsSerializer, OrganizationMembersSerializer, SsoProvidersSerializer, ScimConfigurationsSerializer, SsoSessionsSerializer, ScimEventsLogSerializer, MfaConfigurationsSerializer)
 
@@ -444,6 +445,8 @@ def _handle_user_created(data: Dict[str, Any]):
         logger.info(f"Created user {clerk_user_id} from Clerk webhook")
     else:
         logger.info(f"User {clerk_user_id} already exists")
+    
+    invalidate_user_cache(clerk_user_id)
 
 
 def _handle_user_updated(data: Dict[str, Any]):
@@ -477,6 +480,9 @@ def _handle_user_updated(data: Dict[str, Any]):
         
     except User.DoesNotExist:
         logger.warning(f"User {clerk_user_id} not found for update")
+    
+    # Next authenticated request re-syncs from the JWT claims.
+    invalidate_user_cache(clerk_user_id)
 
 
 def _handle_user_deleted(data: Dict[str, Any]):
@@ -494,6 +500,8 @@ def _handle_user_deleted(data: Dict[str, Any]):
         
     except User.DoesNotExist:
         logger.warning(f"User {clerk_user_id} not found for deletion")
+    
+    invalidate_user_cache(clerk_user_id)
 
 
 def _handle_organization_created(data: Dict[str, Any]):
@@ -880,3 +880,48 @@ class FinancialPeriods(BaseModel):
     class Meta:
         db_table = 'financial_periods'
         verbose_name = 'FinancialPeriods'
+
+
+# ---------------------------------------------------------------------------
+# Scheduler bookkeeping (hand-written — not part of the drizzle migration)
+# ---------------------------------------------------------------------------
+
+class BillingRun(BaseModel):
+    """One organization's billing cycle for one (frequency, period).
+
+    Written by billing.tasks before and after each org is billed, so a
+    retried or redelivered scheduler shard skips orgs that already finished
+    and no org is billed twice for the same period.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('skipped', 'Skipped'),
+        ('failed', 'Failed'),
+    ]
+
+    organization_id = models.UUIDField()
+    frequency = models.CharField(max_length=16)
+    period_start = models.DateField()
+    status = models.CharField(choices=STATUS_CHOICES, max_length=16, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    transactions_created = models.IntegerField(default=0)
+    total_amount = models.DecimalField(max_digits=19, decimal_places=2, default=0)
+    error = models.TextField(blank=True, default='')
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'billing_runs'
+        verbose_name = 'BillingRun'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['organization_id', 'frequency', 'period_start'],
+                name='uq_billing_run_org_period',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['frequency', 'period_start', 'status'],
+                         name='billing_run_period_status_idx'),
+        ]
@@ -0,0 +1,328 @@
+"""
+Concurrency-limited payment retry engine for retry_failed_payments_task.
+
+The task used to charge each failed transaction in turn, so its runtime grew
+with the number of failures and could run into its time limit.
+PaymentRetryEngine runs the Stripe calls on a bounded thread pool instead:
+
+- a shared TokenBucket keeps the job under PAYMENT_RETRY_RATE_PER_SECOND
+  Stripe requests, leaving the rest of the account's API limit to the app;
+- every PaymentIntent carries a deterministic idempotency key (transaction
+  id + attempt number), so a job retried or re-run before its outcome was
+  recorded gets Stripe's original answer instead of charging again;
+- rate-limit, conflict and connection errors are retried with the same key;
+- outcomes are written back in bulk from the calling thread, one UPDATE per
+  outcome kind per PAYMENT_RETRY_FLUSH_SIZE transactions.
+
+Worker threads only talk to Stripe; all database access stays on the
+calling thread.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+#: Outcomes written back per bulk UPDATE round.
+PAYMENT_RETRY_FLUSH_SIZE = 200
+
+#: Stripe calls made per transaction when the answer is "try again".
+TRANSIENT_ATTEMPTS = 3
+TRANSIENT_BACKOFF = 0.5  # seconds, doubled per attempt
+
+#: HTTP statuses Stripe uses for "try again": idempotency-key conflict, rate
+#: limit, server errors.  Connection errors carry no status.
+TRANSIENT_HTTP_STATUSES = frozenset({409, 429, 500, 502, 503, 504})
+
+CreateIntent = Callable[[dict, str, str], object]
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+def idempotency_key(transaction_id, attempt_number: int) -> str:
+    """Stripe idempotency key for one retry attempt of one transaction."""
+    return f"dues-retry-{transaction_id}-{attempt_number}"
+
+
+@dataclass
+class RetryOutcome:
+    """Result of one payment retry attempt."""
+
+    transaction_id: str
+    member_id: Optional[str]
+    attempt_number: int
+    success: bool
+    reason: Optional[str] = None
+    payment_intent_id: Optional[str] = None
+    error: Optional[str] = None
+    #: False when the attempt says nothing about the payment method (no
+    #: processor configured, no card on file, Stripe unreachable) — left
+    #: for the next run.
+    record: bool = True
+
+    def as_result(self) -> dict:
+        """The per-transaction entry of the task result."""
+        entry = {
+            "transaction_id": self.transaction_id,
+            "member_id": self.member_id,
+            "attempt_number": self.attempt_number,
+        }
+        if self.error:
+            return {**entry, "result": "error", "error": self.error}
+        entry.update(result="retried", success=self.success)
+        if self.payment_intent_id:
+            entry["payment_intent_id"] = self.payment_intent_id
+        if self.reason:
+            entry["reason"] = self.reason
+        return entry
+
+
+class PaymentRetryEngine:
+    """
+    Charge a set of (transaction, attempt_number) pairs concurrently.
+
+    ``create_intent`` and ``record`` default to the Stripe client and the
+    bulk dues_transactions writer; tests pass stand-ins.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = None,
+        rate: Optional[float] = None,
+        api_key: Optional[str] = None,
+        create_intent: Optional[CreateIntent] = None,
+        record: Optional[Callable[[List[RetryOutcome]], None]] = None,
+        flush_size: int = PAYMENT_RETRY_FLUSH_SIZE,
+    ):
+        self.workers = workers or settings.PAYMENT_RETRY_CONCURRENCY
+        self.bucket = TokenBucket(rate or settings.PAYMENT_RETRY_RATE_PER_SECOND)
+        self.api_key = api_key or os.environ.get("STRIPE_SECRET_KEY")
+        self.create_intent = create_intent or _create_payment_intent
+        self.record = record or record_outcomes
+        self.flush_size = flush_size
+
+    def run(self, attempts: Iterable[Tuple[dict, int]]) -> List[RetryOutcome]:
+        """Charge every attempt; outcomes are recorded in chunks as they complete."""
+        attempts = list(attempts)
+        if not attempts:
+            return []
+        if not self.api_key:
+            logger.warning(
+                "STRIPE_SECRET_KEY not configured — %d payment retries skipped", len(attempts)
+            )
+            return [
+                _outcome(txn, attempt_number, success=False,
+                         reason="payment_processor_not_configured", record=False)
+                for txn, attempt_number in attempts
+            ]
+
+        outcomes: List[RetryOutcome] = []
+        pending: List[RetryOutcome] = []
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.workers, len(attempts)), thread_name_prefix="payment-retry"
+        )
+        try:
+            futures = [pool.submit(self.charge, txn, n) for txn, n in attempts]
+            for future in as_completed(futures):
+                outcome = future.result()
+                outcomes.append(outcome)
+                pending.append(outcome)
+                if len(pending) >= self.flush_size:
+                    self.record(pending)
+                    pending = []
+        finally:
+            # On a soft time limit, queued charges are dropped; charges already
+            # in flight finish and are answered from their idempotency key on
+            # the next run.
+            pool.shutdown(wait=False, cancel_futures=True)
+            if pending:
+                self.record(pending)
+        return outcomes
+
+    def charge(self, txn: dict, attempt_number: int) -> RetryOutcome:
+        """Create (or replay) the PaymentIntent for one attempt; never raises."""
+        payment_method = txn.get("payment_method_id") or txn.get("stripe_payment_method_id")
+        customer_id = txn.get("stripe_customer_id")
+        if not payment_method or not customer_id:
+            logger.warning(
+                "Transaction %s missing payment_method or customer — cannot retry", txn.get("id")
+            )
+            # No Stripe call was made, so this is not a decline of the card.
+            return _outcome(
+                txn, attempt_number, success=False, reason="missing_payment_method", record=False
+            )
+
+        params = {
+            "amount": _amount_cents(txn.get("amount", 0)),
+            "currency": (txn.get("currency") or "cad").lower(),
+            "customer": customer_id,
+            "payment_method": payment_method,
+            "confirm": True,
+            "off_session": True,
+            "metadata": {
+                "transaction_id": str(txn.get("id", "")),
+                "retry": "true",
+                "attempt": str(attempt_number),
+            },
+        }
+        key = idempotency_key(txn.get("id", ""), attempt_number)
+
+        for call in range(TRANSIENT_ATTEMPTS):
+            self.bucket.acquire()
+            try:
+                intent = self.create_intent(params, key, self.api_key)
+                break
+            except Exception as exc:  # noqa: BLE001
+                transient = _is_transient(exc)
+                if transient and call + 1 < TRANSIENT_ATTEMPTS:
+                    time.sleep(TRANSIENT_BACKOFF * 2**call)
+                    continue
+                logger.error("Payment retry failed for transaction %s: %s", txn.get("id"), exc)
+                if transient:
+                    return _outcome(txn, attempt_number, success=False, error=str(exc), record=False)
+                return _outcome(
+                    txn, attempt_number, success=False, reason=getattr(exc, "code", None) or str(exc)
+                )
+
+        if intent.status in ("succeeded", "requires_capture"):
+            logger.info(
+                "Payment retry succeeded for transaction %s (intent %s)", txn.get("id"), intent.id
+            )
+            return _outcome(txn, attempt_number, success=True, payment_intent_id=intent.id)
+
+        logger.warning(
+            "Payment retry intent status=%s for transaction %s", intent.status, txn.get("id")
+        )
+        return _outcome(
+            txn, attempt_number, success=False,
+            reason=f"intent_status_{intent.status}", payment_intent_id=intent.id,
+        )
+
+
+def record_outcomes(outcomes: List[RetryOutcome]) -> None:
+    """
+    Write a chunk of outcomes back to dues_transactions (best-effort).
+
+    Paid transactions move to 'paid'; declined ones get their failure_count,
+    last_failure_date and reason in metadata, which drives the retry
+    schedule.  One UPDATE ... FROM (VALUES ...) per kind.
+    """
+    paid = [o for o in outcomes if o.record and o.success]
+    declined = [o for o in outcomes if o.record and not o.success]
+    if not paid and not declined:
+        return
+    try:
+        from django.db import connection, transaction
+
+        with transaction.atomic(), connection.cursor() as cur:
+            if paid:
+                cur.execute(
+                    f"""
+                    UPDATE dues_transactions AS d
+                    SET    status     = 'paid',
+                           metadata   = COALESCE(d.metadata, '{{}}'::jsonb)
+                                        || jsonb_build_object('payment_intent_id', v.intent_id),
+                           updated_at = NOW()
+                    FROM   (VALUES {", ".join(["(%s, %s)"] * len(paid))}) AS v(id, intent_id)
+                    WHERE  d.id = v.id::uuid
+                    """,
+                    [value for o in paid for value in (o.transaction_id, o.payment_intent_id)],
+                )
+            if declined:
+                cur.execute(
+                    f"""
+                    UPDATE dues_transactions AS d
+                    SET    metadata   = COALESCE(d.metadata, '{{}}'::jsonb)
+                                        || jsonb_build_object(
+                                               'failure_count',       v.attempt_number::int,
+                                               'last_failure_date',   %s::text,
+                                               'last_failure_reason', v.reason
+                                           ),
+                           updated_at = NOW()
+                    FROM   (VALUES {", ".join(["(%s, %s, %s)"] * len(declined))})
+                           AS v(id, attempt_number, reason)
+                    WHERE  d.id = v.id::uuid
+                    """,
+                    [date.today().isoformat()]
+                    + [
+                        value
+                        for o in declined
+                        for value in (o.transaction_id, o.attempt_number, o.reason or "")
+                    ],
+                )
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Could not record %d payment retry outcomes: %s", len(outcomes), exc)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _create_payment_intent(params: dict, idempotency_key: str, api_key: str):
+    """Create a confirmed off-session PaymentIntent through the Stripe client."""
+    import stripe
+
+    return stripe.PaymentIntent.create(
+        **params, api_key=api_key, idempotency_key=idempotency_key
+    )
+
+
+def _is_transient(exc: Exception) -> bool:
+    """True for Stripe errors that mean "try again with the same key"."""
+    if getattr(exc, "http_status", None) in TRANSIENT_HTTP_STATUSES:
+        return True
+    return isinstance(exc, (ConnectionError, TimeoutError)) or (
+        type(exc).__name__ in ("APIConnectionError", "RateLimitError")
+    )
+
+
+def _amount_cents(amount) -> int:
+    """Dollars to integer cents without float rounding (19.99 → 1999)."""
+    return int((Decimal(str(amount or 0)) * 100).quantize(Decimal("1"), ROUND_HALF_UP))
+
+
+def _outcome(txn: dict, attempt_number: int, **fields) -> RetryOutcome:
+    member_id = txn.get("member_id")
+    return RetryOutcome(
+        transaction_id=str(txn.get("id", "")),
+        member_id=str(member_id) if member_id is not None else None,
+        attempt_number=attempt_number,
+        **fields,
+    )
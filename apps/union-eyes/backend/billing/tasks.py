@@ -6,6 +6,14 @@ Migrated from BullMQ scheduled jobs:
   - frontend/lib/jobs/dues-reminder-scheduler.ts → send_dues_reminders_task
   - frontend/lib/jobs/failed-payment-retry.ts   → retry_failed_payments_task
 
+The billing scheduler fans out as a chord: run_billing_scheduler_task splits
+the orgs into shards of BILLING_SCHEDULER_SHARD_SIZE, bill_org_shard bills
+each shard (one idempotent BillingRun row per org and period), and
+summarize_billing_run totals the compact shard tallies.
+
+Dues reminders stream due transactions from a server-side cursor and enqueue
+one send_notification_batch_task per DUES_REMINDER_BATCH_SIZE members.
+
 Beat schedule (in config/settings.py):
   monthly-billing         crontab(hour=0, minute=0, day_of_month=1)
   weekly-billing          crontab(hour=0, minute=0, day_of_week=1)
@@ -14,11 +22,14 @@ Beat schedule (in config/settings.py):
 """
 
 import logging
-from datetime import date, timedelta
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Literal, Optional
+from itertools import groupby
+from typing import Iterable, Iterator, List, Literal, Optional
 
-from celery import shared_task
+from celery import chord, shared_task
+from django.conf import settings
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -32,6 +43,14 @@ BillingFrequency = Literal["monthly", "bi-weekly", "weekly"]
 # Options: max_retries=2, time_limit=1800 (30 min)
 # ---------------------------------------------------------------------------
 
+#: Hard time limit of one shard; a BillingRun left 'running' longer than this
+#: belongs to a dead worker and may be claimed again.
+BILLING_SHARD_TIME_LIMIT = 900
+
+#: Failed org ids carried in shard and run summaries (the rest are counted).
+MAX_REPORTED_FAILURES = 50
+
+
 @shared_task(
     bind=True,
     name="billing.tasks.run_billing_scheduler_task",
@@ -42,62 +61,136 @@ BillingFrequency = Literal["monthly", "bi-weekly", "weekly"]
     time_limit=1800,
     soft_time_limit=1680,
 )
-def run_billing_scheduler_task(self, frequency: BillingFrequency):
+def run_billing_scheduler_task(self, frequency: BillingFrequency, period: Optional[str] = None):
     """
     Run automated billing for all organizations of the given billing frequency.
 
     Mirrors BillingScheduler.runScheduledBilling() in billing-scheduler.ts.
+    Dispatches a chord of bill_org_shard tasks and returns immediately; the
+    run summary is produced by summarize_billing_run.
 
     Args:
         frequency: 'monthly', 'bi-weekly', or 'weekly'
+        period: ISO start date of the billing period (default: the current one)
     """
     start_time = timezone.now()
-    logger.info("Starting billing scheduler: frequency=%s", frequency)
-
-    result = {
-        "frequency": frequency,
-        "total_organizations": 0,
-        "successful": 0,
-        "failed": 0,
-        "skipped": 0,
-        "results": [],
-        "executed_at": start_time.isoformat(),
-    }
+    period = period or _billing_period(frequency, start_time.date()).isoformat()
+    logger.info("Starting billing scheduler: frequency=%s period=%s", frequency, period)
 
     try:
-        orgs = _get_organizations_for_billing(frequency)
-        result["total_organizations"] = len(orgs)
-        logger.info("Found %d organizations for %s billing", len(orgs), frequency)
-
-        for org in orgs:
-            org_result = _process_org_billing(org, frequency)
-            result["results"].append(org_result)
-
-            if org_result.get("skipped"):
-                result["skipped"] += 1
-            elif org_result.get("success"):
-                result["successful"] += 1
-            else:
-                result["failed"] += 1
-
-        elapsed_ms = int((timezone.now() - start_time).total_seconds() * 1000)
-        result["execution_time_ms"] = elapsed_ms
-
-        # Notify admins if any failures
-        if result["failed"] > 0:
-            _notify_billing_failure(frequency, result)
+        org_ids = _get_org_ids_for_billing(frequency)
+        size = settings.BILLING_SCHEDULER_SHARD_SIZE
+        shards = [org_ids[i : i + size] for i in range(0, len(org_ids), size)]
+        if shards:
+            chord(
+                bill_org_shard.s(org_ids=shard, frequency=frequency, period=period)
+                for shard in shards
+            )(
+                summarize_billing_run.s(
+                    frequency=frequency, period=period, started_at=start_time.isoformat()
+                )
+            )
 
         logger.info(
-            "Billing scheduler complete: freq=%s total=%d ok=%d fail=%d skip=%d elapsed=%dms",
-            frequency, result["total_organizations"],
-            result["successful"], result["failed"],
-            result["skipped"], elapsed_ms,
+            "Billing scheduler dispatched: freq=%s period=%s orgs=%d shards=%d",
+            frequency, period, len(org_ids), len(shards),
         )
-        return result
+        return {
+            "status": "dispatched",
+            "frequency": frequency,
+            "period": period,
+            "total_organizations": len(org_ids),
+            "shards": len(shards),
+            "executed_at": start_time.isoformat(),
+        }
 
     except Exception as exc:  # noqa: BLE001
         logger.error("Billing scheduler failed: frequency=%s error=%s", frequency, exc)
-        raise self.retry(exc=exc)
+        # Keep the period fixed so a retry after midnight bills the same cycle.
+        raise self.retry(exc=exc, args=(frequency,), kwargs={"period": period})
+
+
+@shared_task(
+    bind=True,
+    name="billing.tasks.bill_org_shard",
+    queue="billing",
+    max_retries=2,
+    default_retry_delay=60,
+    acks_late=True,
+    time_limit=BILLING_SHARD_TIME_LIMIT,
+    soft_time_limit=BILLING_SHARD_TIME_LIMIT - 60,
+)
+def bill_org_shard(self, *, org_ids: List[str], frequency: BillingFrequency, period: str) -> dict:
+    """
+    Chord header — bill one shard of organizations.
+
+    Each org is claimed through its BillingRun row before billing and the
+    outcome is written straight after, so a retried or redelivered shard
+    only bills orgs that have not finished for this period.  If the shard
+    fails, claims it never billed go back to 'pending' for the retry.
+    """
+    tally = BillingTally(organizations=len(org_ids))
+    claimed: List[str] = []
+    billed = 0  # claimed[:billed] went through the billing service
+    try:
+        claimed = _claim_billing_runs(org_ids, frequency, period, tally)
+        for org_id in claimed:
+            org_result = _bill_org(org_id, frequency)
+            billed += 1
+            tally.add(_record_org_billing(org_id, frequency, period, org_result))
+        return tally.as_dict()
+
+    except Exception as exc:  # noqa: BLE001
+        _release_billing_runs(claimed[billed:], frequency, period)
+        if billed > tally.processed:
+            # Billed, but the outcome was not written: re-billing could charge
+            # twice, so the claim stays 'running' for an operator to settle.
+            logger.error(
+                "Billing outcome not recorded for org %s (%s) — left running",
+                claimed[billed - 1], period,
+            )
+        if self.request.retries < self.max_retries:
+            logger.warning("Billing shard failed (%d orgs), retrying: %s", len(org_ids), exc)
+            raise self.retry(exc=exc)
+        logger.exception("Billing shard failed (%d orgs)", len(org_ids))
+        tally.failed += tally.organizations - tally.processed
+        return tally.as_dict()
+
+
+@shared_task(
+    name="billing.tasks.summarize_billing_run",
+    queue="billing",
+)
+def summarize_billing_run(
+    shard_results: List[dict], *, frequency: BillingFrequency, period: str, started_at: str
+) -> dict:
+    """Chord callback — total the shard tallies and notify admins on failures."""
+    tally = BillingTally()
+    for shard in shard_results:
+        tally.merge(shard)
+
+    totals = tally.as_dict()
+    elapsed = timezone.now() - datetime.fromisoformat(started_at)
+    result = {
+        "frequency": frequency,
+        "period": period,
+        "total_organizations": totals.pop("organizations"),
+        **totals,
+        "executed_at": started_at,
+        "execution_time_ms": int(elapsed.total_seconds() * 1000),
+    }
+
+    if result["failed"] > 0:
+        _notify_billing_failure(frequency, result)
+
+    logger.info(
+        "Billing scheduler complete: freq=%s period=%s total=%d ok=%d fail=%d skip=%d "
+        "already=%d elapsed=%dms",
+        frequency, period, result["total_organizations"], result["successful"],
+        result["failed"], result["skipped"], result["already_billed"],
+        result["execution_time_ms"],
+    )
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -106,6 +199,16 @@ def run_billing_scheduler_task(self, frequency: BillingFrequency):
 # Options: runs daily at 09:00 UTC
 # ---------------------------------------------------------------------------
 
+#: Rows pulled per round trip from the dues reminder cursor.
+DUES_REMINDER_FETCH_SIZE = 2000
+
+DUES_REMINDER_TITLES = {
+    "7day":    "Dues Payment Due in 7 Days",
+    "1day":    "Dues Payment Due Tomorrow",
+    "overdue": "Dues Payment Overdue",
+}
+
+
 @shared_task(
     bind=True,
     name="billing.tasks.send_dues_reminders_task",
@@ -124,6 +227,10 @@ def send_dues_reminders_task(self):
       - On overdue date
 
     Mirrors DuesReminderScheduler.runReminderJob() in dues-reminder-scheduler.ts.
+    Transactions are streamed from a server-side cursor ordered by member,
+    grouped into one reminder per member and reminder type, and enqueued as
+    send_notification_batch_task messages of DUES_REMINDER_BATCH_SIZE
+    recipients.
     """
     logger.info("Starting dues reminder job")
 
@@ -131,6 +238,8 @@ def send_dues_reminders_task(self):
         "total_processed": 0,
         "reminders_sent": 0,
         "reminders_failed": 0,
+        "members_notified": 0,
+        "batches_enqueued": 0,
         "breakdown": {
             "seven_day_reminders": 0,
             "one_day_reminders": 0,
@@ -143,39 +252,24 @@ def send_dues_reminders_task(self):
         seven_days_out = today + timedelta(days=7)
         one_day_out = today + timedelta(days=1)
 
-        # --- 7-day reminders ---
-        pending_7day = _get_transactions_due_on(seven_days_out)
-        for txn in pending_7day:
-            result["total_processed"] += 1
-            if _send_dues_reminder(txn, reminder_type="7day"):
-                result["reminders_sent"] += 1
-                result["breakdown"]["seven_day_reminders"] += 1
-            else:
-                result["reminders_failed"] += 1
-
-        # --- 1-day reminders ---
-        pending_1day = _get_transactions_due_on(one_day_out)
-        for txn in pending_1day:
-            result["total_processed"] += 1
-            if _send_dues_reminder(txn, reminder_type="1day"):
-                result["reminders_sent"] += 1
-                result["breakdown"]["one_day_reminders"] += 1
-            else:
-                result["reminders_failed"] += 1
-
-        # --- Overdue notices ---
-        overdue = _get_overdue_transactions(cutoff=today)
-        for txn in overdue:
-            result["total_processed"] += 1
-            if _send_dues_reminder(txn, reminder_type="overdue"):
-                result["reminders_sent"] += 1
-                result["breakdown"]["overdue_notices"] += 1
-            else:
-                result["reminders_failed"] += 1
+        reminder_passes = (
+            ("7day", "seven_day_reminders", _get_transactions_due_on(seven_days_out)),
+            ("1day", "one_day_reminders", _get_transactions_due_on(one_day_out)),
+            ("overdue", "overdue_notices", _get_overdue_transactions(cutoff=today)),
+        )
+        for reminder_type, breakdown_key, transactions in reminder_passes:
+            counts = _send_dues_reminders(transactions, reminder_type)
+            result["total_processed"] += counts["transactions"]
+            result["reminders_sent"] += counts["sent"]
+            result["reminders_failed"] += counts["failed"]
+            result["members_notified"] += counts["members"]
+            result["batches_enqueued"] += counts["batches"]
+            result["breakdown"][breakdown_key] += counts["sent"]
 
         logger.info(
-            "Dues reminders complete: processed=%d sent=%d failed=%d",
-            result["total_processed"], result["reminders_sent"], result["reminders_failed"],
+            "Dues reminders complete: processed=%d sent=%d failed=%d batches=%d",
+            result["total_processed"], result["reminders_sent"],
+            result["reminders_failed"], result["batches_enqueued"],
         )
         return result
 
@@ -212,6 +306,9 @@ def retry_failed_payments_task(self):
       Attempt 3 → Day 3
       Attempt 4 → Day 7
       After 4   → mark for admin intervention
+
+    Charges go through billing.payment_retry.PaymentRetryEngine: a bounded,
+    rate-limited thread pool with one idempotency key per attempt.
     """
     RETRY_DAYS = {1: 1, 2: 3, 3: 7}   # attempt_number → days_after_failure
     MAX_ATTEMPTS = 4
@@ -228,10 +325,14 @@ def retry_failed_payments_task(self):
     }
 
     try:
+        from billing.payment_retry import PaymentRetryEngine
+
         transactions = _get_transactions_needing_retry()
         result["total_processed"] = len(transactions)
         logger.info("Found %d transactions needing retry", len(transactions))
 
+        attempts = []
+        admin_required = []
         for txn in transactions:
             metadata = txn.get("metadata", {}) or {}
             failure_count = int(metadata.get("failure_count", 0))
@@ -241,8 +342,7 @@ def retry_failed_payments_task(self):
 
             if not should_retry["retry"]:
                 if should_retry.get("max_attempts_reached"):
-                    _mark_for_admin_intervention(txn["id"], failure_count)
-                    result["marked_for_admin"] += 1
+                    admin_required.append(txn["id"])
                     result["results"].append({
                         "transaction_id": txn["id"],
                         "member_id": txn.get("member_id"),
@@ -251,30 +351,21 @@ def retry_failed_payments_task(self):
                     })
                 continue
 
-            result["retries_attempted"] += 1
-            try:
-                retry_result = _attempt_payment_retry(txn)
-                if retry_result["success"]:
-                    result["retries_succeeded"] += 1
-                else:
-                    result["retries_failed"] += 1
-
-                result["results"].append({
-                    "transaction_id": txn["id"],
-                    "member_id": txn.get("member_id"),
-                    "attempt_number": failure_count + 1,
-                    "result": "retried",
-                    **retry_result,
-                })
-            except Exception as exc:  # noqa: BLE001
+            attempts.append((txn, failure_count + 1))
+
+        if admin_required:
+            _mark_for_admin_intervention(admin_required)
+            result["marked_for_admin"] = len(admin_required)
+
+        # Stripe calls run on a bounded, rate-limited pool; outcomes are
+        # written back in bulk as they complete.
+        result["retries_attempted"] = len(attempts)
+        for outcome in PaymentRetryEngine().run(attempts):
+            if outcome.success:
+                result["retries_succeeded"] += 1
+            else:
                 result["retries_failed"] += 1
-                result["results"].append({
-                    "transaction_id": txn["id"],
-                    "member_id": txn.get("member_id"),
-                    "attempt_number": failure_count + 1,
-                    "result": "error",
-                    "error": str(exc),
-                })
+            result["results"].append(outcome.as_result())
 
         logger.info(
             "Failed payment retry complete: processed=%d attempted=%d succeeded=%d admin=%d",
@@ -292,25 +383,172 @@ def retry_failed_payments_task(self):
 # Internal helpers  (stubs — wire to real DB models as they become available)
 # ---------------------------------------------------------------------------
 
-def _get_organizations_for_billing(frequency: BillingFrequency) -> list[dict]:
-    """Return a list of org dicts configured for this billing frequency."""
+@dataclass
+class BillingTally:
+    """Running totals for a billing run — replaces the per-org results list.
+
+    ``already_billed`` counts orgs whose BillingRun for the period had
+    finished (or was in flight on another worker) when the shard started.
+    """
+
+    organizations: int = 0
+    successful: int = 0
+    failed: int = 0
+    skipped: int = 0
+    already_billed: int = 0
+    transactions_created: int = 0
+    total_amount: Decimal = Decimal("0")
+    failed_org_ids: List[str] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.successful + self.failed + self.skipped + self.already_billed
+
+    def add(self, org_result: dict) -> None:
+        if org_result.get("skipped"):
+            self.skipped += 1
+        elif org_result.get("success"):
+            self.successful += 1
+            self.transactions_created += int(org_result.get("transactions_created", 0))
+            self.total_amount += Decimal(str(org_result.get("total_amount", "0")))
+        else:
+            self.failed += 1
+            self._note_failure(org_result["organization_id"])
+
+    def merge(self, shard: dict) -> None:
+        for name in ("organizations", "successful", "failed", "skipped",
+                     "already_billed", "transactions_created"):
+            setattr(self, name, getattr(self, name) + shard.get(name, 0))
+        self.total_amount += Decimal(shard.get("total_amount", "0"))
+        for org_id in shard.get("failed_org_ids", ()):
+            self._note_failure(org_id)
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "total_amount": str(self.total_amount)}
+
+    def _note_failure(self, org_id: str) -> None:
+        if len(self.failed_org_ids) < MAX_REPORTED_FAILURES:
+            self.failed_org_ids.append(org_id)
+
+
+def _billing_period(frequency: BillingFrequency, today: date) -> date:
+    """First day of the billing period containing ``today``."""
+    if frequency == "monthly":
+        return today.replace(day=1)
+    week_start = today - timedelta(days=today.weekday())
+    if frequency == "bi-weekly" and week_start.isocalendar()[1] % 2:
+        week_start -= timedelta(days=7)
+    return week_start
+
+
+def _get_org_ids_for_billing(frequency: BillingFrequency) -> list[str]:
+    """Return the ids of orgs configured for this billing frequency, in id order."""
     try:
         from billing.models import OrganizationBillingConfigs
 
         qs = OrganizationBillingConfigs.objects.filter(billing_frequency=frequency)
-        return [
-            {
-                "organization_id": str(obj.id),
-                "organization_name": str(obj.id),
-                "frequency": frequency,
-                "enabled": True,
-            }
-            for obj in qs
-        ]
+        return [str(pk) for pk in qs.order_by("id").values_list("id", flat=True)]
     except Exception:  # noqa: BLE001
         return []
 
 
+def _claim_billing_runs(
+    org_ids: List[str], frequency: BillingFrequency, period: str, tally: BillingTally
+) -> List[str]:
+    """Create missing BillingRun rows and claim the ones still to bill.
+
+    Pending and failed runs are claimable, as are 'running' rows older than
+    a shard's time limit (their worker died).  Rows locked by a concurrent
+    claim are left to that worker.
+    """
+    from django.db import transaction
+    from django.db.models import F, Q
+
+    from billing.models import BillingRun
+
+    period_start = date.fromisoformat(period)
+    BillingRun.objects.bulk_create(
+        [
+            BillingRun(organization_id=org_id, frequency=frequency, period_start=period_start)
+            for org_id in org_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+    now = timezone.now()
+    stale = now - timedelta(seconds=BILLING_SHARD_TIME_LIMIT)
+    with transaction.atomic():
+        claimable = list(
+            BillingRun.objects.select_for_update(skip_locked=True)
+            .filter(frequency=frequency, period_start=period_start, organization_id__in=org_ids)
+            .filter(Q(status__in=("pending", "failed")) | Q(status="running", started_at__lt=stale))
+            .values_list("id", "organization_id")
+        )
+        BillingRun.objects.filter(id__in=[pk for pk, _ in claimable]).update(
+            status="running", attempts=F("attempts") + 1, started_at=now, error=""
+        )
+
+    tally.already_billed += len(org_ids) - len(claimable)
+    claimed = {str(org_id) for _, org_id in claimable}
+    return [org_id for org_id in org_ids if org_id in claimed]
+
+
+def _release_billing_runs(org_ids: List[str], frequency: BillingFrequency, period: str) -> None:
+    """Hand claims a failed shard never billed back to 'pending'."""
+    if not org_ids:
+        return
+    from billing.models import BillingRun
+
+    try:
+        BillingRun.objects.filter(
+            organization_id__in=org_ids,
+            frequency=frequency,
+            period_start=date.fromisoformat(period),
+            status="running",
+        ).update(status="pending", started_at=None)
+    except Exception as exc:  # noqa: BLE001
+        # Left 'running': taken over once older than the shard time limit.
+        logger.error("Could not release %d billing claims: %s", len(org_ids), exc)
+
+
+def _bill_org(org_id: str, frequency: BillingFrequency) -> dict:
+    """Run one claimed org through the billing service."""
+    return _process_org_billing(
+        {
+            "organization_id": org_id,
+            "organization_name": org_id,
+            "frequency": frequency,
+            "enabled": True,
+        },
+        frequency,
+    )
+
+
+def _record_org_billing(
+    org_id: str, frequency: BillingFrequency, period: str, org_result: dict
+) -> dict:
+    """Record one org's billing outcome on its BillingRun."""
+    from billing.models import BillingRun
+
+    if org_result.get("skipped"):
+        status = "skipped"
+    elif org_result.get("success"):
+        status = "succeeded"
+    else:
+        status = "failed"
+
+    BillingRun.objects.filter(
+        organization_id=org_id, frequency=frequency, period_start=date.fromisoformat(period)
+    ).update(
+        status=status,
+        transactions_created=int(org_result.get("transactions_created", 0)),
+        total_amount=Decimal(str(org_result.get("total_amount", "0"))),
+        error=org_result.get("error", "") if status == "failed" else "",
+        finished_at=timezone.now(),
+    )
+    return org_result
+
+
 def _process_org_billing(org: dict, frequency: BillingFrequency) -> dict:
     """Process a billing cycle for one organization. Returns a result dict."""
     if not org.get("enabled"):
@@ -361,84 +599,144 @@ def _notify_billing_failure(frequency: str, result: dict) -> None:
         logger.warning("Could not send billing failure notification: %s", exc)
 
 
-def _get_transactions_due_on(due_date: date) -> list[dict]:
-    """Return pending transactions due on the given date."""
-    try:
-        from django.db import connection
-
-        with connection.cursor() as cur:
-            cur.execute(
-                """
-                SELECT id, member_id, amount, due_date
-                FROM   dues_transactions
-                WHERE  status   = 'pending'
-                  AND  due_date = %s
-                """,
-                [due_date],
-            )
-            cols = [c.name for c in cur.description]
-            return [dict(zip(cols, row)) for row in cur.fetchall()]
-    except Exception:  # noqa: BLE001
-        return []
+def _get_transactions_due_on(due_date: date) -> Iterator[dict]:
+    """Stream pending transactions due on the given date, ordered by member."""
+    return _stream_rows(
+        """
+        SELECT id, member_id, amount, due_date
+        FROM   dues_transactions
+        WHERE  status   = 'pending'
+          AND  due_date = %s
+        ORDER  BY member_id, due_date, id
+        """,
+        [due_date],
+    )
+
+
+def _get_overdue_transactions(cutoff: date) -> Iterator[dict]:
+    """Stream transactions that passed their due date and are still unpaid, ordered by member."""
+    return _stream_rows(
+        """
+        SELECT id, member_id, amount, due_date
+        FROM   dues_transactions
+        WHERE  status   IN ('pending', 'overdue')
+          AND  due_date < %s
+        ORDER  BY member_id, due_date, id
+        """,
+        [cutoff],
+    )
+
+
+def _stream_rows(sql: str, params: list) -> Iterator[dict]:
+    """
+    Yield rows as dicts, DUES_REMINDER_FETCH_SIZE at a time.
 
+    Uses a named (server-side) cursor on PostgreSQL unless the database sets
+    DISABLE_SERVER_SIDE_CURSORS (transaction-pooling PgBouncer).  A query
+    failure ends the stream, like the empty list the old fetchall returned.
+    """
+    from django.db import connection
 
-def _get_overdue_transactions(cutoff: date) -> list[dict]:
-    """Return transactions that passed their due date and are still unpaid."""
     try:
-        from django.db import connection
+        if connection.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+            cursor = connection.cursor()
+        else:
+            cursor = connection.chunked_cursor()
+        with cursor as cur:
+            cur.execute(sql, params)
+            cols = [c[0] for c in cur.description]
+            while True:
+                rows = cur.fetchmany(DUES_REMINDER_FETCH_SIZE)
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(zip(cols, row))
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Dues reminder query failed: %s", exc)
 
-        with connection.cursor() as cur:
-            cur.execute(
-                """
-                SELECT id, member_id, amount, due_date
-                FROM   dues_transactions
-                WHERE  status   IN ('pending', 'overdue')
-                  AND  due_date < %s
-                """,
-                [cutoff],
-            )
-            cols = [c.name for c in cur.description]
-            return [dict(zip(cols, row)) for row in cur.fetchall()]
-    except Exception:  # noqa: BLE001
-        return []
 
+def _send_dues_reminders(transactions: Iterable[dict], reminder_type: str) -> dict:
+    """
+    Group a member-ordered transaction stream into one reminder per member and
+    enqueue them in batches of DUES_REMINDER_BATCH_SIZE recipients.
 
-def _send_dues_reminder(txn: dict, reminder_type: str) -> bool:
-    """Dispatch a dues reminder notification for a transaction."""
-    try:
-        from notifications.tasks import send_notification_task
+    Returns transaction, member and batch counts; ``sent``/``failed`` count
+    transactions, as the per-transaction reminders did.
+    """
+    counts = {"transactions": 0, "members": 0, "batches": 0, "sent": 0, "failed": 0}
+    batch: list[dict] = []
+    batch_transactions = 0
+
+    def flush() -> None:
+        nonlocal batch, batch_transactions
+        if _enqueue_reminder_batch(batch, reminder_type):
+            counts["batches"] += 1
+            counts["sent"] += batch_transactions
+        else:
+            counts["failed"] += batch_transactions
+        batch, batch_transactions = [], 0
+
+    for member_id, rows in groupby(transactions, key=lambda txn: txn["member_id"]):
+        member_txns = list(rows)
+        counts["transactions"] += len(member_txns)
+        counts["members"] += 1
+        batch.append(_dues_reminder_recipient(member_id, member_txns, reminder_type))
+        batch_transactions += len(member_txns)
+        if len(batch) >= settings.DUES_REMINDER_BATCH_SIZE:
+            flush()
+    if batch:
+        flush()
+    return counts
+
+
+def _dues_reminder_recipient(member_id, txns: list[dict], reminder_type: str) -> dict:
+    """Build one member's entry in a send_notification_batch_task message."""
+    total = sum((Decimal(str(txn.get("amount") or "0.00")) for txn in txns), Decimal("0.00"))
+    due_date = min(txn["due_date"] for txn in txns)
+    when = "overdue" if reminder_type == "overdue" else f"due {due_date}"
+    if len(txns) == 1:
+        message = f"Your dues payment of ${total} is {when}."
+    else:
+        message = f"Your {len(txns)} dues payments totalling ${total} are {when}."
+    return {
+        "user_id": str(member_id),
+        "message": message,
+        "data": {
+            "transaction_ids": [str(txn["id"]) for txn in txns],
+            "reminder_type": reminder_type,
+            "due_date": str(due_date),
+        },
+    }
 
-        titles = {
-            "7day":   "Dues Payment Due in 7 Days",
-            "1day":   "Dues Payment Due Tomorrow",
-            "overdue": "Dues Payment Overdue",
-        }
 
-        send_notification_task.apply_async(
+def _enqueue_reminder_batch(recipients: list[dict], reminder_type: str) -> bool:
+    """Enqueue one batch notification message for a list of reminder recipients."""
+    try:
+        from notifications.tasks import send_notification_batch_task
+
+        send_notification_batch_task.apply_async(
             kwargs={
-                "user_id": str(txn.get("member_id", "")),
-                "title":   titles.get(reminder_type, "Dues Reminder"),
-                "message": (
-                    f"Your dues payment of ${txn.get('amount', '0.00')} "
-                    f"is {'overdue' if reminder_type == 'overdue' else f'due {txn.get(\"due_date\", \"soon\")}'}."
-                ),
+                "title": DUES_REMINDER_TITLES.get(reminder_type, "Dues Reminder"),
                 "channels": ["email", "in-app"],
-                "data": {
-                    "transaction_id": str(txn.get("id", "")),
-                    "reminder_type":  reminder_type,
-                    "due_date":       str(txn.get("due_date", "")),
-                },
+                "recipients": recipients,
             },
             queue="notifications",
         )
         return True
     except Exception as exc:  # noqa: BLE001
-        logger.error("Failed to send dues reminder: txn=%s error=%s", txn.get("id"), exc)
+        logger.error(
+            "Failed to enqueue dues reminder batch: type=%s size=%d error=%s",
+            reminder_type, len(recipients), exc,
+        )
         return False
 
 
 def _get_transactions_needing_retry() -> list[dict]:
-    """Return failed/overdue transactions that are eligible for payment retry."""
+    """Return failed/overdue transactions for the retry job.
+
+    Includes those that have used up their attempts, so the job can hand
+    them to admin intervention (which moves them out of this set).
+    """
     try:
         from django.db import connection
 
@@ -448,10 +746,6 @@ def _get_transactions_needing_retry() -> list[dict]:
                 SELECT id, member_id, amount, metadata
                 FROM   dues_transactions
                 WHERE  status IN ('failed', 'overdue')
-                  AND  (
-                        metadata->>'failure_count' IS NULL
-                    OR  (metadata->>'failure_count')::int < 4
-                  )
                 """
             )
             cols = [c.name for c in cur.description]
@@ -487,60 +781,8 @@ def _should_retry_payment(
     return {"retry": (date.today() - last).days >= days_required}
 
 
-def _attempt_payment_retry(txn: dict) -> dict:
-    """
-    Attempt to charge the payment method on file via Stripe.
-
-    Requires STRIPE_SECRET_KEY in the environment.
-    Uses the payment_method stored on the dues_transaction.
-    """
-    import os
-
-    stripe_key = os.environ.get("STRIPE_SECRET_KEY")
-    if not stripe_key:
-        logger.warning("STRIPE_SECRET_KEY not configured — payment retry skipped for %s", txn.get("id"))
-        return {"success": False, "reason": "payment_processor_not_configured"}
-
-    try:
-        import stripe
-
-        stripe.api_key = stripe_key
-        amount_cents = int(float(txn.get("amount", 0)) * 100)
-        currency = txn.get("currency", "cad").lower()
-        payment_method = txn.get("payment_method_id") or txn.get("stripe_payment_method_id")
-        customer_id = txn.get("stripe_customer_id")
-
-        if not payment_method or not customer_id:
-            logger.warning("Transaction %s missing payment_method or customer — cannot retry", txn.get("id"))
-            return {"success": False, "reason": "missing_payment_method"}
-
-        intent = stripe.PaymentIntent.create(
-            amount=amount_cents,
-            currency=currency,
-            customer=customer_id,
-            payment_method=payment_method,
-            confirm=True,
-            off_session=True,
-            metadata={
-                "transaction_id": str(txn.get("id", "")),
-                "retry": "true",
-            },
-        )
-
-        if intent.status in ("succeeded", "requires_capture"):
-            logger.info("Payment retry succeeded for transaction %s (intent %s)", txn.get("id"), intent.id)
-            return {"success": True, "payment_intent_id": intent.id}
-
-        logger.warning("Payment retry intent status=%s for transaction %s", intent.status, txn.get("id"))
-        return {"success": False, "reason": f"intent_status_{intent.status}", "payment_intent_id": intent.id}
-
-    except Exception as exc:  # noqa: BLE001
-        logger.error("Payment retry failed for transaction %s: %s", txn.get("id"), exc)
-        return {"success": False, "reason": str(exc)}
-
-
-def _mark_for_admin_intervention(transaction_id: str, failure_count: int) -> None:
-    """Flag a transaction as requiring manual admin action."""
+def _mark_for_admin_intervention(transaction_ids: list) -> None:
+    """Flag transactions as requiring manual admin action (one UPDATE)."""
     try:
         from django.db import connection
 
@@ -550,15 +792,15 @@ def _mark_for_admin_intervention(transaction_id: str, failure_count: int) -> Non
                 UPDATE dues_transactions
                 SET    status    = 'admin_required',
                        updated_at = NOW()
-                WHERE  id = %s
+                WHERE  id = ANY(%s::uuid[])
                 """,
-                [transaction_id],
+                [[str(txn_id) for txn_id in transaction_ids]],
             )
         logger.warning(
-            "Transaction %s marked for admin intervention after %d failures",
-            transaction_id, failure_count,
+            "%d transactions marked for admin intervention after max retries",
+            len(transaction_ids),
         )
     except Exception as exc:  # noqa: BLE001
         logger.error(
-            "Could not mark transaction %s for admin: %s", transaction_id, exc
+            "Could not mark %d transactions for admin: %s", len(transaction_ids), exc
         )
@@ -6,8 +6,14 @@ Beat scheduler:
     celery -A config beat -l info --scheduler django_celery_beat.schedulers:DatabaseScheduler
 """
 import os
+import time
 
 from celery import Celery
+from celery.signals import (
+    before_task_publish,
+    worker_init,
+    worker_process_shutdown,
+)
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
@@ -18,6 +24,36 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Auto-discover tasks.py in every INSTALLED_APP.
 app.autodiscover_tasks()
+# …and in the sub-packages of the "services" app, which discovery skips.
+app.autodiscover_tasks(
+    [
+        "services.compliance_snapshot",
+        "services.events",
+        "services.evidence_pack",
+        "services.integration_control_plane",
+    ]
+)
+
+
+@before_task_publish.connect
+def _stamp_sent_at(headers=None, **kwargs):
+    """Stamp publish time so workers can record queue wait."""
+    if headers is not None:
+        headers.setdefault("sent_at", time.time())
+
+
+@worker_init.connect
+def _cleanup_metric_files(**kwargs):
+    from observability.multiprocess import cleanup_dead_processes
+
+    cleanup_dead_processes()
+
+
+@worker_process_shutdown.connect
+def _archive_metric_file(pid=None, **kwargs):
+    from observability.multiprocess import mark_process_dead
+
+    mark_process_dead(pid or os.getpid())
 
 
 @app.task(bind=True, ignore_result=True)
@@ -0,0 +1,26 @@
+"""Gunicorn configuration for Union Eyes.
+
+Started with:
+    gunicorn -c config/gunicorn.conf.py config.wsgi:application
+
+When ``METRICS_MULTIPROC_DIR`` is set, every worker writes metrics to its own
+file in that directory (see ``observability.multiprocess``); these hooks keep
+the directory tidy across restarts and worker recycling.
+"""
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "4"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "120"))
+
+
+def on_starting(server):
+    from observability.multiprocess import wipe_host_files
+
+    wipe_host_files()
+
+
+def child_exit(server, worker):
+    from observability.multiprocess import mark_process_dead
+
+    mark_process_dead(worker.pid)
@@ -132,6 +132,11 @@ CLERK_JWKS_URL = os.environ.get("CLERK_JWKS_URL")
 CLERK_SECRET_KEY = os.environ.get("CLERK_SECRET_KEY")
 CLERK_PUBLISHABLE_KEY = os.environ.get("CLERK_PUBLISHABLE_KEY")
 CLERK_WEBHOOK_SECRET = os.environ.get("CLERK_WEBHOOK_SECRET")
+# Signing keys are cached process-wide and refreshed in the background.
+CLERK_JWKS_LIFESPAN = int(os.environ.get("CLERK_JWKS_LIFESPAN", "3600"))
+# Verified token payloads are reused for this long (never past ``exp``).
+CLERK_TOKEN_CACHE_TTL = int(os.environ.get("CLERK_TOKEN_CACHE_TTL", "60"))
+CLERK_TOKEN_CACHE_SIZE = int(os.environ.get("CLERK_TOKEN_CACHE_SIZE", "2048"))
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/1")
 
@@ -224,28 +229,43 @@ CELERY_TASK_ROUTES = {
     "notifications.tasks.send_email_digest_task": {"queue": "email"},
     "notifications.tasks.send_sms_task": {"queue": "sms"},
     "notifications.tasks.send_notification_task": {"queue": "notifications"},
+    "notifications.tasks.send_notification_batch_task": {"queue": "notifications"},
     "analytics.tasks.generate_report_task": {"queue": "reports"},
     "core.tasks.cleanup_task": {"queue": "cleanup"},
     "billing.tasks.run_billing_scheduler_task": {"queue": "billing"},
+    "billing.tasks.bill_org_shard": {"queue": "billing"},
+    "billing.tasks.summarize_billing_run": {"queue": "billing"},
     "billing.tasks.send_dues_reminders_task": {"queue": "billing"},
     "billing.tasks.retry_failed_payments_task": {"queue": "billing"},
     # Integration control plane
     "services.integration_control_plane.tasks.dispatch_integration": {
         "queue": "integration_queue"
     },
+    "integration_control_plane.dispatch_integration_batch": {
+        "queue": "integration_queue"
+    },
     "services.integration_control_plane.tasks.retry_integration": {
         "queue": "integration_retry_queue"
     },
     "services.integration_control_plane.tasks.send_to_dead_letter": {
         "queue": "integration_dead_letter_queue"
     },
+    "integration_control_plane.purge_idempotency_keys": {"queue": "cleanup"},
+    "integration_control_plane.release_parked": {"queue": "integration_queue"},
+    "integration_control_plane.flush_health": {"queue": "integration_queue"},
     # Event bus
     "services.events.tasks.process_event_task": {"queue": "notifications"},
+    "events.process_event_batch": {"queue": "notifications"},
+    "events.relay_outbox": {"queue": "notifications"},
     # Compliance snapshots
     "compliance_snapshot.capture_daily": {"queue": "reports"},
     "compliance_snapshot.capture_monthly": {"queue": "reports"},
     "compliance_snapshot.capture_quarterly": {"queue": "reports"},
     "compliance_snapshot.capture_on_demand": {"queue": "reports"},
+    "compliance_snapshot.capture_shard": {"queue": "reports"},
+    "compliance_snapshot.capture_summary": {"queue": "reports"},
+    # Evidence packs
+    "evidence_pack.build": {"queue": "reports"},
 }
 
 # ---------------------------------------------------------------------------
@@ -281,6 +301,30 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": crontab(hour=3, minute=30, day_of_week=0),
         "kwargs": {"target": "sessions", "older_than_days": 90},
     },
+    # ---------- batched audit-chain writer (enqueue_audit_log) ------------
+    "link-queued-audit-logs": {
+        "task": "core.tasks.link_audit_logs_task",
+        "schedule": 10.0,  # seconds
+    },
+    # ---------- integration circuit breaker ------------------------------
+    "release-parked-integration-deliveries": {
+        "task": "integration_control_plane.release_parked",
+        "schedule": 5.0,  # seconds
+    },
+    "flush-integration-health": {
+        "task": "integration_control_plane.flush_health",
+        "schedule": 30.0,  # seconds
+    },
+    # ---------- integration idempotency-key sweeper ----------------------
+    "hourly-purge-integration-idempotency-keys": {
+        "task": "integration_control_plane.purge_idempotency_keys",
+        "schedule": crontab(minute=15),  # 15 * * * *
+    },
+    # ---------- event outbox relay (safety net for missed on_commit kicks) -
+    "relay-event-outbox": {
+        "task": "events.relay_outbox",
+        "schedule": 5.0,  # seconds
+    },
     # ---------- billing scheduler (was: BillingScheduler) ------------------
     "monthly-billing": {
         "task": "billing.tasks.run_billing_scheduler_task",
@@ -399,3 +443,56 @@ LOGGING = {
 # Webhook / signing configuration
 WEBHOOK_DEFAULT_SECRET = os.environ.get("WEBHOOK_DEFAULT_SECRET", SECRET_KEY)
 REQUEST_SIGNING_SECRET = os.environ.get("REQUEST_SIGNING_SECRET", SECRET_KEY)
+
+# Evidence packs — artifacts hashed and inserted per bulk_create batch
+EVIDENCE_PACK_BATCH_SIZE = int(os.environ.get("EVIDENCE_PACK_BATCH_SIZE", "1000"))
+
+# Event bus — events per broker message published by the outbox relay
+EVENT_OUTBOX_BATCH_SIZE = int(os.environ.get("EVENT_OUTBOX_BATCH_SIZE", "500"))
+# Seconds between on-commit relay kicks; the 5 s beat relays the rest
+EVENT_OUTBOX_KICK_INTERVAL = int(os.environ.get("EVENT_OUTBOX_KICK_INTERVAL", "1"))
+
+# Integration delivery engine (services.integration_control_plane.delivery).
+# Per-integration overrides: metadata["max_concurrency"], metadata["timeout_seconds"].
+INTEGRATION_DELIVERY_WORKERS = int(os.environ.get("INTEGRATION_DELIVERY_WORKERS", "32"))
+INTEGRATION_DELIVERY_CONCURRENCY = int(os.environ.get("INTEGRATION_DELIVERY_CONCURRENCY", "4"))
+INTEGRATION_DELIVERY_TIMEOUT = float(os.environ.get("INTEGRATION_DELIVERY_TIMEOUT", "10"))
+INTEGRATION_DELIVERY_MAX_TIMEOUT = float(os.environ.get("INTEGRATION_DELIVERY_MAX_TIMEOUT", "30"))
+INTEGRATION_DELIVERY_BUDGET = float(os.environ.get("INTEGRATION_DELIVERY_BUDGET", "60"))
+INTEGRATION_HTTP_POOL_HOSTS = int(os.environ.get("INTEGRATION_HTTP_POOL_HOSTS", "50"))
+INTEGRATION_HTTP_POOL_SIZE = int(os.environ.get("INTEGRATION_HTTP_POOL_SIZE", "32"))
+
+# Integration delivery idempotency (services.integration_control_plane.idempotency)
+INTEGRATION_IDEMPOTENCY_CLAIM_TTL = int(os.environ.get("INTEGRATION_IDEMPOTENCY_CLAIM_TTL", "300"))
+INTEGRATION_IDEMPOTENCY_TTL_HOURS = int(os.environ.get("INTEGRATION_IDEMPOTENCY_TTL_HOURS", "24"))
+INTEGRATION_IDEMPOTENCY_PURGE_BATCH = int(
+    os.environ.get("INTEGRATION_IDEMPOTENCY_PURGE_BATCH", "5000")
+)
+
+# Integration circuit breaker (services.integration_control_plane.circuit).
+# Opens when the rolling window holds >= MIN_REQUESTS outcomes and at least
+# FAILURE_RATE of them failed; stays open OPEN_SECONDS, doubling per re-trip.
+INTEGRATION_CIRCUIT_WINDOW = int(os.environ.get("INTEGRATION_CIRCUIT_WINDOW", "60"))
+INTEGRATION_CIRCUIT_BUCKETS = int(os.environ.get("INTEGRATION_CIRCUIT_BUCKETS", "6"))
+INTEGRATION_CIRCUIT_MIN_REQUESTS = int(os.environ.get("INTEGRATION_CIRCUIT_MIN_REQUESTS", "10"))
+INTEGRATION_CIRCUIT_FAILURE_RATE = float(os.environ.get("INTEGRATION_CIRCUIT_FAILURE_RATE", "0.5"))
+INTEGRATION_CIRCUIT_OPEN_SECONDS = int(os.environ.get("INTEGRATION_CIRCUIT_OPEN_SECONDS", "30"))
+INTEGRATION_CIRCUIT_MAX_OPEN_SECONDS = int(
+    os.environ.get("INTEGRATION_CIRCUIT_MAX_OPEN_SECONDS", "600")
+)
+INTEGRATION_PARKED_RELEASE_BATCH = int(os.environ.get("INTEGRATION_PARKED_RELEASE_BATCH", "500"))
+INTEGRATION_HEALTH_FLUSH_BATCH = int(os.environ.get("INTEGRATION_HEALTH_FLUSH_BATCH", "500"))
+
+# Compliance snapshots — organizations per bulk-capture shard (chord header task)
+COMPLIANCE_SNAPSHOT_SHARD_SIZE = int(os.environ.get("COMPLIANCE_SNAPSHOT_SHARD_SIZE", "500"))
+
+# Billing scheduler — organizations per bill_org_shard task (chord header)
+BILLING_SCHEDULER_SHARD_SIZE = int(os.environ.get("BILLING_SCHEDULER_SHARD_SIZE", "500"))
+
+# Dues reminders — recipients per send_notification_batch_task message
+DUES_REMINDER_BATCH_SIZE = int(os.environ.get("DUES_REMINDER_BATCH_SIZE", "500"))
+
+# Failed-payment retries — concurrent Stripe calls and the job's share of the
+# account's API rate limit (Stripe allows 100 requests/s in live mode)
+PAYMENT_RETRY_CONCURRENCY = int(os.environ.get("PAYMENT_RETRY_CONCURRENCY", "8"))
+PAYMENT_RETRY_RATE_PER_SECOND = float(os.environ.get("PAYMENT_RETRY_RATE_PER_SECOND", "25"))
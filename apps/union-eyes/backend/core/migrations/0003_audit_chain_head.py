@@ -0,0 +1,72 @@
+"""
+Migration: per-org audit chain heads and the batched-append queue.
+
+Appends now lock one ``audit_chain_heads`` row per org (claimed with
+``UPDATE … RETURNING``) instead of the newest ``audit_logs`` row, and each
+log records its ``chain_seq``.  Existing logs keep ``chain_seq = NULL`` and
+sort before sequenced ones; heads are seeded lazily from the latest log.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_audit_hash_chain"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auditlogs",
+            name="chain_seq",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="auditlogs",
+            index=models.Index(
+                fields=["organization_id", "chain_seq"],
+                name="idx_ue_audit_logs_org_seq",
+            ),
+        ),
+        migrations.CreateModel(
+            name="AuditChainHead",
+            fields=[
+                ("organization_id", models.UUIDField(primary_key=True, serialize=False)),
+                ("last_seq", models.BigIntegerField(default=0)),
+                ("last_hash", models.CharField(blank=True, max_length=64, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "audit_chain_heads",
+                "verbose_name": "AuditChainHead",
+            },
+        ),
+        migrations.CreateModel(
+            name="PendingAuditLog",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("organization_id", models.UUIDField(blank=True, null=True)),
+                ("action", models.CharField(max_length=100)),
+                ("resource_type", models.CharField(max_length=255)),
+                ("resource_id", models.CharField(max_length=255)),
+                ("user_id", models.CharField(max_length=255)),
+                ("correlation_id", models.UUIDField(blank=True, null=True)),
+                ("details", models.JSONField(blank=True, default=dict, null=True)),
+                ("changes", models.JSONField(blank=True, default=dict, null=True)),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                ("user_agent", models.TextField(blank=True, null=True)),
+                ("enqueued_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "audit_log_queue",
+                "verbose_name": "PendingAuditLog",
+                "indexes": [
+                    models.Index(
+                        fields=["organization_id", "id"],
+                        name="idx_ue_audit_queue_org",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -185,6 +185,8 @@ class AuditLogs(BaseModel):
     # — Hash chain —
     content_hash = models.CharField(max_length=64, null=True, blank=True)
     previous_hash = models.CharField(max_length=64, null=True, blank=True)
+    # Position in the org's chain; NULL for rows written before chain heads.
+    chain_seq = models.BigIntegerField(null=True, blank=True)
 
     class Meta:
         db_table = "audit_logs"
@@ -197,6 +199,86 @@ class AuditLogs(BaseModel):
             models.Index(
                 fields=["correlation_id"], name="idx_ue_audit_logs_correlation"
             ),
+            models.Index(
+                fields=["organization_id", "chain_seq"],
+                name="idx_ue_audit_logs_org_seq",
+            ),
+        ]
+
+
+class AuditChainHead(models.Model):
+    """Tip of one organization's audit hash chain.
+
+    Appends claim the next ``chain_seq`` with ``UPDATE … RETURNING`` on this
+    row, so concurrent writers queue on one small row per org instead of
+    locking the newest AuditLogs record.  Logs without an organization chain
+    under ``core.services.NULL_ORG_CHAIN``.
+    """
+
+    organization_id = models.UUIDField(primary_key=True)
+    last_seq = models.BigIntegerField(default=0)
+    last_hash = models.CharField(max_length=64, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "audit_chain_heads"
+        verbose_name = "AuditChainHead"
+
+
+class PendingAuditLog(models.Model):
+    """Audit entry queued for the batched chain writer.
+
+    ``core.services.enqueue_audit_log`` inserts these without touching the
+    chain head; ``link_pending_audit_logs`` later hashes and appends many of
+    them to AuditLogs in one transaction.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    organization_id = models.UUIDField(null=True, blank=True)
+    action = models.CharField(max_length=100)
+    resource_type = models.CharField(max_length=255)
+    resource_id = models.CharField(max_length=255)
+    user_id = models.CharField(max_length=255)
+    correlation_id = models.UUIDField(null=True, blank=True)
+    details = models.JSONField(default=dict, null=True, blank=True)
+    changes = models.JSONField(default=dict, null=True, blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.TextField(null=True, blank=True)
+    enqueued_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "audit_log_queue"
+        verbose_name = "PendingAuditLog"
+        indexes = [
+            models.Index(
+                fields=["organization_id", "id"],
+                name="idx_ue_audit_queue_org",
+            ),
+        ]
+
+
+class ChainCheckpoint(models.Model):
+    """Last verified position of one org's hash chain.
+
+    Written by ``core.chain_verifier`` after a clean run so the next run only
+    verifies rows after ``position`` (the keyset of the last verified row).
+    """
+
+    chain = models.CharField(max_length=64)
+    org_id = models.UUIDField(null=True, blank=True)
+    position = models.JSONField()
+    last_hash = models.CharField(max_length=64)
+    verified_count = models.BigIntegerField(default=0)
+    verified_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "chain_verification_checkpoints"
+        verbose_name = "ChainCheckpoint"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["chain", "org_id"],
+                name="uq_chain_checkpoint_chain_org",
+            ),
         ]
 
 
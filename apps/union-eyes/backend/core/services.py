@@ -9,9 +9,11 @@ Aligned with NzilaOS audit invariants:
 import hashlib
 import json
 import uuid
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
 
 
 def compute_content_hash(
@@ -42,6 +44,13 @@ def compute_content_hash(
     return hashlib.sha256(payload.encode()).hexdigest()
 
 
+#: Chain-head key for audit logs written without an organization.
+NULL_ORG_CHAIN = uuid.UUID(int=0)
+
+#: Max queued entries the batched writer links per transaction.
+AUDIT_LINK_BATCH_SIZE = 500
+
+
 def create_audit_log(
     *,
     organization_id: uuid.UUID,
@@ -57,22 +66,16 @@ def create_audit_log(
 ):
     """Create a hash-chained AuditLogs record inside a transaction.
 
-    Fetches the latest record for this org to get previous_hash, then
-    computes and stores content_hash before inserting.
-    Caller must be inside transaction.atomic() to prevent race conditions.
+    Claims the next sequence number and previous_hash from the org's
+    ``AuditChainHead`` with ``UPDATE … RETURNING`` (which row-locks only the
+    head until commit), inserts the record, then advances the head's hash.
 
     Returns the saved AuditLogs instance.
     """
     from core.models import AuditLogs  # local import avoids circular deps
 
     with transaction.atomic():
-        latest = (
-            AuditLogs.objects.select_for_update()
-            .filter(organization_id=organization_id)
-            .order_by("-created_at")
-            .first()
-        )
-        previous_hash = latest.content_hash if latest else None
+        seq, previous_hash = _claim_chain_slots(organization_id, 1)
 
         content_hash = compute_content_hash(
             action=action,
@@ -80,11 +83,11 @@ def create_audit_log(
             resource_id=str(resource_id),
             user_id=str(actor_id),
             correlation_id=str(correlation_id) if correlation_id else "",
-            details=details,
+            details=details or {},  # hash what is stored, as verification does
             previous_hash=previous_hash,
         )
 
-        return AuditLogs.objects.create(
+        log = AuditLogs.objects.create(
             organization_id=organization_id,
             action=action,
             resource_type=resource_type,
@@ -97,52 +100,186 @@ def create_audit_log(
             user_agent=user_agent,
             content_hash=content_hash,
             previous_hash=previous_hash,
+            chain_seq=seq + 1,
         )
+        _advance_chain_head(organization_id, content_hash)
+        return log
+
+
+def enqueue_audit_log(
+    *,
+    organization_id: uuid.UUID,
+    actor_id: str,
+    action: str,
+    resource_type: str,
+    resource_id: str,
+    details: Any = None,
+    changes: Any = None,
+    correlation_id: Optional[uuid.UUID] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+):
+    """Queue an audit entry for the batched chain writer.
+
+    A plain INSERT with no chain lock, for high-volume call sites that do
+    not need the hashed record immediately.  The ``core.link_audit_logs``
+    task links queued entries in enqueue order; their ``created_at`` is the
+    link time and ``PendingAuditLog.enqueued_at`` is not carried over.
+
+    Returns the saved PendingAuditLog instance.
+    """
+    from core.models import PendingAuditLog
+
+    return PendingAuditLog.objects.create(
+        organization_id=organization_id,
+        action=action,
+        resource_type=resource_type,
+        resource_id=str(resource_id),
+        user_id=str(actor_id),
+        correlation_id=correlation_id,
+        details=details or {},
+        changes=changes or {},
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+
 
+def link_pending_audit_logs(
+    organization_id: Optional[uuid.UUID], batch_size: int = AUDIT_LINK_BATCH_SIZE
+) -> int:
+    """Append up to *batch_size* queued entries for one org in one transaction.
 
-def verify_audit_chain(organization_id: uuid.UUID) -> dict:
+    The chain head is claimed once for the whole batch, hashes are computed
+    in memory and the records are bulk-inserted.  Returns the number linked.
+    """
+    from core.models import AuditLogs, PendingAuditLog
+
+    with transaction.atomic():
+        pending = list(
+            PendingAuditLog.objects.select_for_update(skip_locked=True)
+            .filter(organization_id=organization_id)
+            .order_by("id")[:batch_size]
+        )
+        if not pending:
+            return 0
+
+        seq, previous_hash = _claim_chain_slots(organization_id, len(pending))
+        records = []
+        for entry in pending:
+            seq += 1
+            content_hash = compute_content_hash(
+                action=entry.action,
+                resource_type=entry.resource_type,
+                resource_id=entry.resource_id,
+                user_id=entry.user_id,
+                correlation_id=str(entry.correlation_id) if entry.correlation_id else "",
+                details=entry.details or {},
+                previous_hash=previous_hash,
+            )
+            records.append(
+                AuditLogs(
+                    organization_id=organization_id,
+                    action=entry.action,
+                    resource_type=entry.resource_type,
+                    resource_id=entry.resource_id,
+                    user_id=entry.user_id,
+                    correlation_id=entry.correlation_id,
+                    details=entry.details or {},
+                    changes=entry.changes or {},
+                    ip_address=entry.ip_address,
+                    user_agent=entry.user_agent,
+                    content_hash=content_hash,
+                    previous_hash=previous_hash,
+                    chain_seq=seq,
+                )
+            )
+            previous_hash = content_hash
+
+        AuditLogs.objects.bulk_create(records)
+        _advance_chain_head(organization_id, previous_hash)
+        PendingAuditLog.objects.filter(pk__in=[e.pk for e in pending]).delete()
+        return len(records)
+
+
+def _claim_chain_slots(
+    organization_id: Optional[uuid.UUID], count: int
+) -> Tuple[int, Optional[str]]:
+    """Reserve *count* sequence numbers on the org's chain head.
+
+    Returns ``(seq_before, last_hash)``; the head row stays locked until the
+    surrounding transaction ends.  A missing head is seeded from the newest
+    existing AuditLogs record (one-off, for orgs with pre-head history).
+    """
+    from core.models import AuditChainHead
+
+    head_key = organization_id or NULL_ORG_CHAIN
+    head_param = AuditChainHead._meta.pk.get_db_prep_value(head_key, connection)
+    table = connection.ops.quote_name(AuditChainHead._meta.db_table)
+    sql = (
+        f"UPDATE {table} SET last_seq = last_seq + %s, updated_at = %s "
+        f"WHERE organization_id = %s RETURNING last_seq, last_hash"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [count, timezone.now(), head_param])
+        row = cursor.fetchone()
+        if row is None:
+            _seed_chain_head(organization_id, head_key)
+            cursor.execute(sql, [count, timezone.now(), head_param])
+            row = cursor.fetchone()
+    last_seq, last_hash = row
+    return last_seq - count, last_hash
+
+
+def _seed_chain_head(organization_id: Optional[uuid.UUID], head_key: uuid.UUID) -> None:
+    from core.models import AuditChainHead, AuditLogs
+
+    latest = (
+        AuditLogs.objects.filter(organization_id=organization_id)
+        .order_by(F("chain_seq").desc(nulls_last=True), "-created_at")
+        .values("content_hash", "chain_seq")
+        .first()
+    )
+    AuditChainHead.objects.bulk_create(
+        [
+            AuditChainHead(
+                organization_id=head_key,
+                last_seq=(latest or {}).get("chain_seq") or 0,
+                last_hash=(latest or {}).get("content_hash"),
+            )
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def _advance_chain_head(organization_id: Optional[uuid.UUID], content_hash: str) -> None:
+    from core.models import AuditChainHead
+
+    AuditChainHead.objects.filter(
+        organization_id=organization_id or NULL_ORG_CHAIN
+    ).update(last_hash=content_hash)
+
+
+def verify_audit_chain(
+    organization_id: uuid.UUID, *, full: bool = False, workers: int = 1
+) -> dict:
     """Verify the integrity of the audit log hash chain for an org.
 
+    Resumes after the last verified checkpoint unless ``full`` is set;
+    ``workers > 1`` verifies chain segments in parallel processes
+    (see ``core.chain_verifier``).
+
     Returns:
         {'valid': True, 'count': N}
         or {'valid': False, 'broken_at_id': '<uuid>', 'broken_at_index': N, 'count': N}
     """
-    from core.models import AuditLogs
-
-    records = list(
-        AuditLogs.objects.filter(organization_id=organization_id)
-        .order_by("created_at")
-        .values(
-            "id",
-            "action",
-            "resource_type",
-            "resource_id",
-            "user_id",
-            "correlation_id",
-            "details",
-            "content_hash",
-            "previous_hash",
-        )
-    )
+    from core.chain_verifier import verify_chain
 
-    prev_hash = None
-    for idx, rec in enumerate(records):
-        expected = compute_content_hash(
-            action=rec["action"] or "",
-            resource_type=rec["resource_type"] or "",
-            resource_id=str(rec["resource_id"] or ""),
-            user_id=str(rec["user_id"] or ""),
-            correlation_id=str(rec["correlation_id"] or ""),
-            details=rec["details"],
-            previous_hash=prev_hash,
-        )
-        if rec["content_hash"] != expected:
-            return {
-                "valid": False,
-                "broken_at_id": str(rec["id"]),
-                "broken_at_index": idx,
-                "count": len(records),
-            }
-        prev_hash = rec["content_hash"]
-
-    return {"valid": True, "count": len(records)}
+    result = verify_chain("audit_logs", organization_id, full=full, workers=workers)
+    if result.valid:
+        return {"valid": True, "count": result.count}
+    return {
+        "valid": False,
+        "broken_at_id": str(result.broken_row["id"]),
+        "broken_at_index": result.broken_index,
+        "count": result.count,
+    }
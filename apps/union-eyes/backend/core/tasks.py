@@ -5,7 +5,7 @@ Migrated from BullMQ workers:
   - frontend/lib/workers/cleanup-worker.ts → cleanup_task
 
 Queue routing:
-  cleanup queue → cleanup_task
+  cleanup queue → cleanup_task, link_audit_logs_task
 
 Cleanup targets (mirrors BullMQ CleanupJobData):
   logs        → Archive audit logs older than N days (immutable audit trail)
@@ -192,3 +192,40 @@ def _cleanup_exports(older_than_days: int, **_) -> dict:
 
     logger.info("Deleted %d export files older than %d days", deleted, older_than_days)
     return {"deleted": deleted}
+
+
+# ---------------------------------------------------------------------------
+# Task: link_audit_logs_task
+# Batched audit-chain writer for entries queued via enqueue_audit_log().
+# Only one writer per org makes progress at a time (queue rows are claimed
+# with SKIP LOCKED and the chain head is row-locked), so overlapping beat
+# runs are harmless.
+# ---------------------------------------------------------------------------
+
+@shared_task(
+    name="core.tasks.link_audit_logs_task",
+    queue="cleanup",
+    acks_late=True,
+    ignore_result=True,
+)
+def link_audit_logs_task(max_batches_per_org: int = 20) -> dict:
+    """Hash-chain queued audit entries into AuditLogs, one batch per transaction."""
+    from core.models import PendingAuditLog
+    from core.services import link_pending_audit_logs
+
+    org_ids = list(
+        PendingAuditLog.objects.order_by()
+        .values_list("organization_id", flat=True)
+        .distinct()
+    )
+    linked = 0
+    for org_id in org_ids:
+        for _ in range(max_batches_per_org):
+            count = link_pending_audit_logs(org_id)
+            linked += count
+            if not count:
+                break
+
+    if linked:
+        logger.info("Linked %d queued audit logs across %d orgs", linked, len(org_ids))
+    return {"linked": linked, "orgs": len(org_ids)}
@@ -6,17 +6,32 @@ Provides configurable throttling at three levels:
   2. **Organization-based** — fair-use across organizations
   3. **API-key-based** — per-key limits
 
-Uses Django's cache framework (Redis-backed) with a sliding-window counter.
+All applicable buckets are checked in a single Redis round trip by a Lua
+script implementing a sliding-window *counter*: each key keeps one integer
+for the current fixed window and one for the previous, and the request count
+is estimated as ``previous × (unelapsed fraction) + current``.  Memory is O(1)
+per key regardless of request rate.
+
+A per-process token bucket in front of Redis rejects clients that are
+already over limit from this worker's traffic alone, without a network hop.
+If Redis is unavailable the middleware fails open to those local buckets.
+
+Responses carry ``RateLimit-Limit`` / ``RateLimit-Remaining`` /
+``RateLimit-Reset`` for the most constrained bucket, plus ``Retry-After``
+on 429.
 """
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import math
+import threading
 import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 from django.conf import settings
-from django.core.cache import cache
 from django.http import HttpRequest, JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
@@ -36,6 +51,12 @@ RATE_LIMIT_EXEMPT_PATHS: list[str] = [
     "/metrics",
 ]
 
+# Max identifiers tracked by each process's local token buckets.
+LOCAL_BUCKET_MAX_ENTRIES = 10_000
+
+# After a Redis error, skip Redis for this long before trying again.
+REDIS_RETRY_INTERVAL = 5.0
+
 
 def _get_config() -> dict:
     return getattr(settings, "RATE_LIMIT_CONFIG", RATE_LIMIT_DEFAULTS)
@@ -53,41 +74,239 @@ def _cache_key(bucket: str, identifier: str) -> str:
     return f"rl:{bucket}:{hashed}"
 
 
-def _is_rate_limited(bucket: str, identifier: str, limit: int, window: int) -> bool:
+# ---------------------------------------------------------------------------
+# Redis sliding-window counter (one round trip for all buckets)
+# ---------------------------------------------------------------------------
+
+# KEYS: (current window key, previous window key) per bucket
+# ARGV: now_ms, then (limit, window_ms, window_start_ms) per bucket
+# Returns: {denied bucket index or 0, retry_after_ms, estimate_1, estimate_2, ...}
+# Nothing is counted when a request is denied.
+SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local n = #KEYS / 2
+local denied, retry_after = 0, 0
+local estimates = {}
+for i = 1, n do
+  local limit = tonumber(ARGV[3 * i - 1])
+  local window = tonumber(ARGV[3 * i])
+  local elapsed = now - tonumber(ARGV[3 * i + 1])
+  local curr = tonumber(redis.call('GET', KEYS[2 * i - 1]) or '0')
+  local prev = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+  local estimate = prev * (window - elapsed) / window + curr
+  estimates[i] = estimate
+  if denied == 0 and estimate + 1 > limit then
+    denied = i
+    if curr + 1 > limit then
+      retry_after = window - elapsed
+    else
+      -- until the previous window's weighted share has decayed enough
+      retry_after = window * (1 - (limit - curr - 1) / prev) - elapsed
+    end
+  end
+end
+if denied == 0 then
+  for i = 1, n do
+    redis.call('INCR', KEYS[2 * i - 1])
+    redis.call('PEXPIRE', KEYS[2 * i - 1], 2 * tonumber(ARGV[3 * i]))
+    estimates[i] = estimates[i] + 1
+  end
+end
+local result = {denied, math.ceil(math.max(retry_after, 0))}
+for i = 1, n do
+  result[2 + i] = math.ceil(estimates[i])
+end
+return result
+"""
+
+_redis_lock = threading.Lock()
+_redis_script = None
+_redis_retry_at = 0.0
+
+
+def _get_redis():
+    """Return the default cache's Redis client (django-redis)."""
+    from django_redis import get_redis_connection
+
+    return get_redis_connection("default")
+
+
+def _sliding_window_script():
+    """Registered script for the current Redis client, or None while backing off."""
+    global _redis_script, _redis_retry_at
+    if _redis_script is not None:
+        return _redis_script
+    if time.monotonic() < _redis_retry_at:
+        return None
+    with _redis_lock:
+        if _redis_script is None:
+            try:
+                _redis_script = _get_redis().register_script(SLIDING_WINDOW_LUA)
+            except Exception as exc:
+                _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+                logger.warning("Rate limiter: Redis unavailable (%s)", exc)
+        return _redis_script
+
+
+def _redis_failed(exc: Exception) -> None:
+    global _redis_script, _redis_retry_at
+    _redis_script = None
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+    logger.warning("Rate limiter: Redis call failed, using local buckets (%s)", exc)
+
+
+def reset_rate_limiter() -> None:
+    """Forget the Redis script and local buckets (tests)."""
+    global _redis_script, _redis_retry_at
+    with _redis_lock:
+        _redis_script = None
+        _redis_retry_at = 0.0
+    _local_buckets.clear()
+
+
+# ---------------------------------------------------------------------------
+# Per-process token bucket
+# ---------------------------------------------------------------------------
+
+
+class LocalTokenBuckets:
+    """Size-bounded token buckets (capacity ``limit``, refill ``limit/window``).
+
+    A worker only sees part of a client's traffic, so an empty local bucket
+    means the client is over the global limit too — those requests can be
+    rejected without asking Redis.
     """
-    Sliding-window counter.  Returns True if *identifier* has exceeded *limit*
-    requests in the last *window* seconds.
+
+    def __init__(self, max_entries: int = LOCAL_BUCKET_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, limit: int, window: float) -> float:
+        """Take one token; return 0 on success, else seconds until one refills."""
+        rate = limit / window
+        now = time.monotonic()
+        with self._lock:
+            state = self._buckets.get(key)
+            if state is None:
+                state = [float(limit), now]
+                self._buckets[key] = state
+                while len(self._buckets) > self.max_entries:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                state[0] = min(float(limit), state[0] + (now - state[1]) * rate)
+                state[1] = now
+            if state[0] >= 1:
+                state[0] -= 1
+                return 0.0
+            return (1 - state[0]) / rate
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+_local_buckets = LocalTokenBuckets()
+
+
+# ---------------------------------------------------------------------------
+# Decision
+# ---------------------------------------------------------------------------
+
+
+class RateLimitResult:
+    """Outcome of a rate-limit check, with the values for response headers."""
+
+    __slots__ = ("bucket", "limited", "limit", "remaining", "reset", "retry_after")
+
+    def __init__(
+        self,
+        bucket: str,
+        limited: bool,
+        limit: int,
+        remaining: int,
+        reset: int,
+        retry_after: int = 0,
+    ):
+        self.bucket = bucket
+        self.limited = limited
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        self.retry_after = retry_after
+
+    def headers(self) -> dict:
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(self.reset),
+        }
+        if self.limited:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
+
+def check_rate_limits(
+    checks: List[Tuple[str, str, int, int]],
+) -> Optional[RateLimitResult]:
+    """Check ``(bucket, identifier, limit, window)`` tuples in one pass.
+
+    Returns the denying bucket's result, or — when allowed — the result for
+    the bucket with the fewest remaining requests.
     """
-    key = _cache_key(bucket, identifier)
-    now = time.time()
-    window_start = now - window
+    if not checks:
+        return None
+
+    for bucket, identifier, limit, window in checks:
+        wait = _local_buckets.take(_cache_key(bucket, identifier), limit, window)
+        if wait:
+            _log_exceeded(bucket, identifier)
+            retry_after = max(1, math.ceil(wait))
+            return RateLimitResult(bucket, True, limit, 0, retry_after, retry_after)
 
-    # Use atomic pipeline when available (django-redis).
+    script = _sliding_window_script()
+    if script is None:
+        return None  # local buckets only
     try:
-        from django_redis import get_redis_connection
-
-        conn = get_redis_connection("default")
-        pipe = conn.pipeline()
-        pipe.zremrangebyscore(key, 0, window_start)
-        pipe.zadd(key, {str(now): now})
-        pipe.zcard(key)
-        pipe.expire(key, window)
-        results = pipe.execute()
-        count = results[2]
-    except Exception:
-        # Fallback: simple counter via Django cache.
-        count = cache.get(key, 0) + 1
-        cache.set(key, count, timeout=window)
-
-    if count > limit:
-        logger.warning(
-            "Rate limit exceeded: bucket=%s id=%s count=%d",
-            bucket,
-            identifier[:8],
-            count,
+        return _check_redis(script, checks)
+    except Exception as exc:
+        _redis_failed(exc)
+        return None
+
+
+def _check_redis(script, checks: List[Tuple[str, str, int, int]]) -> RateLimitResult:
+    now_ms = int(time.time() * 1000)
+    keys: List[str] = []
+    args: List[int] = [now_ms]
+    resets: List[int] = []
+    for bucket, identifier, limit, window in checks:
+        window_ms = window * 1000
+        index = now_ms // window_ms
+        base = _cache_key(bucket, identifier)
+        keys += [f"{base}:{index}", f"{base}:{index - 1}"]
+        args += [limit, window_ms, index * window_ms]
+        resets.append(math.ceil(((index + 1) * window_ms - now_ms) / 1000))
+
+    denied, retry_after_ms, *estimates = script(keys=keys, args=args)
+
+    if denied:
+        bucket, identifier, limit, _ = checks[denied - 1]
+        _log_exceeded(bucket, identifier)
+        retry_after = max(1, math.ceil(retry_after_ms / 1000))
+        return RateLimitResult(
+            bucket, True, limit, 0, resets[denied - 1], retry_after
         )
-        return True
-    return False
+
+    results = [
+        RateLimitResult(bucket, False, limit, max(0, limit - estimate), reset)
+        for (bucket, _, limit, _), estimate, reset in zip(checks, estimates, resets)
+    ]
+    return min(results, key=lambda r: r.remaining)
+
+
+def _log_exceeded(bucket: str, identifier: str) -> None:
+    logger.warning("Rate limit exceeded: bucket=%s id=%s", bucket, identifier[:8])
 
 
 class RateLimitMiddleware(MiddlewareMixin):
@@ -104,34 +323,41 @@ class RateLimitMiddleware(MiddlewareMixin):
 
         # 1 — IP-based
         ip_cfg = cfg.get("ip", RATE_LIMIT_DEFAULTS["ip"])
-        if _is_rate_limited(
-            "ip", _client_ip(request), ip_cfg["limit"], ip_cfg["window"]
-        ):
-            return _rate_limit_response("ip")
+        checks = [("ip", _client_ip(request), ip_cfg["limit"], ip_cfg["window"])]
 
         # 2 — Organization-based
         org_id = getattr(request, "organization_id", None)
         if org_id:
             org_cfg = cfg.get("org", RATE_LIMIT_DEFAULTS["org"])
-            if _is_rate_limited(
-                "org", str(org_id), org_cfg["limit"], org_cfg["window"]
-            ):
-                return _rate_limit_response("org")
+            checks.append(("org", str(org_id), org_cfg["limit"], org_cfg["window"]))
 
         # 3 — API-key
         api_key = request.META.get("HTTP_X_API_KEY")
         if api_key:
             key_cfg = cfg.get("api_key", RATE_LIMIT_DEFAULTS["api_key"])
-            if _is_rate_limited(
-                "api_key", api_key, key_cfg["limit"], key_cfg["window"]
-            ):
-                return _rate_limit_response("api_key")
+            checks.append(("api_key", api_key, key_cfg["limit"], key_cfg["window"]))
 
+        result = check_rate_limits(checks)
+        if result is None:
+            return None
+        if result.limited:
+            return _rate_limit_response(result)
+        request._rate_limit = result
         return None
 
+    def process_response(self, request: HttpRequest, response):
+        result = getattr(request, "_rate_limit", None)
+        if result is not None:
+            for header, value in result.headers().items():
+                response[header] = value
+        return response
+
 
-def _rate_limit_response(bucket: str) -> JsonResponse:
-    return JsonResponse(
-        {"error": "rate_limit_exceeded", "bucket": bucket},
+def _rate_limit_response(result: RateLimitResult) -> JsonResponse:
+    response = JsonResponse(
+        {"error": "rate_limit_exceeded", "bucket": result.bucket},
         status=429,
     )
+    for header, value in result.headers().items():
+        response[header] = value
+    return response
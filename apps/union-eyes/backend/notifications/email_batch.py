@@ -0,0 +1,136 @@
+"""
+Batch email delivery for send_email_task.
+
+send_email_task used to call send_mail once per address.  Each call opened
+and closed its own SMTP connection (connect, EHLO, STARTTLS, AUTH, QUIT) and
+re-rendered the template even when the context was identical.  EmailBatch
+holds one backend connection for the whole batch, renders each template once
+per distinct context, and hands the messages to ``send_messages`` on that
+connection.  It records a Delivery per address, so the task retries only the
+addresses that failed.
+"""
+
+import json
+import logging
+import smtplib
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+
+logger = logging.getLogger(__name__)
+
+SENT = "sent"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+@dataclass
+class Delivery:
+    """Delivery state of one address in a batch."""
+
+    email: str
+    status: str = FAILED
+    error: Optional[str] = None
+
+
+class EmailBatch:
+    """
+    Send one templated email to many addresses over a single connection.
+
+    ``render(template, context)`` and ``allowed(email)`` are the task's
+    template renderer and opt-out check; ``recipient_data`` holds
+    per-address context merged over ``data``.
+    """
+
+    def __init__(
+        self,
+        *,
+        subject: str,
+        template: str,
+        data: dict,
+        render: Callable[[str, dict], str],
+        allowed: Callable[[str], bool],
+        recipient_data: Optional[Dict[str, dict]] = None,
+        priority: int = 5,
+        connection=None,
+    ):
+        self.subject = subject
+        self.template = template
+        self.data = data
+        self.render = render
+        self.allowed = allowed
+        self.recipient_data = recipient_data or {}
+        self.priority = priority
+        self.connection = connection
+        self.renders = 0
+        self._rendered: Dict[str, str] = {}
+
+    def send(self, recipients: Iterable[str]) -> List[Delivery]:
+        """Deliver to each address once; never raises for a single address."""
+        deliveries: List[Delivery] = []
+        outgoing = []
+        for email in dict.fromkeys(recipients):
+            delivery = Delivery(email)
+            deliveries.append(delivery)
+            # Respect opt-out (skip non-critical emails)
+            if self.priority != 1 and not self.allowed(email):
+                logger.info("Skipping email — opted out: %s", email)
+                delivery.status = SKIPPED
+                continue
+            try:
+                outgoing.append((delivery, self._message(email)))
+            except Exception as exc:  # noqa: BLE001
+                delivery.error = str(exc)
+                logger.error("Failed to render email to %s: %s", email, exc)
+
+        if outgoing:
+            self._deliver(outgoing)
+        return deliveries
+
+    def _message(self, email: str) -> EmailMultiAlternatives:
+        context = {**self.data, **self.recipient_data.get(email, {})}
+        key = json.dumps(context, sort_keys=True, default=str)
+        html = self._rendered.get(key)
+        if html is None:
+            html = self._rendered[key] = self.render(self.template, context)
+            self.renders += 1
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body="",  # HTML-only; could add html2text conversion here
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[email],
+        )
+        message.attach_alternative(html, "text/html")
+        return message
+
+    def _deliver(self, outgoing: list) -> None:
+        connection = self.connection or get_connection(fail_silently=False)
+        try:
+            # Opened here, so send_messages reuses it instead of opening and
+            # closing a connection per call.
+            connection.open()
+        except Exception as exc:  # noqa: BLE001
+            for delivery, _ in outgoing:
+                delivery.error = str(exc)
+            logger.error("Could not open email connection: %s", exc)
+            return
+        try:
+            for delivery, message in outgoing:
+                # One message per call: SMTP sends each message as its own
+                # transaction anyway, and this tells which address failed.
+                try:
+                    try:
+                        connection.send_messages([message])
+                    except smtplib.SMTPServerDisconnected:
+                        connection.close()
+                        connection.open()
+                        connection.send_messages([message])
+                    delivery.status = SENT
+                    delivery.error = None
+                except Exception as exc:  # noqa: BLE001
+                    delivery.error = str(exc)
+                    logger.error("Failed to send email to %s: %s", delivery.email, exc)
+        finally:
+            connection.close()
@@ -6,10 +6,13 @@ Migrated from BullMQ workers:
   - frontend/lib/workers/sms-worker.ts       → send_sms_task
   - frontend/lib/workers/notification-worker.ts → send_notification_task
 
+send_notification_batch_task delivers one title to many recipients (e.g. the
+daily dues reminders) from a single broker message.
+
 Queue routing (set in config/settings.py):
   email queue       → send_email_task, send_email_digest_task
   sms queue         → send_sms_task
-  notifications queue → send_notification_task
+  notifications queue → send_notification_task, send_notification_batch_task
 """
 
 import logging
@@ -85,6 +88,29 @@ def _log_notification(
         logger.warning("Could not persist notification log: %s", exc)
 
 
+def _log_notifications(entries: list[dict]) -> None:
+    """
+    Persist many delivery records in one insert (best-effort).
+
+    Each entry takes the keyword arguments of _log_notification plus an
+    optional ``organization_id``.
+    """
+    if not entries:
+        return
+    try:
+        from notifications.models import NotificationLog
+
+        NotificationLog.objects.bulk_create(
+            NotificationLog(
+                organization_id=entry.get("organization_id"),
+                type=entry["channel"],
+            )
+            for entry in entries
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not persist %d notification logs: %s", len(entries), exc)
+
+
 def _check_email_preference(email: str) -> bool:
     """Return True if the recipient allows email notifications."""
     try:
@@ -140,21 +166,6 @@ def _render_email_template(template: str, data: dict) -> str:
         return f"<p><strong>{data.get('title', '')}</strong><br>{data.get('message', '')}</p>"
 
 
-def _send_via_smtp(to: str, subject: str, html: str) -> None:
-    """Deliver a single email via Django's email backend."""
-    from django.core.mail import send_mail
-
-    text_content = ""  # HTML-only; could add html2text conversion here
-    send_mail(
-        subject=subject,
-        message=text_content,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[to],
-        html_message=html,
-        fail_silently=False,
-    )
-
-
 # ---------------------------------------------------------------------------
 # Task: send_email_task
 # BullMQ equivalent: emailQueue / email-worker.ts → processEmailJob()
@@ -180,64 +191,76 @@ def send_email_task(
     data: dict,
     priority: int = 5,
     user_id: Optional[str] = None,
+    recipient_data: Optional[dict] = None,
 ):
     """
     Send an email (or batch of emails) using a named template.
 
+    The batch shares one mail connection (see notifications.email_batch);
+    a retry re-sends only to the addresses that failed.
+
     Args:
-        to:       Single address or list of addresses.
-        subject:  Email subject line.
-        template: Template key (e.g. 'welcome', 'deadline-alert').
-        data:     Template context data.
-        priority: 1 = critical (overrides opt-out), 5 = normal.
-        user_id:  Clerk user ID for audit logging.
+        to:             Single address or list of addresses.
+        subject:        Email subject line.
+        template:       Template key (e.g. 'welcome', 'deadline-alert').
+        data:           Template context data.
+        priority:       1 = critical (overrides opt-out), 5 = normal.
+        user_id:        Clerk user ID for audit logging.
+        recipient_data: Optional per-address context merged over ``data``.
     """
-    recipients = [to] if isinstance(to, str) else list(to)
-    sent = 0
-    errors = []
+    from notifications.email_batch import FAILED, SENT, EmailBatch
 
-    for email in recipients:
-        try:
-            # Respect opt-out (skip non-critical emails)
-            if priority != 1 and not _check_email_preference(email):
-                logger.info("Skipping email — opted out: %s", email)
-                _log_notification(
-                    "notifications", "email", email, subject, template, "skipped"
-                )
-                continue
-
-            html = _render_email_template(template, data)
-            _send_via_smtp(email, subject, html)
-            _log_notification(
-                "notifications",
-                "email",
-                email,
-                subject,
-                template,
-                "sent",
-                user_id=user_id,
-            )
-            sent += 1
-            logger.info("Email sent to %s (template=%s)", email, template)
+    recipient_data = recipient_data or {}
+    recipients = [to] if isinstance(to, str) else list(to)
 
-        except Exception as exc:  # noqa: BLE001
-            _log_notification(
-                "notifications",
-                "email",
-                email,
-                subject,
-                template,
-                "failed",
-                error=str(exc),
-            )
-            errors.append({"email": email, "error": str(exc)})
-            logger.error("Failed to send email to %s: %s", email, exc)
+    # One connection and one render per distinct context for the whole batch.
+    deliveries = EmailBatch(
+        subject=subject,
+        template=template,
+        data=data,
+        render=_render_email_template,
+        allowed=_check_email_preference,
+        recipient_data=recipient_data,
+        priority=priority,
+    ).send(recipients)
+
+    _log_notifications(
+        [
+            {
+                "channel": "email",
+                "recipient": d.email,
+                "subject": subject,
+                "template": template,
+                "status": d.status,
+                "error": d.error,
+                "user_id": user_id,
+            }
+            for d in deliveries
+        ]
+    )
+    sent = sum(d.status == SENT for d in deliveries)
+    failed = [d.email for d in deliveries if d.status == FAILED]
+    logger.info(
+        "Emails sent: %d/%d (template=%s, failed=%d)",
+        sent, len(recipients), template, len(failed),
+    )
 
-    if errors:
-        # Retry the whole task; Celery will pass same args
+    if failed:
+        # Retry only the failed addresses; delivered ones are not re-sent.
         raise self.retry(
-            exc=RuntimeError(f"{len(errors)}/{len(recipients)} emails failed"),
+            exc=RuntimeError(f"{len(failed)}/{len(recipients)} emails failed"),
             countdown=5 * (2**self.request.retries),  # exponential backoff
+            kwargs={
+                "to": failed,
+                "subject": subject,
+                "template": template,
+                "data": data,
+                "priority": priority,
+                "user_id": user_id,
+                "recipient_data": {
+                    email: recipient_data[email] for email in failed if email in recipient_data
+                },
+            },
         )
 
     return {"sent": sent, "total": len(recipients)}
@@ -269,7 +292,7 @@ def send_email_digest_task(self, frequency: str = "daily"):
     logger.info("Running email digest task: frequency=%s", frequency)
 
     # Placeholder: in production query UserNotificationPreferences here
-    # and call _send_via_smtp for each user.
+    # and send the digests through notifications.email_batch.EmailBatch.
     sent = 0
     logger.info("Email digest complete: sent=%d frequency=%s", sent, frequency)
     return {"sent": sent, "frequency": frequency}
@@ -451,6 +474,140 @@ def send_notification_task(
     }
 
 
+# ---------------------------------------------------------------------------
+# Task: send_notification_batch_task
+# One broker message for up to ~500 recipients sharing a title and channels;
+# each recipient carries its own message and data.
+# ---------------------------------------------------------------------------
+
+
+@shared_task(
+    bind=True,
+    name="notifications.tasks.send_notification_batch_task",
+    queue="notifications",
+    max_retries=3,
+    default_retry_delay=5,
+    acks_late=True,
+)
+def send_notification_batch_task(
+    self,
+    *,
+    title: str,
+    channels: list,  # ['email', 'sms', 'push', 'in-app']
+    recipients: list,  # [{'user_id': ..., 'message': ..., 'data': {...}}]
+):
+    """
+    Dispatch one notification per recipient across the given channels.
+
+    The batch counterpart of send_notification_task: email for the whole
+    batch goes out as a single send_email_task with per-address context,
+    in-app records are written in one bulk insert and published through one
+    Redis pipeline.  The batch is retried only when every channel failed
+    (nothing was delivered), so a retry never duplicates a notification.
+
+    Args:
+        title:      Notification headline shared by the batch.
+        channels:   List of channels to dispatch on.
+        recipients: Dicts with ``user_id``, ``message`` and optional ``data``.
+    """
+    successful_channels = []
+    failed_channels = []
+
+    for channel in channels:
+        try:
+            if channel == "email":
+                emails = {}
+                for r in recipients:
+                    data = r.get("data") or {}
+                    if data.get("email"):
+                        emails[data["email"]] = {
+                            "title": title,
+                            "message": r["message"],
+                            **data,
+                        }
+                if emails:
+                    send_email_task.apply_async(
+                        kwargs={
+                            "to": list(emails),
+                            "subject": title,
+                            "template": "notification",
+                            "data": {"title": title},
+                            "recipient_data": emails,
+                        },
+                        queue="email",
+                    )
+                if len(emails) < len(recipients):
+                    logger.warning(
+                        "No email for %d of %d recipients — skipping email",
+                        len(recipients) - len(emails), len(recipients),
+                    )
+                successful_channels.append(channel)
+
+            elif channel == "sms":
+                # Twilio sends one message per number; the sms queue's rate
+                # limit applies per message, so SMS still fans out.
+                for r in recipients:
+                    phone = (r.get("data") or {}).get("phone")
+                    if phone:
+                        send_sms_task.apply_async(
+                            kwargs={
+                                "to": phone,
+                                "message": f"{title}: {r['message']}",
+                                "user_id": r["user_id"],
+                            },
+                            queue="sms",
+                        )
+                successful_channels.append(channel)
+
+            elif channel == "in-app":
+                _create_in_app_notifications(title, recipients)
+                successful_channels.append(channel)
+
+            elif channel == "push":
+                for r in recipients:
+                    _send_push_notification(
+                        r["user_id"], title, r["message"], r.get("data") or {}
+                    )
+                successful_channels.append(channel)
+
+            else:
+                logger.warning("Unknown notification channel: %s", channel)
+
+        except Exception as exc:  # noqa: BLE001
+            logger.error(
+                "Channel %s failed for batch of %d: %s", channel, len(recipients), exc
+            )
+            failed_channels.append({"channel": channel, "error": str(exc)})
+
+    _log_notifications(
+        [
+            {
+                "channel": "multi",
+                "recipient": r["user_id"],
+                "subject": title,
+                "template": "notification",
+                "status": "sent" if not failed_channels else "partial",
+                "user_id": r["user_id"],
+                "organization_id": (r.get("data") or {}).get("organization_id"),
+            }
+            for r in recipients
+        ]
+    )
+
+    if failed_channels and len(failed_channels) == len(channels):
+        raise self.retry(
+            exc=RuntimeError(f"All channels failed for batch of {len(recipients)}"),
+            countdown=5 * (2**self.request.retries),
+        )
+
+    return {
+        "recipients": len(recipients),
+        "sent": len(successful_channels),
+        "failed": len(failed_channels),
+        "channels": successful_channels,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers for in-app / push
 # ---------------------------------------------------------------------------
@@ -499,6 +656,52 @@ def _create_in_app_notification(
         logger.warning("Redis pub/sub failed for in-app notification: %s", exc)
 
 
+def _create_in_app_notifications(title: str, recipients: list) -> None:
+    """Bulk form of _create_in_app_notification: one insert, one Redis round trip."""
+    try:
+        from notifications.models import NotificationLog
+
+        NotificationLog.objects.bulk_create(
+            NotificationLog(
+                type="in-app",
+                organization_id=(recipient.get("data") or {}).get("organization_id") or None,
+            )
+            for recipient in recipients
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not create in-app notifications: %s", exc)
+
+    try:
+        import json
+
+        import redis as _redis
+
+        r = _redis.from_url(settings.REDIS_URL)
+        pipe = r.pipeline(transaction=False)
+        now = timezone.now().isoformat()
+        for recipient in recipients:
+            data = recipient.get("data") or {}
+            org_id = data.get("organization_id", "default")
+            pipe.publish(
+                f"notifications:{org_id}:{recipient['user_id']}",
+                json.dumps(
+                    {
+                        "type": "notification",
+                        "userId": recipient["user_id"],
+                        "orgId": org_id,
+                        "title": title,
+                        "message": recipient["message"],
+                        "data": data,
+                        "timestamp": now,
+                    },
+                    default=str,
+                ),
+            )
+        pipe.execute()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Redis pub/sub failed for in-app notifications: %s", exc)
+
+
 def _send_push_notification(user_id: str, title: str, message: str, data: dict) -> None:
     """Dispatch a push notification via the existing FcmServiceViewSet logic."""
     # Delegate to the existing FCM service view logic when available.
@@ -5,43 +5,178 @@ Exposes key operational metrics at ``/metrics`` (Prometheus text format)
 and provides metric-recording helpers for application code.
 
 Metrics tracked:
-  - api_latency (histogram)
+  - api_latency (histogram, labelled by method / route template / status)
   - api_error_rate (counter)
   - integration_failures (counter)
+  - integration_delivery_ms (histogram, labelled by integration type / outcome)
+  - integration_circuit_transitions (counter, labelled by integration type / transition)
   - queue_depth (gauge — sampled periodically)
   - active_cases (gauge)
+
+Storage model:
+  - Histograms are native Prometheus histograms with fixed buckets, so each
+    series costs ``len(buckets) + 2`` floats no matter how many samples it
+    sees.  Quantiles are computed server-side (``histogram_quantile``).
+  - Counters and histograms are lock-striped: each thread writes to one of
+    ``_STRIPE_COUNT`` shards with its own lock, and ``render_prometheus``
+    merges shard snapshots without blocking writers on a global lock.
+  - Each metric is capped at ``MAX_SERIES_PER_METRIC`` label combinations;
+    further series fold into a single series whose labels are all ``other``.
+  - When ``METRICS_MULTIPROC_DIR`` is set, every write goes to this process's
+    memory-mapped file instead (see ``observability.multiprocess``) and the
+    ``/metrics`` view merges all gunicorn / Celery worker files at scrape time.
 """
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import os
+import re
 import threading
 import time
+from bisect import bisect_left
 from collections import defaultdict
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from django.http import HttpRequest, HttpResponse
 
 logger = logging.getLogger("observability.metrics")
 
 # ---------------------------------------------------------------------------
-# In-process metric store (thread-safe)
+# Configuration
 # ---------------------------------------------------------------------------
-_lock = threading.Lock()
 
-# Counters: metric_name → {labels_tuple: count}
-_counters: Dict[str, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+# Upper bounds (inclusive) in milliseconds; ``+Inf`` is implicit.
+DEFAULT_LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
 
-# Gauges: metric_name → {labels_tuple: value}
-_gauges: Dict[str, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+# Celery tasks run far longer than HTTP requests.
+TASK_DURATION_BUCKETS_MS: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS + (
+    30000,
+    60000,
+    300000,
+    900000,
+)
+
+MAX_SERIES_PER_METRIC = 1000
 
-# Histograms: metric_name → {labels_tuple: [observations]}
-_histograms: Dict[str, Dict[tuple, List[float]]] = defaultdict(
-    lambda: defaultdict(list)
+# Request methods kept as-is in labels; anything else is reported as OTHER.
+HTTP_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"}
 )
+UNMATCHED_ROUTE = "<unmatched>"
+OVERFLOW_LABEL_VALUE = "other"
+
+_STRIPE_COUNT = 16
 
-# Label names per metric.
-_label_names: Dict[str, tuple] = {}
+# ---------------------------------------------------------------------------
+# In-process metric store (lock-striped)
+# ---------------------------------------------------------------------------
+
+
+class _Stripe:
+    """One shard of counter / histogram state, guarded by its own lock."""
+
+    __slots__ = ("lock", "counters", "histograms")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # metric_name → {labels_tuple: value}
+        self.counters: Dict[str, Dict[tuple, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        # metric_name → {labels_tuple: [bucket counts..., +Inf count, sum]}
+        self.histograms: Dict[str, Dict[tuple, List[float]]] = defaultdict(dict)
+
+
+_stripes: List[_Stripe] = [_Stripe() for _ in range(_STRIPE_COUNT)]
+_stripe_counter = itertools.count()
+_thread_local = threading.local()
+
+# Gauges hold absolute values, so they live in one dict under one lock
+# (they are written far less often than counters / histograms).
+_lock = threading.Lock()
+_gauges: Dict[str, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+
+# Histogram bucket bounds per metric (sorted, without +Inf).
+_histogram_buckets: Dict[str, Tuple[float, ...]] = {}
+
+# Known label combinations per metric, for the cardinality cap.
+_registry_lock = threading.Lock()
+_series: Dict[str, Set[tuple]] = {}
+_overflow_logged: Set[str] = set()
+
+# How a gauge is combined across processes in multi-process mode.
+GAUGE_MODES = ("sum", "max", "min")
+_gauge_modes: Dict[str, str] = {}
+
+# Multi-process store for the current pid (reopened after fork).
+_mp_pid: Optional[int] = None
+_mp_store = None
+_mp_keys: Dict[tuple, str] = {}
+
+
+def _process_store():
+    """Return this process's mmap store, or None in single-process mode."""
+    global _mp_pid, _mp_store
+    pid = os.getpid()
+    if _mp_pid == pid:
+        return _mp_store
+
+    from observability import multiprocess
+
+    with _registry_lock:
+        if _mp_pid != pid:
+            directory = multiprocess.multiprocess_dir()
+            _mp_keys.clear()
+            _mp_store = None
+            if directory:
+                try:
+                    _mp_store = multiprocess.ProcessStore(directory, pid)
+                except OSError as e:
+                    logger.warning(
+                        "Cannot open metrics dir %s (%s) — using in-process metrics",
+                        directory,
+                        e,
+                    )
+            _mp_pid = pid
+    return _mp_store
+
+
+def _mp_key(name: str, key: tuple, sample: str = "") -> str:
+    cache_key = (name, key, sample)
+    encoded = _mp_keys.get(cache_key)
+    if encoded is None:
+        from observability.multiprocess import encode_key
+
+        encoded = encode_key(name, key, sample)
+        _mp_keys[cache_key] = encoded
+    return encoded
+
+
+def _stripe() -> _Stripe:
+    """Return this thread's stripe (assigned round-robin on first use)."""
+    try:
+        return _thread_local.stripe
+    except AttributeError:
+        stripe = _stripes[next(_stripe_counter) % _STRIPE_COUNT]
+        _thread_local.stripe = stripe
+        return stripe
 
 
 # ---------------------------------------------------------------------------
@@ -49,20 +184,52 @@ _label_names: Dict[str, tuple] = {}
 # ---------------------------------------------------------------------------
 
 
+def register_histogram(name: str, buckets: Sequence[float]) -> None:
+    """Configure the bucket upper bounds for histogram *name*.
+
+    Must be called before the first observation; existing series keep the
+    bucket layout they were created with.
+    """
+    bounds = tuple(sorted(float(b) for b in buckets))
+    if not bounds:
+        raise ValueError("A histogram needs at least one bucket")
+    _histogram_buckets[name] = bounds
+
+
+def register_gauge(name: str, multiprocess_mode: str = "sum") -> None:
+    """Choose how gauge *name* is combined across worker processes."""
+    if multiprocess_mode not in GAUGE_MODES:
+        raise ValueError(f"multiprocess_mode must be one of {GAUGE_MODES}")
+    _gauge_modes[name] = multiprocess_mode
+
+
 def counter_inc(
     name: str, labels: Optional[Dict[str, str]] = None, value: float = 1
 ) -> None:
     """Increment a counter."""
-    key = _labels_key(labels)
-    with _lock:
-        _counters[name][key] += value
+    _counter_inc_key(name, _labels_key(labels), value)
+
+
+def _counter_inc_key(name: str, key: tuple, value: float = 1) -> None:
+    key = _admit(name, key)
+    store = _process_store()
+    if store is not None:
+        store.inc("counter", _mp_key(name, key), value)
+        return
+    stripe = _stripe()
+    with stripe.lock:
+        stripe.counters[name][key] += value
 
 
 def gauge_set(
     name: str, labels: Optional[Dict[str, str]] = None, value: float = 0
 ) -> None:
     """Set a gauge to an absolute value."""
-    key = _labels_key(labels)
+    key = _admit(name, _labels_key(labels))
+    store = _process_store()
+    if store is not None:
+        store.set("gauge", _mp_key(name, key), value)
+        return
     with _lock:
         _gauges[name][key] = value
 
@@ -70,7 +237,11 @@ def gauge_set(
 def gauge_inc(
     name: str, labels: Optional[Dict[str, str]] = None, value: float = 1
 ) -> None:
-    key = _labels_key(labels)
+    key = _admit(name, _labels_key(labels))
+    store = _process_store()
+    if store is not None:
+        store.inc("gauge", _mp_key(name, key), value)
+        return
     with _lock:
         _gauges[name][key] += value
 
@@ -78,7 +249,11 @@ def gauge_inc(
 def gauge_dec(
     name: str, labels: Optional[Dict[str, str]] = None, value: float = 1
 ) -> None:
-    key = _labels_key(labels)
+    key = _admit(name, _labels_key(labels))
+    store = _process_store()
+    if store is not None:
+        store.inc("gauge", _mp_key(name, key), -value)
+        return
     with _lock:
         _gauges[name][key] -= value
 
@@ -86,10 +261,55 @@ def gauge_dec(
 def histogram_observe(
     name: str, value: float, labels: Optional[Dict[str, str]] = None
 ) -> None:
-    """Record an observation in a histogram."""
-    key = _labels_key(labels)
+    """Record an observation in a fixed-bucket histogram."""
+    _histogram_observe_key(name, _labels_key(labels), value)
+
+
+def _histogram_observe_key(name: str, key: tuple, value: float) -> None:
+    key = _admit(name, key)
+    buckets = _histogram_buckets.get(name, DEFAULT_LATENCY_BUCKETS_MS)
+    index = bisect_left(buckets, value)
+    store = _process_store()
+    if store is not None:
+        store.inc("histogram", _mp_key(name, key, str(index)), 1)
+        store.inc("histogram", _mp_key(name, key, "sum"), value)
+        return
+    stripe = _stripe()
+    with stripe.lock:
+        series = stripe.histograms[name].get(key)
+        if series is None:
+            series = [0.0] * (len(buckets) + 2)
+            stripe.histograms[name][key] = series
+        series[index] += 1
+        series[-1] += value
+
+
+def reset_metrics() -> None:
+    """Clear every recorded value (tests / benchmarks).
+
+    In multi-process mode this only forgets the open store; the files
+    themselves belong to the deployment and are wiped at startup.
+    """
+    global _mp_pid, _mp_store
+    for stripe in _stripes:
+        with stripe.lock:
+            stripe.counters.clear()
+            stripe.histograms.clear()
     with _lock:
-        _histograms[name][key].append(value)
+        _gauges.clear()
+    with _registry_lock:
+        _series.clear()
+        _overflow_logged.clear()
+        if _mp_store is not None:
+            _mp_store.close()
+        _mp_pid = None
+        _mp_store = None
+        _mp_keys.clear()
+
+
+def series_count(name: str) -> int:
+    """Number of distinct label combinations recorded for *name*."""
+    return len(_series.get(name, ()))
 
 
 # ---------------------------------------------------------------------------
@@ -98,21 +318,57 @@ def histogram_observe(
 
 
 def record_api_latency(method: str, path: str, status: int, latency_ms: float) -> None:
-    """Record API request latency and bump error counter if 5xx."""
-    histogram_observe(
-        "api_latency_ms",
-        latency_ms,
-        labels={"method": method, "path": _normalize_path(path), "status": str(status)},
-    )
-    counter_inc(
-        "api_requests_total",
-        labels={"method": method, "path": _normalize_path(path), "status": str(status)},
-    )
-    if status >= 500:
-        counter_inc(
-            "api_errors_total",
-            labels={"method": method, "path": _normalize_path(path)},
-        )
+    """Record API request latency for a raw *path* (UUIDs folded to ``:id``).
+
+    Request middleware uses ``record_request`` with the resolved route
+    template instead; this remains for callers that only have a path.
+    """
+    record_request(method, _normalize_path(path), status, latency_ms)
+
+
+def record_request(method: str, route: str, status: int, latency_ms: float) -> None:
+    """Record one HTTP request: latency histogram, request and 5xx counters.
+
+    Label tuples are built once per (method, route, status) and, in
+    single-process mode, all series are updated under one stripe lock.
+    """
+    latency_key, error_key = _request_label_keys(method, route, status)
+    store = _process_store()
+    if store is not None:
+        _histogram_observe_key("api_latency_ms", latency_key, latency_ms)
+        _counter_inc_key("api_requests_total", latency_key)
+        if error_key is not None:
+            _counter_inc_key("api_errors_total", error_key)
+        return
+
+    latency_key = _admit("api_latency_ms", latency_key)
+    requests_key = _admit("api_requests_total", latency_key)
+    if error_key is not None:
+        error_key = _admit("api_errors_total", error_key)
+    buckets = _histogram_buckets.get("api_latency_ms", DEFAULT_LATENCY_BUCKETS_MS)
+    index = bisect_left(buckets, latency_ms)
+    stripe = _stripe()
+    with stripe.lock:
+        series = stripe.histograms["api_latency_ms"].get(latency_key)
+        if series is None:
+            series = [0.0] * (len(buckets) + 2)
+            stripe.histograms["api_latency_ms"][latency_key] = series
+        series[index] += 1
+        series[-1] += latency_ms
+        stripe.counters["api_requests_total"][requests_key] += 1
+        if error_key is not None:
+            stripe.counters["api_errors_total"][error_key] += 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _request_label_keys(
+    method: str, route: str, status: int
+) -> Tuple[tuple, Optional[tuple]]:
+    """Sorted label tuples for the request series (and the 5xx series)."""
+    method = method if method in HTTP_METHODS else "OTHER"
+    latency_key = (("method", method), ("path", route), ("status", str(status)))
+    error_key = (("method", method), ("path", route)) if status >= 500 else None
+    return latency_key, error_key
 
 
 def record_integration_failure(integration_type: str, org_id: str) -> None:
@@ -122,6 +378,25 @@ def record_integration_failure(integration_type: str, org_id: str) -> None:
     )
 
 
+def record_integration_delivery(
+    integration_type: str, outcome: str, latency_ms: float
+) -> None:
+    """Observe one outbound integration HTTP delivery."""
+    histogram_observe(
+        "integration_delivery_ms",
+        latency_ms,
+        labels={"type": integration_type, "outcome": outcome},
+    )
+
+
+def record_integration_circuit(integration_type: str, transition: str) -> None:
+    """Count one circuit-breaker transition (opened / reopened / closed)."""
+    counter_inc(
+        "integration_circuit_transitions_total",
+        labels={"type": integration_type, "transition": transition},
+    )
+
+
 def set_queue_depth(queue_name: str, depth: int) -> None:
     gauge_set("queue_depth", labels={"queue": queue_name}, value=float(depth))
 
@@ -130,28 +405,156 @@ def set_active_cases(org_id: str, count: int) -> None:
     gauge_set("active_cases", labels={"org_id": org_id[:8]}, value=float(count))
 
 
+register_histogram(
+    "integration_delivery_ms", DEFAULT_LATENCY_BUCKETS_MS + (30000,)
+)
+register_gauge("queue_depth", multiprocess_mode="max")
+register_gauge("active_cases", multiprocess_mode="max")
+
+
+# ---------------------------------------------------------------------------
+# Celery task instrumentation
+# ---------------------------------------------------------------------------
+
+register_histogram("celery_task_duration_ms", TASK_DURATION_BUCKETS_MS)
+register_histogram("celery_task_queue_wait_ms", TASK_DURATION_BUCKETS_MS)
+
+
+@contextmanager
+def track_task(task) -> Iterator[None]:
+    """Record duration, outcome and queue wait for a bound Celery task.
+
+    Usage::
+
+        @shared_task(bind=True, ...)
+        def my_task(self, ...):
+            with track_task(self):
+                ...
+
+    Queue wait is measured from the ``sent_at`` header stamped at publish
+    time (see ``config.celery``) to task start, minus any ETA/countdown.
+    Direct (non-worker) calls are not recorded, so a task that delegates to
+    another task's function is only counted once.
+    """
+    request = task.request
+    if getattr(request, "called_directly", True):
+        yield
+        return
+
+    task_name = task.name
+    wait_ms = _queue_wait_ms(request)
+    if wait_ms is not None:
+        histogram_observe(
+            "celery_task_queue_wait_ms", wait_ms, labels={"task": task_name}
+        )
+
+    from celery.exceptions import Retry
+
+    status = "success"
+    start = time.monotonic()
+    try:
+        yield
+    except Retry:
+        status = "retry"
+        record_task_retry(task_name)
+        raise
+    except Exception:
+        status = "failure"
+        raise
+    finally:
+        histogram_observe(
+            "celery_task_duration_ms",
+            (time.monotonic() - start) * 1000,
+            labels={"task": task_name, "status": status},
+        )
+
+
+def instrument_task(fn):
+    """Decorator form of ``track_task`` for bound task functions.
+
+    Apply beneath ``@shared_task(bind=True, ...)``.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        with track_task(self):
+            return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+def record_task_retry(task_name: str) -> None:
+    """Count a retry scheduled by (or on behalf of) *task_name*."""
+    counter_inc("celery_task_retries_total", labels={"task": task_name})
+
+
+def _queue_wait_ms(request) -> Optional[float]:
+    sent_at = getattr(request, "sent_at", None)
+    if sent_at is None:
+        sent_at = (getattr(request, "headers", None) or {}).get("sent_at")
+    if sent_at is None:
+        return None
+    ready_at = float(sent_at)
+    eta = getattr(request, "eta", None)
+    if eta:
+        try:
+            ready_at = max(ready_at, datetime.fromisoformat(str(eta)).timestamp())
+        except ValueError:
+            pass
+    return max(0.0, (time.time() - ready_at) * 1000)
+
+
 # ---------------------------------------------------------------------------
 # Django middleware — auto-record latency for every request
 # ---------------------------------------------------------------------------
 
 
+def route_label(request: HttpRequest) -> str:
+    """Route template of the resolved view (``/api/cases/<uuid:pk>/``).
+
+    Requests that matched no URL pattern share one ``<unmatched>`` label, so
+    scanners probing random paths cannot blow up series cardinality.
+    """
+    match = getattr(request, "resolver_match", None)
+    route = getattr(match, "route", None)
+    if not route:
+        return UNMATCHED_ROUTE if match is None else (match.view_name or UNMATCHED_ROUTE)
+    return route if route.startswith("/") else "/" + route
+
+
+def instrument_request(request: HttpRequest, get_response) -> HttpResponse:
+    """Time ``get_response(request)`` and record the request metrics.
+
+    The single timing point for request metrics: if an outer middleware is
+    already instrumenting *request*, this just calls through.
+    """
+    if getattr(request, "_metrics_instrumented", False):
+        return get_response(request)
+    request._metrics_instrumented = True
+
+    start = time.monotonic()
+    response = get_response(request)
+    record_request(
+        request.method or "UNKNOWN",
+        route_label(request),
+        response.status_code,
+        (time.monotonic() - start) * 1000,
+    )
+    return response
+
+
 class MetricsMiddleware:
-    """Records api_latency_ms for every request."""
+    """Records request metrics only (no logging context).
+
+    ``ObservabilityMiddleware`` already records the same metrics; installing
+    both is harmless since only the outermost one times the request.
+    """
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        start = time.monotonic()
-        response = self.get_response(request)
-        elapsed_ms = (time.monotonic() - start) * 1000
-        record_api_latency(
-            method=request.method or "UNKNOWN",
-            path=request.path,
-            status=response.status_code,
-            latency_ms=elapsed_ms,
-        )
-        return response
+        return instrument_request(request, self.get_response)
 
 
 # ---------------------------------------------------------------------------
@@ -161,47 +564,127 @@ class MetricsMiddleware:
 
 def render_prometheus() -> str:
     """Render all metrics in Prometheus text exposition format."""
-    lines: List[str] = []
+    store = _process_store()
+    if store is not None:
+        return _render(*_collect_multiprocess(store.directory))
+
+    counters, histograms = _snapshot_stripes()
     with _lock:
-        # Counters
-        for name, series in sorted(_counters.items()):
-            lines.append(f"# TYPE {name} counter")
-            for labels_key, value in sorted(series.items()):
-                lbl = _format_labels(labels_key)
-                lines.append(f"{name}{lbl} {value}")
-
-        # Gauges
-        for name, series in sorted(_gauges.items()):
-            lines.append(f"# TYPE {name} gauge")
-            for labels_key, value in sorted(series.items()):
-                lbl = _format_labels(labels_key)
-                lines.append(f"{name}{lbl} {value}")
-
-        # Histograms — simplified (sum, count, quantiles)
-        for name, series in sorted(_histograms.items()):
-            lines.append(f"# TYPE {name} summary")
-            for labels_key, observations in sorted(series.items()):
-                lbl = _format_labels(labels_key)
-                if observations:
-                    sorted_obs = sorted(observations)
-                    total = sum(sorted_obs)
-                    count = len(sorted_obs)
-                    p50 = sorted_obs[int(count * 0.5)] if count else 0
-                    p95 = sorted_obs[int(count * 0.95)] if count else 0
-                    p99 = sorted_obs[int(count * 0.99)] if count else 0
-                    lines.append(f'{name}{_merge_labels(lbl, "quantile", "0.5")} {p50}')
-                    lines.append(
-                        f'{name}{_merge_labels(lbl, "quantile", "0.95")} {p95}'
-                    )
-                    lines.append(
-                        f'{name}{_merge_labels(lbl, "quantile", "0.99")} {p99}'
-                    )
-                    lines.append(f"{name}_sum{lbl} {total}")
-                    lines.append(f"{name}_count{lbl} {count}")
+        gauges = {name: dict(series) for name, series in _gauges.items()}
+    return _render(counters, gauges, histograms)
+
+
+def _render(
+    counters: Dict[str, Dict[tuple, float]],
+    gauges: Dict[str, Dict[tuple, float]],
+    histograms: Dict[str, Dict[tuple, List[float]]],
+) -> str:
+    lines: List[str] = []
+
+    # Counters
+    for name, series in sorted(counters.items()):
+        lines.append(f"# TYPE {name} counter")
+        for labels_key, value in sorted(series.items()):
+            lines.append(f"{name}{_format_labels(labels_key)} {value}")
+
+    # Gauges
+    for name, series in sorted(gauges.items()):
+        lines.append(f"# TYPE {name} gauge")
+        for labels_key, value in sorted(series.items()):
+            lines.append(f"{name}{_format_labels(labels_key)} {value}")
+
+    # Histograms — cumulative buckets, sum, count
+    for name, series in sorted(histograms.items()):
+        lines.append(f"# TYPE {name} histogram")
+        bounds = [
+            _format_bound(b)
+            for b in _histogram_buckets.get(name, DEFAULT_LATENCY_BUCKETS_MS)
+        ] + ["+Inf"]
+        for labels_key, values in sorted(series.items()):
+            lbl = _format_labels(labels_key)
+            cumulative = 0.0
+            for bound, bucket_count in zip(bounds, values[:-1]):
+                cumulative += bucket_count
+                lines.append(
+                    f"{name}_bucket{_merge_labels(lbl, 'le', bound)} {cumulative}"
+                )
+            lines.append(f"{name}_sum{lbl} {values[-1]}")
+            lines.append(f"{name}_count{lbl} {cumulative}")
 
     return "\n".join(lines) + "\n"
 
 
+def _collect_multiprocess(directory: str) -> Tuple[
+    Dict[str, Dict[tuple, float]],
+    Dict[str, Dict[tuple, float]],
+    Dict[str, Dict[tuple, List[float]]],
+]:
+    """Merge every worker's file into the shapes ``_render`` expects."""
+    from observability.multiprocess import collect
+
+    merged = collect(directory)
+
+    counters = {
+        name: {key: samples[""] for key, samples in series.items()}
+        for name, series in merged["counter"].items()
+    }
+
+    gauges: Dict[str, Dict[tuple, float]] = {}
+    for name, series in merged["gauge"].items():
+        mode = _gauge_modes.get(name, "sum")
+        combine = {"sum": sum, "max": max, "min": min}[mode]
+        gauges[name] = {
+            key: combine(per_pid.values()) for key, per_pid in series.items()
+        }
+
+    histograms: Dict[str, Dict[tuple, List[float]]] = {}
+    for name, series in merged["histogram"].items():
+        slots = len(_histogram_buckets.get(name, DEFAULT_LATENCY_BUCKETS_MS)) + 1
+        histograms[name] = {}
+        for key, samples in series.items():
+            values = [0.0] * (slots + 1)
+            for sample, value in samples.items():
+                if sample == "sum":
+                    values[-1] += value
+                else:
+                    values[min(int(sample), slots - 1)] += value
+            histograms[name][key] = values
+
+    return counters, gauges, histograms
+
+
+def _snapshot_stripes() -> Tuple[
+    Dict[str, Dict[tuple, float]], Dict[str, Dict[tuple, List[float]]]
+]:
+    """Merge every stripe into one view, holding each stripe's lock briefly."""
+    counters: Dict[str, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+    histograms: Dict[str, Dict[tuple, List[float]]] = defaultdict(dict)
+    for stripe in _stripes:
+        with stripe.lock:
+            stripe_counters = [
+                (name, list(series.items()))
+                for name, series in stripe.counters.items()
+            ]
+            stripe_histograms = [
+                (name, [(key, list(values)) for key, values in series.items()])
+                for name, series in stripe.histograms.items()
+            ]
+        for name, items in stripe_counters:
+            merged = counters[name]
+            for key, value in items:
+                merged[key] += value
+        for name, items in stripe_histograms:
+            merged_hist = histograms[name]
+            for key, values in items:
+                existing = merged_hist.get(key)
+                if existing is None:
+                    merged_hist[key] = values
+                else:
+                    for i, v in enumerate(values):
+                        existing[i] += v
+    return counters, histograms
+
+
 def metrics_view(request: HttpRequest) -> HttpResponse:
     """Django view that serves ``/metrics``."""
     body = render_prometheus()
@@ -219,13 +702,58 @@ def _labels_key(labels: Optional[Dict[str, str]]) -> tuple:
     return tuple(sorted(labels.items()))
 
 
+def _admit(name: str, key: tuple) -> tuple:
+    """Apply the per-metric cardinality cap to a labels key.
+
+    Known series take a lock-free membership check; only new series touch
+    the registry lock.  Once a metric is full, unseen label combinations map
+    to a single ``other`` series.
+    """
+    known = _series.get(name)
+    if known is not None and key in known:
+        return key
+    if known is not None and len(known) >= MAX_SERIES_PER_METRIC:
+        return _overflow_key(name, key)
+
+    with _registry_lock:
+        known = _series.setdefault(name, set())
+        if key in known:
+            return key
+        if len(known) >= MAX_SERIES_PER_METRIC:
+            return _overflow_key(name, key)
+        known.add(key)
+    return key
+
+
+def _overflow_key(name: str, key: tuple) -> tuple:
+    if name not in _overflow_logged:
+        _overflow_logged.add(name)
+        logger.warning(
+            "Metric %s exceeded %d series — folding new series into '%s'",
+            name,
+            MAX_SERIES_PER_METRIC,
+            OVERFLOW_LABEL_VALUE,
+        )
+    return tuple((label, OVERFLOW_LABEL_VALUE) for label, _ in key)
+
+
+def _escape_label_value(value) -> str:
+    return (
+        str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
 def _format_labels(labels_key: tuple) -> str:
     if not labels_key:
         return ""
-    inner = ",".join(f'{k}="{v}"' for k, v in labels_key)
+    inner = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in labels_key)
     return "{" + inner + "}"
 
 
+def _format_bound(bound: float) -> str:
+    return format(bound, "g") if bound != int(bound) else str(int(bound))
+
+
 def _merge_labels(existing: str, key: str, value: str) -> str:
     """Add an extra label to a formatted label string."""
     pair = f'{key}="{value}"'
@@ -234,12 +762,11 @@ def _merge_labels(existing: str, key: str, value: str) -> str:
     return "{" + pair + "}"
 
 
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
 def _normalize_path(path: str) -> str:
     """Replace UUID-like segments with ``:id`` to reduce cardinality."""
-    import re
-
-    return re.sub(
-        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-        ":id",
-        path,
-    )
+    return _UUID_RE.sub(":id", path)
@@ -9,12 +9,11 @@ Add to ``settings.MIDDLEWARE``::
 
 from __future__ import annotations
 
-import time
 from uuid import uuid4
 
 from django.http import HttpRequest, HttpResponse
 from observability.logging import clear_request_context, set_request_context
-from observability.metrics import record_api_latency
+from observability.metrics import instrument_request
 
 
 class ObservabilityMiddleware:
@@ -40,17 +39,8 @@ class ObservabilityMiddleware:
             service="union-eyes-backend",
         )
 
-        start = time.monotonic()
-        response = self.get_response(request)
-        elapsed_ms = (time.monotonic() - start) * 1000
-
-        # Record metrics.
-        record_api_latency(
-            method=request.method or "UNKNOWN",
-            path=request.path,
-            status=response.status_code,
-            latency_ms=elapsed_ms,
-        )
+        # Single timing point for request metrics (labelled by route template).
+        response = instrument_request(request, self.get_response)
 
         # Propagate correlation header.
         response["X-Request-Id"] = request_id
@@ -0,0 +1,323 @@
+"""
+Multi-process metric store — one memory-mapped file per process.
+
+Enabled by pointing ``METRICS_MULTIPROC_DIR`` at a directory shared by every
+gunicorn and Celery worker (wiped on deploy).  Each process appends its own
+series to ``<kind>_<host>_<pid>.db`` and updates values in place; the
+``/metrics`` view merges every file at scrape time.
+
+File layout (little-endian)::
+
+    header : uint32 used_bytes | 4 bytes padding
+    entry  : uint32 key_len | key (UTF-8 JSON) | padding to 8 | float64 value
+
+Only the owning process writes to a file, so writers never contend across
+processes.  When a process exits its counters and histograms are folded into
+``archive.db`` (so totals never go backwards) and its file is removed; gauges
+of dead processes are simply dropped.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import glob
+import json
+import logging
+import mmap
+import os
+import socket
+import struct
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("observability.metrics")
+
+MULTIPROC_DIR_ENV = "METRICS_MULTIPROC_DIR"
+
+_INITIAL_FILE_SIZE = 64 * 1024
+_HEADER = struct.Struct("<I4x")
+_KEY_LEN = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+
+ARCHIVE_FILE = "archive.db"
+_LOCK_FILE = ".lock"
+_HOSTNAME = socket.gethostname().replace("_", "-")
+
+
+def multiprocess_dir() -> str:
+    return os.environ.get(MULTIPROC_DIR_ENV, "")
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped key → float64 file
+# ---------------------------------------------------------------------------
+
+
+class MmapedValues:
+    """Append-only map of string keys to float64 slots in an mmap'd file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            self._file.truncate(_INITIAL_FILE_SIZE)
+            size = _INITIAL_FILE_SIZE
+        self._capacity = size
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._used = _HEADER.unpack_from(self._mmap, 0)[0]
+        if self._used == 0:
+            self._used = _HEADER.size
+            _HEADER.pack_into(self._mmap, 0, self._used)
+        self._positions: Dict[str, int] = {
+            key: pos for key, _, pos in _iter_entries(self._mmap, self._used)
+        }
+
+    def read(self, key: str) -> float:
+        pos = self._positions.get(key)
+        if pos is None:
+            return 0.0
+        return _VALUE.unpack_from(self._mmap, pos)[0]
+
+    def write(self, key: str, value: float) -> None:
+        pos = self._positions.get(key)
+        if pos is None:
+            pos = self._append(key)
+        _VALUE.pack_into(self._mmap, pos, value)
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        for key, value, _ in _iter_entries(self._mmap, self._used):
+            yield key, value
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode("utf-8")
+        padding = (8 - (_KEY_LEN.size + len(encoded)) % 8) % 8
+        entry_size = _KEY_LEN.size + len(encoded) + padding + _VALUE.size
+        while self._used + entry_size > self._capacity:
+            self._grow()
+
+        offset = self._used
+        _KEY_LEN.pack_into(self._mmap, offset, len(encoded))
+        self._mmap[offset + 4 : offset + 4 + len(encoded)] = encoded
+        value_pos = offset + entry_size - _VALUE.size
+        _VALUE.pack_into(self._mmap, value_pos, 0.0)
+
+        # Publish the entry only after it is fully written.
+        self._used += entry_size
+        _HEADER.pack_into(self._mmap, 0, self._used)
+        self._positions[key] = value_pos
+        return value_pos
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        self._mmap.close()
+        self._file.truncate(self._capacity)
+        self._mmap = mmap.mmap(self._file.fileno(), self._capacity)
+
+
+def _iter_entries(buf, used: int) -> Iterator[Tuple[str, float, int]]:
+    pos = _HEADER.size
+    while pos < used:
+        (key_len,) = _KEY_LEN.unpack_from(buf, pos)
+        key_start = pos + _KEY_LEN.size
+        key = bytes(buf[key_start : key_start + key_len]).decode("utf-8")
+        padding = (8 - (_KEY_LEN.size + key_len) % 8) % 8
+        value_pos = key_start + key_len + padding
+        (value,) = _VALUE.unpack_from(buf, value_pos)
+        yield key, value, value_pos
+        pos = value_pos + _VALUE.size
+
+
+def read_file(path: str) -> List[Tuple[str, float]]:
+    """Read every entry of a metric file without mapping it writable."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        return []
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    return [(key, value) for key, value, _ in _iter_entries(data, used)]
+
+
+# ---------------------------------------------------------------------------
+# Per-process store
+# ---------------------------------------------------------------------------
+
+
+def encode_key(name: str, labels: tuple, sample: str = "") -> str:
+    return json.dumps([name, [list(pair) for pair in labels], sample])
+
+
+class ProcessStore:
+    """This process's counter / gauge / histogram files."""
+
+    def __init__(self, directory: str, pid: int):
+        self.directory = directory
+        self.pid = pid
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._files = {
+            kind: MmapedValues(_process_file(directory, kind, pid))
+            for kind in ("counter", "gauge", "histogram")
+        }
+
+    def inc(self, kind: str, key: str, amount: float) -> None:
+        values = self._files[kind]
+        with self._lock:
+            values.write(key, values.read(key) + amount)
+
+    def set(self, kind: str, key: str, value: float) -> None:
+        with self._lock:
+            self._files[kind].write(key, value)
+
+    def close(self) -> None:
+        for values in self._files.values():
+            values.close()
+
+
+def _process_file(directory: str, kind: str, pid: int, host: str = _HOSTNAME) -> str:
+    return os.path.join(directory, f"{kind}_{host}_{pid}.db")
+
+
+def _parse_filename(path: str) -> Optional[Tuple[str, str, int]]:
+    """Return (kind, host, pid) for a per-process file name."""
+    parts = os.path.basename(path)[:-3].split("_")
+    if len(parts) != 3 or not parts[2].isdigit():
+        return None
+    return parts[0], parts[1], int(parts[2])
+
+
+# ---------------------------------------------------------------------------
+# Scrape-time aggregation and dead-process cleanup
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _directory_lock(directory: str):
+    with open(os.path.join(directory, _LOCK_FILE), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def mark_process_dead(pid: int, directory: Optional[str] = None) -> None:
+    """Fold a finished process's counters/histograms into the archive.
+
+    Call from gunicorn ``child_exit`` and Celery ``worker_process_shutdown``.
+    """
+    directory = directory or multiprocess_dir()
+    if not directory:
+        return
+    with _directory_lock(directory):
+        _archive_process(directory, _HOSTNAME, pid)
+
+
+def wipe_host_files(directory: Optional[str] = None) -> None:
+    """Remove this host's per-process files (gunicorn ``on_starting``).
+
+    Files written by other hosts sharing the directory (e.g. Celery worker
+    containers) and the archive are left alone.
+    """
+    directory = directory or multiprocess_dir()
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    with _directory_lock(directory):
+        for path in glob.glob(os.path.join(directory, "*_*_*.db")):
+            parsed = _parse_filename(path)
+            if parsed and parsed[1] == _HOSTNAME:
+                os.remove(path)
+
+
+def cleanup_dead_processes(directory: Optional[str] = None) -> int:
+    """Archive files left by dead processes on this host; return the count."""
+    directory = directory or multiprocess_dir()
+    if not directory:
+        return 0
+    dead = set()
+    for path in glob.glob(os.path.join(directory, "*_*_*.db")):
+        parsed = _parse_filename(path)
+        if parsed and parsed[1] == _HOSTNAME and not _pid_alive(parsed[2]):
+            dead.add(parsed[2])
+    if dead:
+        with _directory_lock(directory):
+            for pid in dead:
+                _archive_process(directory, _HOSTNAME, pid)
+    return len(dead)
+
+
+def _archive_process(directory: str, host: str, pid: int) -> None:
+    archive = None
+    try:
+        for kind in ("counter", "histogram"):
+            path = _process_file(directory, kind, pid, host)
+            if not os.path.exists(path):
+                continue
+            if archive is None:
+                archive = MmapedValues(os.path.join(directory, ARCHIVE_FILE))
+            for key, value in read_file(path):
+                archive_key = json.dumps([kind, key])
+                archive.write(archive_key, archive.read(archive_key) + value)
+            os.remove(path)
+        gauge_path = _process_file(directory, "gauge", pid, host)
+        if os.path.exists(gauge_path):
+            os.remove(gauge_path)
+    finally:
+        if archive is not None:
+            archive.close()
+
+
+def collect(directory: str) -> Dict[str, Dict[str, Dict[tuple, Dict[str, float]]]]:
+    """Merge every process file in *directory*.
+
+    Returns ``{kind: {metric: {labels: {sample: value}}}}``; gauge samples are
+    keyed by pid so the caller can apply the metric's aggregation mode.
+    """
+    cleanup_dead_processes(directory)
+    merged: Dict[str, Dict[str, Dict[tuple, Dict[str, float]]]] = {
+        kind: defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
+        for kind in ("counter", "gauge", "histogram")
+    }
+
+    def add(kind: str, key: str, value: float, pid: Optional[int] = None) -> None:
+        name, labels, sample = json.loads(key)
+        labels_key = tuple(tuple(pair) for pair in labels)
+        if kind == "gauge":
+            sample = str(pid)
+        merged[kind][name][labels_key][sample] += value
+
+    archive_path = os.path.join(directory, ARCHIVE_FILE)
+    if os.path.exists(archive_path):
+        for archive_key, value in read_file(archive_path):
+            kind, key = json.loads(archive_key)
+            add(kind, key, value)
+
+    for path in glob.glob(os.path.join(directory, "*_*_*.db")):
+        parsed = _parse_filename(path)
+        if parsed is None:
+            continue
+        try:
+            entries = read_file(path)
+        except FileNotFoundError:
+            continue  # archived between glob and open
+        for key, value in entries:
+            add(parsed[0], key, value, parsed[2])
+
+    return merged
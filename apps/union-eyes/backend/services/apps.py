@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ServicesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "services"
+
+    def ready(self):
+        from services.integration_control_plane import signals  # noqa: F401 — registers receivers
@@ -2,16 +2,20 @@
 Compliance Snapshot Engine — snapshot capture logic.
 
 ``capture_snapshot`` gathers compliance-relevant counters from the database
-and creates a hash-chained snapshot record.
+and creates a hash-chained snapshot record.  ``capture_snapshots`` does the
+same for many organizations at once: one grouped COUNT query per source
+table, one bulk chain-append and one bulk event emit.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from django.db.models import Count, Q
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import Count, OuterRef, Q, Subquery
 from django.utils import timezone
 
 from .models import ComplianceSnapshot
@@ -43,93 +47,171 @@ def capture_snapshot(
     if extra_payload:
         payload["custom"] = extra_payload
 
-    # Determine chain predecessor.
-    last = (
-        ComplianceSnapshot.objects.filter(org_id=org_id)
-        .order_by("-sequence_number")
-        .first()
-    )
-    previous_hash = last.hash if last else ""
-    sequence_number = (last.sequence_number + 1) if last else 1
-
-    snapshot = ComplianceSnapshot(
-        org_id=org_id,
-        snapshot_type=snapshot_type,
-        snapshot_payload=payload,
-        previous_hash=previous_hash,
-        sequence_number=sequence_number,
-        created_by=created_by,
-    )
-    snapshot.save()  # auto-computes hash
+    snapshot = _append_snapshot(org_id, payload, snapshot_type, created_by)
 
     logger.info(
         "Compliance snapshot captured: org=%s type=%s seq=%d",
         str(org_id)[:8],
         snapshot_type,
-        sequence_number,
+        snapshot.sequence_number,
     )
-
-    # Emit event.
-    try:
-        from services.events.dispatcher import emit_event
-
-        emit_event(
-            event_type="compliance_snapshot_created",
-            org_id=str(org_id),
-            actor_id=created_by,
-            payload={
-                "snapshot_id": str(snapshot.id),
-                "snapshot_type": snapshot_type,
-                "sequence_number": sequence_number,
-            },
-        )
-    except Exception:
-        logger.exception("Failed to emit compliance_snapshot_created event")
+    _announce([snapshot])
 
     return {
         "snapshot_id": str(snapshot.id),
         "org_id": str(org_id),
         "snapshot_type": snapshot_type,
-        "sequence_number": sequence_number,
+        "sequence_number": snapshot.sequence_number,
         "hash": snapshot.hash,
-        "previous_hash": previous_hash,
+        "previous_hash": snapshot.previous_hash,
         "payload": payload,
     }
 
 
-def verify_chain(org_id: str) -> Dict[str, Any]:
+def capture_snapshots(
+    org_ids: Iterable[str],
+    *,
+    snapshot_type: str,
+    created_by: str = "system",
+) -> Dict[str, int]:
     """
-    Verify the entire hash chain for *org_id*.
+    Capture compliance snapshots for every org in *org_ids*.
 
-    Returns ``{"valid": bool, "total": int, "broken_at": int | None}``.
+    Payloads match ``capture_snapshot``'s.  Every snapshot is chained onto
+    its org's current head and all are inserted in one transaction; if a
+    concurrent capture moved a head meanwhile, the orgs are appended one by
+    one instead.
+
+    Returns ``{"captured": int, "failed": int}``.
     """
-    snapshots = list(
-        ComplianceSnapshot.objects.filter(org_id=org_id).order_by("sequence_number")
+    org_ids = [str(org_id) for org_id in org_ids]
+    if not org_ids:
+        return {"captured": 0, "failed": 0}
+
+    payloads = gather_payloads(org_ids)
+    heads = _chain_heads(org_ids)
+    snapshots = []
+    for org_id in org_ids:
+        sequence_number, previous_hash = heads.get(org_id, (0, ""))
+        snapshot = ComplianceSnapshot(
+            org_id=org_id,
+            snapshot_type=snapshot_type,
+            snapshot_payload=payloads[org_id],
+            previous_hash=previous_hash,
+            sequence_number=sequence_number + 1,
+            created_by=created_by,
+        )
+        snapshot.hash = snapshot._compute_hash()  # bulk_create skips save()
+        snapshots.append(snapshot)
+
+    failed = 0
+    try:
+        with transaction.atomic():
+            ComplianceSnapshot.objects.bulk_create(snapshots)
+    except IntegrityError:
+        logger.warning(
+            "Chain head moved during bulk capture; appending %d orgs one by one",
+            len(org_ids),
+        )
+        snapshots = []
+        for org_id in org_ids:
+            try:
+                with transaction.atomic():
+                    snapshot = _append_snapshot(
+                        org_id, payloads[org_id], snapshot_type, created_by
+                    )
+                snapshots.append(snapshot)
+            except Exception:
+                logger.exception("Snapshot failed for org %s", org_id)
+                failed += 1
+
+    _announce(snapshots)
+    return {"captured": len(snapshots), "failed": failed}
+
+
+def _append_snapshot(
+    org_id: str, payload: Dict[str, Any], snapshot_type: str, created_by: str
+) -> ComplianceSnapshot:
+    """Chain one snapshot onto *org_id*'s newest snapshot."""
+    last = (
+        ComplianceSnapshot.objects.filter(org_id=org_id)
+        .order_by("-sequence_number")
+        .first()
+    )
+    snapshot = ComplianceSnapshot(
+        org_id=org_id,
+        snapshot_type=snapshot_type,
+        snapshot_payload=payload,
+        previous_hash=last.hash if last else "",
+        sequence_number=(last.sequence_number + 1) if last else 1,
+        created_by=created_by,
+    )
+    snapshot.save()  # auto-computes hash
+    return snapshot
+
+
+def _chain_heads(org_ids: List[str]) -> Dict[str, Tuple[int, str]]:
+    """``{org_id: (sequence_number, hash)}`` of each org's newest snapshot."""
+    newest = (
+        ComplianceSnapshot.objects.filter(org_id=OuterRef("org_id"))
+        .order_by("-sequence_number")
+        .values("sequence_number")[:1]
+    )
+    rows = (
+        ComplianceSnapshot.objects.filter(
+            org_id__in=org_ids, sequence_number=Subquery(newest)
+        )
+        .order_by()
+        .values_list("org_id", "sequence_number", "hash")
     )
+    return {str(org_id): (seq, chain_hash) for org_id, seq, chain_hash in rows}
 
+
+def _announce(snapshots: List[ComplianceSnapshot]) -> None:
+    """Emit ``compliance_snapshot_created`` for each snapshot (one bulk INSERT)."""
     if not snapshots:
-        return {"valid": True, "total": 0, "broken_at": None}
-
-    for i, snap in enumerate(snapshots):
-        # Verify own hash.
-        if not snap.verify_integrity():
-            return {
-                "valid": False,
-                "total": len(snapshots),
-                "broken_at": snap.sequence_number,
+        return
+    try:
+        from services.events.dispatcher import emit_events
+
+        emit_events(
+            {
+                "event_type": "compliance_snapshot_created",
+                "org_id": str(snapshot.org_id),
+                "actor_id": snapshot.created_by,
+                "payload": {
+                    "snapshot_id": str(snapshot.id),
+                    "snapshot_type": snapshot.snapshot_type,
+                    "sequence_number": snapshot.sequence_number,
+                },
             }
+            for snapshot in snapshots
+        )
+    except Exception:
+        logger.exception("Failed to emit compliance_snapshot_created events")
 
-        # Verify chain linkage.
-        if i > 0:
-            expected_prev = snapshots[i - 1].hash
-            if snap.previous_hash != expected_prev:
-                return {
-                    "valid": False,
-                    "total": len(snapshots),
-                    "broken_at": snap.sequence_number,
-                }
 
-    return {"valid": True, "total": len(snapshots), "broken_at": None}
+def verify_chain(
+    org_id: str, *, full: bool = False, workers: int = 1
+) -> Dict[str, Any]:
+    """
+    Verify the hash chain for *org_id*.
+
+    Only snapshots after the last verified checkpoint are checked unless
+    *full* is set; see ``core.chain_verifier``.
+
+    Returns ``{"valid": bool, "total": int, "broken_at": int | None}``.
+    """
+    from core.chain_verifier import verify_chain as verify_hash_chain
+
+    result = verify_hash_chain(
+        "compliance_snapshots", org_id, full=full, workers=workers
+    )
+    return {
+        "valid": result.valid,
+        "total": result.count,
+        "broken_at": None if result.valid else result.broken_row["sequence_number"],
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -138,94 +220,114 @@ def verify_chain(org_id: str) -> Dict[str, Any]:
 
 
 def _gather_payload(org_id: str) -> Dict[str, Any]:
-    """
-    Query the database for compliance-relevant counters.
+    """Compliance-relevant counters for one org."""
+    return gather_payloads([str(org_id)])[str(org_id)]
 
-    Gracefully handles missing tables / apps.
-    """
-    payload: Dict[str, Any] = {
-        "captured_at": timezone.now().isoformat(),
-        "org_id": str(org_id),
-    }
 
-    # Members.
-    try:
-        from auth_core.models import OrganizationMembers
-
-        members_qs = OrganizationMembers.objects.filter(organization_id=org_id)
-        payload["members"] = {
-            "total": members_qs.count(),
-            "active": (
-                members_qs.filter(status="active").count()
-                if members_qs.filter(status="active").exists()
-                else 0
-            ),
-        }
-    except Exception:
-        payload["members"] = {"error": "unavailable"}
+_CLOSED_CASE_STATUSES = ["closed", "resolved", "rejected"]
 
-    # Cases / Claims.
-    try:
-        from grievances.models import Claims
-
-        claims_qs = Claims.objects.filter(organization_id=org_id)
-        payload["cases"] = {
-            "total": claims_qs.count(),
-            "open": claims_qs.exclude(
-                status__in=["closed", "resolved", "rejected"]
-            ).count(),
-        }
-    except Exception:
-        payload["cases"] = {"error": "unavailable"}
 
-    # Audit events (last 30 days).
-    try:
-        from core.models import AuditLogs
+def gather_payloads(org_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Query the database for compliance-relevant counters of many orgs.
 
-        thirty_days_ago = timezone.now() - timezone.timedelta(days=30)
-        payload["audit_events_30d"] = AuditLogs.objects.filter(
-            organization_id=org_id,
-            created_at__gte=thirty_days_ago,
-        ).count()
-    except Exception:
-        payload["audit_events_30d"] = "unavailable"
+    Each source table is read once with ``GROUP BY org`` and one conditional
+    ``COUNT(...) FILTER (WHERE ...)`` per counter; orgs without rows get
+    zeros.  A source whose table or app is missing is marked unavailable.
+    """
+    now = timezone.now()
+    thirty_days_ago = now - timezone.timedelta(days=30)
+    payloads: Dict[str, Dict[str, Any]] = {
+        org_id: {"captured_at": now.isoformat(), "org_id": org_id} for org_id in org_ids
+    }
 
-    # Integration health.
-    try:
-        from services.integration_control_plane.models import IntegrationRegistry
-
-        int_qs = IntegrationRegistry.objects.filter(org_id=org_id)
-        payload["integrations"] = {
-            "total": int_qs.count(),
-            "active": int_qs.filter(status="active").count(),
-            "degraded": int_qs.filter(status="degraded").count(),
-            "failed": int_qs.filter(status="failed").count(),
-        }
-    except Exception:
-        payload["integrations"] = {"error": "unavailable"}
+    _add_counts(
+        payloads,
+        "members",
+        "auth_core.OrganizationMembers",
+        "organization_id",
+        {"total": None, "active": Q(status="active")},
+    )
+    _add_counts(
+        payloads,
+        "cases",
+        "grievances.Claims",
+        "organization_id",
+        {"total": None, "open": ~Q(status__in=_CLOSED_CASE_STATUSES)},
+    )
+    _add_counts(
+        payloads,
+        "audit_events_30d",
+        "core.AuditLogs",
+        "organization_id",
+        {"count": Q(created_at__gte=thirty_days_ago)},
+        scalar=True,
+    )
+    _add_counts(
+        payloads,
+        "integrations",
+        "services.IntegrationRegistry",
+        "org_id",
+        {
+            "total": None,
+            "active": Q(status="active"),
+            "degraded": Q(status="degraded"),
+            "failed": Q(status="failed"),
+        },
+    )
+    _add_counts(
+        payloads,
+        "domain_events_30d",
+        "services.Event",
+        "org_id",
+        {"count": Q(created_at__gte=thirty_days_ago)},
+        scalar=True,
+    )
+    _add_counts(
+        payloads,
+        "evidence_packs",
+        "services.EvidencePack",
+        "org_id",
+        {"total": None, "sealed": Q(status="sealed")},
+    )
+    return payloads
 
-    # Domain events (last 30 days).
-    try:
-        from services.events.models import Event
 
-        payload["domain_events_30d"] = Event.objects.filter(
-            org_id=org_id,
-            created_at__gte=timezone.now() - timezone.timedelta(days=30),
-        ).count()
-    except Exception:
-        payload["domain_events_30d"] = "unavailable"
+def _add_counts(
+    payloads: Dict[str, Dict[str, Any]],
+    key: str,
+    model_label: str,
+    org_field: str,
+    counters: Dict[str, Optional[Q]],
+    *,
+    scalar: bool = False,
+) -> None:
+    """Set ``payload[key]`` for every org from one grouped COUNT query.
 
-    # Evidence packs.
+    With *scalar*, only the single counter's value is stored.  A filter that
+    applies to every counter is pushed into ``WHERE`` instead of ``FILTER``.
+    """
+    where = Q(**{f"{org_field}__in": list(payloads)})
+    if scalar:
+        (name, condition), = counters.items()
+        where &= condition
+        counters = {name: None}
     try:
-        from services.evidence_pack.models import EvidencePack
-
-        payload["evidence_packs"] = {
-            "total": EvidencePack.objects.filter(org_id=org_id).count(),
-            "sealed": EvidencePack.objects.filter(
-                org_id=org_id, status="sealed"
-            ).count(),
-        }
+        model = apps.get_model(model_label)
+        rows = (
+            model.objects.filter(where)
+            .order_by()
+            .values(org_field)
+            .annotate(**{name: Count("pk", filter=q) for name, q in counters.items()})
+        )
+        counts = {str(row[org_field]): row for row in rows}
     except Exception:
-        payload["evidence_packs"] = {"error": "unavailable"}
-
-    return payload
+        unavailable = "unavailable" if scalar else {"error": "unavailable"}
+        for payload in payloads.values():
+            payload[key] = unavailable
+        return
+
+    for org_id, payload in payloads.items():
+        row = counts.get(org_id, {})
+        values = {name: row.get(name, 0) for name in counters}
+        payload[key] = values[name] if scalar else values
@@ -1,14 +1,20 @@
 """
 Compliance Snapshot Engine — Celery periodic tasks.
 
-These tasks are registered in settings.CELERY_BEAT_SCHEDULE.
+These tasks are registered in settings.CELERY_BEAT_SCHEDULE.  The periodic
+captures split the active organizations into shards of
+``COMPLIANCE_SNAPSHOT_SHARD_SIZE`` and run them as a chord: each shard is
+captured in bulk by ``capture_snapshot_shard`` and
+``summarize_snapshot_capture`` logs the totals.
 """
 
 from __future__ import annotations
 
 import logging
+from typing import List
 
-from celery import shared_task
+from celery import chord, shared_task
+from django.conf import settings
 from django.utils import timezone
 
 logger = logging.getLogger("compliance_snapshot.tasks")
@@ -60,31 +66,32 @@ def capture_on_demand(*, org_id: str, created_by: str = "system") -> dict:
     )
 
 
-def _capture_for_all(snapshot_type: str) -> dict:
-    """Iterate all active orgs and capture snapshots."""
-    from services.compliance_snapshot.service import capture_snapshot
+@shared_task(
+    name="compliance_snapshot.capture_shard",
+    queue="reports",
+    acks_late=True,
+)
+def capture_snapshot_shard(*, org_ids: List[str], snapshot_type: str) -> dict:
+    """Capture snapshots for one shard of organizations in bulk."""
+    from services.compliance_snapshot.service import capture_snapshots
 
     try:
-        from auth_core.models import Organizations
-
-        orgs = Organizations.objects.filter(status="active")
+        return capture_snapshots(org_ids, snapshot_type=snapshot_type, created_by="system")
     except Exception:
-        logger.exception("Cannot query organizations")
-        return {"status": "error", "reason": "cannot_query_orgs"}
+        logger.exception("Snapshot shard failed (%d orgs)", len(org_ids))
+        return {"captured": 0, "failed": len(org_ids)}
 
-    results = {"captured": 0, "failed": 0}
-    for org in orgs.iterator():
-        try:
-            capture_snapshot(
-                org_id=str(org.id),
-                snapshot_type=snapshot_type,
-                created_by="system",
-            )
-            results["captured"] += 1
-        except Exception:
-            logger.exception("Snapshot failed for org %s", org.id)
-            results["failed"] += 1
 
+@shared_task(
+    name="compliance_snapshot.capture_summary",
+    queue="reports",
+)
+def summarize_snapshot_capture(shard_results: List[dict], *, snapshot_type: str) -> dict:
+    """Chord callback — total the shard results."""
+    results = {
+        "captured": sum(r["captured"] for r in shard_results),
+        "failed": sum(r["failed"] for r in shard_results),
+    }
     logger.info(
         "Compliance snapshots (%s): captured=%d failed=%d",
         snapshot_type,
@@ -92,3 +99,35 @@ def _capture_for_all(snapshot_type: str) -> dict:
         results["failed"],
     )
     return results
+
+
+def _capture_for_all(snapshot_type: str) -> dict:
+    """Fan all active orgs out to a chord of shard captures."""
+    try:
+        from auth_core.models import Organizations
+
+        org_ids = [
+            str(org_id)
+            for org_id in Organizations.objects.filter(status="active")
+            .order_by("id")
+            .values_list("id", flat=True)
+        ]
+    except Exception:
+        logger.exception("Cannot query organizations")
+        return {"status": "error", "reason": "cannot_query_orgs"}
+
+    size = settings.COMPLIANCE_SNAPSHOT_SHARD_SIZE
+    shards = [org_ids[i : i + size] for i in range(0, len(org_ids), size)]
+    if shards:
+        chord(
+            capture_snapshot_shard.s(org_ids=shard, snapshot_type=snapshot_type)
+            for shard in shards
+        )(summarize_snapshot_capture.s(snapshot_type=snapshot_type))
+
+    logger.info(
+        "Compliance snapshots (%s): %d orgs in %d shards",
+        snapshot_type,
+        len(org_ids),
+        len(shards),
+    )
+    return {"status": "dispatched", "orgs": len(org_ids), "shards": len(shards)}
@@ -54,7 +54,9 @@ class ComplianceSnapshotViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        result = verify_chain(str(org_id))
+        # Always from the first snapshot: an audit answer must not rest on an
+        # earlier run's checkpoint.
+        result = verify_chain(str(org_id), full=True)
         return Response(result)
 
     @action(detail=True, methods=["get"], url_path="verify")
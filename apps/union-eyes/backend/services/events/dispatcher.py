@@ -2,14 +2,14 @@
 Event Dispatcher — the central nervous system of the Event Bus.
 
 Responsibilities:
-  1. Persist event to database
-  2. Publish to Celery for async processing
+  1. Persist event to database (with an outbox row, same transaction)
+  2. Relay committed events to Celery in batches for async processing
   3. Trigger matching integrations
   4. Write audit log entry
 
 Usage::
 
-    from services.events.dispatcher import emit_event
+    from services.events.dispatcher import emit_event, emit_events
 
     emit_event(
         event_type="case_created",
@@ -17,6 +17,13 @@ Usage::
         actor_id=str(user.id),
         payload={"case_id": str(case.id), "priority": "high"},
     )
+
+    # Many events: one bulk INSERT, published in batches after commit.
+    emit_events([
+        {"event_type": "vote_cast", "org_id": org_id, "actor_id": voter_id,
+         "payload": {"ballot_id": ballot_id}}
+        for voter_id in voter_ids
+    ])
 """
 
 from __future__ import annotations
@@ -24,13 +31,19 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import uuid4
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 
 logger = logging.getLogger("event_dispatcher")
 
+#: Cache flag held for EVENT_OUTBOX_KICK_INTERVAL seconds after a relay kick.
+RELAY_KICK_KEY = "events:relay_kick"
+
 
 def emit_event(
     *,
@@ -67,43 +80,131 @@ def emit_event(
     str
         The UUID of the persisted event.
     """
-    from services.events.models import Event
-
-    payload = payload or {}
-    metadata = metadata or {}
-
-    event = Event(
-        event_type=event_type,
-        org_id=org_id,
-        actor_id=actor_id,
-        payload=payload,
-        correlation_id=correlation_id,
-        metadata=metadata,
-        created_at=timezone.now(),
+    (event_id,) = emit_events(
+        [
+            {
+                "event_type": event_type,
+                "org_id": org_id,
+                "actor_id": actor_id,
+                "payload": payload,
+                "correlation_id": correlation_id,
+                "metadata": metadata,
+            }
+        ],
+        sync=sync,
     )
-    event.save()  # computes signature_hash automatically
 
     logger.info(
         "Event emitted: %s (id=%s, org=%s, actor=%s)",
         event_type,
-        event.id,
+        event_id,
         str(org_id)[:8],
         str(actor_id)[:8],
     )
+    return event_id
+
+
+def emit_events(events: Iterable[Dict[str, Any]], *, sync: bool = False) -> List[str]:
+    """
+    Emit many domain events with one bulk INSERT.
+
+    Each item takes the keyword arguments of :func:`emit_event` (minus
+    ``sync``).  Events and their outbox rows are written in one
+    transaction — the caller's, if one is open — and the outbox relay is
+    kicked once it commits, so no worker can see an uncommitted event.
+
+    Returns the event UUIDs in input order.
+    """
+    from services.events.models import Event, EventOutbox
+
+    now = timezone.now()
+    records = []
+    for item in events:
+        event = Event(
+            event_type=item["event_type"],
+            org_id=item["org_id"],
+            actor_id=item["actor_id"],
+            payload=item.get("payload") or {},
+            correlation_id=item.get("correlation_id", ""),
+            metadata=item.get("metadata") or {},
+            created_at=now,
+        )
+        event.signature_hash = event._compute_hash()  # bulk_create skips save()
+        records.append(event)
+    if not records:
+        return []
+
+    batch_size = settings.EVENT_OUTBOX_BATCH_SIZE
+    with transaction.atomic():
+        Event.objects.bulk_create(records, batch_size=batch_size)
+        if not sync:
+            EventOutbox.objects.bulk_create(
+                [EventOutbox(event=event) for event in records],
+                batch_size=batch_size,
+            )
+            transaction.on_commit(_kick_outbox_relay)
 
     if sync:
-        _process_event_sync(event)
-    else:
-        _enqueue_event(event)
+        for event in records:
+            _process_event_sync(event)
+
+    if len(records) > 1:
+        logger.info("Emitted %d events in bulk", len(records))
+    return [str(event.id) for event in records]
+
+
+def _kick_outbox_relay() -> None:
+    """Ask a worker to relay the outbox now rather than at the next beat.
 
-    return str(event.id)
+    At most one kick is sent per EVENT_OUTBOX_KICK_INTERVAL: a relay publishes
+    a whole batch, so a burst of commits needs one kick, and anything it
+    misses is left to the periodic relay.
+    """
+    from services.events.tasks import relay_event_outbox_task
 
+    try:
+        # False means another kick is in its interval; None is an unreachable
+        # Redis (IGNORE_EXCEPTIONS), which must not stop the kick.
+        if cache.add(RELAY_KICK_KEY, 1, timeout=settings.EVENT_OUTBOX_KICK_INTERVAL) is False:
+            return
+    except Exception:
+        logger.debug("Relay kick debounce unavailable", exc_info=True)
 
-def _enqueue_event(event) -> None:
-    """Publish event to Celery for async fan-out."""
-    from services.events.tasks import process_event_task
+    try:
+        relay_event_outbox_task.delay()
+    except Exception:
+        # The rows are committed; the periodic relay will pick them up.
+        logger.warning("Could not kick the event outbox relay", exc_info=True)
 
-    process_event_task.delay(event_id=str(event.id))
+
+def relay_event_outbox(batch_size: Optional[int] = None) -> int:
+    """
+    Publish up to *batch_size* committed events as one Celery message.
+
+    *batch_size* defaults to ``settings.EVENT_OUTBOX_BATCH_SIZE``.
+    Outbox rows are claimed with SKIP LOCKED, so concurrent relays publish
+    disjoint batches.  The rows are deleted in the same transaction as the
+    publish; a crash in between re-publishes the batch (at-least-once).
+    Returns the number of events relayed.
+    """
+    from services.events.models import EventOutbox
+    from services.events.tasks import process_event_batch_task
+
+    batch_size = batch_size or settings.EVENT_OUTBOX_BATCH_SIZE
+    with transaction.atomic():
+        claimed = list(
+            EventOutbox.objects.select_for_update(skip_locked=True)
+            .order_by("id")
+            .values_list("id", "event_id")[:batch_size]
+        )
+        if not claimed:
+            return 0
+
+        process_event_batch_task.delay(
+            event_ids=[str(event_id) for _, event_id in claimed]
+        )
+        EventOutbox.objects.filter(pk__in=[pk for pk, _ in claimed]).delete()
+    return len(claimed)
 
 
 def _process_event_sync(event) -> None:
@@ -153,51 +254,103 @@ def trigger_integrations(event) -> int:
     """
     Look up integrations subscribed to ``event.event_type`` and dispatch.
 
+    Subscriptions come from the cached per-org index
+    (``integration_control_plane.subscriptions``).  The payload's idempotency
+    hash is computed once here and carried in the message.
     Returns the number of integrations triggered.
     """
     try:
-        from services.integration_control_plane.models import IntegrationRegistry
-        from services.integration_control_plane.tasks import dispatch_integration
-
-        integrations = IntegrationRegistry.objects.filter(
-            org_id=event.org_id,
-            status="active",
-            integration_type__in=["webhook_outbound", "api_push"],
+        from services.integration_control_plane.idempotency import payload_hash
+        from services.integration_control_plane.subscriptions import (
+            subscribed_integration_ids,
         )
+        from services.integration_control_plane.tasks import dispatch_integration
 
-        count = 0
-        for integration in integrations:
-            # Check if integration metadata subscribes to this event type
-            subscribed_events = integration.metadata.get("subscribed_events", [])
-            if subscribed_events and event.event_type not in subscribed_events:
-                continue
-
+        integration_ids = subscribed_integration_ids(event.org_id, event.event_type)
+        if integration_ids:
+            payload = _integration_payload(event)
+            request_hash = payload_hash(payload)
+        for integration_id in integration_ids:
             dispatch_integration.delay(
-                integration_id=str(integration.id),
+                integration_id=integration_id,
                 org_id=str(event.org_id),
-                payload={
-                    "event_id": str(event.id),
-                    "event_type": event.event_type,
-                    "org_id": str(event.org_id),
-                    "actor_id": event.actor_id,
-                    "payload": event.payload,
-                    "created_at": event.created_at.isoformat(),
-                    "signature_hash": event.signature_hash,
-                },
+                payload=payload,
+                payload_hash=request_hash,
             )
-            count += 1
 
-        if count:
+        if integration_ids:
             logger.info(
-                "Triggered %d integration(s) for event %s", count, event.event_type
+                "Triggered %d integration(s) for event %s",
+                len(integration_ids),
+                event.event_type,
             )
-        return count
+        return len(integration_ids)
 
     except Exception:
         logger.exception("Failed to trigger integrations for event %s", event.id)
         return 0
 
 
+def trigger_integrations_batch(events) -> int:
+    """
+    Dispatch a batch of events, one message per subscribed integration.
+
+    Each integration receives its events' payloads in batch order through
+    ``dispatch_integration_batch``, with each payload's idempotency hash
+    alongside.  Returns the number of messages sent.
+    """
+    try:
+        from services.integration_control_plane.idempotency import payload_hash
+        from services.integration_control_plane.subscriptions import (
+            subscribed_integration_ids,
+        )
+        from services.integration_control_plane.tasks import (
+            dispatch_integration_batch,
+        )
+
+        groups: Dict[tuple, List[tuple]] = {}
+        for event in events:
+            integration_ids = subscribed_integration_ids(event.org_id, event.event_type)
+            if not integration_ids:
+                continue
+            payload = _integration_payload(event)
+            entry = (payload, payload_hash(payload))
+            for integration_id in integration_ids:
+                groups.setdefault((integration_id, str(event.org_id)), []).append(entry)
+
+        for (integration_id, org_id), entries in groups.items():
+            dispatch_integration_batch.delay(
+                integration_id=integration_id,
+                org_id=org_id,
+                payloads=[payload for payload, _ in entries],
+                payload_hashes=[request_hash for _, request_hash in entries],
+            )
+
+        if groups:
+            logger.info(
+                "Triggered %d integration(s) for a batch of %d events",
+                len(groups),
+                len(events),
+            )
+        return len(groups)
+
+    except Exception:
+        logger.exception("Failed to trigger integrations for an event batch")
+        return 0
+
+
+def _integration_payload(event) -> Dict[str, Any]:
+    return {
+        "event_id": str(event.id),
+        "event_type": event.event_type,
+        "org_id": str(event.org_id),
+        "actor_id": event.actor_id,
+        "payload": event.payload,
+        "created_at": event.created_at.isoformat(),
+        "signature_hash": event.signature_hash,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -4,6 +4,9 @@ Event Bus — Domain event model.
 Every meaningful state change in the platform produces an ``Event`` record.
 Events are persisted, published to Celery for async processing, and used
 to trigger integrations and write audit logs.
+
+Publication goes through ``EventOutbox``: the outbox row is written in the
+same transaction as the event, so only committed events reach the broker.
 """
 
 import hashlib
@@ -97,7 +100,12 @@ class Event(models.Model):
         db_table = "domain_events"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["org_id", "event_type"], name="idx_events_org_type"),
+            # Time-windowed reads per type (evidence packs) range-scan this;
+            # it also serves plain (org_id, event_type) lookups.
+            models.Index(
+                fields=["org_id", "event_type", "created_at"],
+                name="idx_events_org_type_time",
+            ),
             models.Index(fields=["org_id", "created_at"], name="idx_events_org_time"),
             models.Index(
                 fields=["actor_id", "created_at"], name="idx_events_actor_time"
@@ -132,3 +140,24 @@ class Event(models.Model):
     def verify_integrity(self) -> bool:
         """Return True if the stored hash matches a freshly computed one."""
         return self.signature_hash == self._compute_hash()
+
+
+class EventOutbox(models.Model):
+    """Committed event awaiting publication to Celery.
+
+    ``services.events.dispatcher.emit_events`` inserts one row per event in
+    the emitting transaction; ``relay_event_outbox`` later publishes many of
+    them per broker message and deletes the rows it published.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    event = models.OneToOneField(
+        Event, on_delete=models.CASCADE, related_name="outbox_entry"
+    )
+    enqueued_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "domain_event_outbox"
+
+    def __str__(self) -> str:
+        return f"EventOutbox({self.event_id})"
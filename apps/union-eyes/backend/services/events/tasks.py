@@ -1,14 +1,20 @@
 """
 Event Bus — Celery tasks for async event processing.
+
+Emitted events reach workers through the outbox: ``relay_event_outbox_task``
+publishes committed events in batches and ``process_event_batch_task`` fans
+out each batch.  ``process_event_task`` still handles single-event messages.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from celery import shared_task
 
+from observability.metrics import instrument_task
+
 logger = logging.getLogger("event_tasks")
 
 
@@ -20,6 +26,7 @@ logger = logging.getLogger("event_tasks")
     max_retries=3,
     default_retry_delay=10,
 )
+@instrument_task
 def process_event_task(self, *, event_id: str) -> Dict[str, Any]:
     """
     Async fan-out for a persisted domain event.
@@ -40,15 +47,72 @@ def process_event_task(self, *, event_id: str) -> Dict[str, Any]:
     return {"status": "processed", "event_id": event_id}
 
 
-def _fan_out(event) -> None:
-    """Execute all side-effects for an event."""
+@shared_task(
+    name="events.process_event_batch",
+    bind=True,
+    queue="notifications",
+    acks_late=True,
+    max_retries=3,
+    default_retry_delay=10,
+)
+@instrument_task
+def process_event_batch_task(self, *, event_ids: List[str]) -> Dict[str, Any]:
+    """
+    Fan out a batch of persisted events, loaded with one query.
+
+    Integration deliveries are grouped: one dispatch message per
+    subscribed integration for the whole batch.
+    """
+    from services.events.dispatcher import trigger_integrations_batch
+    from services.events.models import Event
+
+    events = list(Event.objects.filter(pk__in=event_ids).order_by("created_at", "id"))
+    for event in events:
+        _fan_out(event, integrations=False)
+    trigger_integrations_batch(events)
+
+    missing = len(set(event_ids)) - len(events)
+    if missing:
+        logger.error("%d of %d batched events not found", missing, len(event_ids))
+    return {"status": "processed", "processed": len(events), "missing": missing}
+
+
+@shared_task(
+    name="events.relay_outbox",
+    queue="notifications",
+    acks_late=True,
+    ignore_result=True,
+)
+def relay_event_outbox_task(max_batches: int = 50) -> Dict[str, Any]:
+    """Publish committed outbox events, one message per batch."""
+    from services.events.dispatcher import relay_event_outbox
+
+    relayed = batches = 0
+    for _ in range(max_batches):
+        count = relay_event_outbox()
+        if not count:
+            break
+        relayed += count
+        batches += 1
+
+    if relayed:
+        logger.info("Relayed %d outbox events in %d batch(es)", relayed, batches)
+    return {"relayed": relayed, "batches": batches}
+
+
+def _fan_out(event, *, integrations: bool = True) -> None:
+    """Execute all side-effects for an event.
+
+    *integrations* is False when the caller dispatches a whole batch to
+    the integrations itself.
+    """
     from services.events.dispatcher import trigger_integrations, write_audit_log
 
     # 1. Audit log
     write_audit_log(event)
 
     # 2. Integration dispatch
-    triggered = trigger_integrations(event)
+    triggered = trigger_integrations(event) if integrations else 0
 
     # 3. In-process handlers (pluggable — import and call registered handlers)
     _run_handlers(event)
@@ -7,6 +7,14 @@ The ``build_evidence_pack`` function:
   3. Builds a checksum manifest
   4. Seals the pack
   5. Returns a JSON archive + PDF summary + manifest
+
+Collectors are streaming producers of ``(source_id, content)`` pairs; the
+builder hashes them and inserts artifacts with one ``bulk_create`` per
+``EVIDENCE_PACK_BATCH_SIZE`` rows.  The API creates the pack and hands the
+collection to ``tasks.build_evidence_pack_task``.
+
+``stream_pack_ndjson`` / ``stream_pack_zip`` export a sealed pack in chunks
+with flat memory, re-verifying every artifact and the seal as they go.
 """
 
 from __future__ import annotations
@@ -14,16 +22,23 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import tempfile
+import zipfile
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+from django.conf import settings
+from django.db import connection
 from django.utils import timezone
 
 from .models import EvidenceArtifact, EvidencePack
 
 logger = logging.getLogger("evidence_pack")
 
+# (stage, artifacts collected so far) — called after every batch insert.
+ProgressCallback = Callable[[str, int], None]
+
 
 def build_evidence_pack(
     *,
@@ -39,6 +54,7 @@ def build_evidence_pack(
     include_governance: bool = True,
     include_votes: bool = True,
     seal: bool = True,
+    batch_size: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Build and optionally seal an evidence pack.
@@ -46,12 +62,41 @@ def build_evidence_pack(
     Returns a dict with ``pack_id``, ``manifest``, ``artifact_count``, and
     ``status``.
     """
+    pack = create_evidence_pack(
+        org_id=org_id,
+        pack_type=pack_type,
+        title=title,
+        period_start=period_start,
+        period_end=period_end,
+        requested_by=requested_by,
+    )
+    return collect_evidence_pack(
+        pack,
+        include_events=include_events,
+        include_audit_logs=include_audit_logs,
+        include_cases=include_cases,
+        include_governance=include_governance,
+        include_votes=include_votes,
+        seal=seal,
+        batch_size=batch_size,
+    )
 
+
+def create_evidence_pack(
+    *,
+    org_id: str,
+    pack_type: str = "governance_full",
+    title: str = "",
+    period_start: Optional[datetime] = None,
+    period_end: Optional[datetime] = None,
+    requested_by: str = "system",
+) -> EvidencePack:
+    """Create the draft pack that ``collect_evidence_pack`` fills."""
     period_end = period_end or timezone.now()
     if not title:
         title = f"Evidence Pack — {pack_type} — {period_end:%Y-%m-%d}"
 
-    pack = EvidencePack.objects.create(
+    return EvidencePack.objects.create(
         org_id=org_id,
         pack_type=pack_type,
         title=title,
@@ -60,24 +105,48 @@ def build_evidence_pack(
         requested_by=requested_by,
     )
 
+
+def collect_evidence_pack(
+    pack: EvidencePack,
+    *,
+    include_events: bool = True,
+    include_audit_logs: bool = True,
+    include_cases: bool = True,
+    include_governance: bool = True,
+    include_votes: bool = True,
+    seal: bool = True,
+    batch_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
+    """Collect artifacts into a draft *pack*, write its manifest, and seal it."""
+    batch_size = batch_size or settings.EVIDENCE_PACK_BATCH_SIZE
+    org_id = str(pack.org_id)
     manifest: Dict[str, str] = {}  # artifact_id → content_hash
 
     # ---- Collect artifacts ----
 
-    if include_audit_logs:
-        _collect_audit_logs(pack, org_id, period_start, period_end, manifest)
-
-    if include_events:
-        _collect_domain_events(pack, org_id, period_start, period_end, manifest)
-
-    if include_cases:
-        _collect_cases(pack, org_id, period_start, period_end, manifest)
-
-    if include_governance:
-        _collect_governance(pack, org_id, period_start, period_end, manifest)
-
-    if include_votes:
-        _collect_votes(pack, org_id, period_start, period_end, manifest)
+    stages = [
+        (include_audit_logs, "audit_logs", _collect_audit_logs),
+        (
+            include_events or include_governance or include_votes,
+            "events",
+            partial(
+                _collect_events,
+                domain=include_events,
+                governance=include_governance,
+                votes=include_votes,
+            ),
+        ),
+        (include_cases, "cases", _collect_cases),
+    ]
+    for enabled, stage, collector in stages:
+        if not enabled:
+            continue
+        try:
+            rows = collector(org_id, pack.period_start, pack.period_end, batch_size)
+            _ingest(pack, stage, rows, manifest, batch_size, progress)
+        except Exception:
+            logger.exception("Failed to collect %s", stage)
 
     # ---- Finalize ----
     pack.checksum_manifest = manifest
@@ -85,7 +154,7 @@ def build_evidence_pack(
     pack.save()
 
     if seal:
-        pack.seal(actor_id=requested_by)
+        pack.seal(actor_id=pack.requested_by)
 
     logger.info(
         "Evidence pack built: id=%s artifacts=%d sealed=%s",
@@ -104,175 +173,164 @@ def build_evidence_pack(
     }
 
 
-# ---------------------------------------------------------------------------
-# Artifact collectors
-# ---------------------------------------------------------------------------
+def _ingest(
+    pack: EvidencePack,
+    stage: str,
+    rows: "Artifacts",
+    manifest: Dict[str, str],
+    batch_size: int,
+    progress: Optional[ProgressCallback],
+) -> None:
+    """Hash *rows* and insert them as artifacts, ``batch_size`` at a time.
 
+    The manifest only gains entries for batches that were written.
+    """
+    batch: List[EvidenceArtifact] = []
 
-def _collect_audit_logs(pack, org_id, start, end, manifest) -> None:
-    try:
-        from core.models import AuditLogs
-
-        qs = AuditLogs.objects.filter(organization_id=org_id)
-        if start:
-            qs = qs.filter(created_at__gte=start)
-        if end:
-            qs = qs.filter(created_at__lte=end)
-
-        for log in qs.order_by("created_at").iterator(chunk_size=200):
-            content = {
-                "id": str(log.id),
-                "action": getattr(log, "action", ""),
-                "actor": getattr(log, "actor", ""),
-                "details": getattr(log, "details", ""),
-                "content_hash": getattr(log, "content_hash", ""),
-                "created_at": str(log.created_at),
-            }
-            artifact = EvidenceArtifact(
+    def flush() -> None:
+        EvidenceArtifact.objects.bulk_create(batch)
+        for artifact in batch:
+            manifest[str(artifact.id)] = artifact.content_hash
+        batch.clear()
+        if progress is not None:
+            progress(stage, len(manifest))
+
+    for artifact_type, source_id, content, canonical in rows:
+        content_hash, size_bytes = EvidenceArtifact.hash_canonical(canonical)
+        batch.append(
+            EvidenceArtifact(
                 pack=pack,
-                artifact_type="audit_log",
-                source_id=str(log.id),
+                artifact_type=artifact_type,
+                source_id=source_id,
                 content=content,
+                content_hash=content_hash,
+                size_bytes=size_bytes,
             )
-            artifact.save()
-            manifest[str(artifact.id)] = artifact.content_hash
+        )
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
 
-    except Exception:
-        logger.exception("Failed to collect audit logs")
 
+# ---------------------------------------------------------------------------
+# Artifact collectors — yield (artifact_type, source_id, content, canonical
+# JSON of content) in created_at order
+# ---------------------------------------------------------------------------
 
-def _collect_domain_events(pack, org_id, start, end, manifest) -> None:
-    try:
-        from services.events.models import Event
-
-        qs = Event.objects.filter(org_id=org_id)
-        if start:
-            qs = qs.filter(created_at__gte=start)
-        if end:
-            qs = qs.filter(created_at__lte=end)
-
-        for event in qs.order_by("created_at").iterator(chunk_size=200):
-            content = {
-                "id": str(event.id),
-                "event_type": event.event_type,
-                "actor_id": event.actor_id,
-                "payload": event.payload,
-                "signature_hash": event.signature_hash,
-                "created_at": str(event.created_at),
-            }
-            artifact = EvidenceArtifact(
-                pack=pack,
-                artifact_type="domain_event",
-                source_id=str(event.id),
-                content=content,
-            )
-            artifact.save()
-            manifest[str(artifact.id)] = artifact.content_hash
+Artifacts = Iterator[Tuple[str, str, Dict[str, Any], str]]
+
+GOVERNANCE_EVENT_TYPES = (
+    "governance_action",
+    "policy_changed",
+    "break_glass_activated",
+)
+VOTE_EVENT_TYPE = "vote_cast"
+
+# Sorted content keys of each event-derived artifact type.
+_DOMAIN_EVENT_KEYS = (
+    "actor_id",
+    "created_at",
+    "event_type",
+    "id",
+    "payload",
+    "signature_hash",
+)
+_GOVERNANCE_KEYS = ("actor_id", "created_at", "event_type", "id", "payload")
+_VOTE_KEYS = ("actor_id", "created_at", "id", "payload")
+
+
+def _in_period(qs, start, end):
+    if start:
+        qs = qs.filter(created_at__gte=start)
+    if end:
+        qs = qs.filter(created_at__lte=end)
+    return qs.order_by("created_at")
+
+
+def _collect_audit_logs(org_id, start, end, chunk_size) -> Artifacts:
+    from core.models import AuditLogs
+
+    qs = _in_period(AuditLogs.objects.filter(organization_id=org_id), start, end)
+    for log in qs.iterator(chunk_size=chunk_size):
+        content = {
+            "id": str(log.id),
+            "action": getattr(log, "action", ""),
+            "actor": getattr(log, "actor", ""),
+            "details": getattr(log, "details", ""),
+            "content_hash": getattr(log, "content_hash", ""),
+            "created_at": str(log.created_at),
+        }
+        yield _artifact("audit_log", str(log.id), content)
+
+
+def _collect_events(
+    org_id, start, end, chunk_size, *, domain: bool, governance: bool, votes: bool
+) -> Artifacts:
+    """
+    One ordered pass over the org's events for the window.
 
-    except Exception:
-        logger.exception("Failed to collect domain events")
+    Each event becomes a ``domain_event`` (if *domain*), plus a
+    ``governance_action`` or ``vote_record`` when its type qualifies.  Field
+    values are serialized once and spliced into each artifact's canonical
+    JSON, which is identical to ``EvidenceArtifact.canonical_json(content)``.
+    """
+    from services.events.models import Event
 
+    qs = Event.objects.filter(org_id=org_id)
+    if not domain:
+        wanted = (GOVERNANCE_EVENT_TYPES if governance else ()) + (
+            (VOTE_EVENT_TYPE,) if votes else ()
+        )
+        qs = qs.filter(event_type__in=wanted)
+    rows = _in_period(qs, start, end).values_list(
+        "id", "event_type", "actor_id", "payload", "signature_hash", "created_at"
+    )
+    dumps = EvidenceArtifact.canonical_json
 
-def _collect_cases(pack, org_id, start, end, manifest) -> None:
-    try:
-        from grievances.models import Claims
-
-        qs = Claims.objects.filter(organization_id=org_id)
-        if start:
-            qs = qs.filter(created_at__gte=start)
-        if end:
-            qs = qs.filter(created_at__lte=end)
-
-        for claim in qs.order_by("created_at").iterator(chunk_size=200):
-            content = {
-                "id": str(claim.id),
-                "status": getattr(claim, "status", ""),
-                "claim_type": getattr(claim, "claim_type", ""),
-                "created_at": str(claim.created_at),
-                "updated_at": str(claim.updated_at),
-            }
-            artifact = EvidenceArtifact(
-                pack=pack,
-                artifact_type="case_record",
-                source_id=str(claim.id),
-                content=content,
-            )
-            artifact.save()
-            manifest[str(artifact.id)] = artifact.content_hash
+    for row in rows.iterator(chunk_size=chunk_size):
+        event_id, event_type, actor_id, payload, signature_hash, created_at = row
+        source_id = str(event_id)
+        fields = {
+            "id": source_id,
+            "event_type": event_type,
+            "actor_id": actor_id,
+            "payload": payload,
+            "signature_hash": signature_hash,
+            "created_at": str(created_at),
+        }
+        encoded = {key: dumps(value) for key, value in fields.items()}
 
-    except Exception:
-        logger.exception("Failed to collect cases")
+        if domain:
+            yield _event_artifact("domain_event", _DOMAIN_EVENT_KEYS, fields, encoded)
+        if governance and event_type in GOVERNANCE_EVENT_TYPES:
+            yield _event_artifact("governance_action", _GOVERNANCE_KEYS, fields, encoded)
+        if votes and event_type == VOTE_EVENT_TYPE:
+            yield _event_artifact("vote_record", _VOTE_KEYS, fields, encoded)
 
 
-def _collect_governance(pack, org_id, start, end, manifest) -> None:
-    """Collect governance-related events from the domain event store."""
-    try:
-        from services.events.models import Event
-
-        governance_types = [
-            "governance_action",
-            "policy_changed",
-            "break_glass_activated",
-        ]
-        qs = Event.objects.filter(
-            org_id=org_id,
-            event_type__in=governance_types,
-        )
-        if start:
-            qs = qs.filter(created_at__gte=start)
-        if end:
-            qs = qs.filter(created_at__lte=end)
-
-        for event in qs.order_by("created_at").iterator(chunk_size=200):
-            content = {
-                "id": str(event.id),
-                "event_type": event.event_type,
-                "actor_id": event.actor_id,
-                "payload": event.payload,
-                "created_at": str(event.created_at),
-            }
-            artifact = EvidenceArtifact(
-                pack=pack,
-                artifact_type="governance_action",
-                source_id=str(event.id),
-                content=content,
-            )
-            artifact.save()
-            manifest[str(artifact.id)] = artifact.content_hash
+def _event_artifact(artifact_type, keys, fields, encoded):
+    canonical = "{" + ", ".join(f'"{key}": {encoded[key]}' for key in keys) + "}"
+    return artifact_type, fields["id"], {key: fields[key] for key in keys}, canonical
 
-    except Exception:
-        logger.exception("Failed to collect governance actions")
 
+def _collect_cases(org_id, start, end, chunk_size) -> Artifacts:
+    from grievances.models import Claims
 
-def _collect_votes(pack, org_id, start, end, manifest) -> None:
-    """Collect vote events from the domain event store."""
-    try:
-        from services.events.models import Event
-
-        qs = Event.objects.filter(org_id=org_id, event_type="vote_cast")
-        if start:
-            qs = qs.filter(created_at__gte=start)
-        if end:
-            qs = qs.filter(created_at__lte=end)
-
-        for event in qs.order_by("created_at").iterator(chunk_size=200):
-            content = {
-                "id": str(event.id),
-                "actor_id": event.actor_id,
-                "payload": event.payload,
-                "created_at": str(event.created_at),
-            }
-            artifact = EvidenceArtifact(
-                pack=pack,
-                artifact_type="vote_record",
-                source_id=str(event.id),
-                content=content,
-            )
-            artifact.save()
-            manifest[str(artifact.id)] = artifact.content_hash
+    qs = _in_period(Claims.objects.filter(organization_id=org_id), start, end)
+    for claim in qs.iterator(chunk_size=chunk_size):
+        content = {
+            "id": str(claim.id),
+            "status": getattr(claim, "status", ""),
+            "claim_type": getattr(claim, "claim_type", ""),
+            "created_at": str(claim.created_at),
+            "updated_at": str(claim.updated_at),
+        }
+        yield _artifact("case_record", str(claim.id), content)
 
-    except Exception:
-        logger.exception("Failed to collect votes")
+
+def _artifact(artifact_type, source_id, content):
+    return artifact_type, source_id, content, EvidenceArtifact.canonical_json(content)
 
 
 # ---------------------------------------------------------------------------
@@ -284,6 +342,9 @@ def export_pack_json(pack_id: str) -> Dict[str, Any]:
     """
     Export a sealed evidence pack as a JSON archive.
 
+    Builds the whole archive in memory; large packs should use
+    ``stream_pack_ndjson`` or ``stream_pack_zip``.
+
     Raises ValueError if the pack is not sealed or integrity check fails.
     """
     pack = EvidencePack.objects.get(pk=pack_id)
@@ -324,3 +385,261 @@ def export_pack_json(pack_id: str) -> Dict[str, Any]:
     pack.save(update_fields=["status", "updated_at"])
 
     return archive
+
+
+# ---------------------------------------------------------------------------
+# Streaming export
+# ---------------------------------------------------------------------------
+
+EXPORT_CHUNK_SIZE = 2000
+# Per-artifact-type spool kept in memory before it rolls over to disk (ZIP).
+ZIP_SPOOL_BYTES = 4 * 1024 * 1024
+# Failing artifact ids listed in the verification trailer.
+MAX_REPORTED_FAILURES = 100
+
+
+def stream_pack_ndjson(pack_id: str) -> Iterator[bytes]:
+    """
+    Export a sealed pack as NDJSON chunks.
+
+    Lines are a ``pack`` header, one ``artifact`` record per artifact (in id
+    order, with ``content`` in its canonical hashed form), and a final
+    ``verification`` trailer.  The checksum manifest is never loaded into
+    memory: it is streamed from PostgreSQL in key order, merge-joined with
+    the artifacts, and re-hashed to check ``pack_hash``.
+
+    Raises ValueError if the pack is not sealed.
+    """
+    pack = _open_export(pack_id)
+    return _ndjson_chunks(pack)
+
+
+def stream_pack_zip(pack_id: str) -> Iterator[bytes]:
+    """
+    Export a sealed pack as a streamed ZIP.
+
+    Contains ``pack.json``, ``artifacts/<artifact_type>.ndjson`` and
+    ``verification.json``; verification is as in ``stream_pack_ndjson``.
+
+    Raises ValueError if the pack is not sealed.
+    """
+    pack = _open_export(pack_id)
+    return _zip_chunks(pack)
+
+
+def _open_export(pack_id: str) -> EvidencePack:
+    pack = EvidencePack.objects.defer("checksum_manifest").get(pk=pack_id)
+    if pack.status not in ("sealed", "exported"):
+        raise ValueError(f"Pack must be sealed before export (current: {pack.status})")
+    pack.status = "exported"
+    pack.save(update_fields=["status", "updated_at"])
+    return pack
+
+
+def _pack_header(pack: EvidencePack) -> Dict[str, Any]:
+    return {
+        "record": "pack",
+        "pack_id": str(pack.id),
+        "org_id": str(pack.org_id),
+        "pack_type": pack.pack_type,
+        "title": pack.title,
+        "period_start": str(pack.period_start) if pack.period_start else None,
+        "period_end": str(pack.period_end) if pack.period_end else None,
+        "sealed_at": str(pack.sealed_at) if pack.sealed_at else None,
+        "sealed_by": pack.sealed_by,
+        "pack_hash": pack.pack_hash,
+        "artifact_count": pack.artifact_count,
+    }
+
+
+def _ndjson_chunks(pack: EvidencePack) -> Iterator[bytes]:
+    yield _json_line(_pack_header(pack))
+    verifier = _ManifestVerifier(_iter_manifest(pack))
+    lines: List[bytes] = []
+    for _, line in _artifact_lines(pack, verifier):
+        lines.append(line)
+        if len(lines) >= EXPORT_CHUNK_SIZE:
+            yield b"".join(lines)
+            lines.clear()
+    lines.append(_json_line(verifier.finish(pack.pack_hash)))
+    yield b"".join(lines)
+
+
+def _zip_chunks(pack: EvidencePack) -> Iterator[bytes]:
+    out = _ZipStream()
+    spools: Dict[str, Any] = {}
+    try:
+        with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("pack.json", json.dumps(_pack_header(pack), indent=2))
+            yield out.drain()
+
+            # Artifacts arrive in id order (for verification), so each type is
+            # spooled until the pass completes, then written as one member.
+            verifier = _ManifestVerifier(_iter_manifest(pack))
+            for artifact_type, line in _artifact_lines(pack, verifier):
+                spool = spools.get(artifact_type)
+                if spool is None:
+                    spool = spools[artifact_type] = tempfile.SpooledTemporaryFile(
+                        max_size=ZIP_SPOOL_BYTES
+                    )
+                spool.write(line)
+
+            for artifact_type in sorted(spools):
+                spool = spools[artifact_type]
+                spool.seek(0)
+                name = f"artifacts/{artifact_type}.ndjson"
+                with archive.open(name, "w", force_zip64=True) as member:
+                    while chunk := spool.read(1024 * 1024):
+                        member.write(chunk)
+                        yield out.drain()
+
+            verification = verifier.finish(pack.pack_hash)
+            archive.writestr("verification.json", json.dumps(verification, indent=2))
+        yield out.drain()
+    finally:
+        for spool in spools.values():
+            spool.close()
+
+
+def _artifact_lines(
+    pack: EvidencePack, verifier: "_ManifestVerifier"
+) -> Iterator[Tuple[str, bytes]]:
+    """Yield ``(artifact_type, ndjson_line)`` in id order, checking each one."""
+    rows = (
+        EvidenceArtifact.objects.filter(pack=pack)
+        .order_by("id")
+        .values_list(
+            "id", "artifact_type", "source_id", "content", "content_hash", "created_at"
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for artifact_id, artifact_type, source_id, content, content_hash, created_at in rows:
+        artifact_id = str(artifact_id)
+        # Same canonical form EvidenceArtifact.hash_content hashes.
+        canonical = json.dumps(content, sort_keys=True, default=str)
+        verifier.check(
+            artifact_id, hashlib.sha256(canonical.encode()).hexdigest(), content_hash
+        )
+        head = json.dumps(
+            {
+                "record": "artifact",
+                "id": artifact_id,
+                "artifact_type": artifact_type,
+                "source_id": source_id,
+                "content_hash": content_hash,
+                "created_at": str(created_at),
+            }
+        )
+        yield artifact_type, f'{head[:-1]}, "content": {canonical}}}\n'.encode()
+
+
+def _iter_manifest(pack: EvidencePack) -> Iterator[Tuple[str, Any]]:
+    """Stream ``checksum_manifest`` entries in key (byte) order."""
+    table = connection.ops.quote_name(EvidencePack._meta.db_table)
+    sql = (
+        f"SELECT m.key, m.value::text FROM {table} p, "
+        f"jsonb_each(p.checksum_manifest) AS m "
+        f'WHERE p.id = %s ORDER BY m.key COLLATE "C"'
+    )
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(sql, [pack.pk])
+        while rows := cursor.fetchmany(EXPORT_CHUNK_SIZE):
+            for key, value in rows:
+                yield key, json.loads(value)
+
+
+class _SealHasher:
+    """Incremental ``sha256(json.dumps(manifest, sort_keys=True, default=str))``.
+
+    Entries must be added in sorted key order.
+    """
+
+    def __init__(self):
+        self._sha = hashlib.sha256()
+        self._empty = True
+
+    def add(self, key: str, value: Any) -> None:
+        separator = "{" if self._empty else ", "
+        entry = f"{json.dumps(key)}: {json.dumps(value, sort_keys=True, default=str)}"
+        self._sha.update(f"{separator}{entry}".encode())
+        self._empty = False
+
+    def hexdigest(self) -> str:
+        sha = self._sha.copy()
+        sha.update(b"{}" if self._empty else b"}")
+        return sha.hexdigest()
+
+
+class _ManifestVerifier:
+    """Merge-join id-ordered artifacts against the key-ordered manifest."""
+
+    def __init__(self, manifest: Iterator[Tuple[str, Any]]):
+        self._manifest = manifest
+        self._seal = _SealHasher()
+        self.checked = 0
+        self.manifest_entries = 0
+        self.counts = {"mismatched": 0, "missing": 0, "unexpected": 0}
+        self.failures: List[Dict[str, str]] = []
+        self._entry = self._next_entry()
+
+    def check(self, artifact_id: str, computed_hash: str, stored_hash: str) -> None:
+        self.checked += 1
+        while self._entry is not None and self._entry[0] < artifact_id:
+            self._fail("missing", self._entry[0])
+            self._entry = self._next_entry()
+        if self._entry is None or self._entry[0] != artifact_id:
+            self._fail("unexpected", artifact_id)
+            return
+        if not computed_hash == stored_hash == self._entry[1]:
+            self._fail("mismatched", artifact_id)
+        self._entry = self._next_entry()
+
+    def finish(self, pack_hash: str) -> Dict[str, Any]:
+        while self._entry is not None:
+            self._fail("missing", self._entry[0])
+            self._entry = self._next_entry()
+        seal_valid = bool(pack_hash) and self._seal.hexdigest() == pack_hash
+        return {
+            "record": "verification",
+            "valid": seal_valid and not any(self.counts.values()),
+            "seal_valid": seal_valid,
+            "artifacts_checked": self.checked,
+            "manifest_entries": self.manifest_entries,
+            **self.counts,
+            "failures": self.failures,
+        }
+
+    def _next_entry(self) -> Optional[Tuple[str, Any]]:
+        entry = next(self._manifest, None)
+        if entry is not None:
+            self._seal.add(*entry)
+            self.manifest_entries += 1
+        return entry
+
+    def _fail(self, kind: str, artifact_id: str) -> None:
+        self.counts[kind] += 1
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append({"id": artifact_id, "problem": kind})
+
+
+class _ZipStream:
+    """Write-only sink for ``zipfile`` that hands back what was written."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _json_line(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, default=str) + "\n").encode()
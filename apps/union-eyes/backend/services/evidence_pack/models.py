@@ -159,9 +159,23 @@ class EvidenceArtifact(models.Model):
     def __str__(self) -> str:
         return f"Artifact({self.artifact_type}, {self.source_id[:12]}…)"
 
+    @staticmethod
+    def canonical_json(value) -> str:
+        """The serialization that ``content_hash`` is computed over."""
+        return json.dumps(value, sort_keys=True, default=str)
+
+    @staticmethod
+    def hash_canonical(canonical: str) -> tuple[str, int]:
+        """Return ``(content_hash, size_bytes)`` for an already-canonical string."""
+        encoded = canonical.encode()
+        return hashlib.sha256(encoded).hexdigest(), len(encoded)
+
+    @classmethod
+    def hash_content(cls, content) -> tuple[str, int]:
+        """Return ``(content_hash, size_bytes)`` for serialized *content*."""
+        return cls.hash_canonical(cls.canonical_json(content))
+
     def save(self, *args, **kwargs):
         if not self.content_hash:
-            canonical = json.dumps(self.content, sort_keys=True, default=str)
-            self.content_hash = hashlib.sha256(canonical.encode()).hexdigest()
-            self.size_bytes = len(canonical.encode())
+            self.content_hash, self.size_bytes = self.hash_content(self.content)
         super().save(*args, **kwargs)
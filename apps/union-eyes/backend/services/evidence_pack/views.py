@@ -4,16 +4,24 @@ Evidence Pack System — DRF views.
 Provides:
   GET     /api/governance/evidence-pack/            — list packs for org
   GET     /api/governance/evidence-pack/<id>/        — pack detail
-  POST    /api/governance/evidence-pack/export/      — build + seal + export
+  POST    /api/governance/evidence-pack/export/      — queue build + seal
   GET     /api/governance/evidence-pack/<id>/download/ — download sealed JSON
+          (``?stream=ndjson`` or ``?stream=zip`` for a streamed, verified export)
   GET     /api/governance/evidence-pack/<id>/verify/   — verify seal integrity
 """
 
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from .builder import build_evidence_pack, export_pack_json
+from .builder import (
+    create_evidence_pack,
+    export_pack_json,
+    stream_pack_ndjson,
+    stream_pack_zip,
+)
 from .models import EvidenceArtifact, EvidencePack
 from .serializers import (
     EvidenceArtifactSerializer,
@@ -21,6 +29,12 @@ from .serializers import (
     EvidencePackSerializer,
 )
 
+# ``?stream=`` value → (exporter, content type) for the download action.
+STREAM_FORMATS = {
+    "ndjson": (stream_pack_ndjson, "application/x-ndjson"),
+    "zip": (stream_pack_zip, "application/zip"),
+}
+
 
 class EvidencePackViewSet(viewsets.ReadOnlyModelViewSet):
     """Read-only listing + export/verify actions for evidence packs."""
@@ -34,14 +48,15 @@ class EvidencePackViewSet(viewsets.ReadOnlyModelViewSet):
             return EvidencePack.objects.none()
         return EvidencePack.objects.filter(org_id=org_id)
 
-    # ----- export: build + seal + return -----
+    # ----- export: queue build + seal -----
 
     @action(detail=False, methods=["post"], url_path="export")
     def export(self, request):
         """
         ``POST /api/governance/evidence-pack/export/``
 
-        Builds, seals, and returns a governance evidence pack.
+        Creates a draft pack and queues the build; returns ``202`` with the
+        pack id.  Poll the pack detail for ``metadata.build`` progress.
         """
         ser = EvidencePackExportSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
@@ -55,42 +70,57 @@ class EvidencePackViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        result = build_evidence_pack(
+        pack = create_evidence_pack(
             org_id=str(org_id),
             pack_type=ser.validated_data["pack_type"],
             title=ser.validated_data.get("title", ""),
             period_start=ser.validated_data.get("period_start"),
             period_end=ser.validated_data.get("period_end"),
             requested_by=actor_id,
-            include_events=ser.validated_data["include_events"],
-            include_audit_logs=ser.validated_data["include_audit_logs"],
-            include_cases=ser.validated_data["include_cases"],
-            include_governance=ser.validated_data["include_governance"],
-            include_votes=ser.validated_data["include_votes"],
+        )
+        pack.metadata = {"build": {"state": "queued"}}
+        pack.save(update_fields=["metadata", "updated_at"])
+
+        from .tasks import build_evidence_pack_task
+
+        options = {
+            key: ser.validated_data[key]
+            for key in (
+                "include_events",
+                "include_audit_logs",
+                "include_cases",
+                "include_governance",
+                "include_votes",
+            )
+        }
+        transaction.on_commit(
+            lambda: build_evidence_pack_task.delay(pack_id=str(pack.id), **options)
         )
 
-        # Emit governance event.
-        from services.events.dispatcher import emit_event
-
-        emit_event(
-            event_type="evidence_pack_exported",
-            org_id=str(org_id),
-            actor_id=actor_id,
-            payload={
-                "pack_id": result["pack_id"],
-                "pack_type": ser.validated_data["pack_type"],
-                "artifact_count": result["artifact_count"],
+        return Response(
+            {
+                "pack_id": str(pack.id),
+                "title": pack.title,
+                "status": pack.status,
+                "build": pack.metadata["build"],
             },
+            status=status.HTTP_202_ACCEPTED,
         )
 
-        return Response(result, status=status.HTTP_201_CREATED)
-
     # ----- download sealed JSON -----
 
     @action(detail=True, methods=["get"], url_path="download")
     def download(self, request, pk=None):
         """Download the sealed JSON archive for a pack."""
+        stream = request.query_params.get("stream")
         try:
+            if stream in STREAM_FORMATS:
+                exporter, content_type = STREAM_FORMATS[stream]
+                response = StreamingHttpResponse(exporter(pk), content_type=content_type)
+                response["Content-Disposition"] = (
+                    f'attachment; filename="evidence-pack-{pk}.{stream}"'
+                )
+                return response
             archive = export_pack_json(pk)
             return Response(archive)
         except EvidencePack.DoesNotExist:
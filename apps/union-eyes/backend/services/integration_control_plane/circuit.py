@@ -0,0 +1,413 @@
+"""
+Integration Control Plane — shared circuit breaker.
+
+Delivery workers check one Redis-held circuit per integration before
+sending:
+
+- **closed** — deliveries go out and their outcomes are counted in a rolling
+  window of ``INTEGRATION_CIRCUIT_BUCKETS`` time buckets.  Once the window
+  holds at least ``INTEGRATION_CIRCUIT_MIN_REQUESTS`` outcomes with a failure
+  rate of ``INTEGRATION_CIRCUIT_FAILURE_RATE`` or more, the circuit opens.
+- **open** — nothing is sent for ``INTEGRATION_CIRCUIT_OPEN_SECONDS``, doubled
+  on each consecutive trip up to ``INTEGRATION_CIRCUIT_MAX_OPEN_SECONDS``.
+  Messages are parked in a Redis sorted set (scored by release time) and
+  re-queued by ``pop_due_parked``.
+- **half-open** — one probe delivery goes through; success closes the
+  circuit, failure opens it again.
+
+A check and an outcome are one Lua script call each.  Outcomes also add to
+per-integration health counters in Redis that ``flush_health`` writes to
+``IntegrationRegistry`` in aggregate, instead of one row update per attempt.
+
+If Redis is unavailable, deliveries are allowed and health is written
+straight to the database, as before.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from django.conf import settings
+
+from observability.metrics import record_integration_circuit
+
+logger = logging.getLogger("integration_circuit")
+
+PARKED_KEY = "icp_parked"
+DIRTY_KEY = "icp_health:dirty"
+
+# While a half-open probe is in flight, parked messages look again this often.
+PROBE_RECHECK_SECONDS = 5.0
+
+# Extra time a probe may take beyond the longest delivery timeout.
+PROBE_GRACE_SECONDS = 5.0
+
+# After a Redis error, skip Redis for this long before trying again.
+REDIS_RETRY_INTERVAL = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Lua scripts
+# ---------------------------------------------------------------------------
+
+# KEYS: circuit
+# ARGV: now_ms, probe token, probe_ms, recheck_ms
+# Returns {decision, wait_ms}: 0 = closed, 1 = wait, 2 = send as the probe
+CHECK_LUA = """
+local state = redis.call('HMGET', KEYS[1], 'state', 'until', 'probe_until')
+if not state[1] then
+  return {0, 0}
+end
+local now = tonumber(ARGV[1])
+if state[1] == 'open' then
+  local open_until = tonumber(state[2])
+  if now < open_until then
+    return {1, open_until - now}
+  end
+else
+  local probe_until = tonumber(state[3] or '0')
+  if now < probe_until then
+    return {1, math.min(probe_until - now, tonumber(ARGV[4]))}
+  end
+end
+redis.call('HSET', KEYS[1], 'state', 'half_open', 'probe', ARGV[2],
+           'probe_until', now + tonumber(ARGV[3]))
+return {2, 0}
+"""
+
+# KEYS: circuit, health counters, dirty set, window buckets (current first)
+# ARGV: now_ms, ok (1|0), bucket_ttl_ms, min_requests, failure_rate,
+#       open_ms, max_open_ms, integration id, failure reason
+# Returns the transition: 'opened', 'reopened', 'closed' or ''
+RECORD_LUA = """
+local now = tonumber(ARGV[1])
+local ok = ARGV[2] == '1'
+redis.call('HINCRBY', KEYS[4], ok and 'ok' or 'fail', 1)
+redis.call('PEXPIRE', KEYS[4], ARGV[3])
+
+if ok then
+  redis.call('HSET', KEYS[2], 'succeeded', 1, 'consecutive', 0, 'last_success', now)
+else
+  redis.call('HINCRBY', KEYS[2], 'failures', 1)
+  redis.call('HINCRBY', KEYS[2], 'consecutive', 1)
+  redis.call('HSET', KEYS[2], 'last_failure', now, 'reason', ARGV[9])
+end
+redis.call('SADD', KEYS[3], ARGV[8])
+
+local open_ms, max_open_ms = tonumber(ARGV[6]), tonumber(ARGV[7])
+local state = redis.call('HMGET', KEYS[1], 'state', 'trips')
+if state[1] == 'half_open' then
+  if ok then
+    redis.call('DEL', KEYS[1])
+    for i = 4, #KEYS do
+      redis.call('DEL', KEYS[i])
+    end
+    return 'closed'
+  end
+  local trips = tonumber(state[2] or '1') + 1
+  local wait = math.min(open_ms * 2 ^ (trips - 1), max_open_ms)
+  redis.call('HSET', KEYS[1], 'state', 'open', 'until', now + wait, 'trips', trips)
+  redis.call('HDEL', KEYS[1], 'probe', 'probe_until')
+  redis.call('PEXPIRE', KEYS[1], wait + max_open_ms)
+  return 'reopened'
+end
+if ok or state[1] then
+  return ''
+end
+
+local total, failed = 0, 0
+for i = 4, #KEYS do
+  local counts = redis.call('HMGET', KEYS[i], 'ok', 'fail')
+  local fail = tonumber(counts[2] or '0')
+  total = total + tonumber(counts[1] or '0') + fail
+  failed = failed + fail
+end
+if total >= tonumber(ARGV[4]) and failed >= tonumber(ARGV[5]) * total then
+  redis.call('HSET', KEYS[1], 'state', 'open', 'until', now + open_ms, 'trips', 1)
+  redis.call('PEXPIRE', KEYS[1], open_ms + max_open_ms)
+  return 'opened'
+end
+return ''
+"""
+
+# KEYS: parked set
+# ARGV: now_ms, limit
+POP_DUE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #due > 0 then
+  redis.call('ZREM', KEYS[1], unpack(due))
+end
+return due
+"""
+
+# KEYS: dirty set
+# ARGV: limit
+# Returns {id, {field, value, ...}, id, {...}, ...} and resets those counters
+TAKE_HEALTH_LUA = """
+local ids = redis.call('SPOP', KEYS[1], ARGV[1])
+local out = {}
+for _, id in ipairs(ids) do
+  local key = 'icp_health:' .. id
+  out[#out + 1] = id
+  out[#out + 1] = redis.call('HGETALL', key)
+  redis.call('DEL', key)
+end
+return out
+"""
+
+_LUA = {
+    "check": CHECK_LUA,
+    "record": RECORD_LUA,
+    "pop_due": POP_DUE_LUA,
+    "take_health": TAKE_HEALTH_LUA,
+}
+
+_redis_lock = threading.Lock()
+_redis_scripts: Optional[Dict[str, Any]] = None
+_redis_retry_at = 0.0
+
+
+def _get_redis():
+    """Return the default cache's Redis client (django-redis)."""
+    from django_redis import get_redis_connection
+
+    return get_redis_connection("default")
+
+
+def _scripts() -> Optional[Dict[str, Any]]:
+    """Client and registered scripts, or None while backing off."""
+    global _redis_scripts, _redis_retry_at
+    if _redis_scripts is not None:
+        return _redis_scripts
+    if time.monotonic() < _redis_retry_at:
+        return None
+    with _redis_lock:
+        if _redis_scripts is None:
+            try:
+                client = _get_redis()
+                scripts = {name: client.register_script(lua) for name, lua in _LUA.items()}
+                _redis_scripts = dict(scripts, client=client)
+            except Exception as exc:
+                _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+                logger.warning("Circuit breaker: Redis unavailable (%s)", exc)
+        return _redis_scripts
+
+
+def _redis_failed(exc: Exception) -> None:
+    global _redis_scripts, _redis_retry_at
+    _redis_scripts = None
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+    logger.warning("Circuit breaker: Redis call failed, circuits closed (%s)", exc)
+
+
+def reset_circuits() -> None:
+    """Forget the Redis client and scripts (tests)."""
+    global _redis_scripts, _redis_retry_at
+    with _redis_lock:
+        _redis_scripts = None
+        _redis_retry_at = 0.0
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _circuit_key(integration_id) -> str:
+    return f"icp_cb:{integration_id}"
+
+
+# ---------------------------------------------------------------------------
+# Check and record
+# ---------------------------------------------------------------------------
+
+
+class Decision(NamedTuple):
+    """Whether a delivery may be sent now and, if not, for how long to park it."""
+
+    allowed: bool
+    probe: bool = False
+    wait: float = 0.0
+
+
+CLOSED = Decision(True)
+
+
+def check(integration, token: str) -> Decision:
+    """Ask the circuit whether a delivery to *integration* may go out.
+
+    *token* identifies the caller if it is let through as the half-open probe.
+    """
+    scripts = _scripts()
+    if scripts is None:
+        return CLOSED
+    probe_seconds = settings.INTEGRATION_DELIVERY_MAX_TIMEOUT + PROBE_GRACE_SECONDS
+    try:
+        decision, wait_ms = scripts["check"](
+            keys=[_circuit_key(integration.id)],
+            args=[
+                _now_ms(),
+                token,
+                int(probe_seconds * 1000),
+                int(PROBE_RECHECK_SECONDS * 1000),
+            ],
+        )
+    except Exception as exc:
+        _redis_failed(exc)
+        return CLOSED
+    if decision == 0:
+        return CLOSED
+    if decision == 2:
+        logger.info("Circuit half-open for %s — sending probe", integration.name)
+        return Decision(True, probe=True)
+    return Decision(False, wait=wait_ms / 1000)
+
+
+def record(integration, ok: bool, reason: str = "") -> str:
+    """Count one delivery outcome; returns the circuit transition, if any."""
+    scripts = _scripts()
+    if scripts is None:
+        _record_in_database(integration, ok, reason)
+        return ""
+
+    window_ms = settings.INTEGRATION_CIRCUIT_WINDOW * 1000
+    bucket_ms = max(1, window_ms // settings.INTEGRATION_CIRCUIT_BUCKETS)
+    now = _now_ms()
+    index = now // bucket_ms
+    base = _circuit_key(integration.id)
+    try:
+        transition = scripts["record"](
+            keys=[base, f"icp_health:{integration.id}", DIRTY_KEY]
+            + [
+                f"{base}:w:{index - i}"
+                for i in range(settings.INTEGRATION_CIRCUIT_BUCKETS)
+            ],
+            args=[
+                now,
+                1 if ok else 0,
+                window_ms + bucket_ms,
+                settings.INTEGRATION_CIRCUIT_MIN_REQUESTS,
+                settings.INTEGRATION_CIRCUIT_FAILURE_RATE,
+                settings.INTEGRATION_CIRCUIT_OPEN_SECONDS * 1000,
+                settings.INTEGRATION_CIRCUIT_MAX_OPEN_SECONDS * 1000,
+                str(integration.id),
+                reason[:500],
+            ],
+        )
+    except Exception as exc:
+        _redis_failed(exc)
+        _record_in_database(integration, ok, reason)
+        return ""
+
+    transition = transition.decode() if isinstance(transition, bytes) else transition
+    if transition:
+        record_integration_circuit(integration.integration_type, transition)
+        log = logger.info if transition == "closed" else logger.warning
+        log("Circuit %s for integration %s", transition, integration.name)
+    return transition
+
+
+def _record_in_database(integration, ok: bool, reason: str) -> None:
+    if ok:
+        integration.record_success()
+    else:
+        integration.record_failure(reason=reason[:500])
+
+
+# ---------------------------------------------------------------------------
+# Delay queue for messages held back by an open circuit
+# ---------------------------------------------------------------------------
+
+
+def park(messages: List[Dict[str, Any]], wait: float) -> bool:
+    """Hold dispatch *messages* (task kwargs) for *wait* seconds.
+
+    Returns False if Redis is unavailable; the caller must re-queue them
+    some other way.
+    """
+    scripts = _scripts()
+    if scripts is None:
+        return False
+    release_at = _now_ms() + int(wait * 1000)
+    try:
+        scripts["client"].zadd(
+            PARKED_KEY,
+            {json.dumps(m, sort_keys=True, default=str): release_at for m in messages},
+        )
+    except Exception as exc:
+        _redis_failed(exc)
+        return False
+    return True
+
+
+def pop_due_parked(limit: int) -> List[Dict[str, Any]]:
+    """Remove and return up to *limit* parked messages whose time has come."""
+    scripts = _scripts()
+    if scripts is None:
+        return []
+    try:
+        due = scripts["pop_due"](keys=[PARKED_KEY], args=[_now_ms(), limit])
+    except Exception as exc:
+        _redis_failed(exc)
+        return []
+    return [json.loads(member) for member in due]
+
+
+# ---------------------------------------------------------------------------
+# Aggregated registry write-back
+# ---------------------------------------------------------------------------
+
+
+def flush_health(limit: Optional[int] = None) -> int:
+    """Write health counters gathered since the last flush to the registry.
+
+    Each integration with outcomes gets one row update, whatever the number
+    of deliveries.  Returns the number of integrations flushed.
+    """
+    from services.integration_control_plane.models import IntegrationRegistry
+
+    scripts = _scripts()
+    if scripts is None:
+        return 0
+    limit = limit or settings.INTEGRATION_HEALTH_FLUSH_BATCH
+    try:
+        taken = scripts["take_health"](keys=[DIRTY_KEY], args=[limit])
+    except Exception as exc:
+        _redis_failed(exc)
+        return 0
+
+    counters = {}
+    for raw_id, flat in zip(taken[::2], taken[1::2]):
+        fields = {
+            _text(flat[i]): _text(flat[i + 1]) for i in range(0, len(flat), 2)
+        }
+        if fields:
+            counters[_text(raw_id)] = fields
+
+    flushed = 0
+    for integration in IntegrationRegistry.objects.filter(pk__in=list(counters)):
+        fields = counters[str(integration.pk)]
+        integration.apply_health_counters(
+            failures=int(fields.get("failures", 0)),
+            consecutive=int(fields.get("consecutive", 0)),
+            succeeded="succeeded" in fields,
+            last_success_at=_from_ms(fields.get("last_success")),
+            last_failure_at=_from_ms(fields.get("last_failure")),
+            reason=fields.get("reason", ""),
+        )
+        flushed += 1
+    return flushed
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _from_ms(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(int(value) / 1000, tz=dt_timezone.utc)
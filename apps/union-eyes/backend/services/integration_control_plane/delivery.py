@@ -0,0 +1,258 @@
+"""
+Integration Control Plane — pooled, concurrent HTTP delivery engine.
+
+Each worker process keeps one ``DeliveryEngine``:
+
+- a ``requests.Session`` whose ``HTTPAdapter`` pools keep-alive connections
+  per host, so repeat deliveries skip TCP / TLS setup;
+- a thread pool, so one task can keep many deliveries in flight and a slow
+  endpoint does not serialise everything behind it;
+- a per-integration concurrency limit (``metadata["max_concurrency"]``)
+  and read timeout (``metadata["timeout_seconds"]``), capped by settings.
+
+Only the HTTP exchange runs on the pool threads; callers record outcomes
+(registry health, idempotency keys, retries) on their own thread.
+Delivery latency is exported as the ``integration_delivery_ms`` histogram.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from observability.metrics import record_integration_delivery
+
+logger = logging.getLogger("integration_delivery")
+
+CONNECT_TIMEOUT = 5  # seconds; the read timeout is per integration
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of one HTTP delivery attempt."""
+
+    status_code: Optional[int] = None
+    body: Optional[dict] = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _Lane:
+    """Per-integration admission: at most *limit* deliveries in flight."""
+
+    __slots__ = ("limit", "active", "pending")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self.pending: Deque[tuple] = deque()
+
+
+class DeliveryEngine:
+    """Process-wide pooled HTTP client with per-integration limits.
+
+    Deliveries beyond an integration's limit wait in that integration's lane
+    rather than on a pool thread, so a saturated endpoint never ties up
+    threads other integrations could use.  Pools and threads are created
+    lazily and recreated after a fork, so the module-level engine is safe to
+    import before Celery forks its workers.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        default_concurrency: Optional[int] = None,
+        default_timeout: Optional[float] = None,
+    ):
+        self._workers = workers
+        self._pool_size = pool_size
+        self._default_concurrency = default_concurrency
+        self._default_timeout = default_timeout
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lanes: Dict[str, _Lane] = {}
+
+    # ----- per-integration policy -----
+
+    def concurrency_limit(self, integration) -> int:
+        default = self._default_concurrency or settings.INTEGRATION_DELIVERY_CONCURRENCY
+        limit = (integration.metadata or {}).get("max_concurrency") or default
+        return max(1, min(int(limit), self._max_workers()))
+
+    def read_timeout(self, integration) -> float:
+        default = self._default_timeout or settings.INTEGRATION_DELIVERY_TIMEOUT
+        timeout = (integration.metadata or {}).get("timeout_seconds") or default
+        return min(float(timeout), settings.INTEGRATION_DELIVERY_MAX_TIMEOUT)
+
+    # ----- delivery -----
+
+    def post(self, integration, body: bytes, headers: Dict[str, str]) -> DeliveryResult:
+        """Deliver one request and wait for it (still lane-limited)."""
+        return self.submit(integration, body, headers).result()
+
+    def submit(
+        self,
+        integration,
+        body: bytes,
+        headers: Dict[str, str],
+        *,
+        deadline: Optional[float] = None,
+    ) -> "Future[Optional[DeliveryResult]]":
+        """Queue one delivery.
+
+        The future resolves to ``None`` if the delivery could not start
+        before *deadline* (a ``time.monotonic()`` value); the request was
+        then never sent.
+        """
+        self._ensure()
+        future: "Future[Optional[DeliveryResult]]" = Future()
+        item = (future, integration, body, headers, deadline)
+        key = str(integration.id)
+        limit = self.concurrency_limit(integration)
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = self._lanes[key] = _Lane(limit)
+            lane.limit = limit
+            if lane.active >= lane.limit:
+                lane.pending.append(item)
+                return future
+            lane.active += 1
+        self._executor.submit(self._run, lane, item)
+        return future
+
+    def post_many(
+        self,
+        integration,
+        requests_: Sequence[Tuple[bytes, Dict[str, str]]],
+        *,
+        budget: Optional[float] = None,
+    ) -> List[Optional[DeliveryResult]]:
+        """Deliver *requests_* concurrently within a time *budget* (seconds).
+
+        Results are in input order; ``None`` marks a request that could not
+        start within the budget.  Requests already in flight when the budget
+        runs out finish (bounded by the read timeout).
+        """
+        budget = settings.INTEGRATION_DELIVERY_BUDGET if budget is None else budget
+        deadline = time.monotonic() + budget
+        futures = [
+            self.submit(integration, body, headers, deadline=deadline)
+            for body, headers in requests_
+        ]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        with self._lock:
+            executor, session = self._executor, self._session
+            self._pid = None
+            self._session = self._executor = None
+            self._lanes = {}
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if session is not None:
+            session.close()
+
+    # ----- internals -----
+
+    def _run(self, lane: _Lane, item: tuple) -> None:
+        """Run *item*, then hand the lane's slot to its next pending item.
+
+        The next item is queued behind other lanes' work rather than run on
+        this thread, so busy integrations take turns on the pool.
+        """
+        future, integration, body, headers, deadline = item
+        try:
+            if deadline is not None and time.monotonic() >= deadline:
+                future.set_result(None)
+            else:
+                future.set_result(self._post(integration, body, headers))
+        except BaseException as exc:  # never strand a waiting caller
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                item = lane.pending.popleft() if lane.pending else None
+                if item is None:
+                    lane.active -= 1
+            if item is not None:
+                self._executor.submit(self._run, lane, item)
+
+    def _post(self, integration, body: bytes, headers: Dict[str, str]) -> DeliveryResult:
+        start = time.monotonic()
+        result = DeliveryResult()
+        outcome = "success"
+        try:
+            resp = self._session.post(
+                integration.endpoint_url,
+                data=body,
+                headers=headers,
+                timeout=(CONNECT_TIMEOUT, self.read_timeout(integration)),
+            )
+            result.status_code = resp.status_code
+            resp.raise_for_status()
+            result.body = _safe_json(resp)
+        except requests.Timeout as exc:
+            outcome, result.error = "timeout", str(exc)
+        except requests.HTTPError as exc:
+            outcome, result.error = "http_error", str(exc)
+        except Exception as exc:
+            outcome, result.error = "error", str(exc)
+        result.elapsed_ms = (time.monotonic() - start) * 1000
+        record_integration_delivery(integration.integration_type, outcome, result.elapsed_ms)
+        return result
+
+    def _max_workers(self) -> int:
+        return self._workers or settings.INTEGRATION_DELIVERY_WORKERS
+
+    def _ensure(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            # Fresh pools after fork: never share sockets with the parent.
+            pool_size = self._pool_size or settings.INTEGRATION_HTTP_POOL_SIZE
+            adapter = HTTPAdapter(
+                pool_connections=settings.INTEGRATION_HTTP_POOL_HOSTS,
+                pool_maxsize=pool_size,
+                max_retries=0,  # retries are scheduled by the task layer
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers(), thread_name_prefix="integration-delivery"
+            )
+            self._lanes = {}
+            self._pid = pid
+
+
+def _safe_json(response: requests.Response) -> Optional[dict]:
+    try:
+        return response.json()
+    except Exception:
+        return None
+
+
+#: Shared engine for this worker process.
+delivery_engine = DeliveryEngine()
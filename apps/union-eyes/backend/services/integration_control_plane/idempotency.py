@@ -0,0 +1,139 @@
+"""
+Integration Control Plane — delivery idempotency.
+
+Redis is the first level: before a delivery, ``claim`` takes the key
+``icp_idem:<org>:<integration>:<request_hash>`` with ``SET NX EX`` (Django
+``cache.add``).  The same payload sent to two integrations is two deliveries.
+The key holds the claim owner while the delivery is in flight and the
+cached response once it succeeded.  Only when the key is absent does
+``claim`` ask the database, which stays the durable record
+(``IntegrationIdempotencyKey``, 24 h).  If Redis is unavailable, every check
+falls back to the database.
+
+``purge_expired`` deletes expired rows in batches for the periodic sweeper.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger("integration_idempotency")
+
+
+def payload_hash(payload: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical payload — the idempotency ``request_hash``."""
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _key(org_id, integration_id, request_hash: str) -> str:
+    return f"icp_idem:{org_id}:{integration_id}:{request_hash}"
+
+
+def _duplicate(status: Optional[int], body: Any) -> Dict[str, Any]:
+    return {"status": "duplicate", "original_status": status, "original_body": body}
+
+
+def claim(org_id, integration_id, request_hash: str, owner: str) -> Optional[Dict[str, Any]]:
+    """
+    Claim the right to deliver *request_hash* to *integration_id* for *org_id*.
+
+    Returns ``None`` if the caller may deliver, or a ``duplicate`` result if
+    the request was already delivered or another message is delivering it.
+    A claim already held by *owner* (a redelivered message) is re-entered.
+    """
+    from services.integration_control_plane.models import IntegrationIdempotencyKey
+
+    key = _key(org_id, integration_id, request_hash)
+    try:
+        claimed = cache.add(
+            key, {"owner": owner}, timeout=settings.INTEGRATION_IDEMPOTENCY_CLAIM_TTL
+        )
+        held = None if claimed else cache.get(key)
+    except Exception as e:
+        logger.warning("Idempotency cache unavailable, using the database: %s", e)
+        held = None
+
+    if isinstance(held, dict):
+        if "response_status" in held:
+            return _duplicate(held["response_status"], held.get("response_body"))
+        if held.get("owner") != owner:
+            return {"status": "duplicate", "reason": "in_flight"}
+
+    row = (
+        IntegrationIdempotencyKey.objects.filter(
+            request_hash=request_hash,
+            org_id=org_id,
+            integration_id=integration_id,
+            expires_at__gte=timezone.now(),
+        )
+        .only("response_status", "response_body", "expires_at")
+        .first()
+    )
+    if row is None:
+        return None
+    _remember(key, row.response_status, row.response_body, row.expires_at)
+    return _duplicate(row.response_status, row.response_body)
+
+
+def record_delivery(
+    integration, org_id, request_hash: str, status: Optional[int], body: Any
+) -> None:
+    """Persist a successful delivery and cache its response."""
+    from services.integration_control_plane.models import IntegrationIdempotencyKey
+
+    expires_at = timezone.now() + timedelta(hours=settings.INTEGRATION_IDEMPOTENCY_TTL_HOURS)
+    IntegrationIdempotencyKey.objects.create(
+        request_hash=request_hash,
+        integration=integration,
+        org_id=org_id,
+        response_status=status,
+        response_body=body,
+        expires_at=expires_at,
+    )
+    _remember(_key(org_id, integration.pk, request_hash), status, body, expires_at)
+
+
+def release(org_id, integration_id, request_hash: str) -> None:
+    """Drop an in-flight claim so a retry or requeue can take it."""
+    try:
+        cache.delete(_key(org_id, integration_id, request_hash))
+    except Exception as e:
+        logger.warning("Idempotency cache delete failed: %s", e)
+
+
+def purge_expired(batch_size: Optional[int] = None, max_batches: int = 1000) -> int:
+    """Delete expired idempotency rows, *batch_size* at a time."""
+    from services.integration_control_plane.models import IntegrationIdempotencyKey
+
+    batch_size = batch_size or settings.INTEGRATION_IDEMPOTENCY_PURGE_BATCH
+    cutoff = timezone.now()
+    purged = 0
+    for _ in range(max_batches):
+        ids = list(
+            IntegrationIdempotencyKey.objects.filter(expires_at__lt=cutoff)
+            .order_by()
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        purged += IntegrationIdempotencyKey.objects.filter(pk__in=ids).delete()[0]
+    return purged
+
+
+def _remember(key: str, status: Optional[int], body: Any, expires_at) -> None:
+    ttl = int((expires_at - timezone.now()).total_seconds())
+    if ttl <= 0:
+        return
+    try:
+        cache.set(key, {"response_status": status, "response_body": body}, timeout=ttl)
+    except Exception as e:
+        logger.warning("Idempotency cache write failed: %s", e)
@@ -99,21 +99,26 @@ class IntegrationRegistry(models.Model):
 
     # ----- domain helpers -----
 
+    # ``status`` is only written when it changes: a status save invalidates
+    # the org's cached subscription index (see ``signals``).  Deliveries
+    # count outcomes in Redis and ``circuit.flush_health`` applies them here
+    # in aggregate; the per-outcome methods are the fallback without Redis.
+
     def record_success(self) -> None:
+        previous_status = self.status
         self.last_success_at = timezone.now()
         self.consecutive_failures = 0
         if self.status == "degraded":
             self.status = "active"
         self.save(
-            update_fields=[
-                "last_success_at",
-                "consecutive_failures",
-                "status",
-                "updated_at",
-            ]
+            update_fields=self._with_status(
+                ["last_success_at", "consecutive_failures", "updated_at"],
+                previous_status,
+            )
         )
 
     def record_failure(self, reason: str = "") -> None:
+        previous_status = self.status
         self.failure_count += 1
         self.consecutive_failures += 1
         self.last_failure_at = timezone.now()
@@ -123,16 +128,60 @@ class IntegrationRegistry(models.Model):
         elif self.consecutive_failures >= 3:
             self.status = "degraded"
         self.save(
-            update_fields=[
-                "failure_count",
-                "consecutive_failures",
-                "last_failure_at",
-                "last_failure_reason",
-                "status",
-                "updated_at",
-            ]
+            update_fields=self._with_status(
+                [
+                    "failure_count",
+                    "consecutive_failures",
+                    "last_failure_at",
+                    "last_failure_reason",
+                    "updated_at",
+                ],
+                previous_status,
+            )
         )
 
+    def apply_health_counters(
+        self,
+        *,
+        failures: int,
+        consecutive: int,
+        succeeded: bool,
+        last_success_at=None,
+        last_failure_at=None,
+        reason: str = "",
+    ) -> None:
+        """Apply delivery outcomes aggregated since the last flush.
+
+        Same status rules as ``record_success`` / ``record_failure`` applied
+        one by one; *consecutive* counts the failures after the last success
+        (or all of them if nothing succeeded).
+        """
+        previous_status = self.status
+        fields = ["updated_at"]
+        if succeeded:
+            self.last_success_at = last_success_at
+            self.consecutive_failures = consecutive
+            fields += ["last_success_at", "consecutive_failures"]
+            if self.status == "degraded":
+                self.status = "active"
+        else:
+            self.consecutive_failures += consecutive
+            fields.append("consecutive_failures")
+        if failures:
+            self.failure_count += failures
+            self.last_failure_at = last_failure_at
+            self.last_failure_reason = reason
+            fields += ["failure_count", "last_failure_at", "last_failure_reason"]
+        if consecutive:
+            if self.consecutive_failures >= self.max_retries:
+                self.status = "failed"
+            elif self.consecutive_failures >= 3:
+                self.status = "degraded"
+        self.save(update_fields=self._with_status(fields, previous_status))
+
+    def _with_status(self, fields: list, previous_status: str) -> list:
+        return fields + ["status"] if self.status != previous_status else fields
+
 
 class IntegrationIdempotencyKey(models.Model):
     """
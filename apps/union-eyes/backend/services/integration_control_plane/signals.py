@@ -0,0 +1,26 @@
+"""Cache invalidation hooks for integration control plane models."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from services.integration_control_plane.models import IntegrationRegistry
+from services.integration_control_plane.subscriptions import invalidate_subscriptions
+
+#: Fields the subscription index is built from.
+_INDEXED_FIELDS = frozenset({"org_id", "integration_type", "status", "metadata"})
+
+
+@receiver(post_save, sender=IntegrationRegistry)
+@receiver(post_delete, sender=IntegrationRegistry)
+def _invalidate_subscription_index(sender, instance, update_fields=None, **kwargs):
+    """Forget the org's subscription index when a registration changes.
+
+    Health bookkeeping saves (``record_success`` / ``record_failure`` without
+    a status change) leave the index alone.  Invalidation waits for commit so
+    a concurrent rebuild cannot re-cache the old rows.
+    """
+    if update_fields is not None and not _INDEXED_FIELDS.intersection(update_fields):
+        return
+    org_id = instance.org_id
+    transaction.on_commit(lambda: invalidate_subscriptions(org_id))
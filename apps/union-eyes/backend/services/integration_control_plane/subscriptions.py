@@ -0,0 +1,64 @@
+"""
+Integration Control Plane — cached subscription index.
+
+Maps ``(org_id, event_type)`` to the active outbound integrations that
+should receive the event, so event fan-out does not query
+``IntegrationRegistry`` and scan ``metadata["subscribed_events"]`` for every
+event.  The index is built per org and kept in an ``auth_core.caching``
+``TieredCache`` (process-local dict in front of Redis).  It is invalidated
+by the ``IntegrationRegistry`` save/delete signals (see ``.signals``).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from auth_core.caching import MISSING, TieredCache
+
+SUBSCRIPTION_CACHE_LOCAL_TTL = 10
+SUBSCRIPTION_CACHE_SHARED_TTL = 900
+
+#: Integration types that receive domain events.
+OUTBOUND_TYPES = ("webhook_outbound", "api_push")
+
+#: Index key for integrations with no ``subscribed_events`` filter.
+ALL_EVENTS = "*"
+
+subscription_cache = TieredCache(
+    "icp_subs",
+    local_ttl=SUBSCRIPTION_CACHE_LOCAL_TTL,
+    shared_ttl=SUBSCRIPTION_CACHE_SHARED_TTL,
+)
+
+
+def subscribed_integration_ids(org_id, event_type: str) -> List[str]:
+    """IDs of the active outbound integrations subscribed to *event_type*."""
+    index = subscription_cache.get(str(org_id))
+    if index is MISSING:
+        index = build_subscription_index(org_id)
+        subscription_cache.set(str(org_id), index)
+    return index.get(event_type, []) + index.get(ALL_EVENTS, [])
+
+
+def build_subscription_index(org_id) -> Dict[str, List[str]]:
+    """Read one org's subscriptions from the database (one query)."""
+    from services.integration_control_plane.models import IntegrationRegistry
+
+    index: Dict[str, List[str]] = {}
+    rows = IntegrationRegistry.objects.filter(
+        org_id=org_id,
+        status="active",
+        integration_type__in=OUTBOUND_TYPES,
+    ).values_list("id", "metadata")
+    for integration_id, metadata in rows:
+        # No (or an empty) subscription list means "every event".
+        event_types = (metadata or {}).get("subscribed_events") or [ALL_EVENTS]
+        for event_type in set(event_types):
+            index.setdefault(event_type, []).append(str(integration_id))
+    return index
+
+
+def invalidate_subscriptions(org_id) -> None:
+    """Drop the cached index for *org_id* (this process and Redis)."""
+    if org_id:
+        subscription_cache.delete(str(org_id))
@@ -2,11 +2,14 @@
 Integration Retry Engine — Celery workers.
 
 Provides resilient delivery with exponential backoff, max-retry thresholds,
-and dead-letter queue semantics for failed integration dispatches.
+and dead-letter queue semantics for failed integration dispatches.  HTTP
+requests go through the pooled ``delivery.delivery_engine``.  Each delivery
+first checks the integration's circuit breaker (``circuit``); while it is
+open, messages are parked and released later instead of being sent.
 
 Queues
 ------
-- ``integration_queue``       — primary dispatch
+- ``integration_queue``       — primary dispatch (single and grouped)
 - ``integration_retry_queue`` — retries with backoff
 - ``integration_dead_letter_queue`` — permanently failed deliveries
 """
@@ -14,16 +17,20 @@ Queues
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
 import logging
 import time
-from datetime import timedelta
-from typing import Any, Dict, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-import requests
 from celery import shared_task
-from django.utils import timezone
+from django.conf import settings
+
+from observability.metrics import instrument_task, record_task_retry
+from services.integration_control_plane import circuit, idempotency
+from services.integration_control_plane.delivery import DeliveryResult, delivery_engine
 
 logger = logging.getLogger("integration_retry")
 
@@ -33,7 +40,6 @@ logger = logging.getLogger("integration_retry")
 MAX_RETRIES = 8
 BASE_BACKOFF_SECONDS = 5  # first retry after 5 s → 10 → 20 → 40 → …
 BACKOFF_MULTIPLIER = 2
-REQUEST_TIMEOUT = 30  # seconds
 
 
 # ---------------------------------------------------------------------------
@@ -49,6 +55,7 @@ REQUEST_TIMEOUT = 30  # seconds
     acks_late=True,
     reject_on_worker_lost=True,
 )
+@instrument_task
 def dispatch_integration(
     self,
     *,
@@ -57,54 +64,233 @@ def dispatch_integration(
     payload: Dict[str, Any],
     idempotency_key: Optional[str] = None,
     attempt: int = 0,
+    payload_hash: Optional[str] = None,
+    claim_owner: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Deliver *payload* to the integration identified by *integration_id*.
 
-    On failure the task is re-enqueued on ``integration_retry_queue`` with
-    exponential backoff.  After *MAX_RETRIES* the payload is routed to
-    ``integration_dead_letter_queue``.
+    *payload_hash* is computed once when the event is dispatched and carried
+    through retries.  On failure the task is re-enqueued on
+    ``integration_retry_queue`` with exponential backoff.  After
+    *MAX_RETRIES* the payload is routed to ``integration_dead_letter_queue``.
+    """
+    integration, skipped = _resolve_integration(integration_id, org_id)
+    if skipped:
+        return skipped
+
+    owner = claim_owner or self.request.id or uuid4().hex
+    decision = circuit.check(integration, owner)
+    if not decision.allowed:
+        message = _single_message(
+            integration_id, org_id, payload, idempotency_key, payload_hash, attempt
+        )
+        return _park([message], decision.wait)
+
+    prepared, duplicate = _prepare_delivery(
+        integration,
+        org_id,
+        payload,
+        idempotency_key,
+        attempt,
+        request_hash=payload_hash,
+        owner=owner,
+    )
+    if duplicate:
+        return duplicate
+
+    result = delivery_engine.post(integration, prepared["body"], prepared["headers"])
+    return _finish_delivery(
+        self.name, integration, org_id, payload, prepared, attempt, result
+    )
+
+
+# ---------------------------------------------------------------------------
+# Grouped dispatch — many event payloads for one integration per message
+# ---------------------------------------------------------------------------
+
+
+@shared_task(
+    name="integration_control_plane.dispatch_integration_batch",
+    bind=True,
+    queue="integration_queue",
+    max_retries=0,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+@instrument_task
+def dispatch_integration_batch(
+    self,
+    *,
+    integration_id: str,
+    org_id: str,
+    payloads: List[Dict[str, Any]],
+    payload_hashes: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
-    from services.integration_control_plane.models import (
-        IntegrationIdempotencyKey,
-        IntegrationRegistry,
+    Deliver *payloads* to one integration, concurrently.
+
+    Requests go out through the shared delivery engine, up to the
+    integration's concurrency limit and within one time budget.  Outcomes
+    are recorded per payload, so idempotency, retries and dead-lettering
+    still apply per delivery; payloads that could not start within the
+    budget are re-queued as single dispatches.  An open circuit parks the
+    whole batch; a half-open one sends the first payload alone as the probe.
+    """
+    integration, skipped = _resolve_integration(integration_id, org_id)
+    if skipped:
+        return dict(skipped, deliveries=0)
+
+    owner = self.request.id or uuid4().hex
+    hashes = payload_hashes or [None] * len(payloads)
+    decision = circuit.check(integration, owner)
+    if not decision.allowed:
+        messages = [
+            _single_message(integration_id, org_id, payload, None, request_hash)
+            for payload, request_hash in zip(payloads, hashes)
+        ]
+        return dict(_park(messages, decision.wait), deliveries=len(payloads))
+
+    statuses: Counter = Counter()
+    pending = []
+    for payload, request_hash in zip(payloads, hashes):
+        prepared, duplicate = _prepare_delivery(
+            integration, org_id, payload, None, 0, request_hash=request_hash, owner=owner
+        )
+        if duplicate:
+            statuses["duplicate"] += 1
+        else:
+            pending.append((payload, prepared))
+
+    if decision.probe and pending:
+        (payload, prepared), pending = pending[0], pending[1:]
+        result = delivery_engine.post(integration, prepared["body"], prepared["headers"])
+        outcome = _finish_delivery(
+            self.name, integration, org_id, payload, prepared, 0, result
+        )
+        statuses[outcome["status"]] += 1
+        decision = circuit.check(integration, owner)
+        if not decision.allowed and pending:
+            for _, prepared in pending:
+                idempotency.release(org_id, integration.pk, prepared["request_hash"])
+            _park(
+                [
+                    _single_message(
+                        integration_id,
+                        org_id,
+                        payload,
+                        prepared["idempotency_key"],
+                        prepared["request_hash"],
+                    )
+                    for payload, prepared in pending
+                ],
+                decision.wait,
+            )
+            statuses["parked"] += len(pending)
+            pending = []
+
+    results = delivery_engine.post_many(
+        integration, [(prepared["body"], prepared["headers"]) for _, prepared in pending]
     )
+    for (payload, prepared), result in zip(pending, results):
+        if result is None:
+            idempotency.release(org_id, integration.pk, prepared["request_hash"])
+            dispatch_integration.delay(
+                integration_id=integration_id,
+                org_id=org_id,
+                payload=payload,
+                idempotency_key=prepared["idempotency_key"],
+                payload_hash=prepared["request_hash"],
+            )
+            statuses["deferred"] += 1
+            continue
+        outcome = _finish_delivery(
+            self.name, integration, org_id, payload, prepared, 0, result
+        )
+        statuses[outcome["status"]] += 1
+
+    return {"status": "processed", "deliveries": len(payloads), "results": dict(statuses)}
+
+
+# ---------------------------------------------------------------------------
+# Delivery steps shared by the single and grouped tasks
+# ---------------------------------------------------------------------------
+
+
+def _single_message(
+    integration_id: str,
+    org_id: str,
+    payload: Dict[str, Any],
+    idempotency_key: Optional[str],
+    request_hash: Optional[str],
+    attempt: int = 0,
+) -> Dict[str, Any]:
+    """``dispatch_integration`` kwargs for one payload."""
+    return {
+        "integration_id": integration_id,
+        "org_id": org_id,
+        "payload": payload,
+        "idempotency_key": idempotency_key,
+        "attempt": attempt,
+        "payload_hash": request_hash,
+    }
+
+
+def _park(messages: List[Dict[str, Any]], wait: float) -> Dict[str, Any]:
+    """Hold dispatch *messages* back while the integration's circuit is open."""
+    if not circuit.park(messages, wait):
+        for message in messages:
+            dispatch_integration.apply_async(kwargs=message, countdown=wait)
+    logger.info("Circuit open — parked %d delivery(ies) for %.1fs", len(messages), wait)
+    return {"status": "parked", "parked": len(messages), "retry_in_s": round(wait, 1)}
+
+
+def _resolve_integration(integration_id: str, org_id: str):
+    """Return ``(integration, None)``, or ``(None, result)`` if it cannot receive."""
+    from services.integration_control_plane.models import IntegrationRegistry
 
-    # ---- resolve integration ----
     try:
         integration = IntegrationRegistry.objects.get(pk=integration_id, org_id=org_id)
     except IntegrationRegistry.DoesNotExist:
         logger.error("Integration %s not found for org %s", integration_id, org_id)
-        return {"status": "error", "reason": "integration_not_found"}
+        return None, {"status": "error", "reason": "integration_not_found"}
 
     if integration.status in ("paused", "disabled"):
         logger.info(
             "Integration %s is %s — skipping", integration_id, integration.status
         )
-        return {"status": "skipped", "reason": integration.status}
+        return None, {"status": "skipped", "reason": integration.status}
+    return integration, None
+
 
-    # ---- idempotency check ----
-    request_hash = _hash_payload(payload)
+def _prepare_delivery(
+    integration,
+    org_id: str,
+    payload: Dict[str, Any],
+    idempotency_key: Optional[str],
+    attempt: int,
+    *,
+    request_hash: Optional[str],
+    owner: str,
+):
+    """Idempotency claim plus signed request body and headers.
+
+    Returns ``(prepared, None)``, or ``(None, result)`` for a duplicate.
+    """
+    request_hash = request_hash or idempotency.payload_hash(payload)
     if idempotency_key is None:
         idempotency_key = request_hash
 
-    already = IntegrationIdempotencyKey.objects.filter(
-        request_hash=request_hash,
-        org_id=org_id,
-        expires_at__gte=timezone.now(),
-    ).first()
-    if already:
+    duplicate = idempotency.claim(org_id, integration.pk, request_hash, owner)
+    if duplicate:
         logger.info(
             "Duplicate request detected (hash=%s) — returning cached response",
             request_hash[:12],
         )
-        return {
-            "status": "duplicate",
-            "original_status": already.response_status,
-            "original_body": already.response_body,
-        }
+        return None, duplicate
 
-    # ---- deliver ----
+    # The signature covers exactly the bytes that are sent.
+    body_bytes = json.dumps(payload, sort_keys=True).encode()
     headers = {
         "Content-Type": "application/json",
         "X-Idempotency-Key": idempotency_key,
@@ -113,11 +299,8 @@ def dispatch_integration(
         "X-Attempt": str(attempt),
     }
     if integration.secret:
-        import hmac as _hmac
-
-        body_bytes = json.dumps(payload, sort_keys=True).encode()
         ts = str(int(time.time()))
-        sig = _hmac.new(
+        sig = hmac.new(
             integration.secret.encode(),
             f"{ts}.{body_bytes.decode()}".encode(),
             hashlib.sha256,
@@ -125,67 +308,73 @@ def dispatch_integration(
         headers["X-Webhook-Signature"] = sig
         headers["X-Webhook-Timestamp"] = ts
 
-    try:
-        resp = requests.post(
-            integration.endpoint_url,
-            json=payload,
-            headers=headers,
-            timeout=REQUEST_TIMEOUT,
-        )
-        resp.raise_for_status()
+    return {
+        "request_hash": request_hash,
+        "idempotency_key": idempotency_key,
+        "body": body_bytes,
+        "headers": headers,
+    }, None
 
-        # success → record
-        integration.record_success()
-        IntegrationIdempotencyKey.objects.create(
-            request_hash=request_hash,
-            integration=integration,
-            org_id=org_id,
-            response_status=resp.status_code,
-            response_body=_safe_json(resp),
-            expires_at=timezone.now() + timedelta(hours=24),
+
+def _finish_delivery(
+    task_name: str,
+    integration,
+    org_id: str,
+    payload: Dict[str, Any],
+    prepared: Dict[str, Any],
+    attempt: int,
+    result: DeliveryResult,
+) -> Dict[str, Any]:
+    """Record a delivery outcome and schedule a retry or dead-letter."""
+    if result.ok:
+        circuit.record(integration, ok=True)
+        idempotency.record_delivery(
+            integration, org_id, prepared["request_hash"], result.status_code, result.body
         )
         logger.info(
             "Integration dispatch OK — %s → %s (%s)",
             integration.name,
             integration.endpoint_url,
-            resp.status_code,
-        )
-        return {"status": "delivered", "http_status": resp.status_code}
-
-    except Exception as exc:
-        integration.record_failure(reason=str(exc)[:500])
-        logger.warning(
-            "Integration dispatch FAILED (attempt %d/%d) — %s: %s",
-            attempt + 1,
-            MAX_RETRIES,
-            integration.name,
-            exc,
+            result.status_code,
         )
+        return {"status": "delivered", "http_status": result.status_code}
+
+    circuit.record(integration, ok=False, reason=result.error)
+    idempotency.release(org_id, integration.pk, prepared["request_hash"])
+    logger.warning(
+        "Integration dispatch FAILED (attempt %d/%d) — %s: %s",
+        attempt + 1,
+        MAX_RETRIES,
+        integration.name,
+        result.error,
+    )
 
-        if attempt + 1 >= MAX_RETRIES:
-            # Dead-letter
-            send_to_dead_letter.delay(
-                integration_id=integration_id,
-                org_id=org_id,
-                payload=payload,
-                error=str(exc)[:1000],
-                attempts=attempt + 1,
-            )
-            return {"status": "dead_lettered", "attempts": attempt + 1}
-
-        # Schedule retry with exponential backoff
-        backoff = BASE_BACKOFF_SECONDS * (BACKOFF_MULTIPLIER**attempt)
-        retry_integration.apply_async(
-            kwargs={
-                "integration_id": integration_id,
-                "org_id": org_id,
-                "payload": payload,
-                "idempotency_key": idempotency_key,
-                "attempt": attempt + 1,
-            },
-            countdown=backoff,
+    if attempt + 1 >= MAX_RETRIES:
+        # Dead-letter
+        send_to_dead_letter.delay(
+            integration_id=str(integration.id),
+            org_id=org_id,
+            payload=payload,
+            error=result.error[:1000],
+            attempts=attempt + 1,
         )
-        return {"status": "retrying", "next_attempt": attempt + 1, "backoff_s": backoff}
+        return {"status": "dead_lettered", "attempts": attempt + 1}
+
+    # Schedule retry with exponential backoff
+    record_task_retry(task_name)
+    backoff = BASE_BACKOFF_SECONDS * (BACKOFF_MULTIPLIER**attempt)
+    retry_integration.apply_async(
+        kwargs={
+            "integration_id": str(integration.id),
+            "org_id": org_id,
+            "payload": payload,
+            "idempotency_key": prepared["idempotency_key"],
+            "attempt": attempt + 1,
+            "payload_hash": prepared["request_hash"],
+        },
+        countdown=backoff,
+    )
+    return {"status": "retrying", "next_attempt": attempt + 1, "backoff_s": backoff}
 
 
 # ---------------------------------------------------------------------------
@@ -199,6 +388,7 @@ def dispatch_integration(
     queue="integration_retry_queue",
     acks_late=True,
 )
+@instrument_task
 def retry_integration(
     self,
     *,
@@ -207,6 +397,7 @@ def retry_integration(
     payload: Dict[str, Any],
     idempotency_key: Optional[str] = None,
     attempt: int = 1,
+    payload_hash: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Re-dispatch an integration delivery.  Delegates back to
@@ -218,6 +409,8 @@ def retry_integration(
         payload=payload,
         idempotency_key=idempotency_key,
         attempt=attempt,
+        payload_hash=payload_hash,
+        claim_owner=self.request.id,
     )
 
 
@@ -274,17 +467,59 @@ def send_to_dead_letter(
 
 
 # ---------------------------------------------------------------------------
-# Helpers
+# Idempotency-key sweeper
 # ---------------------------------------------------------------------------
 
 
-def _hash_payload(payload: Dict[str, Any]) -> str:
-    canonical = json.dumps(payload, sort_keys=True, default=str)
-    return hashlib.sha256(canonical.encode()).hexdigest()
+@shared_task(
+    name="integration_control_plane.purge_idempotency_keys",
+    queue="cleanup",
+    acks_late=True,
+    ignore_result=True,
+)
+def purge_idempotency_keys() -> Dict[str, Any]:
+    """Delete expired ``IntegrationIdempotencyKey`` rows in batches."""
+    purged = idempotency.purge_expired()
+    if purged:
+        logger.info("Purged %d expired integration idempotency keys", purged)
+    return {"purged": purged}
 
 
-def _safe_json(response: requests.Response) -> Optional[dict]:
-    try:
-        return response.json()
-    except Exception:
-        return None
+# ---------------------------------------------------------------------------
+# Circuit-breaker housekeeping
+# ---------------------------------------------------------------------------
+
+
+@shared_task(
+    name="integration_control_plane.release_parked",
+    queue="integration_queue",
+    ignore_result=True,
+)
+def release_parked_deliveries(max_batches: int = 20) -> Dict[str, Any]:
+    """Re-queue parked deliveries whose wait is over.
+
+    Each goes back through ``dispatch_integration``, which checks the circuit
+    again — and parks the message again if it is still open.
+    """
+    batch_size = settings.INTEGRATION_PARKED_RELEASE_BATCH
+    released = 0
+    for _ in range(max_batches):
+        messages = circuit.pop_due_parked(batch_size)
+        for message in messages:
+            dispatch_integration.delay(**message)
+        released += len(messages)
+        if len(messages) < batch_size:
+            break
+    if released:
+        logger.info("Released %d parked integration deliveries", released)
+    return {"released": released}
+
+
+@shared_task(
+    name="integration_control_plane.flush_health",
+    queue="integration_queue",
+    ignore_result=True,
+)
+def flush_integration_health() -> Dict[str, Any]:
+    """Write aggregated delivery outcomes to ``IntegrationRegistry``."""
+    return {"flushed": circuit.flush_health()}
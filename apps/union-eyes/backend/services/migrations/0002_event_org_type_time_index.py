@@ -0,0 +1,30 @@
+"""
+Migration: widen the (org_id, event_type) event index with created_at.
+
+Evidence-pack builds read events per org, type and time window; the
+three-column index turns those into range scans and still covers the
+two-column lookups the old index served.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("services", "0001_enterprise_hardening"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["org_id", "event_type", "created_at"],
+                name="idx_events_org_type_time",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="event",
+            name="idx_events_org_type",
+        ),
+    ]
@@ -0,0 +1,37 @@
+"""
+Migration: transactional outbox for domain events.
+
+Rows are written with the event and deleted once the relay has published
+them, so the table only ever holds the unpublished backlog.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("services", "0002_event_org_type_time_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventOutbox",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("enqueued_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "event",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="outbox_entry",
+                        to="services.event",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "domain_event_outbox",
+            },
+        ),
+    ]
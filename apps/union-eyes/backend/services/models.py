@@ -1,6 +1,6 @@
 from django.db import models
 from services.compliance_snapshot.models import ComplianceSnapshot  # noqa: F401
-from services.events.models import Event  # noqa: F401
+from services.events.models import Event, EventOutbox  # noqa: F401
 from services.evidence_pack.models import EvidenceArtifact, EvidencePack  # noqa: F401
 
 # Import sub-package models so Django discovers them for migrations.
@@ -0,0 +1,23 @@
+"""
+Shared pytest configuration.
+
+Benchmarks marked ``slow_benchmark`` take tens of seconds each, so they only
+run when benchmarks are asked for explicitly (``--benchmark-only``).
+"""
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow_benchmark: long-running benchmark, run only with --benchmark-only"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", default=False):
+        return
+    skip = pytest.mark.skip(reason="slow benchmark; run with --benchmark-only")
+    for item in items:
+        if "slow_benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,112 @@
+"""
+Local SMTP sink for email delivery tests and throughput benchmarks.
+
+Speaks enough SMTP (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT) for
+Django's SMTP backend and keeps every accepted message.  ``handshake_delay``
+is slept before the greeting, standing in for the TCP/TLS/AUTH cost of a
+real relay; ``reject`` lists addresses refused at RCPT with a 550.
+"""
+
+from __future__ import annotations
+
+import socketserver
+import threading
+import time
+from collections import Counter
+from email import message_from_bytes
+from typing import Iterable, Optional
+
+
+class SmtpSink:
+    def __init__(self, *, handshake_delay: float = 0.0, reject: Iterable[str] = ()):
+        self.handshake_delay = handshake_delay
+        self.reject = {address.lower() for address in reject}
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages: list = []
+        self.rcpt_attempts: Counter = Counter()
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def delivered_to(self, address: str) -> int:
+        """Number of accepted messages addressed to ``address``."""
+        with self.lock:
+            return sum(address in rcpts for rcpts, _ in self.messages)
+
+    def __enter__(self) -> "SmtpSink":
+        sink = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str) -> None:
+                self.wfile.write(line.encode() + b"\r\n")
+                self.wfile.flush()
+
+            def handle(self):
+                with sink.lock:
+                    sink.connections += 1
+                if sink.handshake_delay:
+                    time.sleep(sink.handshake_delay)
+                self.reply("220 sink ESMTP")
+                rcpts: list = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    verb = line[:4].decode(errors="replace").upper()
+                    arg = line[5:].decode(errors="replace").strip()
+                    if verb == "EHLO":
+                        self.reply("250-sink")
+                        self.reply("250 8BITMIME")
+                    elif verb == "HELO":
+                        self.reply("250 sink")
+                    elif verb == "MAIL":
+                        rcpts = []
+                        self.reply("250 OK")
+                    elif verb == "RCPT":
+                        address = arg.split(":", 1)[1].strip().strip("<>").lower()
+                        with sink.lock:
+                            sink.rcpt_attempts[address] += 1
+                        if address in sink.reject:
+                            self.reply("550 mailbox unavailable")
+                        else:
+                            rcpts.append(address)
+                            self.reply("250 OK")
+                    elif verb == "DATA":
+                        self.reply("354 end with <CRLF>.<CRLF>")
+                        chunks = []
+                        while True:
+                            chunk = self.rfile.readline()
+                            if not chunk or chunk == b".\r\n":
+                                break
+                            chunks.append(chunk[1:] if chunk.startswith(b"..") else chunk)
+                        with sink.lock:
+                            sink.messages.append((rcpts, message_from_bytes(b"".join(chunks))))
+                        rcpts = []
+                        self.reply("250 queued")
+                    elif verb in ("RSET", "NOOP"):
+                        rcpts = []
+                        self.reply("250 OK")
+                    elif verb == "QUIT":
+                        self.reply("221 bye")
+                        return
+                    else:
+                        self.reply("502 not implemented")
+
+        class Server(socketserver.ThreadingTCPServer):
+            daemon_threads = True
+            allow_reuse_address = True
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
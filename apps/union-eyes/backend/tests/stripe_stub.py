@@ -0,0 +1,81 @@
+"""
+Local stand-in for the Stripe PaymentIntents API, for payment retry tests and
+benchmarks.
+
+``StripeStub.create`` has the signature of
+``billing.payment_retry._create_payment_intent``.  Each call sleeps for
+``latency`` and then asks ``responder(transaction_id, n)`` — ``n`` counts
+calls for that transaction — for an intent status or an exception to raise.
+Like Stripe, a repeated idempotency key replays the first successful answer
+without charging again.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Callable, Optional, Union
+
+Responder = Callable[[str, int], Union[str, Exception]]
+
+
+class StripeError(Exception):
+    """Shaped like stripe.error.StripeError: ``http_status`` and ``code``."""
+
+    def __init__(self, message: str, *, http_status: Optional[int] = None, code: Optional[str] = None):
+        super().__init__(message)
+        self.http_status = http_status
+        self.code = code
+
+
+def rate_limited() -> StripeError:
+    return StripeError("Too many requests", http_status=429, code="rate_limit")
+
+
+def card_declined() -> StripeError:
+    return StripeError("Your card was declined.", http_status=402, code="card_declined")
+
+
+class StripeStub:
+    def __init__(self, *, latency: float = 0.0, responder: Optional[Responder] = None):
+        self.latency = latency
+        self.responder = responder or (lambda txn_id, n: "succeeded")
+        self.lock = threading.Lock()
+        self.calls: Counter = Counter()
+        self.keys: list = []
+        self.charges = 0
+        self.call_times: list = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._replies: dict = {}
+
+    def create(self, params: dict, idempotency_key: str, api_key: str):
+        txn_id = params["metadata"]["transaction_id"]
+        with self.lock:
+            self.calls[txn_id] += 1
+            n = self.calls[txn_id]
+            self.keys.append(idempotency_key)
+            self.call_times.append(time.monotonic())
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            replay = self._replies.get(idempotency_key)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if replay is not None:
+                return replay
+            answer = self.responder(txn_id, n)
+            if isinstance(answer, Exception):
+                raise answer
+            with self.lock:
+                if idempotency_key not in self._replies:
+                    self.charges += 1
+                    self._replies[idempotency_key] = SimpleNamespace(
+                        id=f"pi_{self.charges}", status=answer
+                    )
+                return self._replies[idempotency_key]
+        finally:
+            with self.lock:
+                self.in_flight -= 1
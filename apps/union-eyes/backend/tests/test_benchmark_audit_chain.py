@@ -0,0 +1,98 @@
+"""
+Benchmark — concurrent audit-chain appends to a single org.
+
+N threads call ``create_audit_log`` for the same organization.  Reports
+throughput and the time spent waiting for the chain-head row lock (the
+``UPDATE … RETURNING`` claim), then checks the chain still verifies.
+Needs PostgreSQL (row locks); the threads use their own connections.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_audit_chain.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+
+import pytest
+
+THREADS = 8
+APPENDS_PER_THREAD = 50
+
+
+@pytest.fixture
+def organization(transactional_db):
+    from auth_core.models import Organizations
+
+    return Organizations.objects.create(
+        name="Bench Local",
+        slug="bench-local",
+        organization_type="local",
+        clerk_organization_id="org_bench",
+    )
+
+
+def _run_appenders(org_id, lock_waits):
+    from django.db import connection
+
+    from core import services
+
+    claim = services._claim_chain_slots
+
+    def timed_claim(organization_id, count):
+        start = time.perf_counter()
+        try:
+            return claim(organization_id, count)
+        finally:
+            lock_waits.append(time.perf_counter() - start)
+
+    def work(worker: int) -> None:
+        try:
+            for i in range(APPENDS_PER_THREAD):
+                services.create_audit_log(
+                    organization_id=org_id,
+                    actor_id=f"user_{worker}",
+                    action="update",
+                    resource_type="Claim",
+                    resource_id=str(i),
+                    details={"worker": worker},
+                )
+        finally:
+            connection.close()
+
+    services._claim_chain_slots = timed_claim
+    try:
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        services._claim_chain_slots = claim
+
+
+@pytest.mark.benchmark(group="audit-chain")
+def test_concurrent_appends_one_org(benchmark, organization):
+    from core.services import verify_audit_chain
+
+    lock_waits: list = []
+    benchmark.pedantic(
+        _run_appenders, args=(organization.id, lock_waits), rounds=3, iterations=1
+    )
+
+    total = THREADS * APPENDS_PER_THREAD
+    throughput = total / benchmark.stats.stats.mean
+    benchmark.extra_info["appends_per_second"] = round(throughput, 1)
+    benchmark.extra_info["lock_wait_p50_ms"] = round(
+        statistics.median(lock_waits) * 1000, 3
+    )
+    benchmark.extra_info["lock_wait_p99_ms"] = round(
+        statistics.quantiles(lock_waits, n=100)[98] * 1000, 3
+    )
+
+    result = verify_audit_chain(organization.id)
+    assert result == {"valid": True, "count": total * 3}
@@ -0,0 +1,87 @@
+"""
+Benchmark — per-request Clerk token verification cost.
+
+Compares the legacy path (a fresh ``PyJWKClient`` per request, so every call
+re-downloads the JWKS) with the process-wide key store and verified-token
+cache, against the local ``JWKSStub`` endpoint.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_auth.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import jwt
+import pytest
+from django.test import override_settings
+
+from tests.test_clerk_auth_cache import JWKSStub
+
+
+@pytest.fixture
+def jwks_stub():
+    from auth_core.authentication import reset_auth_caches
+
+    stub = JWKSStub()
+    reset_auth_caches()
+    with override_settings(CLERK_JWKS_URL=stub.url):
+        yield stub
+    reset_auth_caches()
+    stub.close()
+
+
+def _legacy_verify(jwks_url: str, token: str) -> dict:
+    """The pre-cache implementation of ``ClerkAuthentication._verify_token``."""
+    jwks_client = jwt.PyJWKClient(
+        jwks_url,
+        cache_keys=True,
+        max_cached_keys=16,
+        cache_jwk_set=True,
+        lifespan=3600,
+    )
+    signing_key = jwks_client.get_signing_key_from_jwt(token)
+    return jwt.decode(
+        token, signing_key.key, algorithms=["RS256"], options={"verify_aud": False}
+    )
+
+
+@pytest.mark.benchmark(group="clerk-auth")
+def test_verify_token_legacy(benchmark, jwks_stub):
+    token = jwks_stub.issue()
+    calls = []
+
+    def verify():
+        calls.append(None)
+        return _legacy_verify(jwks_stub.url, token)
+
+    payload = benchmark(verify)
+    assert payload["sub"] == "user_abc"
+    # One JWKS download per request.
+    assert jwks_stub.fetch_count == len(calls)
+
+
+@pytest.mark.benchmark(group="clerk-auth")
+def test_verify_token_cached_keys(benchmark, jwks_stub, settings):
+    """Key store only — every call still runs RSA verification."""
+    from auth_core.authentication import ClerkAuthentication
+
+    settings.CLERK_TOKEN_CACHE_TTL = 0
+    token = jwks_stub.issue()
+    auth = ClerkAuthentication()
+    payload = benchmark(auth._verify_token, token)
+    assert payload["sub"] == "user_abc"
+    assert jwks_stub.fetch_count == 1
+
+
+@pytest.mark.benchmark(group="clerk-auth")
+def test_verify_token_cached_payload(benchmark, jwks_stub):
+    """Repeated calls from one session hit the verified-token cache."""
+    from auth_core.authentication import ClerkAuthentication
+
+    token = jwks_stub.issue()
+    auth = ClerkAuthentication()
+    payload = benchmark(auth._verify_token, token)
+    assert payload["sub"] == "user_abc"
+    assert jwks_stub.fetch_count == 1
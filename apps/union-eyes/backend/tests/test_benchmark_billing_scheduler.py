@@ -0,0 +1,104 @@
+"""
+Benchmark — billing scheduler over 10,000 organizations.
+
+A stub billing service stands in for ``_process_org_billing``: every org
+takes ``BILLING_LATENCY`` seconds and one in ``FAILURE_EVERY`` fails.  The
+chord runs ``bill_org_shard`` over shards of ``SHARD_SIZE`` orgs on
+``WORKERS`` threads standing in for Celery workers, then
+``summarize_billing_run``; wall time and the size of the final task result
+are reported in ``extra_info``.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_billing_scheduler.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from django.db import connections
+from django.utils import timezone
+
+ORGS = 10_000
+SHARD_SIZE = 500
+WORKERS = 8
+BILLING_LATENCY = 0.001  # seconds per org
+FAILURE_EVERY = 200
+PERIOD = "2026-10-01"
+
+pytestmark = pytest.mark.slow_benchmark
+
+
+@pytest.fixture
+def org_ids():
+    return [str(uuid.UUID(int=i + 1)) for i in range(ORGS)]
+
+
+def _stub_billing_service(org, frequency):
+    time.sleep(BILLING_LATENCY)
+    org_id = org["organization_id"]
+    if uuid.UUID(org_id).int % FAILURE_EVERY == 0:
+        return {"organization_id": org_id, "organization_name": org_id,
+                "success": False, "error": "card_declined"}
+    return {"organization_id": org_id, "organization_name": org_id, "success": True,
+            "transactions_created": 3, "total_amount": "42.00"}
+
+
+def _bill_shard(shard):
+    from billing.tasks import bill_org_shard
+
+    try:
+        return bill_org_shard.apply(
+            kwargs={"org_ids": shard, "frequency": "monthly", "period": PERIOD}
+        ).get()
+    finally:
+        connections.close_all()
+
+
+def _report(benchmark, seconds, result):
+    benchmark.extra_info.update(
+        organizations=ORGS,
+        seconds=round(seconds, 2),
+        result_bytes=len(json.dumps(result)),
+    )
+
+
+@pytest.mark.benchmark(group="billing-scheduler")
+def test_sharded_chord(benchmark, org_ids, transactional_db):
+    from billing.models import BillingRun
+    from billing.tasks import summarize_billing_run
+
+    shards = [org_ids[i : i + SHARD_SIZE] for i in range(0, ORGS, SHARD_SIZE)]
+
+    def run():
+        start = time.perf_counter()
+        with patch("billing.tasks._process_org_billing", _stub_billing_service), patch(
+            "billing.tasks._notify_billing_failure"
+        ), ThreadPoolExecutor(max_workers=WORKERS) as workers:
+            shard_results = list(workers.map(_bill_shard, shards))
+            result = summarize_billing_run(
+                shard_results,
+                frequency="monthly",
+                period=PERIOD,
+                started_at=timezone.now().isoformat(),
+            )
+        return time.perf_counter() - start, result
+
+    seconds, result = benchmark.pedantic(run, rounds=1, iterations=1)
+    _report(benchmark, seconds, result)
+    assert result["failed"] == ORGS // FAILURE_EVERY
+    assert BillingRun.objects.filter(status="succeeded").count() == ORGS - result["failed"]
+
+    # A retried run bills nobody twice.
+    with patch("billing.tasks._process_org_billing", _stub_billing_service):
+        rerun = _bill_shard(shards[0])
+    assert rerun["already_billed"] == SHARD_SIZE - len(
+        [o for o in shards[0] if uuid.UUID(o).int % FAILURE_EVERY == 0]
+    )
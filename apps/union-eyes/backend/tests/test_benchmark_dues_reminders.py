@@ -0,0 +1,99 @@
+"""
+Benchmark — dues reminders for 100,000 transactions due on one day.
+
+100,000 pending transactions belong to 80,000 members (every fourth member
+owes two).  A stub broker stands in for ``apply_async``: it JSON-encodes
+each message the way kombu would and records its size.  Broker messages,
+bytes enqueued, wall time and peak Python memory of ``_send_dues_reminders``
+are reported in ``extra_info``.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_dues_reminders.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+import uuid
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+from kombu.utils.json import dumps
+
+TRANSACTIONS = 100_000
+BATCH_SIZE = 500
+DUE = date(2026, 10, 24)
+
+pytestmark = pytest.mark.slow_benchmark
+
+
+def _rows():
+    """Member-ordered rows, as the reminder cursor returns them."""
+    member = 0
+    for i in range(TRANSACTIONS):
+        if i % 5 != 4:  # every fourth member gets a second transaction
+            member += 1
+        yield {
+            "id": uuid.UUID(int=i + 1),
+            "member_id": uuid.UUID(int=member),
+            "amount": Decimal("42.50"),
+            "due_date": DUE,
+        }
+
+
+class _StubBroker:
+    def __init__(self):
+        self.messages = 0
+        self.bytes = 0
+
+    def apply_async(self, kwargs=None, **options):
+        self.messages += 1
+        self.bytes += len(dumps(kwargs))
+
+
+def _measure(task_path, send):
+    broker = _StubBroker()
+    with patch(task_path, broker):
+        tracemalloc.start()
+        start = time.perf_counter()
+        send()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "transactions": TRANSACTIONS,
+        "broker_messages": broker.messages,
+        "broker_mb": round(broker.bytes / 1e6, 2),
+        "seconds": round(elapsed, 2),
+        "peak_mb": round(peak / 1e6, 1),
+    }
+
+
+@pytest.mark.benchmark(group="dues-reminders")
+def test_batched_member_messages(benchmark):
+    from billing.tasks import _send_dues_reminders
+
+    counts = {}
+    stats = {}
+
+    def send():
+        counts.update(_send_dues_reminders(_rows(), "7day"))
+
+    with override_settings(DUES_REMINDER_BATCH_SIZE=BATCH_SIZE):
+        benchmark.pedantic(
+            lambda: stats.update(
+                _measure("notifications.tasks.send_notification_batch_task", send)
+            ),
+            rounds=1,
+            iterations=1,
+        )
+    benchmark.extra_info.update(stats)
+
+    assert counts["sent"] == TRANSACTIONS
+    assert stats["broker_messages"] == -(-counts["members"] // BATCH_SIZE)
@@ -0,0 +1,73 @@
+"""
+Benchmark — one email to 500 recipients through a local SMTP sink.
+
+The sink (tests/smtp_sink.py) sleeps ``HANDSHAKE_DELAY`` before greeting
+each connection, standing in for the TCP/TLS/AUTH cost of a real relay.
+All recipients share one template context.  Wall time, emails per second,
+SMTP connections and template renders of ``send_email_task`` are reported
+in ``extra_info``.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_email_batch.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tests.smtp_sink import SmtpSink
+from tests.test_email_batch import _smtp
+
+RECIPIENTS = 500
+HANDSHAKE_DELAY = 0.02  # seconds per SMTP connection
+DATA = {"title": "General meeting", "message": "Thursday 7pm, union hall"}
+
+pytestmark = pytest.mark.slow_benchmark
+
+
+@pytest.fixture
+def recipients():
+    return [f"member{i}@example.com" for i in range(RECIPIENTS)]
+
+
+def _measure(send, recipients):
+    from notifications import tasks
+
+    with SmtpSink(handshake_delay=HANDSHAKE_DELAY) as sink, _smtp(sink), patch.object(
+        tasks, "_render_email_template", wraps=tasks._render_email_template
+    ) as render, patch.object(tasks, "_log_notifications"):
+        start = time.perf_counter()
+        send(recipients)
+        elapsed = time.perf_counter() - start
+        delivered = len(sink.messages)
+        connections = sink.connections
+    return {
+        "recipients": RECIPIENTS,
+        "delivered": delivered,
+        "seconds": round(elapsed, 2),
+        "emails_per_second": round(delivered / elapsed),
+        "smtp_connections": connections,
+        "renders": render.call_count,
+    }
+
+
+@pytest.mark.benchmark(group="email-batch")
+def test_batch_send_email_task(benchmark, recipients):
+    from notifications.tasks import send_email_task
+
+    def send(to):
+        send_email_task.apply(
+            kwargs={"to": to, "subject": "Meeting notice", "template": "notification", "data": DATA}
+        ).get()
+
+    stats = {}
+    benchmark.pedantic(lambda: stats.update(_measure(send, recipients)), rounds=1, iterations=1)
+    benchmark.extra_info.update(stats)
+
+    assert stats["delivered"] == RECIPIENTS
+    assert (stats["smtp_connections"], stats["renders"]) == (1, 1)
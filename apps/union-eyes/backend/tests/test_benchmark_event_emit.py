@@ -0,0 +1,95 @@
+"""
+Benchmark — single versus bulk domain-event emission.
+
+Emits the same number of events through ``emit_event`` (one INSERT pair
+and one relay kick each) and through one ``emit_events`` call, publishing
+to a fakeredis server that stands in for the Redis broker.  Reports
+events/sec and the broker messages each path produced once the outbox
+relay has drained.  Needs PostgreSQL (``SKIP LOCKED`` in the relay).
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_event_emit.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+EVENTS = 2_000
+QUEUE = "notifications"
+
+
+@pytest.fixture
+def broker(transactional_db):
+    """Route kombu's Redis transport to an in-process fakeredis server."""
+    from config.celery import app
+
+    server = fakeredis.FakeServer()
+    with patch(
+        "kombu.transport.redis.Channel._create_client",
+        lambda channel, asynchronous=False: fakeredis.FakeStrictRedis(server=server),
+    ):
+        yield fakeredis.FakeStrictRedis(server=server)
+        app.pool.force_close_all()
+
+
+def _items(org_id):
+    return [
+        {
+            "event_type": "vote_cast",
+            "org_id": org_id,
+            "actor_id": f"user_{i}",
+            "payload": {"ballot": i},
+        }
+        for i in range(EVENTS)
+    ]
+
+
+def _drain(redis) -> int:
+    """Relay the outbox and return the broker messages published in total."""
+    from services.events.tasks import relay_event_outbox_task
+
+    relay_event_outbox_task.apply(kwargs={"max_batches": EVENTS})
+    return redis.llen(QUEUE)
+
+
+def _report(benchmark, redis):
+    messages = _drain(redis)
+    seconds = benchmark.stats.stats.mean
+    benchmark.extra_info.update(
+        events=EVENTS,
+        events_per_sec=round(EVENTS / seconds),
+        broker_messages=messages,
+    )
+    return messages
+
+
+@pytest.mark.benchmark(group="event-emit")
+def test_emit_single(benchmark, broker):
+    from services.events.dispatcher import emit_event
+
+    def emit():
+        for item in _items(str(uuid.uuid4())):
+            emit_event(**item)
+
+    benchmark.pedantic(emit, rounds=1, iterations=1)
+    # One relay kick per event, plus the relay's batch messages.
+    assert _report(benchmark, broker) > EVENTS
+
+
+@pytest.mark.benchmark(group="event-emit")
+def test_emit_bulk(benchmark, broker):
+    from django.conf import settings
+    from services.events.dispatcher import emit_events
+
+    benchmark.pedantic(
+        lambda: emit_events(_items(str(uuid.uuid4()))), rounds=1, iterations=1
+    )
+    batches = -(-EVENTS // settings.EVENT_OUTBOX_BATCH_SIZE)
+    assert _report(benchmark, broker) == 1 + batches
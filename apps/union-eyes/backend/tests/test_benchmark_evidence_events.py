@@ -0,0 +1,85 @@
+"""
+Benchmark — evidence-pack event collection on a seeded event table.
+
+Seeds 100k events for one org (mixed types, with governance and vote
+events), then times a governance-full pack build over the event stages and
+checks the Event table is scanned once.  Needs PostgreSQL.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_evidence_events.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+
+import pytest
+
+EVENTS = 100_000
+SEED_BATCH = 10_000
+EVENT_TYPES = [
+    "case_created",
+    "case_updated",
+    "member_updated",
+    "vote_cast",
+    "governance_action",
+    "policy_changed",
+    "dues_payment_received",
+]
+
+
+@pytest.fixture
+def seeded_org(transactional_db):
+    from django.utils import timezone
+
+    from services.events.models import Event
+
+    org_id = uuid.uuid4()
+    start = timezone.now() - timedelta(days=30)
+    batch = []
+    for i in range(EVENTS):
+        event = Event(
+            event_type=EVENT_TYPES[i % len(EVENT_TYPES)],
+            org_id=org_id,
+            actor_id=f"user_{i % 503}",
+            payload={"seq": i, "detail": {"amount": i * 1.25, "note": "x" * 40}},
+            created_at=start + timedelta(seconds=i * 20),
+        )
+        event.signature_hash = event._compute_hash()
+        batch.append(event)
+        if len(batch) == SEED_BATCH:
+            Event.objects.bulk_create(batch)
+            batch = []
+    return str(org_id), start
+
+
+@pytest.mark.benchmark(group="evidence-events")
+def test_event_stages_single_pass(benchmark, seeded_org):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from services.evidence_pack.builder import build_evidence_pack
+
+    org_id, start = seeded_org
+
+    def build():
+        with CaptureQueriesContext(connection) as ctx:
+            result = build_evidence_pack(
+                org_id=org_id,
+                period_start=start,
+                include_audit_logs=False,
+                include_cases=False,
+                seal=False,
+            )
+        scans = [q for q in ctx.captured_queries if 'FROM "domain_events"' in q["sql"]]
+        return result, scans
+
+    result, scans = benchmark.pedantic(build, rounds=3, iterations=1)
+
+    assert len(scans) == 1
+    per_type = EVENTS // len(EVENT_TYPES)
+    # every event + governance_action/policy_changed + vote_cast again
+    assert result["artifact_count"] >= EVENTS + 3 * per_type
@@ -0,0 +1,105 @@
+"""
+Load test — integration deliveries/sec against 1, 10 and 100 slow endpoints.
+
+A local stand-in webhook server (``tests.webhook_stub``) answers every
+request after ``ENDPOINT_DELAY`` seconds.  The pooled delivery engine keeps
+up to ``max_concurrency`` requests in flight per endpoint on one shared
+thread pool.  The baseline sends a fresh, sequential ``requests.post`` per
+delivery, as ``dispatch_integration`` used to.  No database needed.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_integration_delivery.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+import pytest
+import requests
+
+from tests.webhook_stub import WebhookStub
+
+ENDPOINT_DELAY = 0.05  # seconds per response
+DELIVERIES_PER_ENDPOINT = 20
+ENGINE_WORKERS = 64
+PER_ENDPOINT_CONCURRENCY = 4
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with WebhookStub(delay=ENDPOINT_DELAY) as server:
+        yield server
+
+
+def _integrations(stub, count):
+    from services.integration_control_plane.models import IntegrationRegistry
+
+    return [
+        IntegrationRegistry(
+            id=uuid.uuid4(),
+            org_id=uuid.uuid4(),
+            integration_type="webhook_outbound",
+            name=f"endpoint-{i}",
+            endpoint_url=stub.url(f"/endpoint-{i}"),
+            metadata={"max_concurrency": PER_ENDPOINT_CONCURRENCY},
+        )
+        for i in range(count)
+    ]
+
+
+def _report(benchmark, deliveries, seconds):
+    benchmark.extra_info.update(
+        deliveries=deliveries, deliveries_per_sec=round(deliveries / seconds, 1)
+    )
+
+
+@pytest.mark.benchmark(group="integration-delivery")
+@pytest.mark.parametrize("endpoints", [1, 10, 100])
+def test_pooled_engine(benchmark, stub, endpoints):
+    from services.integration_control_plane.delivery import DeliveryEngine
+
+    engine = DeliveryEngine(workers=ENGINE_WORKERS, pool_size=ENGINE_WORKERS)
+    integrations = _integrations(stub, endpoints)
+    body = b'{"event_type": "vote_cast"}'
+    headers = {"Content-Type": "application/json"}
+    elapsed = {}
+
+    def deliver():
+        start = time.perf_counter()
+        futures = [
+            engine.submit(integration, body, headers)
+            for _ in range(DELIVERIES_PER_ENDPOINT)
+            for integration in integrations
+        ]
+        results = [future.result() for future in futures]
+        elapsed["s"] = time.perf_counter() - start
+        assert all(result.ok for result in results)
+
+    try:
+        benchmark.pedantic(deliver, rounds=1, iterations=1)
+    finally:
+        engine.close()
+    _report(benchmark, endpoints * DELIVERIES_PER_ENDPOINT, elapsed["s"])
+
+
+@pytest.mark.benchmark(group="integration-delivery")
+def test_sequential_fresh_connections_baseline(benchmark, stub):
+    integrations = _integrations(stub, 10)
+    deliveries = 5
+    elapsed = {}
+
+    def deliver():
+        start = time.perf_counter()
+        for _ in range(deliveries):
+            for integration in integrations:
+                requests.post(
+                    integration.endpoint_url, json={"event_type": "vote_cast"}, timeout=30
+                ).raise_for_status()
+        elapsed["s"] = time.perf_counter() - start
+
+    benchmark.pedantic(deliver, rounds=1, iterations=1)
+    _report(benchmark, deliveries * len(integrations), elapsed["s"])
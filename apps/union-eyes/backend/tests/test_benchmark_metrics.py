@@ -0,0 +1,76 @@
+"""
+Benchmark — metrics registry under concurrent load.
+
+Records 1M histogram observations from several threads, then checks that
+memory stayed constant per series and that a ``/metrics`` scrape is fast.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_metrics.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import threading
+import tracemalloc
+
+import pytest
+
+OBSERVATIONS = 1_000_000
+THREADS = 8
+ROUTES = 20
+
+
+@pytest.fixture
+def loaded_registry():
+    from observability.metrics import histogram_observe, reset_metrics
+
+    reset_metrics()
+    per_thread = OBSERVATIONS // THREADS
+
+    def work(seed: int) -> None:
+        for i in range(per_thread):
+            histogram_observe(
+                "api_latency_ms",
+                float((i * 7 + seed) % 3000),
+                labels={"route": f"/api/r{i % ROUTES}/", "status": "200"},
+            )
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    yield after - before
+    reset_metrics()
+
+
+@pytest.mark.slow_benchmark
+@pytest.mark.benchmark(group="metrics")
+def test_scrape_after_one_million_observations(benchmark, loaded_registry):
+    from observability.metrics import render_prometheus, series_count
+
+    # 20 series × 16 stripes × 13 floats — nowhere near 1M samples.
+    assert loaded_registry < 2 * 1024 * 1024
+    assert series_count("api_latency_ms") == ROUTES
+
+    body = benchmark(render_prometheus)
+    assert "api_latency_ms_count" in body
+    if benchmark.enabled:  # no timings under --benchmark-disable
+        assert benchmark.stats.stats.max < 0.05  # 50 ms per scrape
+
+
+@pytest.mark.benchmark(group="metrics")
+def test_observe_hot_path(benchmark):
+    from observability.metrics import histogram_observe, reset_metrics
+
+    reset_metrics()
+    labels = {"route": "/api/x/", "status": "200"}
+    benchmark(histogram_observe, "api_latency_ms", 12.5, labels)
+    reset_metrics()
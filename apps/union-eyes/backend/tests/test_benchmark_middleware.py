@@ -0,0 +1,70 @@
+"""
+Benchmark — per-request overhead of the request instrumentation middleware.
+
+Times ``ObservabilityMiddleware`` (logging context + request metrics) around
+a no-op view, alone and stacked under ``MetricsMiddleware``, to catch
+regressions in the request hot path.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_middleware.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import pytest
+
+ROUTE = "api/cases/<uuid:pk>/"
+
+
+def _request():
+    from django.test import RequestFactory
+    from django.urls import ResolverMatch
+
+    request = RequestFactory().get("/api/cases/0b9e6a4c-2f1d-4c4e-9d7b-3a2f1e0c9b8a/")
+    request.resolver_match = ResolverMatch(lambda r: None, (), {}, route=ROUTE)
+    return request
+
+
+def _view(request):
+    from django.http import HttpResponse
+
+    return HttpResponse()
+
+
+@pytest.fixture
+def fresh_registry():
+    from observability.metrics import reset_metrics
+
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+@pytest.mark.benchmark(group="middleware")
+def test_observability_middleware_overhead(benchmark, fresh_registry):
+    from observability.metrics import series_count
+    from observability.middleware import ObservabilityMiddleware
+
+    middleware = ObservabilityMiddleware(_view)
+    benchmark(lambda: middleware(_request()))
+
+    assert series_count("api_latency_ms") == 1
+    if benchmark.enabled:  # no timings under --benchmark-disable
+        assert benchmark.stats.stats.median < 0.0005  # 500 µs incl. request build
+
+
+@pytest.mark.benchmark(group="middleware")
+def test_stacked_middleware_overhead(benchmark, fresh_registry):
+    from observability.metrics import MetricsMiddleware
+    from observability.middleware import ObservabilityMiddleware
+
+    stack = MetricsMiddleware(ObservabilityMiddleware(_view))
+    benchmark(lambda: stack(_request()))
+
+
+@pytest.mark.benchmark(group="middleware")
+def test_request_factory_baseline(benchmark):
+    """Cost of building the request and response alone, for comparison."""
+    benchmark(lambda: _view(_request()))
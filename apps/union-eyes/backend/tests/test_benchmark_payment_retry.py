@@ -0,0 +1,96 @@
+"""
+Benchmark — failed-payment retries for 400 transactions.
+
+The local Stripe stand-in (tests/stripe_stub.py) answers every
+PaymentIntent after ``STRIPE_LATENCY`` seconds; one in ``DECLINE_EVERY``
+cards is declined and one in ``RATE_LIMIT_EVERY`` first calls gets a 429.
+``PaymentRetryEngine`` runs with ``WORKERS`` threads under a ``RATE``
+requests/s token bucket; wall time, Stripe calls, charges and outcome
+write statements are reported in ``extra_info``.
+
+Run with::
+
+    DJANGO_SETTINGS_MODULE=config.settings pytest tests/test_benchmark_payment_retry.py \\
+        --benchmark-only
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from tests.stripe_stub import StripeStub, card_declined, rate_limited
+
+TRANSACTIONS = 400
+STRIPE_LATENCY = 0.05  # seconds per PaymentIntent
+DECLINE_EVERY = 20
+RATE_LIMIT_EVERY = 50
+WORKERS = 16
+RATE = 100  # Stripe requests per second
+
+pytestmark = pytest.mark.slow_benchmark
+
+
+@pytest.fixture
+def attempts():
+    return [
+        (
+            {
+                "id": str(uuid.UUID(int=i + 1)),
+                "member_id": f"member-{i}",
+                "amount": "42.00",
+                "stripe_customer_id": f"cus_{i}",
+                "payment_method_id": f"pm_{i}",
+            },
+            1,
+        )
+        for i in range(TRANSACTIONS)
+    ]
+
+
+def _responder(txn_id, n):
+    i = uuid.UUID(txn_id).int
+    if i % DECLINE_EVERY == 0:
+        return card_declined()
+    if i % RATE_LIMIT_EVERY == 1 and n == 1:
+        return rate_limited()
+    return "succeeded"
+
+
+@pytest.mark.benchmark(group="payment-retry")
+def test_engine_retries(benchmark, attempts):
+    from billing.payment_retry import PaymentRetryEngine
+
+    stub = StripeStub(latency=STRIPE_LATENCY, responder=_responder)
+    flushes = []
+    stats = {}
+
+    def run():
+        engine = PaymentRetryEngine(
+            workers=WORKERS,
+            rate=RATE,
+            api_key="sk_test_stub",
+            create_intent=stub.create,
+            record=lambda chunk: flushes.append(
+                len({o.success for o in chunk if o.record})
+            ),
+        )
+        start = time.perf_counter()
+        with patch("billing.payment_retry.TRANSIENT_BACKOFF", 0.05):
+            outcomes = engine.run(attempts)
+        stats.update(
+            seconds=round(time.perf_counter() - start, 2),
+            succeeded=sum(o.success for o in outcomes),
+            stripe_calls=len(stub.keys),
+            charges=stub.charges,
+            write_statements=sum(flushes),  # one UPDATE per outcome kind per chunk
+        )
+
+    benchmark.pedantic(run, rounds=1, iterations=1)
+    benchmark.extra_info.update(stats)
+
+    assert stats["succeeded"] == TRANSACTIONS - TRANSACTIONS // DECLINE_EVERY
+    assert stub.max_in_flight <= WORKERS
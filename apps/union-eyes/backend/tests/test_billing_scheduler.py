@@ -0,0 +1,208 @@
+"""
+Tests for the sharded billing scheduler: chord fan-out, idempotent per-org
+BillingRun claims across shard retries, and the compact run summary.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+PERIOD = "2026-10-01"
+
+
+def _stub_billing(failing=()):
+    def process(org, frequency):
+        if org["organization_id"] in failing:
+            return {"organization_id": org["organization_id"], "success": False, "error": "declined"}
+        return {
+            "organization_id": org["organization_id"],
+            "success": True,
+            "transactions_created": 2,
+            "total_amount": "10.50",
+        }
+
+    return process
+
+
+class SchedulerFanOutTest(SimpleTestCase):
+    @override_settings(BILLING_SCHEDULER_SHARD_SIZE=2)
+    @patch("billing.tasks.chord")
+    @patch("billing.tasks._get_org_ids_for_billing")
+    def test_orgs_split_into_chord_shards_for_one_period(self, org_ids, chord):
+        from billing.tasks import run_billing_scheduler_task
+
+        org_ids.return_value = [f"org-{i}" for i in range(5)]
+        result = run_billing_scheduler_task.apply(
+            args=("monthly",), kwargs={"period": PERIOD}
+        ).get()
+
+        self.assertEqual(
+            (result["status"], result["total_organizations"], result["shards"]),
+            ("dispatched", 5, 3),
+        )
+        header = list(chord.call_args.args[0])
+        self.assertEqual(
+            [sig.kwargs["org_ids"] for sig in header],
+            [["org-0", "org-1"], ["org-2", "org-3"], ["org-4"]],
+        )
+        self.assertEqual({sig.kwargs["period"] for sig in header}, {PERIOD})
+        callback = chord.return_value.call_args.args[0]
+        self.assertEqual(callback.kwargs["period"], PERIOD)
+
+    def test_billing_periods(self):
+        from billing.tasks import _billing_period
+
+        day = date(2026, 10, 17)  # Saturday, ISO week 42
+        self.assertEqual(_billing_period("monthly", day), date(2026, 10, 1))
+        self.assertEqual(_billing_period("weekly", day), date(2026, 10, 12))
+        self.assertEqual(_billing_period("bi-weekly", day), date(2026, 10, 12))
+        self.assertEqual(_billing_period("bi-weekly", day + timedelta(days=7)), date(2026, 10, 12))
+
+    @patch("billing.tasks._notify_billing_failure")
+    def test_summary_totals_shard_tallies(self, notify):
+        from billing.tasks import MAX_REPORTED_FAILURES, summarize_billing_run
+
+        shard = {
+            "organizations": 40, "successful": 30, "failed": 40, "skipped": 0,
+            "already_billed": 0, "transactions_created": 60, "total_amount": "315.00",
+            "failed_org_ids": [f"org-{i}" for i in range(40)],
+        }
+        result = summarize_billing_run(
+            [shard, shard],
+            frequency="monthly",
+            period=PERIOD,
+            started_at=timezone.now().isoformat(),
+        )
+
+        self.assertEqual(result["total_organizations"], 80)
+        self.assertEqual((result["successful"], result["failed"]), (60, 80))
+        self.assertEqual(result["total_amount"], "630.00")
+        self.assertEqual(len(result["failed_org_ids"]), MAX_REPORTED_FAILURES)
+        self.assertNotIn("results", result)
+        notify.assert_called_once()
+
+
+class ShardIdempotencyTest(TestCase):
+    def setUp(self):
+        self.org_ids = [str(uuid.uuid4()) for _ in range(4)]
+
+    def _bill(self, failing=()):
+        from billing.tasks import bill_org_shard
+
+        with patch("billing.tasks._process_org_billing", side_effect=_stub_billing(failing)) as process:
+            tally = bill_org_shard.apply(
+                kwargs={"org_ids": self.org_ids, "frequency": "monthly", "period": PERIOD}
+            ).get()
+        return tally, process
+
+    def test_rerun_bills_only_unfinished_orgs(self):
+        from billing.models import BillingRun
+
+        tally, process = self._bill(failing={self.org_ids[1]})
+        self.assertEqual(
+            (tally["successful"], tally["failed"], tally["already_billed"]), (3, 1, 0)
+        )
+        self.assertEqual(tally["total_amount"], "31.50")
+        self.assertEqual(tally["failed_org_ids"], [self.org_ids[1]])
+
+        tally, process = self._bill()
+        self.assertEqual(
+            (tally["successful"], tally["failed"], tally["already_billed"]), (1, 0, 3)
+        )
+        self.assertEqual(
+            [call.args[0]["organization_id"] for call in process.call_args_list],
+            [self.org_ids[1]],
+        )
+        retried = BillingRun.objects.get(organization_id=self.org_ids[1])
+        self.assertEqual((retried.status, retried.attempts, retried.error), ("succeeded", 2, ""))
+
+    def test_stale_running_claim_is_taken_over(self):
+        from billing.models import BillingRun
+
+        BillingRun.objects.create(
+            organization_id=self.org_ids[0], frequency="monthly",
+            period_start=date.fromisoformat(PERIOD), status="running",
+            started_at=timezone.now() - timedelta(hours=1),
+        )
+        BillingRun.objects.create(
+            organization_id=self.org_ids[1], frequency="monthly",
+            period_start=date.fromisoformat(PERIOD), status="running",
+            started_at=timezone.now(),
+        )
+
+        tally, _ = self._bill()
+
+        self.assertEqual((tally["successful"], tally["already_billed"]), (3, 1))
+        self.assertEqual(
+            BillingRun.objects.get(organization_id=self.org_ids[1]).status, "running"
+        )
+
+    def test_shard_failing_midway_releases_unbilled_claims_for_the_retry(self):
+        from billing.models import BillingRun
+        from billing.tasks import bill_org_shard
+
+        billing = _stub_billing()
+        crashes = [self.org_ids[2]]  # the first attempt dies reaching org 2
+
+        def process(org, frequency):
+            if org["organization_id"] in crashes:
+                crashes.remove(org["organization_id"])
+                raise ConnectionError("billing service unavailable")
+            return billing(org, frequency)
+
+        with patch("billing.tasks._process_org_billing", side_effect=process) as calls:
+            tally = bill_org_shard.apply(
+                kwargs={"org_ids": self.org_ids, "frequency": "monthly", "period": PERIOD}
+            ).get()
+
+        # The retry bills only the orgs the failed attempt never finished.
+        self.assertEqual((tally["successful"], tally["already_billed"]), (2, 2))
+        self.assertEqual(
+            [call.args[0]["organization_id"] for call in calls.call_args_list],
+            self.org_ids[:3] + self.org_ids[2:],
+        )
+        self.assertEqual(
+            set(BillingRun.objects.values_list("status", flat=True)), {"succeeded"}
+        )
+
+    def test_exhausted_shard_leaves_unbilled_claims_pending(self):
+        from billing.models import BillingRun
+        from billing.tasks import bill_org_shard
+
+        billing = _stub_billing()
+
+        def process(org, frequency):
+            if org["organization_id"] == self.org_ids[1]:
+                raise ConnectionError("billing service unavailable")
+            return billing(org, frequency)
+
+        with patch("billing.tasks._process_org_billing", side_effect=process):
+            tally = bill_org_shard.apply(
+                kwargs={"org_ids": self.org_ids, "frequency": "monthly", "period": PERIOD}
+            ).get()
+
+        self.assertEqual((tally["successful"], tally["failed"]), (0, 3))
+        self.assertEqual(
+            dict(BillingRun.objects.values_list("organization_id", "status")),
+            {
+                uuid.UUID(self.org_ids[0]): "succeeded",
+                uuid.UUID(self.org_ids[1]): "pending",
+                uuid.UUID(self.org_ids[2]): "pending",
+                uuid.UUID(self.org_ids[3]): "pending",
+            },
+        )
+
+    def test_other_periods_do_not_count(self):
+        from billing.models import BillingRun
+
+        BillingRun.objects.create(
+            organization_id=self.org_ids[0], frequency="monthly",
+            period_start=date(2026, 9, 1), status="succeeded",
+        )
+        tally, _ = self._bill()
+        self.assertEqual(tally["successful"], 4)
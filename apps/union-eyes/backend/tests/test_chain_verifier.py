@@ -0,0 +1,212 @@
+"""
+Tests for the streaming hash-chain verifier (checkpoints, keyset paging,
+segmented verification).
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+
+def _verify_in_process(chain, org_id, segments, workers, page_size):
+    from core.chain_verifier import CHAINS, _verify_range
+
+    return [
+        _verify_range(CHAINS[chain], org_id, *segment, page_size=page_size)
+        for segment in segments
+    ]
+
+
+class KeysetPredicateTest(SimpleTestCase):
+    def test_after_expands_lexicographically(self):
+        from django.db.models import Q
+
+        from core.chain_verifier import _after
+
+        self.assertEqual(_after(("a", "b"), (1, 2)), Q(a__gt=1) | (Q(a=1) & Q(b__gt=2)))
+
+    def test_key_round_trip_keeps_microseconds(self):
+        from datetime import datetime, timezone
+
+        from core.chain_verifier import _decode_key, _encode_key
+
+        ts = datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+        pk = uuid.uuid4()
+        self.assertEqual(
+            _decode_key(_encode_key((7, ts, pk))),
+            (7, "2026-01-02T03:04:05.123456+00:00", str(pk)),
+        )
+
+    def test_audit_phases_order_by_indexed_columns(self):
+        from core.chain_verifier import CHAINS
+
+        spec = CHAINS["audit_logs"]
+        legacy = str(spec.phase_queryset(uuid.uuid4(), 0).query)
+        sequenced = str(spec.phase_queryset(uuid.uuid4(), 1).query)
+        self.assertNotIn("COALESCE", legacy + sequenced)
+        self.assertIn('"chain_seq" IS NULL', legacy)
+        self.assertTrue(sequenced.endswith('ORDER BY "audit_logs"."chain_seq" ASC'))
+
+
+class AuditChainVerifierTest(TestCase):
+    def setUp(self):
+        from auth_core.models import Organizations
+
+        self.org = Organizations.objects.create(
+            name="CUPE Local 79",
+            slug="cupe-79",
+            organization_type="local",
+            clerk_organization_id="org_cupe79",
+        )
+
+    def _append(self, n: int):
+        from core.services import create_audit_log
+
+        return [
+            create_audit_log(
+                organization_id=self.org.id,
+                actor_id="user_1",
+                action="update",
+                resource_type="Claim",
+                resource_id=str(i),
+            )
+            for i in range(n)
+        ]
+
+    def _append_legacy_then_sequenced(self, legacy: int, sequenced: int):
+        """Rows written before chain heads (chain_seq NULL), then sequenced ones."""
+        from datetime import timedelta
+
+        from core.models import AuditChainHead, AuditLogs
+
+        logs = self._append(legacy)
+        for i, log in enumerate(logs):
+            AuditLogs.objects.filter(pk=log.pk).update(
+                chain_seq=None, created_at=log.created_at + timedelta(seconds=i)
+            )
+        AuditChainHead.objects.filter(organization_id=self.org.id).delete()
+        return logs + self._append(sequenced)
+
+    def test_paging_crosses_from_legacy_to_sequenced_rows(self):
+        from core.chain_verifier import verify_chain
+        from core.models import AuditLogs
+
+        logs = self._append_legacy_then_sequenced(3, 3)
+        result = verify_chain("audit_logs", self.org.id, full=True, page_size=2)
+        self.assertEqual((result.valid, result.count), (True, 6))
+
+        AuditLogs.objects.filter(pk=logs[4].pk).update(resource_id="forged")
+        result = verify_chain("audit_logs", self.org.id, full=True, page_size=2)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.broken_index, 4)
+
+    @patch("core.chain_verifier._verify_in_pool", side_effect=_verify_in_process)
+    def test_segments_span_both_phases(self, pool):
+        from core.chain_verifier import verify_chain
+
+        logs = self._append_legacy_then_sequenced(3, 2)
+        result = verify_chain("audit_logs", self.org.id, full=True, workers=4, segment_size=2)
+        self.assertEqual((result.valid, result.count), (True, 5))
+        segments = pool.call_args.args[2]
+        self.assertEqual([s[0] and s[0][0] for s in segments], [None, 0, 1])
+        self.assertEqual(segments[2][2], logs[3].content_hash)
+
+    def test_checkpoint_in_old_key_layout_forces_full_run(self):
+        from core.chain_verifier import verify_chain
+        from core.models import ChainCheckpoint
+
+        logs = self._append(2)
+        ChainCheckpoint.objects.create(
+            chain="audit_logs",
+            org_id=self.org.id,
+            position=[2, logs[1].created_at.isoformat(), str(logs[1].pk)],
+            last_hash=logs[1].content_hash,
+            verified_count=2,
+        )
+        result = verify_chain("audit_logs", self.org.id)
+        self.assertEqual((result.valid, result.resumed_from, result.verified), (True, 0, 2))
+
+    def test_second_run_verifies_only_new_tail(self):
+        from core.chain_verifier import verify_chain
+        from core.models import ChainCheckpoint
+
+        self._append(5)
+        first = verify_chain("audit_logs", self.org.id, page_size=2)
+        self.assertEqual((first.valid, first.count, first.verified), (True, 5, 5))
+        checkpoint = ChainCheckpoint.objects.get(chain="audit_logs", org_id=self.org.id)
+        self.assertEqual(checkpoint.verified_count, 5)
+
+        self._append(3)
+        second = verify_chain("audit_logs", self.org.id, page_size=2)
+        self.assertEqual((second.valid, second.count, second.verified), (True, 8, 3))
+        self.assertEqual(second.resumed_from, 5)
+
+    def test_full_run_catches_tampering_behind_checkpoint(self):
+        from core.models import AuditLogs
+        from core.services import verify_audit_chain
+
+        logs = self._append(4)
+        self.assertTrue(verify_audit_chain(self.org.id)["valid"])
+        AuditLogs.objects.filter(pk=logs[1].pk).update(resource_id="forged")
+
+        self.assertTrue(verify_audit_chain(self.org.id)["valid"])  # tail only
+        result = verify_audit_chain(self.org.id, full=True)
+        self.assertEqual(
+            result,
+            {
+                "valid": False,
+                "broken_at_id": str(logs[1].pk),
+                "broken_at_index": 1,
+                "count": 4,
+            },
+        )
+
+    def test_changed_anchor_forces_full_run(self):
+        from core.chain_verifier import verify_chain
+        from core.models import AuditLogs
+
+        logs = self._append(3)
+        verify_chain("audit_logs", self.org.id)
+        AuditLogs.objects.filter(pk=logs[2].pk).update(content_hash="0" * 64)
+
+        result = verify_chain("audit_logs", self.org.id)
+        self.assertFalse(result.valid)
+        self.assertEqual((result.resumed_from, result.broken_index), (0, 2))
+
+    @patch("core.chain_verifier._verify_in_pool", side_effect=_verify_in_process)
+    def test_segmented_run_matches_sequential(self, pool):
+        from core.chain_verifier import verify_chain
+        from core.models import AuditLogs
+
+        logs = self._append(7)
+        result = verify_chain("audit_logs", self.org.id, full=True, workers=4, segment_size=3)
+        self.assertEqual((result.valid, result.count), (True, 7))
+        segments = pool.call_args.args[2]
+        self.assertEqual(len(segments), 3)  # 3 + 3 + 1 rows
+        self.assertEqual(segments[1][2], logs[2].content_hash)
+
+        AuditLogs.objects.filter(pk=logs[5].pk).update(resource_id="forged")
+        result = verify_chain("audit_logs", self.org.id, full=True, workers=4, segment_size=3)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.broken_index, 5)
+
+
+class SnapshotChainVerifierTest(TestCase):
+    def test_resumed_run_checks_linkage_to_checkpoint(self):
+        from services.compliance_snapshot.models import ComplianceSnapshot
+        from services.compliance_snapshot.service import capture_snapshot, verify_chain
+
+        org_id = str(uuid.uuid4())
+        capture_snapshot(org_id=org_id, snapshot_type="daily")
+        self.assertEqual(verify_chain(org_id), {"valid": True, "total": 1, "broken_at": None})
+
+        capture_snapshot(org_id=org_id, snapshot_type="daily")
+        ComplianceSnapshot.objects.filter(org_id=org_id, sequence_number=2).update(
+            previous_hash="f" * 64
+        )
+        result = verify_chain(org_id)
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["broken_at"], 2)
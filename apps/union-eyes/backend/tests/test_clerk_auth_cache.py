@@ -0,0 +1,276 @@
+"""
+Tests for the Clerk auth caches: signing keys, verified tokens and user sync.
+
+A local stand-in JWKS endpoint (``JWKSStub``) replaces Clerk so the tests
+can count key-set fetches and simulate key rotation.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.test import SimpleTestCase, TestCase, override_settings
+from jwt.algorithms import RSAAlgorithm
+
+
+class JWKSStub:
+    """Serves a JWKS document on 127.0.0.1 and counts requests."""
+
+    def __init__(self):
+        self.keys: dict = {}
+        self.fetch_count = 0
+        self.add_key("kid-1")
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                stub.fetch_count += 1
+                body = json.dumps(
+                    {"keys": [jwk for _, jwk in stub.keys.values()]}
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.url = f"http://127.0.0.1:{self._server.server_port}/.well-known/jwks.json"
+
+    def add_key(self, kid: str) -> None:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+        self.keys[kid] = (private_key, jwk)
+
+    def issue(self, kid: str = "kid-1", ttl: int = 300, **claims) -> str:
+        payload = {"sub": "user_abc", "exp": int(time.time()) + ttl, **claims}
+        return jwt.encode(
+            payload, self.keys[kid][0], algorithm="RS256", headers={"kid": kid}
+        )
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class SigningKeyStoreTest(SimpleTestCase):
+    def setUp(self):
+        self.stub = JWKSStub()
+
+    def tearDown(self):
+        self.stub.close()
+
+    def test_keys_fetched_once(self):
+        from auth_core.authentication import SigningKeyStore
+
+        store = SigningKeyStore(self.stub.url)
+        for _ in range(5):
+            store.get_signing_key("kid-1")
+        self.assertEqual(self.stub.fetch_count, 1)
+
+    def test_unknown_kid_triggers_single_refetch(self):
+        from auth_core.authentication import SigningKeyStore
+
+        store = SigningKeyStore(self.stub.url, min_refetch_interval=0)
+        store.get_signing_key("kid-1")
+
+        self.stub.add_key("kid-2")  # rotation on the Clerk side
+        key = store.get_signing_key("kid-2")
+        self.assertEqual(key.key_id, "kid-2")
+        self.assertEqual(self.stub.fetch_count, 2)
+
+    def test_unknown_kid_refetch_is_throttled(self):
+        from auth_core.authentication import SigningKeyStore
+
+        store = SigningKeyStore(self.stub.url, min_refetch_interval=60)
+        store.get_signing_key("kid-1")
+
+        for _ in range(3):
+            with self.assertRaises(jwt.PyJWKClientError):
+                store.get_signing_key("forged-kid")
+        self.assertEqual(self.stub.fetch_count, 1)
+
+    def test_stale_keys_refresh_in_background(self):
+        from auth_core.authentication import SigningKeyStore
+
+        store = SigningKeyStore(self.stub.url, lifespan=0)
+        store.get_signing_key("kid-1")
+        # Stale set still serves the request while a refresh runs.
+        self.assertEqual(store.get_signing_key("kid-1").key_id, "kid-1")
+
+        deadline = time.monotonic() + 5
+        while self.stub.fetch_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertGreaterEqual(self.stub.fetch_count, 2)
+
+
+class VerifiedTokenCacheTest(SimpleTestCase):
+    def test_entry_bounded_by_exp(self):
+        from auth_core.authentication import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(ttl=60)
+        cache.put("tok", {"sub": "u", "exp": time.time() - 1})
+        self.assertIsNone(cache.get("tok"))
+
+    def test_lru_eviction(self):
+        from auth_core.authentication import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(ttl=60, max_entries=2)
+        cache.put("a", {"sub": "a"})
+        cache.put("b", {"sub": "b"})
+        cache.get("a")
+        cache.put("c", {"sub": "c"})
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+
+class ClerkVerifyTokenCacheTest(SimpleTestCase):
+    def setUp(self):
+        from auth_core.authentication import reset_auth_caches
+
+        self.stub = JWKSStub()
+        reset_auth_caches()
+        self.addCleanup(reset_auth_caches)
+
+    def tearDown(self):
+        self.stub.close()
+
+    def test_repeated_token_skips_verification(self):
+        from unittest.mock import patch
+
+        from auth_core.authentication import ClerkAuthentication
+
+        token = self.stub.issue()
+        auth = ClerkAuthentication()
+        with override_settings(CLERK_JWKS_URL=self.stub.url):
+            first = auth._verify_token(token)
+            with patch("auth_core.authentication.jwt.decode") as decode:
+                second = auth._verify_token(token)
+            decode.assert_not_called()
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.stub.fetch_count, 1)
+
+    def test_expired_token_still_rejected(self):
+        from auth_core.authentication import ClerkAuthentication
+
+        token = self.stub.issue(ttl=-10)
+        with override_settings(CLERK_JWKS_URL=self.stub.url):
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                ClerkAuthentication()._verify_token(token)
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TieredCacheTest(SimpleTestCase):
+    def test_shared_tier_backfills_local(self):
+        from auth_core.caching import MISSING, TieredCache
+
+        writer = TieredCache("t", local_ttl=30)
+        reader = TieredCache("t", local_ttl=30)  # another worker process
+        writer.set("k", {"v": 1})
+        self.assertEqual(reader.get("k"), {"v": 1})
+        self.assertEqual(reader.local.get("k"), {"v": 1})
+
+        writer.delete("k")
+        self.assertIs(writer.get("k"), MISSING)
+
+    def test_none_is_cacheable(self):
+        from auth_core.caching import MISSING, TieredCache
+
+        tc = TieredCache("neg")
+        tc.set("unknown", None)
+        self.assertIsNone(tc.get("unknown"))
+        self.assertIs(tc.get("other"), MISSING)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ClerkUserSyncCacheTest(TestCase):
+    """Repeat requests with unchanged claims skip User/Profile writes."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        from auth_core.authentication import reset_auth_caches
+
+        cache.clear()
+        reset_auth_caches()
+        self.addCleanup(reset_auth_caches)
+        self.payload = {
+            "sub": "user_sync_1",
+            "email": "a@example.org",
+            "given_name": "Ada",
+            "family_name": "Lovelace",
+            "o": {"id": "org_1", "rol": "admin"},
+        }
+
+    def test_unchanged_claims_hit_no_queries(self):
+        from auth_core.authentication import ClerkAuthentication
+
+        auth = ClerkAuthentication()
+        user = auth._get_or_create_user(self.payload)
+        with self.assertNumQueries(0):
+            cached = auth._get_or_create_user(self.payload)
+        self.assertEqual(cached.pk, user.pk)
+        self.assertEqual(cached.email, "a@example.org")
+        self.assertFalse(cached._state.adding)
+
+    def test_changed_claims_resync(self):
+        from django.contrib.auth import get_user_model
+
+        from auth_core.authentication import ClerkAuthentication
+
+        auth = ClerkAuthentication()
+        auth._get_or_create_user(self.payload)
+        auth._get_or_create_user({**self.payload, "email": "b@example.org"})
+        user = get_user_model().objects.get(username="user_sync_1")
+        self.assertEqual(user.email, "b@example.org")
+
+    def test_webhook_invalidates(self):
+        from auth_core.authentication import (
+            ClerkAuthentication,
+            invalidate_user_cache,
+            user_sync_cache,
+        )
+        from auth_core.caching import MISSING
+
+        ClerkAuthentication()._get_or_create_user(self.payload)
+        invalidate_user_cache("user_sync_1")
+        self.assertIs(user_sync_cache.get("user_sync_1"), MISSING)
+
+    def test_revoked_privileges_invalidate(self):
+        from django.contrib.auth import get_user_model
+
+        from auth_core.authentication import ClerkAuthentication
+
+        auth = ClerkAuthentication()
+        auth._get_or_create_user(self.payload)
+        user = get_user_model().objects.get(username="user_sync_1")
+        user.is_active = False
+        user.save()  # admin / shell edit, no Clerk webhook
+
+        self.assertFalse(auth._get_or_create_user(self.payload).is_active)
+
+    def test_deleted_user_not_returned(self):
+        from auth_core.authentication import ClerkAuthentication, get_cached_user_by_clerk_id
+
+        user = ClerkAuthentication()._get_or_create_user(self.payload)
+        user.delete()
+        self.assertIsNone(get_cached_user_by_clerk_id("user_sync_1"))
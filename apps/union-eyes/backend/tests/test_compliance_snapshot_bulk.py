@@ -0,0 +1,153 @@
+"""
+Tests for bulk compliance snapshot capture: grouped counter queries, the
+batched chain-append, and the sharded chord that drives the periodic runs.
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+SOURCE_TABLES = [
+    "organization_members",
+    "claims",
+    "audit_logs",
+    "integration_registry",
+    "domain_events",
+    "evidence_packs",
+]
+
+
+class BulkCaptureTest(TestCase):
+    def setUp(self):
+        from auth_core.models import OrganizationMembers, Organizations
+        from grievances.models import Claims
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        self.orgs = [
+            Organizations.objects.create(
+                name=f"Local {i}", slug=f"local-{i}", organization_type="local"
+            )
+            for i in range(3)
+        ]
+        first, second, _ = self.orgs
+        for i, status in enumerate(["active", "active", "suspended"]):
+            OrganizationMembers.objects.create(
+                organization=first, user_id=f"u{i}", role="member", status=status
+            )
+        for status in ["submitted", "closed", "under_review"]:
+            Claims.objects.create(organization_id=second.id, status=status)
+        for i, status in enumerate(["active", "degraded", "failed", "failed"]):
+            IntegrationRegistry.objects.create(
+                org_id=second.id,
+                integration_type="api_push",
+                name=f"i{i}",
+                endpoint_url=f"https://example.com/{i}",
+                status=status,
+            )
+        self.org_ids = [str(org.id) for org in self.orgs]
+
+    def test_payloads_match_single_org_capture(self):
+        from services.compliance_snapshot.service import _gather_payload, gather_payloads
+
+        payloads = gather_payloads(self.org_ids)
+        first, second, third = (payloads[org_id] for org_id in self.org_ids)
+
+        self.assertEqual(first["members"], {"total": 3, "active": 2})
+        self.assertEqual(second["cases"], {"total": 3, "open": 2})
+        self.assertEqual(
+            second["integrations"], {"total": 4, "active": 1, "degraded": 1, "failed": 2}
+        )
+        self.assertEqual(third["members"], {"total": 0, "active": 0})
+        self.assertEqual(third["domain_events_30d"], 0)
+        for org_id in self.org_ids:
+            single = _gather_payload(org_id)
+            self.assertEqual(
+                {k: v for k, v in single.items() if k != "captured_at"},
+                {k: v for k, v in payloads[org_id].items() if k != "captured_at"},
+            )
+
+    def test_one_query_per_source_table_regardless_of_org_count(self):
+        from services.compliance_snapshot.service import capture_snapshots
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = capture_snapshots(self.org_ids, snapshot_type="daily")
+
+        self.assertEqual(result, {"captured": 3, "failed": 0})
+        for table in SOURCE_TABLES:
+            reads = [
+                q for q in ctx.captured_queries
+                if q["sql"].startswith("SELECT") and f'FROM "{table}"' in q["sql"]
+            ]
+            self.assertEqual(len(reads), 1, table)
+        inserts = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "compliance_snapshots"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+    def test_appends_to_existing_chains(self):
+        from services.compliance_snapshot.models import ComplianceSnapshot
+        from services.compliance_snapshot.service import capture_snapshot, capture_snapshots
+        from services.events.models import Event
+
+        head = capture_snapshot(org_id=self.org_ids[0], snapshot_type="on_demand")
+        capture_snapshots(self.org_ids, snapshot_type="daily")
+
+        chained = ComplianceSnapshot.objects.get(org_id=self.org_ids[0], sequence_number=2)
+        self.assertEqual(chained.previous_hash, head["hash"])
+        self.assertTrue(chained.verify_integrity())
+        fresh = ComplianceSnapshot.objects.get(org_id=self.org_ids[1])
+        self.assertEqual((fresh.sequence_number, fresh.previous_hash), (1, ""))
+        self.assertEqual(
+            Event.objects.filter(event_type="compliance_snapshot_created").count(), 4
+        )
+
+    def test_moved_chain_head_falls_back_to_one_by_one(self):
+        from services.compliance_snapshot.models import ComplianceSnapshot
+        from services.compliance_snapshot.service import capture_snapshots
+
+        with patch.object(
+            ComplianceSnapshot.objects, "bulk_create", side_effect=IntegrityError("dup")
+        ):
+            result = capture_snapshots(self.org_ids, snapshot_type="daily")
+
+        self.assertEqual(result, {"captured": 3, "failed": 0})
+        self.assertEqual(
+            ComplianceSnapshot.objects.filter(org_id__in=self.org_ids).count(), 3
+        )
+
+
+class ShardedCaptureTest(SimpleTestCase):
+    @override_settings(COMPLIANCE_SNAPSHOT_SHARD_SIZE=2)
+    @patch("services.compliance_snapshot.tasks.chord")
+    @patch("auth_core.models.Organizations.objects")
+    def test_active_orgs_split_into_chord_shards(self, orgs, chord):
+        from services.compliance_snapshot.tasks import _capture_for_all
+
+        org_ids = [uuid.UUID(int=i) for i in range(5)]
+        orgs.filter.return_value.order_by.return_value.values_list.return_value = org_ids
+
+        result = _capture_for_all("daily")
+
+        self.assertEqual(result, {"status": "dispatched", "orgs": 5, "shards": 3})
+        header = list(chord.call_args.args[0])
+        self.assertEqual(
+            [sig.kwargs["org_ids"] for sig in header],
+            [[str(o) for o in org_ids[:2]], [str(o) for o in org_ids[2:4]], [str(org_ids[4])]],
+        )
+        callback = chord.return_value.call_args.args[0]
+        self.assertEqual(callback.kwargs, {"snapshot_type": "daily"})
+
+    def test_summary_totals_shard_results(self):
+        from services.compliance_snapshot.tasks import summarize_snapshot_capture
+
+        result = summarize_snapshot_capture(
+            [{"captured": 500, "failed": 0}, {"captured": 98, "failed": 2}],
+            snapshot_type="daily",
+        )
+        self.assertEqual(result, {"captured": 598, "failed": 2})
@@ -0,0 +1,127 @@
+"""
+Tests for the batched dues-reminder pipeline: streamed cursor reads, one
+reminder per member and type, and send_notification_batch_task messages.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+DUE = date(2026, 10, 24)
+
+
+def _txn(member, amount="25.00", due_date=DUE):
+    return {"id": uuid.uuid4(), "member_id": member, "amount": Decimal(amount), "due_date": due_date}
+
+
+class StreamRowsTest(TestCase):
+    def test_rows_stream_in_fetch_size_chunks(self):
+        from billing.models import BillingRun
+        from billing.tasks import _stream_rows
+
+        org_ids = sorted(uuid.uuid4() for _ in range(5))
+        BillingRun.objects.bulk_create(
+            BillingRun(organization_id=org_id, frequency="monthly", period_start=DUE)
+            for org_id in org_ids
+        )
+
+        with patch("billing.tasks.DUES_REMINDER_FETCH_SIZE", 2):
+            rows = _stream_rows(
+                "SELECT organization_id, frequency FROM billing_runs ORDER BY organization_id",
+                [],
+            )
+            first = next(rows)
+            self.assertEqual(set(first), {"organization_id", "frequency"})
+            rest = list(rows)
+
+        self.assertEqual(len(rest), 4)
+        self.assertEqual({row["frequency"] for row in rest}, {"monthly"})
+
+    def test_query_failure_ends_the_stream(self):
+        from billing.tasks import _stream_rows
+
+        self.assertEqual(list(_stream_rows("SELECT * FROM no_such_table", [])), [])
+
+
+class ReminderBatchingTest(SimpleTestCase):
+    @override_settings(DUES_REMINDER_BATCH_SIZE=2)
+    @patch("notifications.tasks.send_notification_batch_task")
+    def test_one_reminder_per_member_in_batches(self, batch_task):
+        from billing.tasks import _send_dues_reminders
+
+        rows = [_txn("m1"), _txn("m1", "10.50"), _txn("m2"), _txn("m3"), _txn("m4"), _txn("m5")]
+        counts = _send_dues_reminders(iter(rows), "7day")
+
+        self.assertEqual(
+            counts, {"transactions": 6, "members": 5, "batches": 3, "sent": 6, "failed": 0}
+        )
+        sent = [c.kwargs["kwargs"] for c in batch_task.apply_async.call_args_list]
+        self.assertEqual([len(k["recipients"]) for k in sent], [2, 2, 1])
+        self.assertEqual({k["title"] for k in sent}, {"Dues Payment Due in 7 Days"})
+        first = sent[0]["recipients"][0]
+        self.assertEqual(first["user_id"], "m1")
+        self.assertEqual(first["message"], "Your 2 dues payments totalling $35.50 are due 2026-10-24.")
+        self.assertEqual(len(first["data"]["transaction_ids"]), 2)
+        self.assertEqual(
+            sent[0]["recipients"][1]["message"], "Your dues payment of $25.00 is due 2026-10-24."
+        )
+
+    @patch("notifications.tasks.send_notification_batch_task")
+    def test_failed_enqueue_counts_the_batch_transactions(self, batch_task):
+        from billing.tasks import _send_dues_reminders
+
+        batch_task.apply_async.side_effect = ConnectionError("broker down")
+        counts = _send_dues_reminders(iter([_txn("m1"), _txn("m1"), _txn("m2")]), "overdue")
+
+        self.assertEqual((counts["sent"], counts["failed"], counts["batches"]), (0, 3, 0))
+
+    @patch("notifications.tasks.send_notification_batch_task")
+    @patch("billing.tasks._get_overdue_transactions")
+    @patch("billing.tasks._get_transactions_due_on")
+    def test_task_totals_each_reminder_pass(self, due_on, overdue, batch_task):
+        from billing.tasks import send_dues_reminders_task
+
+        due_on.side_effect = lambda day: iter([_txn("m1", due_date=day), _txn("m2", due_date=day)])
+        overdue.return_value = iter([_txn("m1", due_date=date(2026, 9, 1))] * 3)
+
+        result = send_dues_reminders_task.apply().get()
+
+        self.assertEqual(
+            {k: result[k] for k in ("total_processed", "reminders_sent", "members_notified", "batches_enqueued")},
+            {"total_processed": 7, "reminders_sent": 7, "members_notified": 5, "batches_enqueued": 3},
+        )
+        self.assertEqual(
+            result["breakdown"],
+            {"seven_day_reminders": 2, "one_day_reminders": 2, "overdue_notices": 3},
+        )
+
+
+class NotificationBatchTaskTest(SimpleTestCase):
+    @patch("notifications.tasks._log_notifications")
+    @patch("notifications.tasks._create_in_app_notifications")
+    @patch("notifications.tasks.send_email_task")
+    def test_one_email_message_per_batch(self, email_task, in_app, log):
+        from notifications.tasks import send_notification_batch_task
+
+        recipients = [
+            {"user_id": "u1", "message": "m1", "data": {"email": "a@example.com"}},
+            {"user_id": "u2", "message": "m2", "data": {"email": "b@example.com"}},
+            {"user_id": "u3", "message": "m3", "data": {}},
+        ]
+        result = send_notification_batch_task.apply(
+            kwargs={"title": "Dues", "channels": ["email", "in-app"], "recipients": recipients}
+        ).get()
+
+        self.assertEqual(result["recipients"], 3)
+        self.assertEqual(result["channels"], ["email", "in-app"])
+        email_task.apply_async.assert_called_once()
+        kwargs = email_task.apply_async.call_args.kwargs["kwargs"]
+        self.assertEqual(kwargs["to"], ["a@example.com", "b@example.com"])
+        self.assertEqual(kwargs["recipient_data"]["b@example.com"]["message"], "m2")
+        in_app.assert_called_once_with("Dues", recipients)
+        self.assertEqual(len(log.call_args.args[0]), 3)
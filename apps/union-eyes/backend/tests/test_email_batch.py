@@ -0,0 +1,140 @@
+"""
+Tests for batch email delivery: one SMTP connection per batch, one render per
+distinct context, bulk delivery logs and retries limited to the addresses
+that failed — against the local SMTP sink in tests/smtp_sink.py.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from tests.smtp_sink import SmtpSink
+
+
+def _smtp(sink):
+    return override_settings(
+        EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+        EMAIL_HOST=sink.host,
+        EMAIL_PORT=sink.port,
+        EMAIL_HOST_USER="",
+        EMAIL_HOST_PASSWORD="",
+        EMAIL_USE_TLS=False,
+        EMAIL_USE_SSL=False,
+    )
+
+
+def _render(template, context):
+    return f"<p>{context.get('title', '')}: {context.get('message', '')}</p>"
+
+
+class EmailBatchTest(SimpleTestCase):
+    def _batch(self, **kwargs):
+        from notifications.email_batch import EmailBatch
+
+        kwargs.setdefault("data", {"title": "Meeting", "message": "Thursday 7pm"})
+        return EmailBatch(
+            subject="Notice", template="notification", render=_render,
+            allowed=lambda email: True, **kwargs,
+        )
+
+    def test_whole_batch_shares_one_connection(self):
+        recipients = [f"member{i}@example.com" for i in range(20)]
+        with SmtpSink() as sink, _smtp(sink):
+            deliveries = self._batch().send(recipients)
+
+        self.assertEqual({d.status for d in deliveries}, {"sent"})
+        self.assertEqual((sink.connections, len(sink.messages)), (1, 20))
+        _, message = sink.messages[0]
+        self.assertEqual(message["Subject"], "Notice")
+
+    def test_template_rendered_once_per_distinct_context(self):
+        recipients = [f"member{i}@example.com" for i in range(10)]
+        batch = self._batch(
+            recipient_data={
+                "member1@example.com": {"message": "Room B"},
+                "member2@example.com": {"message": "Room B"},
+                "member3@example.com": {"message": "Room C"},
+            }
+        )
+        with SmtpSink() as sink, _smtp(sink):
+            batch.send(recipients)
+
+        self.assertEqual(batch.renders, 3)
+        bodies = {
+            rcpts[0]: message.get_payload()[-1].get_payload(decode=True).decode()
+            for rcpts, message in sink.messages
+        }
+        self.assertIn("Room C", bodies["member3@example.com"])
+        self.assertIn("Thursday 7pm", bodies["member9@example.com"])
+
+    def test_refused_address_does_not_stop_the_batch(self):
+        with SmtpSink(reject=["gone@example.com"]) as sink, _smtp(sink):
+            deliveries = self._batch().send(["a@example.com", "gone@example.com", "b@example.com"])
+
+        self.assertEqual([d.status for d in deliveries], ["sent", "failed", "sent"])
+        self.assertIn("gone@example.com", deliveries[1].error)
+        self.assertEqual(sink.connections, 1)
+
+    def test_opted_out_and_duplicate_addresses(self):
+        from notifications.email_batch import EmailBatch
+
+        batch = EmailBatch(
+            subject="Notice", template="notification", data={}, render=_render,
+            allowed=lambda email: email != "out@example.com",
+        )
+        with SmtpSink() as sink, _smtp(sink):
+            deliveries = batch.send(["a@example.com", "out@example.com", "a@example.com"])
+
+        self.assertEqual([(d.email, d.status) for d in deliveries],
+                         [("a@example.com", "sent"), ("out@example.com", "skipped")])
+        self.assertEqual(len(sink.messages), 1)
+
+
+class SendEmailTaskTest(SimpleTestCase):
+    @patch("notifications.tasks._render_email_template", side_effect=_render)
+    @patch("notifications.tasks._log_notifications")
+    def test_retries_reach_only_failed_addresses(self, log, render):
+        from notifications.tasks import send_email_task
+
+        recipients = ["a@example.com", "gone@example.com", "b@example.com"]
+        with SmtpSink(reject=["gone@example.com"]) as sink, _smtp(sink):
+            result = send_email_task.apply(
+                kwargs={"to": recipients, "subject": "Notice", "template": "notification",
+                        "data": {"title": "Meeting"}},
+            )
+
+        self.assertTrue(result.failed())  # still refused after max_retries
+        self.assertEqual(sink.rcpt_attempts["gone@example.com"], 1 + send_email_task.max_retries)
+        self.assertEqual(sink.delivered_to("a@example.com"), 1)
+        self.assertEqual(sink.delivered_to("b@example.com"), 1)
+        first_log = log.call_args_list[0].args[0]
+        self.assertEqual([e["status"] for e in first_log], ["sent", "failed", "sent"])
+        self.assertEqual([len(c.args[0]) for c in log.call_args_list[1:]], [1, 1, 1])
+
+    @patch("notifications.tasks._render_email_template", side_effect=_render)
+    @patch("notifications.tasks._log_notifications")
+    def test_single_address(self, log, render):
+        from notifications.tasks import send_email_task
+
+        with SmtpSink() as sink, _smtp(sink):
+            result = send_email_task.apply(
+                kwargs={"to": "a@example.com", "subject": "Hi", "template": "welcome", "data": {}},
+            ).get()
+
+        self.assertEqual(result, {"sent": 1, "total": 1})
+        log.assert_called_once()
+
+
+class NotificationLogBulkTest(SimpleTestCase):
+    @patch("notifications.models.NotificationLog.objects")
+    def test_logs_written_in_one_bulk_insert(self, objects):
+        from notifications.tasks import _log_notifications
+
+        _log_notifications(
+            [{"channel": "email", "recipient": f"m{i}@example.com"} for i in range(50)]
+        )
+
+        objects.bulk_create.assert_called_once()
+        self.assertEqual(len(list(objects.bulk_create.call_args.args[0])), 50)
@@ -78,17 +78,24 @@ class EventDispatcherTest(TestCase):
         self.assertIsInstance(event_id, str)
         self.assertEqual(Event.objects.filter(org_id=org_id).count(), 1)
 
-    @patch("services.events.tasks.process_event_task.delay")
+    @patch("services.events.tasks.relay_event_outbox_task.delay")
     def test_emit_event_enqueues_task(self, mock_delay):
-        from services.events.dispatcher import emit_event
-
-        event_id = emit_event(
-            event_type="case_closed",
-            org_id=str(uuid.uuid4()),
-            actor_id="user-3",
-            payload={},
-        )
-        mock_delay.assert_called_once_with(event_id=event_id)
+        from django.core.cache import cache
+        from services.events.dispatcher import RELAY_KICK_KEY, emit_event
+        from services.events.models import EventOutbox
+
+        cache.delete(RELAY_KICK_KEY)  # not debounced by an earlier test's kick
+        with self.captureOnCommitCallbacks(execute=True):
+            event_id = emit_event(
+                event_type="case_closed",
+                org_id=str(uuid.uuid4()),
+                actor_id="user-3",
+                payload={},
+            )
+            # Nothing is published until the emitting transaction commits.
+            mock_delay.assert_not_called()
+        self.assertTrue(EventOutbox.objects.filter(event_id=event_id).exists())
+        mock_delay.assert_called_once_with()
 
 
 # ============================================================================
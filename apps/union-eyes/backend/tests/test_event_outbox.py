@@ -0,0 +1,159 @@
+"""
+Tests for the domain-event outbox: bulk emit, batched relay and the
+batch fan-out task.
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+def _items(org_id, count):
+    return [
+        {
+            "event_type": "vote_cast",
+            "org_id": org_id,
+            "actor_id": f"user_{i}",
+            "payload": {"ballot": i},
+        }
+        for i in range(count)
+    ]
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class EmitEventsTest(TestCase):
+    def setUp(self):
+        self.org_id = str(uuid.uuid4())
+        cache.clear()
+
+    @patch("services.events.tasks.relay_event_outbox_task.delay")
+    def test_bulk_emit_is_one_insert_and_one_kick(self, kick):
+        from services.events.dispatcher import emit_events
+        from services.events.models import Event, EventOutbox
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as ctx:
+                event_ids = emit_events(_items(self.org_id, 25))
+
+        inserts = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(
+            [sql.split()[2] for sql in inserts],
+            ['"domain_events"', '"domain_event_outbox"'],
+        )
+        self.assertEqual(len(event_ids), 25)
+        self.assertEqual(
+            set(EventOutbox.objects.values_list("event_id", flat=True)),
+            {uuid.UUID(event_id) for event_id in event_ids},
+        )
+        for event in Event.objects.filter(org_id=self.org_id):
+            self.assertTrue(event.verify_integrity())
+        kick.assert_called_once_with()
+
+    @patch("services.events.tasks.relay_event_outbox_task.delay")
+    def test_rolled_back_events_are_never_published(self, kick):
+        from django.db import transaction
+        from services.events.dispatcher import emit_events
+        from services.events.models import EventOutbox
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    emit_events(_items(self.org_id, 3))
+                    raise RuntimeError("abort")
+            except RuntimeError:
+                pass
+
+        kick.assert_not_called()
+        self.assertFalse(EventOutbox.objects.exists())
+
+    @patch("services.events.tasks.relay_event_outbox_task.delay")
+    def test_relay_kicks_are_debounced(self, kick):
+        from services.events.dispatcher import RELAY_KICK_KEY, emit_events
+
+        for _ in range(5):
+            with self.captureOnCommitCallbacks(execute=True):
+                emit_events(_items(self.org_id, 1))
+        self.assertEqual(kick.call_count, 1)
+
+        cache.delete(RELAY_KICK_KEY)  # the interval has passed
+        with self.captureOnCommitCallbacks(execute=True):
+            emit_events(_items(self.org_id, 1))
+        self.assertEqual(kick.call_count, 2)
+
+    @patch("services.events.tasks._fan_out")
+    def test_sync_processes_inline_without_outbox(self, fan_out):
+        from services.events.dispatcher import emit_events
+        from services.events.models import EventOutbox
+
+        emit_events(_items(self.org_id, 2), sync=True)
+        self.assertEqual(fan_out.call_count, 2)
+        self.assertFalse(EventOutbox.objects.exists())
+
+
+class RelayTest(TestCase):
+    @override_settings(EVENT_OUTBOX_BATCH_SIZE=4)
+    @patch("services.events.tasks.process_event_batch_task.delay")
+    def test_relay_publishes_one_message_per_batch(self, publish):
+        from services.events.dispatcher import emit_events
+        from services.events.models import EventOutbox
+        from services.events.tasks import relay_event_outbox_task
+
+        with patch("services.events.tasks.relay_event_outbox_task.delay"):
+            event_ids = emit_events(_items(str(uuid.uuid4()), 10))
+
+        result = relay_event_outbox_task.apply().get()
+
+        self.assertEqual(result, {"relayed": 10, "batches": 3})
+        batches = [call.kwargs["event_ids"] for call in publish.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual(sum(batches, []), event_ids)
+        self.assertFalse(EventOutbox.objects.exists())
+
+    @patch("services.events.tasks.process_event_batch_task.delay")
+    def test_failed_publish_keeps_rows(self, publish):
+        from services.events.dispatcher import emit_events, relay_event_outbox
+        from services.events.models import EventOutbox
+
+        with patch("services.events.tasks.relay_event_outbox_task.delay"):
+            emit_events(_items(str(uuid.uuid4()), 3))
+        publish.side_effect = ConnectionError("broker down")
+
+        with self.assertRaises(ConnectionError):
+            relay_event_outbox()
+        self.assertEqual(EventOutbox.objects.count(), 3)
+
+
+class ProcessEventBatchTest(TestCase):
+    @patch("services.events.dispatcher.trigger_integrations_batch")
+    @patch("services.events.tasks._fan_out")
+    def test_fans_out_every_event_from_one_query(self, fan_out, trigger_batch):
+        from services.events.dispatcher import emit_events
+        from services.events.tasks import process_event_batch_task
+
+        with patch("services.events.tasks.relay_event_outbox_task.delay"):
+            event_ids = emit_events(_items(str(uuid.uuid4()), 5))
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = process_event_batch_task.apply(
+                kwargs={"event_ids": event_ids + [str(uuid.uuid4())]}
+            ).get()
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(result, {"status": "processed", "processed": 5, "missing": 1})
+        self.assertEqual(
+            sorted(str(call.args[0].id) for call in fan_out.call_args_list),
+            sorted(event_ids),
+        )
+        # Integrations are dispatched once for the whole batch.
+        trigger_batch.assert_called_once()
+        self.assertEqual(len(trigger_batch.call_args.args[0]), 5)
@@ -0,0 +1,199 @@
+"""
+Tests for batched evidence-pack ingestion and the background build task.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+class ArtifactHashTest(SimpleTestCase):
+    def test_hash_content_matches_canonical_json(self):
+        from services.evidence_pack.models import EvidenceArtifact
+
+        content = {"b": [1, 2], "a": uuid.UUID(int=1), "é": "ü"}
+        canonical = json.dumps(content, sort_keys=True, default=str)
+        self.assertEqual(
+            EvidenceArtifact.hash_content(content),
+            (hashlib.sha256(canonical.encode()).hexdigest(), len(canonical.encode())),
+        )
+
+
+class BatchedBuildTest(TestCase):
+    def setUp(self):
+        from services.events.models import Event
+
+        self.org_id = str(uuid.uuid4())
+        for i in range(5):
+            Event.objects.create(
+                event_type="vote_cast",
+                org_id=self.org_id,
+                actor_id=f"user_{i}",
+                payload={"ballot": i},
+            )
+
+    def _build(self, **kwargs):
+        from services.evidence_pack.builder import build_evidence_pack
+
+        return build_evidence_pack(
+            org_id=self.org_id,
+            include_audit_logs=False,
+            include_cases=False,
+            include_governance=False,
+            include_events=False,
+            **kwargs,
+        )
+
+    def test_manifest_and_seal_match_per_artifact_hashing(self):
+        from services.evidence_pack.models import EvidenceArtifact, EvidencePack
+
+        result = self._build(batch_size=2)
+
+        artifacts = EvidenceArtifact.objects.filter(pack_id=result["pack_id"])
+        expected = {}
+        for artifact in artifacts:
+            canonical = json.dumps(artifact.content, sort_keys=True, default=str)
+            expected[str(artifact.id)] = hashlib.sha256(canonical.encode()).hexdigest()
+            self.assertEqual(artifact.size_bytes, len(canonical.encode()))
+        self.assertEqual(result["manifest"], expected)
+
+        pack = EvidencePack.objects.get(pk=result["pack_id"])
+        seal = hashlib.sha256(
+            json.dumps(expected, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        self.assertEqual((pack.artifact_count, pack.pack_hash), (5, seal))
+        self.assertTrue(pack.verify_seal())
+
+    def test_one_insert_per_batch(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self._build(batch_size=2)
+        inserts = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "evidence_artifacts"')
+        ]
+        self.assertEqual(len(inserts), 3)  # 2 + 2 + 1
+
+    def test_progress_reported_per_batch(self):
+        from services.evidence_pack.builder import (
+            collect_evidence_pack,
+            create_evidence_pack,
+        )
+
+        pack = create_evidence_pack(org_id=self.org_id)
+        calls = []
+        collect_evidence_pack(
+            pack,
+            include_audit_logs=False,
+            include_cases=False,
+            include_governance=False,
+            batch_size=4,
+            progress=lambda stage, count: calls.append((stage, count)),
+        )
+        # One pass over the events yields a domain_event and a vote_record each.
+        self.assertEqual(calls, [("events", 4), ("events", 8), ("events", 10)])
+
+    def test_task_builds_seals_and_records_state(self):
+        from services.evidence_pack.builder import create_evidence_pack
+        from services.evidence_pack.models import EvidencePack
+        from services.evidence_pack.tasks import build_evidence_pack_task
+
+        pack = create_evidence_pack(org_id=self.org_id, requested_by="user_1")
+        with patch.object(build_evidence_pack_task, "update_state"), patch(
+            "services.events.dispatcher.emit_event"
+        ) as emit:
+            result = build_evidence_pack_task.apply(
+                kwargs={"pack_id": str(pack.id), "include_events": False}
+            ).get()
+
+        pack = EvidencePack.objects.get(pk=pack.pk)
+        self.assertEqual(result["status"], "sealed")
+        self.assertNotIn("manifest", result)
+        self.assertEqual(pack.metadata["build"]["state"], "complete")
+        self.assertEqual(pack.metadata["build"]["artifacts"], 5)
+        self.assertTrue(pack.verify_seal())
+        emit.assert_called_once()
+
+    def test_redelivered_task_does_not_duplicate_artifacts(self):
+        from services.evidence_pack.builder import _ingest, create_evidence_pack
+        from services.evidence_pack.models import EvidenceArtifact, EvidencePack
+        from services.evidence_pack.tasks import build_evidence_pack_task
+
+        pack = create_evidence_pack(org_id=self.org_id, requested_by="user_1")
+        # The first delivery inserted a batch, then its worker died.
+        _ingest(pack, "events", iter([("vote_record", "x", {}, "{}")] * 3), {}, 10, None)
+
+        with patch.object(build_evidence_pack_task, "update_state"), patch(
+            "services.events.dispatcher.emit_event"
+        ):
+            build_evidence_pack_task.apply(
+                kwargs={"pack_id": str(pack.id), "include_events": False}
+            ).get()
+
+        pack = EvidencePack.objects.get(pk=pack.pk)
+        self.assertEqual(EvidenceArtifact.objects.filter(pack=pack).count(), 5)
+        self.assertEqual(pack.artifact_count, 5)
+        self.assertTrue(pack.verify_seal())
+
+
+class SinglePassEventCollectionTest(TestCase):
+    def setUp(self):
+        from services.events.models import Event
+
+        self.org_id = str(uuid.uuid4())
+        for i, event_type in enumerate(
+            ["vote_cast", "policy_changed", "case_created", "governance_action"]
+        ):
+            Event.objects.create(
+                event_type=event_type,
+                org_id=self.org_id,
+                actor_id=f"user_{i}",
+                payload={"n": i, "nested": {"b": [1.5, None], "a": "é"}},
+            )
+
+    def _event_queries(self, **include):
+        from services.evidence_pack.builder import build_evidence_pack
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = build_evidence_pack(
+                org_id=self.org_id, include_audit_logs=False, include_cases=False, **include
+            )
+        scans = [q for q in ctx.captured_queries if 'FROM "domain_events"' in q["sql"]]
+        return result, scans
+
+    def test_one_scan_for_all_event_artifacts(self):
+        from services.evidence_pack.models import EvidenceArtifact
+
+        result, scans = self._event_queries()
+        self.assertEqual(len(scans), 1)
+
+        types = EvidenceArtifact.objects.filter(pack_id=result["pack_id"]).values_list(
+            "artifact_type", flat=True
+        )
+        self.assertEqual(
+            sorted(types),
+            ["domain_event"] * 4 + ["governance_action"] * 2 + ["vote_record"],
+        )
+
+    def test_governance_only_filters_by_type(self):
+        result, scans = self._event_queries(include_events=False, include_votes=False)
+        self.assertEqual(len(scans), 1)
+        self.assertIn('"event_type" IN', scans[0]["sql"])
+        self.assertEqual(result["artifact_count"], 2)
+
+    def test_spliced_canonical_json_matches_per_artifact_hashing(self):
+        from services.evidence_pack.models import EvidenceArtifact
+
+        result, _ = self._event_queries()
+        for artifact in EvidenceArtifact.objects.filter(pack_id=result["pack_id"]):
+            self.assertEqual(
+                (artifact.content_hash, artifact.size_bytes),
+                EvidenceArtifact.hash_content(artifact.content),
+            )
@@ -0,0 +1,154 @@
+"""
+Tests for the streaming evidence-pack export (NDJSON / ZIP) and its
+incremental manifest and seal verification.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import uuid
+import zipfile
+
+from django.test import SimpleTestCase, TestCase
+
+
+class SealHasherTest(SimpleTestCase):
+    def test_matches_pack_seal_canonical_form(self):
+        from services.evidence_pack.builder import _SealHasher
+
+        manifests = [
+            {},
+            {"artifacts": ["audit_logs"]},
+            {str(uuid.uuid4()): hashlib.sha256(str(i).encode()).hexdigest() for i in range(50)},
+            {"b": {"y": 1, "x": [1.5, None]}, "a": "é"},
+        ]
+        for manifest in manifests:
+            hasher = _SealHasher()
+            for key in sorted(manifest):
+                hasher.add(key, manifest[key])
+            canonical = json.dumps(manifest, sort_keys=True, default=str)
+            self.assertEqual(hasher.hexdigest(), hashlib.sha256(canonical.encode()).hexdigest())
+
+
+class ManifestVerifierTest(SimpleTestCase):
+    def _seal(self, manifest):
+        canonical = json.dumps(manifest, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def test_clean_merge(self):
+        from services.evidence_pack.builder import _ManifestVerifier
+
+        manifest = {"a": "h1", "b": "h2"}
+        verifier = _ManifestVerifier(iter(sorted(manifest.items())))
+        verifier.check("a", "h1", "h1")
+        verifier.check("b", "h2", "h2")
+        result = verifier.finish(self._seal(manifest))
+        self.assertTrue(result["valid"])
+        self.assertEqual((result["artifacts_checked"], result["manifest_entries"]), (2, 2))
+
+    def test_reports_missing_unexpected_and_mismatched(self):
+        from services.evidence_pack.builder import _ManifestVerifier
+
+        manifest = {"a": "h1", "c": "h3", "d": "h4"}
+        verifier = _ManifestVerifier(iter(sorted(manifest.items())))
+        verifier.check("b", "hx", "hx")  # not in manifest; "a" skipped
+        verifier.check("c", "tampered", "h3")
+        result = verifier.finish(self._seal(manifest))
+
+        self.assertFalse(result["valid"])
+        self.assertTrue(result["seal_valid"])
+        self.assertEqual(
+            (result["missing"], result["unexpected"], result["mismatched"]), (2, 1, 1)
+        )
+        self.assertEqual(
+            [f["id"] for f in result["failures"]], ["a", "b", "c", "d"]
+        )
+
+    def test_tampered_manifest_fails_seal(self):
+        from services.evidence_pack.builder import _ManifestVerifier
+
+        verifier = _ManifestVerifier(iter([("a", "forged")]))
+        verifier.check("a", "forged", "forged")
+        result = verifier.finish(self._seal({"a": "h1"}))
+        self.assertFalse(result["seal_valid"])
+        self.assertFalse(result["valid"])
+
+
+class StreamingExportTest(TestCase):
+    def setUp(self):
+        from services.events.models import Event
+        from services.evidence_pack.builder import build_evidence_pack
+
+        self.org_id = str(uuid.uuid4())
+        for i in range(7):
+            Event.objects.create(
+                event_type="vote_cast" if i % 2 else "member_joined",
+                org_id=self.org_id,
+                actor_id=f"user_{i}",
+                payload={"n": i},
+            )
+        self.result = build_evidence_pack(
+            org_id=self.org_id,
+            include_audit_logs=False,
+            include_cases=False,
+            include_governance=False,
+            batch_size=3,
+        )
+        self.pack_id = self.result["pack_id"]
+
+    def test_ndjson_export_verifies(self):
+        from services.evidence_pack.builder import stream_pack_ndjson
+        from services.evidence_pack.models import EvidencePack
+
+        body = b"".join(stream_pack_ndjson(self.pack_id))
+        records = [json.loads(line) for line in body.splitlines()]
+
+        header, artifacts, trailer = records[0], records[1:-1], records[-1]
+        self.assertEqual(header["pack_hash"], self.result["pack_hash"])
+        self.assertEqual(len(artifacts), self.result["artifact_count"])
+        self.assertEqual(
+            {a["id"]: a["content_hash"] for a in artifacts}, self.result["manifest"]
+        )
+        self.assertEqual(trailer["record"], "verification")
+        self.assertTrue(trailer["valid"])
+        self.assertEqual(EvidencePack.objects.get(pk=self.pack_id).status, "exported")
+
+    def test_ndjson_trailer_flags_tampered_artifact(self):
+        from services.evidence_pack.builder import stream_pack_ndjson
+        from services.evidence_pack.models import EvidenceArtifact
+
+        victim = EvidenceArtifact.objects.filter(pack_id=self.pack_id).first()
+        EvidenceArtifact.objects.filter(pk=victim.pk).update(content={"forged": True})
+
+        body = b"".join(stream_pack_ndjson(self.pack_id))
+        trailer = json.loads(body.splitlines()[-1])
+        self.assertFalse(trailer["valid"])
+        self.assertTrue(trailer["seal_valid"])
+        self.assertEqual(trailer["failures"], [{"id": str(victim.pk), "problem": "mismatched"}])
+
+    def test_zip_has_one_member_per_type(self):
+        from services.evidence_pack.builder import stream_pack_zip
+
+        body = b"".join(stream_pack_zip(self.pack_id))
+        with zipfile.ZipFile(io.BytesIO(body)) as archive:
+            self.assertEqual(
+                sorted(archive.namelist()),
+                [
+                    "artifacts/domain_event.ndjson",
+                    "artifacts/vote_record.ndjson",
+                    "pack.json",
+                    "verification.json",
+                ],
+            )
+            votes = archive.read("artifacts/vote_record.ndjson").splitlines()
+            self.assertEqual(len(votes), 3)
+            self.assertTrue(json.loads(archive.read("verification.json"))["valid"])
+
+    def test_unsealed_pack_rejected(self):
+        from services.evidence_pack.builder import create_evidence_pack, stream_pack_ndjson
+
+        draft = create_evidence_pack(org_id=self.org_id)
+        with self.assertRaises(ValueError):
+            stream_pack_ndjson(str(draft.pk))
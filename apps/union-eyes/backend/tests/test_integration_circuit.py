@@ -0,0 +1,248 @@
+"""
+Tests for the shared integration circuit breaker (Redis state run against
+fakeredis with Lua support), the parked-delivery queue, and the aggregated
+registry health write-back — end to end against a flapping stub endpoint.
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+import fakeredis
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from tests.webhook_stub import WebhookStub
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+T0 = 1_760_000_000_000
+
+
+class CircuitFixture:
+    """fakeredis behind the circuit module and a controllable clock."""
+
+    def setUp(self):
+        from services.integration_control_plane.circuit import reset_circuits
+
+        super().setUp()
+        self.redis = fakeredis.FakeStrictRedis()
+        self.now = T0
+        for target, kwargs in (
+            ("_get_redis", {"return_value": self.redis}),
+            ("_now_ms", {"side_effect": lambda: self.now}),
+        ):
+            patcher = patch(f"services.integration_control_plane.circuit.{target}", **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        reset_circuits()
+        self.addCleanup(reset_circuits)
+
+
+@override_settings(INTEGRATION_CIRCUIT_MIN_REQUESTS=4)
+class CircuitStateTest(CircuitFixture, SimpleTestCase):
+    def setUp(self):
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        super().setUp()
+        self.integration = IntegrationRegistry(
+            id=uuid.uuid4(), org_id=uuid.uuid4(), integration_type="api_push", name="crm"
+        )
+
+    def _record(self, *outcomes):
+        from services.integration_control_plane import circuit
+
+        return [circuit.record(self.integration, ok) for ok in outcomes]
+
+    def _check(self, token="t1"):
+        from services.integration_control_plane import circuit
+
+        return circuit.check(self.integration, token)
+
+    def test_opens_on_failure_rate_once_enough_requests(self):
+        self.assertEqual(self._record(True, True, True, False, False), [""] * 5)
+        self.assertEqual(self._record(False), ["opened"])  # 3 of 6 failed
+
+        decision = self._check()
+        self.assertFalse(decision.allowed)
+        self.assertEqual(decision.wait, 30.0)
+
+    def test_old_outcomes_leave_the_rolling_window(self):
+        self._record(False, False, False)
+        self.now += 61_000
+        self.assertEqual(self._record(False), [""])  # 1 outcome in the window
+        self.assertTrue(self._check().allowed)
+
+    def test_half_open_probe_reopens_with_longer_wait_then_closes(self):
+        self._record(False, False, False, False)
+
+        self.now += 30_000
+        self.assertEqual(self._check("probe-1"), (True, True, 0.0))
+        waiting = self._check("other")
+        self.assertFalse(waiting.allowed)
+        self.assertLessEqual(waiting.wait, 5.0)  # re-check while the probe runs
+
+        self.assertEqual(self._record(False), ["reopened"])
+        self.assertEqual(self._check().wait, 60.0)
+
+        self.now += 60_000
+        self.assertTrue(self._check("probe-2").probe)
+        self.assertEqual(self._record(True), ["closed"])
+        self.assertEqual(self._check(), (True, False, 0.0))
+        self.assertFalse(self.redis.exists(f"icp_cb:{self.integration.id}"))
+
+    def test_parked_messages_come_back_when_due(self):
+        from services.integration_control_plane import circuit
+
+        self.assertTrue(circuit.park([{"payload": {"n": 1}}, {"payload": {"n": 2}}], 30))
+        self.assertEqual(circuit.pop_due_parked(10), [])
+        self.now += 30_000
+        self.assertEqual(
+            sorted(m["payload"]["n"] for m in circuit.pop_due_parked(10)), [1, 2]
+        )
+        self.assertEqual(self.redis.zcard(circuit.PARKED_KEY), 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, INTEGRATION_CIRCUIT_MIN_REQUESTS=4)
+class FlappingEndpointTest(CircuitFixture, TestCase):
+    def setUp(self):
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        super().setUp()
+        self.down = True
+        responder = lambda path, n: (503 if self.down else 200, 0)
+        self.stub = WebhookStub(responder=responder).__enter__()
+        self.addCleanup(self.stub.__exit__, None, None, None)
+        self.integration = IntegrationRegistry.objects.create(
+            org_id=uuid.uuid4(),
+            integration_type="webhook_outbound",
+            name="flapping",
+            endpoint_url=self.stub.url(),
+            max_retries=10,
+        )
+        retry = patch("services.integration_control_plane.tasks.retry_integration.apply_async")
+        retry.start()
+        self.addCleanup(retry.stop)
+
+    def _kwargs(self, **extra):
+        return dict(
+            integration_id=str(self.integration.id),
+            org_id=str(self.integration.org_id),
+            **extra,
+        )
+
+    def _dispatch(self, n):
+        from services.integration_control_plane.tasks import dispatch_integration
+
+        return dispatch_integration.apply(
+            kwargs=self._kwargs(payload={"event_id": f"e{n}"})
+        ).get()
+
+    def _dispatch_batch(self, *ns):
+        from services.integration_control_plane.tasks import dispatch_integration_batch
+
+        return dispatch_integration_batch.apply(
+            kwargs=self._kwargs(payloads=[{"event_id": f"b{n}"} for n in ns])
+        ).get()
+
+    def _release(self):
+        from services.integration_control_plane.tasks import (
+            dispatch_integration,
+            release_parked_deliveries,
+        )
+
+        with patch.object(
+            dispatch_integration,
+            "delay",
+            side_effect=lambda **kw: dispatch_integration.apply(kwargs=kw),
+        ):
+            return release_parked_deliveries.apply().get()["released"]
+
+    def test_open_circuit_parks_then_releases_after_recovery(self):
+        from services.integration_control_plane.tasks import flush_integration_health
+
+        with CaptureQueriesContext(connection) as ctx:
+            statuses = [self._dispatch(n)["status"] for n in range(7)]
+        self.assertEqual(statuses, ["retrying"] * 4 + ["parked"] * 3)
+        self.assertEqual(self.stub.requests["/hook"], 4)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if q["sql"].startswith('UPDATE "integration_registry"')]
+        )
+
+        self.down = False
+        self.assertEqual(self._release(), 0)  # still open
+        self.now += 30_000
+        self.assertEqual(self._release(), 3)  # probe closes the circuit, rest follow
+        self.assertEqual(self.stub.requests["/hook"], 7)
+
+        # Flaps again: closing started a fresh window (2 successes after the
+        # probe), so 2 failures out of 4 trip it.
+        self.down = True
+        statuses = [self._dispatch(n)["status"] for n in range(7, 12)]
+        self.assertEqual(statuses, ["retrying"] * 2 + ["parked"] * 3)
+
+        self.assertEqual(flush_integration_health.apply().get(), {"flushed": 1})
+        self.integration.refresh_from_db()
+        self.assertEqual(self.integration.failure_count, 6)
+        self.assertEqual(self.integration.consecutive_failures, 2)
+        self.assertEqual(self.integration.status, "active")
+        self.assertIsNotNone(self.integration.last_success_at)
+        self.assertIn("503", self.integration.last_failure_reason)
+
+    def test_batch_parked_while_open_and_probed_with_one_payload(self):
+        for n in range(4):
+            self._dispatch(n)
+
+        result = self._dispatch_batch(1, 2, 3)
+        self.assertEqual((result["status"], result["parked"]), ("parked", 3))
+        self.assertEqual(self.stub.requests["/hook"], 4)
+
+        self.redis.delete("icp_parked")
+        self.now += 30_000
+        result = self._dispatch_batch(4, 5, 6)
+        self.assertEqual(result["results"], {"retrying": 1, "parked": 2})
+        self.assertEqual(self.stub.requests["/hook"], 5)  # only the probe
+
+        self.now += 60_000
+        self.down = False
+        self.assertEqual(self._release(), 2)
+        self.assertEqual(self._dispatch_batch(7, 8)["results"], {"delivered": 2})
+        self.assertEqual(self.stub.requests["/hook"], 9)
+
+    def test_without_redis_deliveries_go_out_and_health_is_written_directly(self):
+        with patch(
+            "services.integration_control_plane.circuit._get_redis",
+            side_effect=ConnectionError("redis down"),
+        ):
+            statuses = [self._dispatch(n)["status"] for n in range(6)]
+
+        self.assertEqual(statuses, ["retrying"] * 6)
+        self.assertEqual(self.stub.requests["/hook"], 6)
+        self.integration.refresh_from_db()
+        self.assertEqual(self.integration.consecutive_failures, 6)
+
+
+class ApplyHealthCountersTest(SimpleTestCase):
+    def _integration(self, **fields):
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        integration = IntegrationRegistry(
+            org_id=uuid.uuid4(), integration_type="api_push", name="crm", **fields
+        )
+        integration.save = lambda update_fields: None
+        return integration
+
+    def test_matches_one_by_one_status_rules(self):
+        integration = self._integration(status="degraded", consecutive_failures=4)
+        integration.apply_health_counters(failures=3, consecutive=1, succeeded=True)
+        self.assertEqual(
+            (integration.status, integration.consecutive_failures, integration.failure_count),
+            ("active", 1, 3),
+        )
+
+        integration.apply_health_counters(failures=4, consecutive=4, succeeded=False)
+        self.assertEqual((integration.status, integration.consecutive_failures), ("failed", 5))
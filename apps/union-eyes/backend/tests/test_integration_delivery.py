@@ -0,0 +1,151 @@
+"""
+Tests for the pooled integration delivery engine and the grouped
+dispatch task that uses it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import uuid
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from tests.webhook_stub import WebhookStub
+
+
+def _integration(url, **metadata):
+    from services.integration_control_plane.models import IntegrationRegistry
+
+    return IntegrationRegistry(
+        id=uuid.uuid4(),
+        org_id=uuid.uuid4(),
+        integration_type="webhook_outbound",
+        name="stub",
+        endpoint_url=url,
+        metadata=metadata,
+    )
+
+
+class DeliveryEngineTest(SimpleTestCase):
+    def _engine(self, **kwargs):
+        from services.integration_control_plane.delivery import DeliveryEngine
+
+        engine = DeliveryEngine(workers=8, **kwargs)
+        self.addCleanup(engine.close)
+        return engine
+
+    def test_connections_are_reused(self):
+        with WebhookStub() as stub:
+            engine = self._engine()
+            integration = _integration(stub.url())
+            for i in range(10):
+                self.assertTrue(engine.post(integration, b"{}", {}).ok)
+        self.assertEqual(stub.requests["/hook"], 10)
+        self.assertEqual(stub.connections, 1)
+
+    def test_per_integration_concurrency_limit(self):
+        with WebhookStub(delay=0.05) as stub:
+            engine = self._engine()
+            limited = _integration(stub.url("/limited"), max_concurrency=2)
+            other = _integration(stub.url("/other"), max_concurrency=4)
+            futures = [engine.submit(limited, b"{}", {}) for _ in range(8)]
+            futures += [engine.submit(other, b"{}", {}) for _ in range(4)]
+            self.assertTrue(all(f.result().ok for f in futures))
+        self.assertEqual(stub.max_in_flight["/limited"], 2)
+        # The limited lane's backlog did not hold the pool: /other ran in parallel.
+        self.assertEqual(stub.max_in_flight["/other"], 4)
+
+    def test_budget_leaves_unstarted_deliveries_unsent(self):
+        with WebhookStub(delay=0.2) as stub:
+            engine = self._engine()
+            integration = _integration(stub.url(), max_concurrency=1)
+            results = engine.post_many(integration, [(b"{}", {})] * 4, budget=0.1)
+        self.assertTrue(results[0].ok)
+        self.assertEqual(results[1:], [None, None, None])
+        self.assertEqual(stub.requests["/hook"], 1)
+
+    def test_timeout_and_http_errors_are_results_with_latency_metrics(self):
+        from observability.metrics import render_prometheus, reset_metrics
+
+        reset_metrics()
+        responder = lambda path, n: (503, 0) if path == "/down" else (200, 0.5)
+        with WebhookStub(responder=responder) as stub:
+            engine = self._engine()
+            slow = engine.post(_integration(stub.url("/slow"), timeout_seconds=0.1), b"{}", {})
+            down = engine.post(_integration(stub.url("/down")), b"{}", {})
+
+        self.assertFalse(slow.ok)
+        self.assertIsNone(slow.status_code)
+        self.assertEqual((down.ok, down.status_code), (False, 503))
+        text = render_prometheus()
+        self.assertIn('integration_delivery_ms_count{outcome="timeout",type="webhook_outbound"} 1', text)
+        self.assertIn('integration_delivery_ms_count{outcome="http_error",type="webhook_outbound"} 1', text)
+
+
+class GroupedDeliveryTest(TestCase):
+    def setUp(self):
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        self.stub = WebhookStub(delay=0.01).__enter__()
+        self.addCleanup(self.stub.__exit__, None, None, None)
+        self.integration = IntegrationRegistry.objects.create(
+            org_id=uuid.uuid4(),
+            integration_type="webhook_outbound",
+            name="stub",
+            endpoint_url=self.stub.url(),
+            secret="s3cret",
+            metadata={"max_concurrency": 3},
+        )
+
+    def _dispatch(self, payloads):
+        from services.integration_control_plane.tasks import dispatch_integration_batch
+
+        return dispatch_integration_batch.apply(
+            kwargs={
+                "integration_id": str(self.integration.id),
+                "org_id": str(self.integration.org_id),
+                "payloads": payloads,
+            }
+        ).get()
+
+    def test_batch_delivers_signed_bodies_concurrently(self):
+        payloads = [{"event_id": str(i), "b": 1, "a": 2} for i in range(6)]
+        result = self._dispatch(payloads)
+
+        self.assertEqual(result["results"], {"delivered": 6})
+        self.assertLessEqual(self.stub.max_in_flight["/hook"], 3)
+        self.assertEqual(
+            sorted(self.stub.bodies["/hook"]),
+            sorted(json.dumps(p, sort_keys=True).encode() for p in payloads),
+        )
+        body, headers = self.stub.bodies["/hook"][0], self.stub.headers["/hook"][0]
+        expected = hmac.new(
+            b"s3cret", f"{headers['X-Webhook-Timestamp']}.{body.decode()}".encode(), hashlib.sha256
+        ).hexdigest()
+        self.assertEqual(headers["X-Webhook-Signature"], expected)
+
+    def test_redelivery_is_a_duplicate(self):
+        self._dispatch([{"event_id": "1"}])
+        self.assertEqual(self._dispatch([{"event_id": "1"}])["results"], {"duplicate": 1})
+        self.assertEqual(self.stub.requests["/hook"], 1)
+
+    @patch("services.integration_control_plane.tasks.dispatch_integration.delay")
+    def test_deliveries_past_the_budget_are_requeued(self, requeue):
+        from services.integration_control_plane.delivery import DeliveryResult
+
+        with patch(
+            "services.integration_control_plane.tasks.delivery_engine.post_many",
+            return_value=[DeliveryResult(status_code=200), None],
+        ):
+            result = self._dispatch([{"event_id": "1"}, {"event_id": "2"}])
+
+        self.assertEqual(result["results"], {"delivered": 1, "deferred": 1})
+        from services.integration_control_plane.idempotency import payload_hash
+
+        self.assertEqual(requeue.call_args.kwargs["payload"], {"event_id": "2"})
+        self.assertEqual(
+            requeue.call_args.kwargs["payload_hash"], payload_hash({"event_id": "2"})
+        )
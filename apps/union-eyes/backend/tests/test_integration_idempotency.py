@@ -0,0 +1,214 @@
+"""
+Tests for the Redis-first integration idempotency check, the expired-key
+sweeper, and the payload hash carried in dispatch messages.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ClaimTest(TestCase):
+    def setUp(self):
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        cache.clear()
+        self.integration = IntegrationRegistry.objects.create(
+            org_id=uuid.uuid4(),
+            integration_type="webhook_outbound",
+            name="hook",
+            endpoint_url="https://example.com/hook",
+        )
+        self.org_id = str(self.integration.org_id)
+
+    def test_payload_hash_is_canonical(self):
+        from services.integration_control_plane.idempotency import payload_hash
+
+        self.assertEqual(payload_hash({"a": 1, "b": 2}), payload_hash({"b": 2, "a": 1}))
+        self.assertNotEqual(payload_hash({"a": 1}), payload_hash({"a": 2}))
+
+    def test_delivered_request_is_answered_from_cache(self):
+        from services.integration_control_plane import idempotency
+
+        self.assertIsNone(idempotency.claim(self.org_id, self.integration.pk, "h1", "task-1"))
+        idempotency.record_delivery(self.integration, self.org_id, "h1", 200, {"ok": True})
+
+        with self.assertNumQueries(0):
+            duplicate = idempotency.claim(self.org_id, self.integration.pk, "h1", "task-2")
+        self.assertEqual(
+            duplicate,
+            {"status": "duplicate", "original_status": 200, "original_body": {"ok": True}},
+        )
+
+    def test_in_flight_claim_blocks_other_owners_only(self):
+        from services.integration_control_plane import idempotency
+
+        self.assertIsNone(idempotency.claim(self.org_id, self.integration.pk, "h1", "task-1"))
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                idempotency.claim(self.org_id, self.integration.pk, "h1", "task-2"),
+                {"status": "duplicate", "reason": "in_flight"},
+            )
+        # A redelivered message re-enters its own claim.
+        self.assertIsNone(idempotency.claim(self.org_id, self.integration.pk, "h1", "task-1"))
+
+        idempotency.release(self.org_id, self.integration.pk, "h1")
+        self.assertIsNone(idempotency.claim(self.org_id, self.integration.pk, "h1", "task-2"))
+
+    def test_database_answers_when_the_cache_is_cold(self):
+        from services.integration_control_plane import idempotency
+
+        idempotency.record_delivery(self.integration, self.org_id, "h1", 202, None)
+        cache.clear()
+
+        self.assertEqual(
+            idempotency.claim(self.org_id, self.integration.pk, "h1", "task-2")["original_status"],
+            202,
+        )
+        with self.assertNumQueries(0):
+            idempotency.claim(self.org_id, self.integration.pk, "h1", "task-3")
+
+    def test_same_payload_to_another_integration_is_not_a_duplicate(self):
+        from services.integration_control_plane import idempotency
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        other = IntegrationRegistry.objects.create(
+            org_id=self.integration.org_id,
+            integration_type="webhook_outbound",
+            name="other hook",
+            endpoint_url="https://example.com/other",
+        )
+        self.assertIsNone(idempotency.claim(self.org_id, self.integration.pk, "h1", "task-1"))
+        self.assertIsNone(idempotency.claim(self.org_id, other.pk, "h1", "task-2"))
+
+        idempotency.record_delivery(self.integration, self.org_id, "h1", 200, None)
+        cache.clear()
+        self.assertEqual(
+            idempotency.claim(self.org_id, self.integration.pk, "h1", "task-3")["status"],
+            "duplicate",
+        )
+        self.assertIsNone(idempotency.claim(self.org_id, other.pk, "h1", "task-3"))
+
+    def test_cache_outage_falls_back_to_database(self):
+        from services.integration_control_plane import idempotency
+
+        idempotency.record_delivery(self.integration, self.org_id, "h1", 200, None)
+        with patch.object(cache, "add", side_effect=ConnectionError("redis down")):
+            self.assertEqual(
+                idempotency.claim(self.org_id, self.integration.pk, "h1", "task-2")["status"],
+                "duplicate",
+            )
+            self.assertIsNone(idempotency.claim(self.org_id, self.integration.pk, "h2", "task-2"))
+
+
+class PurgeExpiredTest(TestCase):
+    def setUp(self):
+        from services.integration_control_plane.models import (
+            IntegrationIdempotencyKey,
+            IntegrationRegistry,
+        )
+
+        integration = IntegrationRegistry.objects.create(
+            org_id=uuid.uuid4(),
+            integration_type="webhook_outbound",
+            name="hook",
+            endpoint_url="https://example.com/hook",
+        )
+        now = timezone.now()
+        IntegrationIdempotencyKey.objects.bulk_create(
+            IntegrationIdempotencyKey(
+                request_hash=f"h{i}",
+                integration=integration,
+                org_id=integration.org_id,
+                response_status=200,
+                expires_at=now + timedelta(hours=-1 if i < 5 else 1),
+            )
+            for i in range(7)
+        )
+
+    def test_expired_rows_deleted_in_batches(self):
+        from services.integration_control_plane.idempotency import purge_expired
+        from services.integration_control_plane.models import IntegrationIdempotencyKey
+
+        with self.assertNumQueries(7):  # 3 batches of (select ids, delete) + final select
+            self.assertEqual(purge_expired(batch_size=2), 5)
+        self.assertEqual(
+            sorted(IntegrationIdempotencyKey.objects.values_list("request_hash", flat=True)),
+            ["h5", "h6"],
+        )
+
+    def test_sweeper_task(self):
+        from services.integration_control_plane.tasks import purge_idempotency_keys
+
+        self.assertEqual(purge_idempotency_keys.apply().get(), {"purged": 5})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class HashInMessageTest(TestCase):
+    def setUp(self):
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        cache.clear()
+        self.integration = IntegrationRegistry.objects.create(
+            org_id=uuid.uuid4(),
+            integration_type="webhook_outbound",
+            name="hook",
+            endpoint_url="https://example.com/hook",
+        )
+
+    def test_dispatch_uses_carried_hash_and_releases_on_failure(self):
+        from services.integration_control_plane import idempotency
+        from services.integration_control_plane.delivery import DeliveryResult
+        from services.integration_control_plane.tasks import dispatch_integration
+
+        with patch(
+            "services.integration_control_plane.idempotency.payload_hash"
+        ) as rehash, patch(
+            "services.integration_control_plane.tasks.delivery_engine.post",
+            return_value=DeliveryResult(status_code=500, error="HTTP 500"),
+        ), patch(
+            "services.integration_control_plane.tasks.retry_integration.apply_async"
+        ) as retry:
+            result = dispatch_integration.apply(
+                kwargs={
+                    "integration_id": str(self.integration.id),
+                    "org_id": str(self.integration.org_id),
+                    "payload": {"event_id": "1"},
+                    "payload_hash": "carried",
+                }
+            ).get()
+
+        rehash.assert_not_called()
+        self.assertEqual(result["status"], "retrying")
+        self.assertEqual(retry.call_args.kwargs["kwargs"]["payload_hash"], "carried")
+        # The failed attempt released its claim, so the retry can take it.
+        self.assertIsNone(
+            idempotency.claim(str(self.integration.org_id), self.integration.pk, "carried", "retry")
+        )
+
+    @patch("services.integration_control_plane.tasks.dispatch_integration.delay")
+    def test_trigger_sends_payload_hash(self, delay):
+        from services.events.dispatcher import trigger_integrations
+        from services.events.models import Event
+        from services.integration_control_plane.idempotency import payload_hash
+
+        event = Event.objects.create(
+            event_type="case_created",
+            org_id=self.integration.org_id,
+            actor_id="u",
+            payload={"n": 1},
+        )
+        self.assertEqual(trigger_integrations(event), 1)
+        kwargs = delay.call_args.kwargs
+        self.assertEqual(kwargs["payload_hash"], payload_hash(kwargs["payload"]))
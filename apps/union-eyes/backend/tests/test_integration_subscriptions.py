@@ -0,0 +1,154 @@
+"""
+Tests for the cached integration subscription index and grouped
+integration dispatch.
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SubscriptionIndexTest(TestCase):
+    def setUp(self):
+        from services.integration_control_plane.subscriptions import subscription_cache
+
+        cache.clear()
+        subscription_cache.local.clear()
+        self.addCleanup(subscription_cache.local.clear)
+        self.org_id = uuid.uuid4()
+
+    def _register(self, name, **fields):
+        from services.integration_control_plane.models import IntegrationRegistry
+
+        fields.setdefault("integration_type", "webhook_outbound")
+        return IntegrationRegistry.objects.create(
+            org_id=self.org_id,
+            name=name,
+            endpoint_url=f"https://example.com/{name}",
+            **fields,
+        )
+
+    def test_index_matches_subscriptions(self):
+        from services.integration_control_plane.subscriptions import (
+            subscribed_integration_ids,
+        )
+
+        cases = self._register("cases", metadata={"subscribed_events": ["case_created"]})
+        everything = self._register("all", integration_type="api_push")
+        self._register("paused", status="paused")
+        self._register("inbound", integration_type="webhook_inbound")
+
+        self.assertCountEqual(
+            subscribed_integration_ids(self.org_id, "case_created"),
+            [str(cases.id), str(everything.id)],
+        )
+        self.assertEqual(
+            subscribed_integration_ids(self.org_id, "vote_cast"), [str(everything.id)]
+        )
+
+    def test_lookups_after_the_first_hit_no_queries(self):
+        from services.integration_control_plane.subscriptions import (
+            subscribed_integration_ids,
+        )
+
+        self._register("all")
+        subscribed_integration_ids(self.org_id, "case_created")
+        with self.assertNumQueries(0):
+            for event_type in ("case_created", "vote_cast", "member_updated"):
+                self.assertEqual(len(subscribed_integration_ids(self.org_id, event_type)), 1)
+
+    def test_save_and_delete_invalidate_after_commit(self):
+        from services.integration_control_plane.subscriptions import (
+            subscribed_integration_ids,
+        )
+
+        self.assertEqual(subscribed_integration_ids(self.org_id, "case_created"), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            integration = self._register("new")
+        self.assertEqual(
+            subscribed_integration_ids(self.org_id, "case_created"), [str(integration.id)]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            integration.metadata = {"subscribed_events": ["vote_cast"]}
+            integration.save()
+        self.assertEqual(subscribed_integration_ids(self.org_id, "case_created"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            integration.delete()
+        self.assertEqual(subscribed_integration_ids(self.org_id, "vote_cast"), [])
+
+    def test_health_bookkeeping_keeps_the_index(self):
+        integration = self._register("hook")
+        with self.captureOnCommitCallbacks() as callbacks:
+            integration.record_success()
+            integration.record_failure("timeout")
+        self.assertEqual(callbacks, [])
+
+        integration.consecutive_failures = 2
+        with self.captureOnCommitCallbacks() as callbacks:
+            integration.record_failure("timeout")  # 3rd → degraded
+        self.assertEqual(len(callbacks), 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GroupedDispatchTest(TestCase):
+    def setUp(self):
+        from services.integration_control_plane.models import IntegrationRegistry
+        from services.integration_control_plane.subscriptions import subscription_cache
+
+        cache.clear()
+        subscription_cache.local.clear()
+        self.addCleanup(subscription_cache.local.clear)
+        self.org_id = uuid.uuid4()
+        self.votes = IntegrationRegistry.objects.create(
+            org_id=self.org_id,
+            integration_type="webhook_outbound",
+            name="votes",
+            endpoint_url="https://example.com/votes",
+            metadata={"subscribed_events": ["vote_cast"]},
+        )
+        self.everything = IntegrationRegistry.objects.create(
+            org_id=self.org_id,
+            integration_type="api_push",
+            name="all",
+            endpoint_url="https://example.com/all",
+        )
+
+    @patch("services.integration_control_plane.tasks.dispatch_integration_batch.delay")
+    def test_one_message_per_integration(self, delay):
+        from services.events.dispatcher import trigger_integrations_batch
+        from services.events.models import Event
+
+        events = [
+            Event.objects.create(
+                event_type=event_type, org_id=self.org_id, actor_id="u", payload={"n": i}
+            )
+            for i, event_type in enumerate(["vote_cast", "case_created", "vote_cast"])
+        ]
+
+        self.assertEqual(trigger_integrations_batch(events), 2)
+        sent = {call.kwargs["integration_id"]: call.kwargs["payloads"] for call in delay.call_args_list}
+        self.assertEqual(
+            [p["event_id"] for p in sent[str(self.votes.id)]],
+            [str(events[0].id), str(events[2].id)],
+        )
+        self.assertEqual(
+            [p["event_id"] for p in sent[str(self.everything.id)]],
+            [str(event.id) for event in events],
+        )
+        from services.integration_control_plane.idempotency import payload_hash
+
+        for call in delay.call_args_list:
+            self.assertEqual(
+                call.kwargs["payload_hashes"], [payload_hash(p) for p in call.kwargs["payloads"]]
+            )
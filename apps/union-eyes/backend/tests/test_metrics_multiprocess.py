@@ -0,0 +1,216 @@
+"""
+Tests for multi-process metrics (``METRICS_MULTIPROC_DIR``) and the Celery
+task instrumentation helpers.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+
+def _run_in_child(fn) -> None:
+    """Fork, run *fn* in the child, and wait for it to exit."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            fn()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+
+class MmapedValuesTest(SimpleTestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def test_values_survive_reopen_and_growth(self):
+        from observability.multiprocess import MmapedValues, read_file
+
+        path = os.path.join(self.dir, "counter_h_1.db")
+        values = MmapedValues(path)
+        for i in range(5000):  # well past the initial 64 KiB
+            values.write(f"series-{i}", float(i))
+        values.close()
+
+        reopened = MmapedValues(path)
+        self.assertEqual(reopened.read("series-4999"), 4999.0)
+        reopened.write("series-1", 42.0)
+        reopened.close()
+
+        entries = dict(read_file(path))
+        self.assertEqual(len(entries), 5000)
+        self.assertEqual(entries["series-1"], 42.0)
+
+
+class MultiProcessRegistryTest(SimpleTestCase):
+    def setUp(self):
+        from observability.metrics import reset_metrics
+
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        env = patch.dict(os.environ, {"METRICS_MULTIPROC_DIR": self.dir})
+        env.start()
+        self.addCleanup(env.stop)
+        reset_metrics()
+        self.addCleanup(reset_metrics)
+
+    def test_scrape_merges_all_workers(self):
+        from observability.metrics import (
+            counter_inc,
+            histogram_observe,
+            render_prometheus,
+        )
+
+        def worker():
+            counter_inc("jobs_total", labels={"q": "a"}, value=2)
+            histogram_observe("job_ms", 30, labels={"q": "a"})
+
+        _run_in_child(worker)
+        _run_in_child(worker)
+        counter_inc("jobs_total", labels={"q": "a"})
+
+        body = render_prometheus()
+        self.assertIn('jobs_total{q="a"} 5.0', body)
+        self.assertIn('job_ms_bucket{q="a",le="25"} 0.0', body)
+        self.assertIn('job_ms_bucket{q="a",le="50"} 2.0', body)
+        self.assertIn('job_ms_count{q="a"} 2.0', body)
+        self.assertIn('job_ms_sum{q="a"} 60.0', body)
+
+    def test_dead_process_files_are_archived(self):
+        from observability.metrics import counter_inc, gauge_set, render_prometheus
+
+        def worker():
+            counter_inc("jobs_total", value=3)
+            gauge_set("inflight", value=7)
+
+        _run_in_child(worker)
+        render_prometheus()  # first scrape archives the dead child
+
+        leftover = [
+            name
+            for name in os.listdir(self.dir)
+            if name.endswith(".db")
+            and name != "archive.db"
+            and not name.endswith(f"_{os.getpid()}.db")
+        ]
+        self.assertEqual(leftover, [])
+
+        body = render_prometheus()
+        self.assertIn("jobs_total 3.0", body)  # counters never go backwards
+        self.assertNotIn("inflight", body)  # gauges of dead workers dropped
+
+    def test_gauge_mode_max(self):
+        from observability.metrics import gauge_set, register_gauge, render_prometheus
+
+        register_gauge("depth", multiprocess_mode="max")
+        gauge_set("depth", value=4)
+        gauge_set("depth_sum", value=4)
+
+        pid = os.fork()
+        if pid == 0:
+            gauge_set("depth", value=9)
+            gauge_set("depth_sum", value=9)
+            time.sleep(2)
+            os._exit(0)
+        try:
+            deadline = time.monotonic() + 5
+            while "depth 9.0" not in render_prometheus() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            body = render_prometheus()
+        finally:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+
+        self.assertIn("depth 9.0", body)
+        self.assertIn("depth_sum 13.0", body)
+
+    def test_wipe_host_files_keeps_archive(self):
+        from observability.metrics import counter_inc, render_prometheus, reset_metrics
+        from observability.multiprocess import wipe_host_files
+
+        _run_in_child(lambda: counter_inc("jobs_total"))
+        render_prometheus()
+        counter_inc("jobs_total")
+        reset_metrics()
+
+        wipe_host_files(self.dir)
+        self.assertIn("jobs_total 1.0", render_prometheus())
+
+
+class TaskInstrumentationTest(SimpleTestCase):
+    def setUp(self):
+        from observability.metrics import reset_metrics
+
+        reset_metrics()
+        self.addCleanup(reset_metrics)
+
+    def _task(self, **request):
+        request.setdefault("called_directly", False)
+        return SimpleNamespace(name="events.process_event", request=SimpleNamespace(**request))
+
+    def test_records_duration_and_queue_wait(self):
+        from observability.metrics import render_prometheus, track_task
+
+        with track_task(self._task(sent_at=time.time() - 2)):
+            pass
+
+        body = render_prometheus()
+        self.assertIn(
+            'celery_task_duration_ms_count{status="success",task="events.process_event"} 1.0',
+            body,
+        )
+        self.assertIn(
+            'celery_task_queue_wait_ms_bucket{task="events.process_event",le="1000"} 0.0',
+            body,
+        )
+        self.assertIn(
+            'celery_task_queue_wait_ms_bucket{task="events.process_event",le="2500"} 1.0',
+            body,
+        )
+
+    def test_failure_and_retry_status(self):
+        from celery.exceptions import Retry
+
+        from observability.metrics import render_prometheus, track_task
+
+        with self.assertRaises(ValueError):
+            with track_task(self._task()):
+                raise ValueError("boom")
+        with self.assertRaises(Retry):
+            with track_task(self._task()):
+                raise Retry()
+
+        body = render_prometheus()
+        self.assertIn('status="failure",task="events.process_event"} 1.0', body)
+        self.assertIn('status="retry",task="events.process_event"} 1.0', body)
+        self.assertIn(
+            'celery_task_retries_total{task="events.process_event"} 1.0', body
+        )
+
+    def test_eta_excluded_from_queue_wait(self):
+        from datetime import datetime, timezone
+
+        from observability.metrics import render_prometheus, track_task
+
+        eta = datetime.fromtimestamp(time.time() - 0.001, tz=timezone.utc).isoformat()
+        with track_task(self._task(sent_at=time.time() - 600, eta=eta)):
+            pass
+        self.assertIn(
+            'celery_task_queue_wait_ms_bucket{task="events.process_event",le="5"} 1.0',
+            render_prometheus(),
+        )
+
+    def test_direct_calls_not_recorded(self):
+        from observability.metrics import render_prometheus, track_task
+
+        with track_task(self._task(called_directly=True)):
+            pass
+        self.assertNotIn("celery_task_duration_ms", render_prometheus())
@@ -0,0 +1,160 @@
+"""
+Tests for the observability metrics registry — fixed-bucket histograms,
+lock-striped counters, cardinality cap and Prometheus rendering.
+"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+
+class MetricsRegistryTest(SimpleTestCase):
+    def setUp(self):
+        from observability.metrics import reset_metrics
+
+        reset_metrics()
+        self.addCleanup(reset_metrics)
+
+    def test_histogram_buckets_are_cumulative(self):
+        from observability.metrics import histogram_observe, render_prometheus
+
+        for value in (1, 7, 30, 20000):
+            histogram_observe("req_ms", value, labels={"path": "/x"})
+        body = render_prometheus()
+
+        self.assertIn("# TYPE req_ms histogram", body)
+        self.assertIn('req_ms_bucket{path="/x",le="5"} 1.0', body)
+        self.assertIn('req_ms_bucket{path="/x",le="10"} 2.0', body)
+        self.assertIn('req_ms_bucket{path="/x",le="50"} 3.0', body)
+        self.assertIn('req_ms_bucket{path="/x",le="+Inf"} 4.0', body)
+        self.assertIn('req_ms_sum{path="/x"} 20038.0', body)
+        self.assertIn('req_ms_count{path="/x"} 4.0', body)
+
+    def test_custom_buckets(self):
+        from observability.metrics import (
+            histogram_observe,
+            register_histogram,
+            render_prometheus,
+        )
+
+        register_histogram("size_bytes", [1024, 0.5])
+        histogram_observe("size_bytes", 0.25)
+        body = render_prometheus()
+        self.assertIn('size_bytes_bucket{le="0.5"} 1.0', body)
+        self.assertIn('size_bytes_bucket{le="1024"} 1.0', body)
+
+    def test_histogram_memory_is_constant_per_series(self):
+        from observability.metrics import _stripes, histogram_observe
+
+        for i in range(10_000):
+            histogram_observe("lat_ms", float(i % 700))
+        sizes = {
+            len(values)
+            for stripe in _stripes
+            for values in stripe.histograms.get("lat_ms", {}).values()
+        }
+        self.assertEqual(sizes, {13})  # 11 bounds + +Inf + sum
+
+    def test_counters_merge_across_threads(self):
+        from observability.metrics import counter_inc, render_prometheus
+
+        def work():
+            for _ in range(1000):
+                counter_inc("hits_total", labels={"route": "a"})
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertIn('hits_total{route="a"} 8000.0', render_prometheus())
+
+    def test_cardinality_cap_folds_into_other(self):
+        from observability import metrics
+
+        with patch.object(metrics, "MAX_SERIES_PER_METRIC", 3):
+            for i in range(10):
+                metrics.counter_inc("by_id_total", labels={"id": str(i)})
+        body = metrics.render_prometheus()
+
+        self.assertEqual(metrics.series_count("by_id_total"), 3)
+        self.assertIn('by_id_total{id="other"} 7.0', body)
+
+    def test_label_values_escaped(self):
+        from observability.metrics import gauge_set, render_prometheus
+
+        gauge_set("g", labels={"q": 'a"b'}, value=1)
+        self.assertIn('g{q="a\\"b"} 1', render_prometheus())
+
+
+class RequestInstrumentationTest(SimpleTestCase):
+    def setUp(self):
+        from observability.metrics import reset_metrics
+
+        reset_metrics()
+        self.addCleanup(reset_metrics)
+
+    def _request(self, path: str, route: str | None):
+        from django.test import RequestFactory
+        from django.urls import ResolverMatch
+
+        request = RequestFactory().get(path)
+        if route is not None:
+            request.resolver_match = ResolverMatch(lambda r: None, (), {}, route=route)
+        return request
+
+    def _view(self, status: int = 200):
+        from django.http import HttpResponse
+
+        return lambda request: HttpResponse(status=status)
+
+    def test_labels_use_route_template(self):
+        from observability.metrics import MetricsMiddleware, render_prometheus, series_count
+
+        middleware = MetricsMiddleware(self._view())
+        for pk in ("1", "2", "3"):
+            middleware(self._request(f"/api/cases/{pk}/", "api/cases/<int:pk>/"))
+
+        body = render_prometheus()
+        self.assertIn(
+            'api_requests_total{method="GET",path="/api/cases/<int:pk>/",status="200"} 3.0',
+            body,
+        )
+        self.assertEqual(series_count("api_latency_ms"), 1)
+
+    def test_unmatched_paths_share_one_series(self):
+        from observability.metrics import MetricsMiddleware, render_prometheus, series_count
+
+        middleware = MetricsMiddleware(self._view(404))
+        for path in ("/wp-admin", "/.env", "/x/y/z"):
+            middleware(self._request(path, None))
+
+        self.assertEqual(series_count("api_requests_total"), 1)
+        self.assertIn('path="<unmatched>",status="404"} 3.0', render_prometheus())
+
+    def test_stacked_middlewares_record_once(self):
+        from observability.metrics import MetricsMiddleware, render_prometheus
+        from observability.middleware import ObservabilityMiddleware
+
+        stack = MetricsMiddleware(ObservabilityMiddleware(self._view(503)))
+        response = stack(self._request("/api/x/", "api/x/"))
+
+        body = render_prometheus()
+        self.assertIn("X-Request-Id", response)
+        self.assertIn('api_latency_ms_count{method="GET",path="/api/x/",status="503"} 1.0', body)
+        self.assertIn('api_errors_total{method="GET",path="/api/x/"} 1.0', body)
+
+    def test_unknown_methods_folded(self):
+        from observability.metrics import record_request, render_prometheus
+
+        record_request("BREW", "/api/x/", 405, 1.0)
+        self.assertIn('method="OTHER"', render_prometheus())
+
+    def test_record_api_latency_normalizes_uuids(self):
+        from observability.metrics import record_api_latency, render_prometheus
+
+        record_api_latency("GET", "/api/cases/0b9e6a4c-2f1d-4c4e-9d7b-3a2f1e0c9b8a/", 200, 3.0)
+        self.assertIn('path="/api/cases/:id/"', render_prometheus())
@@ -0,0 +1,126 @@
+"""
+Tests for the cached Clerk-org → local-org resolution shared by
+OrganizationIsolationMiddleware and OrgScopedMixin.
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class OrgResolutionCacheTest(TestCase):
+    def setUp(self):
+        from auth_core.models import Organizations
+        from auth_core.org_cache import org_cache
+
+        cache.clear()
+        org_cache.local.clear()
+        self.addCleanup(org_cache.local.clear)
+        self.org = Organizations.objects.create(
+            name="CUPE Local 79",
+            slug="cupe-79",
+            organization_type="local",
+            clerk_organization_id="org_cupe79",
+        )
+        self.factory = RequestFactory()
+
+    def test_second_resolution_hits_no_queries(self):
+        from auth_core.org_cache import resolve_organization
+
+        self.assertEqual(resolve_organization("org_cupe79").id, self.org.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_organization("org_cupe79").id, self.org.id)
+
+    def test_unknown_org_cached_negatively(self):
+        from auth_core.org_cache import resolve_organization
+
+        self.assertIsNone(resolve_organization("org_missing"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(resolve_organization("org_missing"))
+
+    def test_create_clears_negative_entry(self):
+        from auth_core.models import Organizations
+        from auth_core.org_cache import resolve_organization
+
+        self.assertIsNone(resolve_organization("org_new"))
+        created = Organizations.objects.create(
+            name="New", slug="new", organization_type="local",
+            clerk_organization_id="org_new",
+        )
+        self.assertEqual(resolve_organization("org_new").id, created.id)
+
+    def test_update_and_delete_invalidate(self):
+        from auth_core.org_cache import resolve_organization
+
+        resolve_organization("org_cupe79")
+        self.org.name = "CUPE Local 79 (renamed)"
+        self.org.save()
+        self.assertEqual(resolve_organization("org_cupe79").name, self.org.name)
+
+        self.org.delete()
+        self.assertIsNone(resolve_organization("org_cupe79"))
+
+    def test_changed_clerk_id_invalidates_old_entry(self):
+        from auth_core.org_cache import resolve_organization
+
+        resolve_organization("org_cupe79")
+        self.org.clerk_organization_id = "org_cupe79_v2"
+        self.org.save()
+        self.assertIsNone(resolve_organization("org_cupe79"))
+        self.assertEqual(resolve_organization("org_cupe79_v2").id, self.org.id)
+
+    def test_middleware_and_mixin_share_one_lookup(self):
+        from auth_core.middleware import OrganizationIsolationMiddleware
+        from auth_core.mixins import _resolve_local_org_id
+
+        request = self.factory.get("/api/x/", HTTP_X_ORGANIZATION_ID="org_cupe79")
+        request.clerk_org_id = "org_cupe79"
+        middleware = OrganizationIsolationMiddleware(lambda r: HttpResponse())
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(middleware.process_request(request))
+            # get_queryset + perform_create in the same request.
+            _resolve_local_org_id(request, "org_cupe79")
+            _resolve_local_org_id(request, "org_cupe79")
+
+        self.assertEqual(request.organization.id, self.org.id)
+        self.assertEqual(request.organization_id, self.org.id)
+
+    def test_header_org_is_never_attached_to_the_request(self):
+        from auth_core.middleware import OrganizationIsolationMiddleware
+        from auth_core.mixins import _resolve_local_org_id
+
+        request = self.factory.get("/api/x/", HTTP_X_ORGANIZATION_ID="org_cupe79")
+        middleware = OrganizationIsolationMiddleware(lambda r: HttpResponse())
+        self.assertIsNone(middleware.process_request(request))
+        self.assertIsNone(request.organization)
+
+        # The mixin still scopes by the header org, without attaching it.
+        self.assertEqual(_resolve_local_org_id(request, "org_cupe79"), str(self.org.id))
+        self.assertIsNone(request.organization)
+        self.assertFalse(hasattr(request, "organization_id"))
+
+    def test_unknown_claim_org_is_forbidden(self):
+        from auth_core.middleware import OrganizationIsolationMiddleware
+
+        request = self.factory.get("/api/x/")
+        request.clerk_org_id = "org_nope"
+        request.clerk_user_id = "user_1"
+        middleware = OrganizationIsolationMiddleware(lambda r: HttpResponse())
+        self.assertEqual(middleware.process_request(request).status_code, 403)
+
+    def test_org_field_introspection_cached(self):
+        from auth_core.models import OrganizationMembers
+        from auth_core.org_cache import model_field_names, model_has_org_field
+
+        self.assertTrue(model_has_org_field(OrganizationMembers))
+        hits = model_field_names.cache_info().hits
+        model_has_org_field(OrganizationMembers)
+        self.assertEqual(model_field_names.cache_info().hits, hits + 1)
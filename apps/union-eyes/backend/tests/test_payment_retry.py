@@ -0,0 +1,212 @@
+"""
+Tests for the payment retry engine: bounded concurrency, the Stripe token
+bucket, deterministic idempotency keys and bulk outcome write-back — all
+against the local Stripe stand-in in tests/stripe_stub.py.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from tests.stripe_stub import StripeStub, card_declined, rate_limited
+
+
+def _txn(i, **extra):
+    return {
+        "id": str(uuid.UUID(int=i + 1)),
+        "member_id": f"member-{i}",
+        "amount": "19.99",
+        "stripe_customer_id": f"cus_{i}",
+        "payment_method_id": f"pm_{i}",
+        **extra,
+    }
+
+
+def _engine(stub, **kwargs):
+    from billing.payment_retry import PaymentRetryEngine
+
+    kwargs.setdefault("workers", 8)
+    kwargs.setdefault("rate", 1_000)
+    kwargs.setdefault("record", MagicMock())
+    return PaymentRetryEngine(api_key="sk_test_stub", create_intent=stub.create, **kwargs)
+
+
+class TokenBucketTest(SimpleTestCase):
+    def test_bucket_paces_acquires_to_rate(self):
+        from billing.payment_retry import TokenBucket
+
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+
+class PaymentRetryEngineTest(SimpleTestCase):
+    def test_charges_run_concurrently_up_to_worker_limit(self):
+        stub = StripeStub(latency=0.05)
+        attempts = [(_txn(i), 1) for i in range(40)]
+
+        start = time.monotonic()
+        outcomes = _engine(stub, workers=8).run(attempts)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(len(outcomes), 40)
+        self.assertTrue(all(o.success for o in outcomes))
+        self.assertLessEqual(stub.max_in_flight, 8)
+        self.assertLess(elapsed, 40 * 0.05 / 3)
+
+    def test_rate_limit_caps_stripe_requests(self):
+        stub = StripeStub()
+        _engine(stub, workers=8, rate=40).run([(_txn(i), 1) for i in range(60)])
+
+        # 40-token burst, then 40/s: the last 20 calls need about half a second.
+        self.assertGreaterEqual(stub.call_times[-1] - stub.call_times[0], 0.45)
+
+    def test_idempotency_key_is_per_transaction_and_attempt(self):
+        from billing.payment_retry import idempotency_key
+
+        stub = StripeStub()
+        txn = _txn(0)
+        _engine(stub).run([(txn, 3)])
+
+        self.assertEqual(stub.keys, [idempotency_key(txn["id"], 3)])
+        self.assertEqual(idempotency_key(txn["id"], 3), f"dues-retry-{txn['id']}-3")
+
+    @patch("billing.payment_retry.TRANSIENT_BACKOFF", 0)
+    def test_rate_limited_call_retried_with_same_key(self):
+        stub = StripeStub(responder=lambda txn_id, n: rate_limited() if n == 1 else "succeeded")
+
+        [outcome] = _engine(stub).run([(_txn(0), 1)])
+
+        self.assertTrue(outcome.success)
+        self.assertEqual(len(set(stub.keys)), 1)
+        self.assertEqual((len(stub.keys), stub.charges), (2, 1))
+
+    @patch("billing.payment_retry.TRANSIENT_BACKOFF", 0)
+    def test_declines_are_recorded_and_outages_are_not(self):
+        declined, down = _txn(0), _txn(1)
+
+        def respond(txn_id, n):
+            return card_declined() if txn_id == declined["id"] else rate_limited()
+
+        outcomes = {o.transaction_id: o for o in _engine(StripeStub(responder=respond)).run(
+            [(declined, 2), (down, 1)]
+        )}
+
+        self.assertEqual(outcomes[declined["id"]].reason, "card_declined")
+        self.assertTrue(outcomes[declined["id"]].record)
+        self.assertFalse(outcomes[down["id"]].record)
+        self.assertEqual(outcomes[down["id"]].as_result()["result"], "error")
+
+    def test_missing_card_is_not_recorded_as_a_decline(self):
+        stub = StripeStub()
+        [outcome] = _engine(stub).run([(_txn(0, payment_method_id=None), 1)])
+
+        self.assertEqual((outcome.reason, outcome.record), ("missing_payment_method", False))
+        self.assertEqual(stub.keys, [])
+
+    def test_rerun_before_recording_does_not_charge_twice(self):
+        stub = StripeStub()
+        attempts = [(_txn(i), 1) for i in range(10)]
+
+        first = _engine(stub).run(attempts)
+        second = _engine(stub).run(attempts)
+
+        self.assertEqual(stub.charges, 10)
+        self.assertEqual(
+            {o.payment_intent_id for o in first}, {o.payment_intent_id for o in second}
+        )
+
+    def test_outcomes_flushed_in_chunks(self):
+        record = MagicMock()
+        _engine(StripeStub(), record=record, flush_size=10).run(
+            [(_txn(i), 1) for i in range(25)]
+        )
+
+        self.assertEqual([len(c.args[0]) for c in record.call_args_list], [10, 10, 5])
+
+    def test_missing_processor_key_skips_without_recording(self):
+        from billing.payment_retry import PaymentRetryEngine
+
+        stub, record = StripeStub(), MagicMock()
+        with patch.dict("os.environ", {}, clear=True):
+            outcomes = PaymentRetryEngine(create_intent=stub.create, record=record).run(
+                [(_txn(0), 1)]
+            )
+
+        self.assertEqual(outcomes[0].reason, "payment_processor_not_configured")
+        self.assertEqual((stub.keys, record.called), ([], False))
+
+    def test_amount_converted_to_cents_without_float_rounding(self):
+        from billing.payment_retry import _amount_cents
+
+        self.assertEqual(_amount_cents("19.99"), 1999)
+        self.assertEqual(_amount_cents(0.29), 29)
+
+
+class RecordOutcomesTest(TestCase):
+    def test_one_update_per_outcome_kind(self):
+        from billing.payment_retry import RetryOutcome, record_outcomes
+
+        outcomes = [
+            RetryOutcome(f"t{i}", "m", 1, success=i % 2 == 0, payment_intent_id=f"pi_{i}")
+            for i in range(100)
+        ] + [RetryOutcome("t-skip", "m", 1, success=False, record=False)]
+        cursor = MagicMock()
+        with patch.object(connection, "cursor") as make_cursor:
+            make_cursor.return_value.__enter__.return_value = cursor
+            record_outcomes(outcomes)
+
+        updates = [c.args for c in cursor.execute.call_args_list if "UPDATE" in c.args[0]]
+        self.assertEqual(len(updates), 2)
+        (paid_sql, paid_params), (_, declined_params) = updates
+        self.assertIn("status     = 'paid'", paid_sql)
+        self.assertEqual(len(paid_params), 50 * 2)
+        self.assertEqual(len(declined_params), 1 + 50 * 3)
+
+
+class RetryFailedPaymentsTaskTest(SimpleTestCase):
+    @patch("billing.payment_retry.record_outcomes")
+    @patch("billing.tasks._mark_for_admin_intervention")
+    @patch("billing.tasks._get_transactions_needing_retry")
+    def test_task_marks_admin_in_bulk_and_retries_through_engine(self, fetch, mark, record):
+        from billing.tasks import retry_failed_payments_task
+
+        fetch.return_value = [
+            _txn(0),
+            _txn(1, metadata={"failure_count": 4}),
+            _txn(2, metadata={"failure_count": 4}),
+            _txn(3, metadata={"failure_count": 1, "last_failure_date": "2020-01-01"}),
+        ]
+        stub = StripeStub(responder=lambda txn_id, n: "requires_payment_method"
+                          if txn_id == _txn(3)["id"] else "succeeded")
+
+        with patch.dict("os.environ", {"STRIPE_SECRET_KEY": "sk_test_stub"}), \
+                patch("billing.payment_retry._create_payment_intent", stub.create):
+            result = retry_failed_payments_task.apply().get()
+
+        mark.assert_called_once_with([_txn(1)["id"], _txn(2)["id"]])
+        self.assertEqual(
+            {k: result[k] for k in ("retries_attempted", "retries_succeeded", "retries_failed", "marked_for_admin")},
+            {"retries_attempted": 2, "retries_succeeded": 1, "retries_failed": 1, "marked_for_admin": 2},
+        )
+        self.assertEqual(sorted(stub.keys), sorted([
+            f"dues-retry-{_txn(0)['id']}-1", f"dues-retry-{_txn(3)['id']}-2",
+        ]))
+        self.assertEqual(len(record.call_args.args[0]), 2)
+
+    def test_exhausted_transactions_are_fetched_for_admin(self):
+        from billing.tasks import _get_transactions_needing_retry
+
+        cursor = MagicMock(description=[], fetchall=MagicMock(return_value=[]))
+        with patch("django.db.connection") as conn:
+            conn.cursor.return_value.__enter__.return_value = cursor
+            _get_transactions_needing_retry()
+
+        self.assertNotIn("failure_count", cursor.execute.call_args.args[0])
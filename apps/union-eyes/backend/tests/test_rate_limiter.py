@@ -0,0 +1,133 @@
+"""
+Tests for the rate-limiting middleware: Redis sliding-window counter (run
+against fakeredis with Lua support), local token buckets and headers.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import fakeredis
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+CONFIG = {
+    "ip": {"limit": 5, "window": 60},
+    "org": {"limit": 3, "window": 60},
+    "api_key": {"limit": 100, "window": 60},
+}
+
+
+@override_settings(RATE_LIMIT_CONFIG=CONFIG)
+class RateLimitMiddlewareTest(SimpleTestCase):
+    def setUp(self):
+        from middleware.rate_limiter import reset_rate_limiter
+
+        self.redis = fakeredis.FakeStrictRedis()
+        patcher = patch("middleware.rate_limiter._get_redis", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        reset_rate_limiter()
+        self.addCleanup(reset_rate_limiter)
+        self.factory = RequestFactory()
+
+    def _call(self, ip="10.0.0.1", org_id=None, **extra):
+        from middleware.rate_limiter import RateLimitMiddleware
+
+        request = self.factory.get("/api/cases/", REMOTE_ADDR=ip, **extra)
+        if org_id:
+            request.organization_id = org_id
+        return RateLimitMiddleware(lambda r: HttpResponse("ok"))(request)
+
+    def _clear_local(self):
+        from middleware.rate_limiter import _local_buckets
+
+        _local_buckets.clear()
+
+    def test_limit_then_429_with_headers(self):
+        for remaining in (4, 3, 2, 1, 0):
+            response = self._call()
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["RateLimit-Limit"], "5")
+            self.assertEqual(response["RateLimit-Remaining"], str(remaining))
+
+        self._clear_local()  # make Redis, not the local bucket, decide
+        response = self._call()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["RateLimit-Remaining"], "0")
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
+
+    def test_denied_requests_are_not_counted(self):
+        for _ in range(6):
+            self._call(org_id="org-1")  # org limit 3 denies the 4th+
+        counters = [
+            int(self.redis.get(key))
+            for key in self.redis.keys("rl:org:*")
+        ]
+        self.assertEqual(counters, [3])
+
+    def test_most_constrained_bucket_reported(self):
+        response = self._call(org_id="org-1")
+        self.assertEqual(response["RateLimit-Limit"], "3")
+        self.assertEqual(response["RateLimit-Remaining"], "2")
+
+    def test_constant_memory_per_key(self):
+        with override_settings(RATE_LIMIT_CONFIG={"ip": {"limit": 10_000, "window": 60}}):
+            for _ in range(500):
+                self._call()
+        keys = self.redis.keys("rl:ip:*")
+        self.assertLessEqual(len(keys), 2)
+        self.assertTrue(all(self.redis.type(k) == b"string" for k in keys))
+
+    def test_previous_window_is_weighted(self):
+        from middleware import rate_limiter
+
+        base = 1_700_000_040.0 - 1_700_000_040.0 % 60  # start of a 60 s window
+        with patch.object(rate_limiter.time, "time", return_value=base + 1):
+            for _ in range(5):
+                self.assertEqual(self._call().status_code, 200)
+
+        self._clear_local()
+        # 30 s into the next window the previous 5 still weigh 2.5 → one more.
+        with patch.object(rate_limiter.time, "time", return_value=base + 90):
+            self.assertEqual(self._call().status_code, 200)
+            self.assertEqual(self._call().status_code, 200)
+            self._clear_local()
+            self.assertEqual(self._call().status_code, 429)
+
+        # Past the second window only the new window counts.
+        self._clear_local()
+        with patch.object(rate_limiter.time, "time", return_value=base + 181):
+            self.assertEqual(self._call().status_code, 200)
+
+    def test_one_redis_round_trip_for_all_buckets(self):
+        self._call(org_id="org-1", HTTP_X_API_KEY="key-1")  # loads the script
+        with patch.object(
+            self.redis, "execute_command", wraps=self.redis.execute_command
+        ) as spy:
+            self._call(org_id="org-1", HTTP_X_API_KEY="key-1")
+        self.assertEqual(spy.call_count, 1)
+
+    def test_local_bucket_rejects_without_redis(self):
+        for _ in range(5):
+            self._call()
+        with patch.object(self.redis, "execute_command") as spy:
+            response = self._call()
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        spy.assert_not_called()
+
+    def test_redis_outage_fails_open(self):
+        with patch.object(
+            self.redis, "execute_command", side_effect=ConnectionError("down")
+        ):
+            response = self._call()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("RateLimit-Limit", response)
+
+    def test_exempt_paths(self):
+        from middleware.rate_limiter import RateLimitMiddleware
+
+        request = self.factory.get("/api/health/")
+        response = RateLimitMiddleware(lambda r: HttpResponse("ok"))(request)
+        self.assertNotIn("RateLimit-Limit", response)
@@ -0,0 +1,93 @@
+"""
+Local stand-in webhook server for integration delivery tests and benchmarks.
+
+Speaks HTTP/1.1 with keep-alive, so tests can observe connection reuse.
+Each path answers with the ``(status, delay_seconds)`` returned by the
+``responder`` callable (default: 200 after ``delay``), which lets a test
+model slow or flapping partner endpoints.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional, Tuple
+
+Responder = Callable[[str, int], Tuple[int, float]]
+
+
+class WebhookStub:
+    def __init__(self, *, delay: float = 0.0, responder: Optional[Responder] = None):
+        self.responder = responder or (lambda path, n: (200, delay))
+        self.lock = threading.Lock()
+        self.requests: Counter = Counter()
+        self.bodies = defaultdict(list)
+        self.headers = defaultdict(list)
+        self.connections = 0
+        self.in_flight: Counter = Counter()
+        self.max_in_flight: Counter = Counter()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def url(self, path: str = "/hook") -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self) -> "WebhookStub":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # One write per response; split writes stall on delayed ACKs.
+            wbufsize = 64 * 1024
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub.lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                path = self.path
+                with stub.lock:
+                    stub.requests[path] += 1
+                    n = stub.requests[path]
+                    stub.bodies[path].append(body)
+                    stub.headers[path].append(dict(self.headers))
+                    stub.in_flight[path] += 1
+                    stub.max_in_flight[path] = max(
+                        stub.max_in_flight[path], stub.in_flight[path]
+                    )
+                try:
+                    status, delay = stub.responder(path, n)
+                    if delay:
+                        time.sleep(delay)
+                    reply = json.dumps({"received": n}).encode()
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(reply)))
+                    self.end_headers()
+                    self.wfile.write(reply)
+                except ConnectionError:
+                    self.close_connection = True  # client gave up (timeout)
+                finally:
+                    with stub.lock:
+                        stub.in_flight[path] -= 1
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 512
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()